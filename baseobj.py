@@ -210,7 +210,7 @@ class BaseObj(object):
         # Representation of object with proper indentation
         out = []
         if self._attrlist is None:
-            attrlist = sorted(self.__dict__.keys())
+            attrlist = sorted(self._attrdict().keys())
         else:
             attrlist = self._attrlist
         for key in attrlist:
@@ -231,6 +231,18 @@ class BaseObj(object):
             joinstr = ", "
         return "%s(%s)" % (name, joinstr.join(out))
 
+    def _attrdict(self):
+        """Return a dictionary of all the attributes set in the object
+           including the attributes defined by __slots__
+        """
+        ret = {}
+        for cls in reversed(type(self).__mro__):
+            for name in cls.__dict__.get('__slots__', ()):
+                if hasattr(self, name):
+                    ret[name] = getattr(self, name)
+        ret.update(getattr(self, '__dict__', {}))
+        return ret
+
     def _str_value(self, value):
         """Format value"""
         if isinstance(value, list) or isinstance(value, tuple):
@@ -343,6 +355,19 @@ class BaseObj(object):
             _dlevel = level
         return _dlevel
 
+    @staticmethod
+    def debug_enabled(level):
+        """Return True if the given level is allowed by the verbose level
+           given in debug_level().
+
+           level:
+               Level to test. This could be a number or a name defined
+               by debug_map()
+        """
+        if type(level) == str:
+            level = _debug_map[level.lower()]
+        return bool(level & _dlevel)
+
     @staticmethod
     def debug_map(bitmap, name='', disp=''):
         """Add a debug mapping.
@@ -443,10 +468,10 @@ class BaseObj(object):
         """
         if len(kwts) == 0 and len(kwds) == 0:
             # Use object attributes, both positional using _attrlist and
-            # named arguments using object's own dictionary
+            # named arguments using object's own attributes
             if self._attrlist is not None:
                 kwts = (getattr(self, attr) for attr in self._attrlist)
-            kwds = self.__dict__
+            kwds = self._attrdict()
         return fstrobj.format(fmt, *kwts, **kwds)
 
     def dprint(self, level, msg, indent=0):
@@ -119,10 +119,17 @@ NFSTEST_ALLMODS = [
     'nfstest/nfs_util.py',
     'nfstest/rexec.py',
     'nfstest/test_util.py',
+    'packet/gzindex.py',
+    'packet/inotify.py',
     'packet/pkt.py',
     'packet/pktt.py',
     'packet/record.py',
     'packet/unpack.py',
+    'packet/analysis/columns.py',
+    'packet/analysis/concurrency.py',
+    'packet/analysis/latency.py',
+    'packet/analysis/timeline.py',
+    'packet/analysis/transport.py',
     'packet/application/rpc.py',
     'packet/application/rpc_const.py',
     'packet/application/gss.py',
@@ -142,6 +149,7 @@ NFSTEST_MODULES = ['baseobj', 'formatstr', 'nfstest_config']
 NFSTEST_PACKAGES = [
     'nfstest',
     'packet',
+    'packet.analysis',
     'packet.application',
     'packet.internet',
     'packet.link',
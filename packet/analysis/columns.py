@@ -0,0 +1,252 @@
+#===============================================================================
+# Copyright 2012 NetApp, Inc. All Rights Reserved,
+# contribution by Jorge Mora <mora@netapp.com>
+#
+# This program is free software; you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation; either version 2 of the License, or (at your option) any later
+# version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#===============================================================================
+"""
+Trace columns module
+
+Provides the object holding a per-packet summary of a trace file as typed
+arrays, one array per column, so queries and aggregations over the whole
+trace can be done on the arrays instead of decoding the packets again.
+The arrays are converted to NumPy arrays and they can be saved into a
+NumPy .npz file if NumPy is available.
+"""
+import os
+from array import array
+import nfstest_config as c
+from baseobj import BaseObj
+from packet.nfs.nfs4_const import OP_READ, OP_WRITE, NFS4_OK
+from packet.nfs.nfs4_type import COMPOUND4args, COMPOUND4res
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Module constants
+__author__    = 'Jorge Mora (%s)' % c.NFSTEST_AUTHOR_EMAIL
+__version__   = '1.0'
+__copyright__ = "Copyright (C) 2012 NetApp, Inc."
+__license__   = "GPL v2"
+
+# Column names and array typecodes, every column has an entry per packet
+_COLUMNS = (
+    ('index',  'L'), # Packet index
+    ('secs',   'd'), # Absolute timestamp of packet
+    ('length', 'L'), # Number of bytes in packet
+    ('stream', 'l'), # TCP connection, position in streams or -1
+    ('rpc',    'b'), # RPC message type: 0 for call, 1 for reply or -1
+    ('xid',    'L'), # RPC transaction identifier
+    ('call',   'l'), # Packet index of the call for a reply or -1
+    ('status', 'l'), # NFS COMPOUND status for a reply or -1
+    ('offset', 'l'), # Offset of READ or WRITE call or -1
+    ('count',  'l'), # Byte count of READ or WRITE or -1
+)
+# Cache file format version
+_NPZ_VERSION = 1
+
+class TraceColumns(BaseObj):
+    """Trace columns object
+
+       Usage:
+           from packet.pktt import Pktt
+
+           x = Pktt("/traces/tracefile.cap")
+
+           # Decode the trace file once and get the columns
+           cols = x.export_columns()
+
+           # Timestamp and NFS operations of the sixth packet
+           secs = cols.secs[5]
+           ops = cols.opslice(5)
+
+           # Using NumPy: number of bytes read or written by all replies
+           # and the packet indexes of all packets on the first connection
+           nbytes = cols.count[(cols.rpc == 1) & (cols.count > 0)].sum()
+           idxlist = cols.index[cols.stream == 0]
+
+       Object definition:
+
+       TraceColumns(
+           index     = array, # Packet index
+           secs      = array, # Absolute timestamp of packet
+           length    = array, # Number of bytes in packet
+           stream    = array, # TCP connection: position in streams or -1
+           rpc       = array, # RPC message type: 0 (call), 1 (reply) or -1
+           xid       = array, # RPC transaction identifier
+           call      = array, # Packet index of call for a reply or -1
+           status    = array, # NFS COMPOUND status for a reply or -1
+           offset    = array, # Offset of READ or WRITE call or -1
+           count     = array, # Byte count of READ or WRITE or -1
+           ops       = array, # NFS operations of all packets
+           ops_start = array, # Position in ops of the first operation of
+                              # each packet, it has an extra entry at the
+                              # end so the operations of packet i are
+                              # ops[ops_start[i]:ops_start[i+1]]
+           streams   = list,  # Name of each TCP connection as given by
+                              # the first packet seen on the connection
+       )
+
+       The offset and count are taken from the first READ or WRITE in the
+       COMPOUND: the offset and count (number of bytes in the data for
+       WRITE) of the call and the number of bytes read or written for
+       a successful reply. All columns are typed arrays (array.array) or
+       NumPy arrays if NumPy is available.
+    """
+    # Class attributes
+    _attrlist = tuple(x[0] for x in _COLUMNS) + ("ops", "ops_start", "streams")
+
+    def __init__(self):
+        """Constructor
+
+           Initialize all columns to empty arrays.
+        """
+        for name, tcode in _COLUMNS:
+            setattr(self, name, array(tcode))
+        self.ops       = array('H')
+        self.ops_start = array('L', [0])
+        self.streams   = []
+        self._stream_map = {}
+
+    def __len__(self):
+        """Return the number of packets"""
+        return len(self.index)
+
+    def opslice(self, pos):
+        """Return the NFS operations of the packet given by the position"""
+        return self.ops[self.ops_start[pos]:self.ops_start[pos+1]]
+
+    def add_packet(self, pkt, pkt_call=None):
+        """Add the packet as a new entry in all columns.
+
+           pkt:
+               Packet object (packet.pkt.Pkt)
+           pkt_call:
+               Call summary (packet.application.rpc.CallInfo) if the
+               packet is a reply, this is the pkt_call attribute of the
+               packet trace object right after the packet is decoded
+        """
+        record = pkt.record
+        self.index.append(record.index)
+        self.secs.append(record.secs)
+        self.length.append(record.length_orig)
+
+        stream = -1
+        tcp = getattr(pkt, 'tcp', None)
+        if tcp is not None:
+            ip = pkt.ip
+            src = (ip.src, tcp.src_port)
+            dst = (ip.dst, tcp.dst_port)
+            key = (src, dst) if src < dst else (dst, src)
+            stream = self._stream_map.get(key)
+            if stream is None:
+                stream = len(self.streams)
+                self._stream_map[key] = stream
+                self.streams.append("%s:%d-%s:%d" % (src + dst))
+        self.stream.append(stream)
+
+        rtype = -1
+        xid = 0
+        call = -1
+        rpc = getattr(pkt, 'rpc', None)
+        if rpc is not None:
+            rtype = rpc.type
+            xid = rpc.xid
+            if rtype == 1 and pkt_call is not None:
+                call = pkt_call.index
+        self.rpc.append(rtype)
+        self.xid.append(xid)
+        self.call.append(call)
+
+        status = -1
+        offset = -1
+        count = -1
+        nfs = getattr(pkt, 'nfs', None)
+        if isinstance(nfs, COMPOUND4args):
+            for item in nfs.argarray:
+                self.ops.append(item.argop)
+                if count >= 0:
+                    continue
+                if item.argop == OP_READ:
+                    offset = item.opread.offset
+                    count = item.opread.count
+                elif item.argop == OP_WRITE:
+                    offset = item.opwrite.offset
+                    count = len(item.opwrite.data)
+        elif isinstance(nfs, COMPOUND4res):
+            status = nfs.status
+            for item in nfs.resarray:
+                self.ops.append(item.resop)
+                if count >= 0:
+                    continue
+                if item.resop == OP_READ and item.opread.status == NFS4_OK:
+                    count = len(item.opread.resok4.data)
+                elif item.resop == OP_WRITE and item.opwrite.status == NFS4_OK:
+                    count = item.opwrite.resok4.count
+        self.status.append(status)
+        self.offset.append(offset)
+        self.count.append(count)
+        self.ops_start.append(len(self.ops))
+
+    def to_numpy(self):
+        """Convert all columns to NumPy arrays, the data is not copied"""
+        if numpy is None:
+            return
+        for name in self._attrlist[:-1]:
+            value = getattr(self, name)
+            if isinstance(value, array):
+                setattr(self, name, numpy.frombuffer(value, dtype=value.typecode))
+
+    def save(self, cfile, tsize=None):
+        """Save all columns into a NumPy .npz file.
+
+           cfile:
+               Name of the cache file
+           tsize:
+               Size of the trace file, it is saved so load() can verify
+               the cache file matches the trace file
+        """
+        if numpy is None:
+            raise Exception("NumPy is needed to save trace columns")
+        self.dprint('PKT1', ">>> TraceColumns.save(%s)" % cfile)
+        data = dict((name, numpy.asarray(getattr(self, name))) for name in self._attrlist)
+        data['streams'] = numpy.array(self.streams, dtype=str)
+        data['_meta'] = numpy.array([_NPZ_VERSION, -1 if tsize is None else tsize], dtype='l')
+        with open(cfile, 'wb') as fd:
+            numpy.savez(fd, **data)
+
+    @staticmethod
+    def load(cfile, tsize=None):
+        """Load all columns from a NumPy .npz file. Return None if the
+           file does not exist or it does not match the trace file.
+
+           cfile:
+               Name of the cache file
+           tsize:
+               Size of the trace file
+        """
+        if numpy is None or not os.path.isfile(cfile):
+            return
+        npz = numpy.load(cfile)
+        try:
+            meta = npz['_meta']
+            if meta[0] != _NPZ_VERSION or (tsize is not None and meta[1] != tsize):
+                return
+            obj = TraceColumns()
+            for name in obj._attrlist:
+                setattr(obj, name, npz[name])
+            obj.streams = obj.streams.tolist()
+        except KeyError:
+            return
+        finally:
+            npz.close()
+        return obj
@@ -0,0 +1,343 @@
+#===============================================================================
+# Copyright 2012 NetApp, Inc. All Rights Reserved,
+# contribution by Jorge Mora <mora@netapp.com>
+#
+# This program is free software; you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation; either version 2 of the License, or (at your option) any later
+# version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#===============================================================================
+"""
+RPC concurrency module
+
+Provides the objects to track the number of outstanding RPC calls on each
+connection and the number of NFSv4.1 session slots in use over time, e.g.,
+to tune the RPC slot table size (sunrpc.tcp_slot_table_entries) or the
+number of session slots and to find the periods when all slots are in use.
+"""
+from array import array
+import nfstest_config as c
+from baseobj import BaseObj
+from packet.nfs.nfs4_const import OP_SEQUENCE, NFS4_OK
+from packet.nfs.nfs4_type import COMPOUND4args, COMPOUND4res
+
+# Module constants
+__author__    = 'Jorge Mora (%s)' % c.NFSTEST_AUTHOR_EMAIL
+__version__   = '1.0'
+__copyright__ = "Copyright (C) 2012 NetApp, Inc."
+__license__   = "GPL v2"
+
+class InFlight(BaseObj):
+    """In-flight object
+
+       Keeps track of the number of outstanding requests on a connection
+       or on a session over time.
+
+       Object definition:
+
+       InFlight(
+           name      = string, # Connection or session identifier
+           count     = int,    # Current number of outstanding requests
+           max       = int,    # Maximum number of outstanding requests
+           limit     = int,    # Current number of slots available or None
+           hist      = dict,   # Number of seconds spent with a given
+                               # number of outstanding requests, keyed by
+                               # the number of outstanding requests
+           series    = array,  # Maximum number of outstanding requests
+                               # for every interval
+           limits    = array,  # Number of slots available at the end of
+                               # every interval, 0 if not known
+           exhausted = list,   # Periods when all slots were in use as
+                               # a list of (start, end) times relative to
+                               # the first packet in the trace file
+       )
+    """
+    # Class attributes
+    _attrlist = ("name", "count", "max", "limit", "hist", "series",
+                 "limits", "exhausted")
+
+    def __init__(self, name, interval, limit=None):
+        """Constructor
+
+           Initialize object's private data.
+
+           name:
+               Connection or session identifier
+           interval:
+               Length of each interval of the time series in seconds
+           limit:
+               Number of slots available [default: None]
+        """
+        self.name      = name
+        self.count     = 0
+        self.max       = 0
+        self.limit     = limit
+        self.hist      = {}
+        self.series    = array('L')
+        self.limits    = array('L')
+        self.exhausted = []
+        self._interval = interval
+        self._rsecs    = None # Time of last change
+        self._start    = None # Start of current exhaustion period
+
+    def _update(self, rsecs):
+        """Account the time spent at the current number of outstanding
+           requests up to the given time
+        """
+        if self._rsecs is not None and rsecs > self._rsecs:
+            self.hist[self.count] = self.hist.get(self.count, 0.0) + rsecs - self._rsecs
+        if self._rsecs is None or rsecs > self._rsecs:
+            self._rsecs = rsecs
+        idx = max(0, int(rsecs / self._interval))
+        count = idx + 1 - len(self.series)
+        if count > 0:
+            # Intervals with no changes keep the current values
+            self.series.extend(array('L', [self.count]) * count)
+            self.limits.extend(array('L', [self.limit or 0]) * count)
+        return idx
+
+    def _check(self, rsecs):
+        """Start or end an exhaustion period"""
+        full = self.limit is not None and self.count >= self.limit
+        if full and self._start is None:
+            self._start = rsecs
+        elif not full and self._start is not None:
+            self.exhausted.append((self._start, rsecs))
+            self._start = None
+
+    def set_count(self, rsecs, count):
+        """Set the number of outstanding requests at the given time"""
+        idx = self._update(rsecs)
+        self.count = count
+        if count > self.max:
+            self.max = count
+        if count > self.series[idx]:
+            self.series[idx] = count
+        self._check(rsecs)
+
+    def set_limit(self, rsecs, limit):
+        """Set the number of slots available at the given time"""
+        idx = self._update(rsecs)
+        self.limit = limit
+        self.limits[idx] = limit
+        self._check(rsecs)
+
+    def close(self, rsecs):
+        """Account the time up to the given time and end the current
+           exhaustion period if any
+        """
+        self._update(rsecs)
+        if self._start is not None:
+            self.exhausted.append((self._start, rsecs))
+            self._start = None
+
+    def mean(self):
+        """Return the time-weighted average of outstanding requests"""
+        total = sum(self.hist.itervalues())
+        if total > 0:
+            return sum(k * v for k, v in self.hist.iteritems()) / total
+        return float(self.count)
+
+class RPCConcurrency(BaseObj):
+    """RPC concurrency object
+
+       Usage:
+           from packet.pktt import Pktt
+           from packet.analysis.concurrency import RPCConcurrency
+
+           x = Pktt("/traces/tracefile.cap")
+
+           # Decode the trace file and track the outstanding calls,
+           # flag the periods with 128 outstanding calls on a connection
+           rc = RPCConcurrency(x, interval=0.1, rpc_slots=128)
+           rc.run()
+           print rc.report()
+
+           # Seconds spent with 16 slots in use on each session
+           for sess in rc.session_map.values():
+               secs = sess.hist.get(16, 0.0)
+
+           # Track the outstanding calls while processing the packets
+           rc = RPCConcurrency(x)
+           for pkt in x:
+               rc.add_packet(pkt)
+           rc.close()
+
+       Object definition:
+
+       RPCConcurrency(
+           conn_map    = dict, # InFlight object for the outstanding RPC
+                               # calls on each connection keyed by
+                               # "client:port-server:port"
+           session_map = dict, # InFlight object for the slots in use on
+                               # each NFSv4.1 session keyed by the session
+                               # id in hex
+           highest_slotid = dict, # Last sr_highest_slotid and
+                                  # sr_target_highest_slotid for each session
+                                  # as a tuple keyed by the session id
+       )
+
+       A call is outstanding from the time the call is seen until its reply
+       is seen. Calls are matched to their replies by the packet trace
+       object (pkt_call attribute), a call removed from its xid map because
+       of its limits (max_calls and call_timeout) is no longer outstanding.
+       A retransmitted call replaces the original call so it is only
+       counted once. The calls removed from the xid map are reported by
+       the packet trace object through add_call_callback().
+
+       A session slot is in use by every outstanding call starting with
+       a SEQUENCE operation. The number of slots available on a session is
+       sr_target_highest_slotid + 1 from the last SEQUENCE reply, all slots
+       are in use when the number of outstanding calls reaches this number.
+    """
+    # Class attributes
+    _attrlist = ("conn_map", "session_map", "highest_slotid")
+
+    def __init__(self, pktt, interval=1.0, rpc_slots=None):
+        """Constructor
+
+           Initialize object's private data.
+
+           pktt:
+               Packet trace object (packet.pktt.Pktt)
+           interval:
+               Length of each interval of the time series in seconds
+               [default: 1.0]
+           rpc_slots:
+               Number of RPC slots on each connection, the periods when
+               there are this many outstanding calls on a connection are
+               flagged as exhausted [default: None]
+        """
+        self._pktt = pktt
+        self._interval = float(interval)
+        self._rpc_slots = rpc_slots
+        # Packet indexes of the calls removed from the xid map of the
+        # packet trace object
+        self._removed = []
+        pktt.add_call_callback(self._removed.append)
+        self._reset()
+
+    def _reset(self):
+        """Discard all outstanding calls and counters"""
+        self._rsecs = 0.0
+        # Outstanding calls: packet index of call -> (connection, session)
+        self._calls = {}
+        del self._removed[:]
+        self.conn_map = {}
+        self.session_map = {}
+        self.highest_slotid = {}
+
+    def _get(self, hmap, name, limit=None):
+        """Return the InFlight object for the given name, create the
+           object if it does not exist
+        """
+        obj = hmap.get(name)
+        if obj is None:
+            obj = InFlight(name, self._interval, limit)
+            hmap[name] = obj
+        return obj
+
+    def _remove_call(self, index, rsecs):
+        """Remove the outstanding call given by the packet index"""
+        call = self._calls.pop(index, None)
+        if call is None:
+            return
+        conn = self.conn_map[call[0]]
+        conn.set_count(rsecs, conn.count - 1)
+        if call[1] is not None:
+            sess = self.session_map[call[1]]
+            sess.set_count(rsecs, sess.count - 1)
+
+    def add_packet(self, pkt):
+        """Add the packet if it is an RPC call or reply, this must be
+           called right after the packet is decoded by the packet trace
+           object so its pkt_call attribute is the call of this reply.
+
+           pkt:
+               Packet object (packet.pkt.Pkt)
+        """
+        rsecs = pkt.record.rsecs
+        self._rsecs = rsecs
+        # Calls evicted or replaced while decoding this packet
+        for index in self._removed:
+            self._remove_call(index, rsecs)
+        del self._removed[:]
+        rpc = getattr(pkt, 'rpc', None)
+        tcp = getattr(pkt, 'tcp', None)
+        if rpc is None or tcp is None:
+            return
+        ip = pkt.ip
+        nfs = getattr(pkt, 'nfs', None)
+        if rpc.type == 0:
+            name = "%s:%d-%s:%d" % (ip.src, tcp.src_port, ip.dst, tcp.dst_port)
+            conn = self._get(self.conn_map, name, self._rpc_slots)
+            conn.set_count(rsecs, conn.count + 1)
+            session = None
+            if isinstance(nfs, COMPOUND4args) and nfs.argarray and \
+               nfs.argarray[0].argop == OP_SEQUENCE:
+                session = nfs.argarray[0].opsequence.sa_sessionid.encode('hex')
+                sess = self._get(self.session_map, session)
+                sess.set_count(rsecs, sess.count + 1)
+            self._calls[pkt.record.index] = (name, session)
+        elif rpc.type == 1:
+            pkt_call = self._pktt.pkt_call
+            if pkt_call is not None and pkt_call.xid == rpc.xid:
+                self._remove_call(pkt_call.index, rsecs)
+            if isinstance(nfs, COMPOUND4res) and nfs.resarray and \
+               nfs.resarray[0].resop == OP_SEQUENCE:
+                res = nfs.resarray[0].opsequence
+                if res.sr_status == NFS4_OK:
+                    resok = res.sr_resok4
+                    session = resok.sr_sessionid.encode('hex')
+                    self.highest_slotid[session] = (resok.sr_highest_slotid,
+                                                    resok.sr_target_highest_slotid)
+                    sess = self._get(self.session_map, session)
+                    sess.set_limit(rsecs, resok.sr_target_highest_slotid + 1)
+
+    def close(self):
+        """Account the time up to the last packet added and end all
+           exhaustion periods in progress
+        """
+        for obj in self.conn_map.values() + self.session_map.values():
+            obj.close(self._rsecs)
+
+    def run(self):
+        """Decode the whole trace file in a single pass and add every RPC
+           call and reply, return this object.
+        """
+        self._reset()
+        pktt = self._pktt
+        position = pktt.get_position()
+        pktt.rewind(0)
+        for pkt in pktt:
+            self.add_packet(pkt)
+        self.close()
+        # Go back to where the caller was, the calls removed from the
+        # xid map while doing so are not part of this run
+        pktt.set_position(position)
+        del self._removed[:]
+        return self
+
+    def report(self):
+        """Return a table with the maximum and time-weighted average number
+           of outstanding requests and the number and total duration of the
+           exhaustion periods for each connection and session
+        """
+        header = ("max", "mean", "limit", "exhausted", "secs")
+        width = max([10] + [len(x) for m in (self.conn_map, self.session_map) for x in m])
+        fmt = "%-" + str(width) + "s" + " %9s" * len(header)
+        out = [fmt % (("",) + header)]
+        for title, hmap in (("Connection", self.conn_map), ("Session", self.session_map)):
+            if hmap:
+                out.append(title + ":")
+            for name in sorted(hmap):
+                obj = hmap[name]
+                secs = sum(end - start for start, end in obj.exhausted)
+                limit = "-" if obj.limit is None else obj.limit
+                out.append(fmt % (name, obj.max, "%.2f" % obj.mean(), limit,
+                                  len(obj.exhausted), "%.3f" % secs))
+        return "\n".join(out)
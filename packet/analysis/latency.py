@@ -0,0 +1,279 @@
+#===============================================================================
+# Copyright 2012 NetApp, Inc. All Rights Reserved,
+# contribution by Jorge Mora <mora@netapp.com>
+#
+# This program is free software; you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation; either version 2 of the License, or (at your option) any later
+# version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#===============================================================================
+"""
+RPC latency module
+
+Provides the objects to measure the latency between each RPC call and its
+reply using the xid map of the packet trace object. Latencies are kept in
+log-bucketed histograms so the memory used does not depend on the number
+of packets in the trace file.
+"""
+import math
+import nfstest_config as c
+from baseobj import BaseObj
+from packet.nfs.nfs4_const import nfs_opnum4, nfs_cb_opnum4
+from packet.nfs.nfs4_type import COMPOUND4res, CB_COMPOUND4res
+
+# Module constants
+__author__    = 'Jorge Mora (%s)' % c.NFSTEST_AUTHOR_EMAIL
+__version__   = '1.0'
+__copyright__ = "Copyright (C) 2012 NetApp, Inc."
+__license__   = "GPL v2"
+
+# Number of buckets for each power of two, the relative error of the
+# value of a bucket is less than 1/_SUB_BUCKETS
+_SUB_BUCKETS = 16
+# Percentiles displayed by report()
+_PERCENTILES = (50, 90, 99, 99.9)
+
+class LogHistogram(BaseObj):
+    """Log-bucketed histogram object
+
+       Usage:
+           from packet.analysis.latency import LogHistogram
+
+           x = LogHistogram()
+
+           # Add values
+           x.add(0.000512)
+           x.add(0.001024)
+
+           # Get the 99th percentile
+           p99 = x.percentile(99)
+
+       Object definition:
+
+       LogHistogram(
+           count   = int,   # Number of values added
+           total   = float, # Sum of all values added
+           min     = float, # Minimum value added
+           max     = float, # Maximum value added
+           buckets = dict,  # Number of values keyed by bucket number
+       )
+
+       Every power of two is split into a fixed number of buckets so the
+       value reported for a percentile is within about 6% of the actual
+       value. The minimum and maximum values are exact.
+    """
+    # Class attributes
+    _attrlist = ("count", "total", "min", "max")
+
+    def __init__(self):
+        """Constructor
+
+           Initialize object's private data.
+        """
+        self.count   = 0
+        self.total   = 0.0
+        self.min     = None
+        self.max     = None
+        self.buckets = {}
+
+    def add(self, value):
+        """Add value to the histogram, negative values are counted as zero"""
+        value = max(value, 0.0)
+        self.count += 1
+        self.total += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+        if value > 0:
+            mant, exp = math.frexp(value)
+            bucket = exp * _SUB_BUCKETS + int((mant - 0.5) * 2 * _SUB_BUCKETS)
+        else:
+            bucket = None
+        self.buckets[bucket] = self.buckets.get(bucket, 0) + 1
+
+    def merge(self, other):
+        """Add all values from another histogram"""
+        if other.count == 0:
+            return
+        self.count += other.count
+        self.total += other.total
+        if self.min is None or other.min < self.min:
+            self.min = other.min
+        if self.max is None or other.max > self.max:
+            self.max = other.max
+        for bucket, count in other.buckets.iteritems():
+            self.buckets[bucket] = self.buckets.get(bucket, 0) + count
+
+    def mean(self):
+        """Return the average of all values added"""
+        if self.count:
+            return self.total / self.count
+
+    def percentile(self, pct):
+        """Return the value at the given percentile, the value returned
+           is the upper limit of the bucket holding the percentile but
+           never greater than the maximum value added.
+
+           pct:
+               Percentile in the range [0, 100]
+        """
+        if self.count == 0:
+            return
+        rank = max(1, int(math.ceil(self.count * pct / 100.0)))
+        seen = 0
+        for bucket in sorted(self.buckets):
+            seen += self.buckets[bucket]
+            if seen >= rank:
+                break
+        if bucket is None:
+            return 0.0
+        exp, sub = divmod(bucket, _SUB_BUCKETS)
+        value = math.ldexp(0.5 + (sub + 1) / (2.0 * _SUB_BUCKETS), exp)
+        return min(value, self.max)
+
+class RPCLatency(BaseObj):
+    """RPC latency object
+
+       Usage:
+           from packet.pktt import Pktt
+           from packet.analysis.latency import RPCLatency
+
+           x = Pktt("/traces/tracefile.cap")
+
+           # Decode the trace file and measure the latency of all replies
+           lat = RPCLatency(x)
+           lat.run()
+           print lat.report()
+
+           # 99th percentile of all READ replies in seconds
+           p99 = lat.op_map['READ'].percentile(99)
+
+           # Measure latencies while processing the packets
+           lat = RPCLatency(x)
+           for pkt in x:
+               lat.add_packet(pkt)
+
+       Object definition:
+
+       RPCLatency(
+           total    = LogHistogram(), # All RPC replies
+           op_map   = dict,           # Histogram for each NFS operation
+                                      # keyed by operation name
+           srv_map  = dict,           # Histogram for each server keyed
+                                      # by IP address of server
+           conn_map = dict,           # Histogram for each connection keyed
+                                      # by "client:port-server:port"
+       )
+
+       The latency of a reply is the difference between the timestamps
+       of the reply and its call. The call is taken from the xid map of
+       the packet trace object so replies whose calls have been evicted
+       or are not in the trace file are not counted. The latency of a
+       COMPOUND reply is added to the histogram of every operation in
+       the reply, callback operations have a "CB_" prefix.
+    """
+    # Class attributes
+    _attrlist = ("total", "op_map", "srv_map", "conn_map")
+
+    def __init__(self, pktt):
+        """Constructor
+
+           Initialize object's private data.
+
+           pktt:
+               Packet trace object (packet.pktt.Pktt)
+        """
+        self._pktt    = pktt
+        self._call    = None # Call of the last reply added
+        self.total    = LogHistogram()
+        self.op_map   = {}
+        self.srv_map  = {}
+        self.conn_map = {}
+
+    def _add(self, hmap, key, value):
+        """Add value to the histogram given by the key"""
+        hist = hmap.get(key)
+        if hist is None:
+            hist = LogHistogram()
+            hmap[key] = hist
+        hist.add(value)
+
+    def add_packet(self, pkt):
+        """Add latency of the packet if it is an RPC reply, this must be
+           called right after the packet is decoded by the packet trace
+           object so its pkt_call attribute is the call of this reply.
+
+           pkt:
+               Packet object (packet.pkt.Pkt)
+        """
+        rpc = getattr(pkt, 'rpc', None)
+        if rpc is None or rpc.type != 1:
+            return
+        pkt_call = self._pktt.pkt_call
+        if pkt_call is None or pkt_call is self._call or pkt_call.xid != rpc.xid:
+            # Call is not known or this reply has already been added
+            return
+        self._call = pkt_call
+        latency = pkt.record.secs - pkt_call.secs
+        self.total.add(latency)
+
+        ip = pkt.ip
+        self._add(self.srv_map, ip.src, latency)
+        tcp = getattr(pkt, 'tcp', None)
+        if tcp is not None:
+            conn = "%s:%d-%s:%d" % (ip.dst, tcp.dst_port, ip.src, tcp.src_port)
+            self._add(self.conn_map, conn, latency)
+
+        nfs = getattr(pkt, 'nfs', None)
+        if isinstance(nfs, COMPOUND4res):
+            opmap = nfs_opnum4
+        elif isinstance(nfs, CB_COMPOUND4res):
+            opmap = nfs_cb_opnum4
+        else:
+            return
+        for resop in set(item.resop for item in nfs.resarray):
+            self._add(self.op_map, opmap.get(resop, str(resop))[3:], latency)
+
+    def run(self):
+        """Decode the whole trace file in a single pass and add the latency
+           of every reply, return this object.
+        """
+        pktt = self._pktt
+        position = pktt.get_position()
+        pktt.rewind(0)
+        for pkt in pktt:
+            self.add_packet(pkt)
+        # Go back to where the caller was
+        pktt.set_position(position)
+        return self
+
+    def report(self, unit=1000.0):
+        """Return a table of the latency statistics: number of replies,
+           average, percentiles and maximum latency for all replies and
+           for each operation, server and connection.
+
+           unit:
+               Multiplier to convert seconds to the unit displayed
+               [default: 1000.0 (milliseconds)]
+        """
+        header = ["count", "mean"] + ["p%g" % x for x in _PERCENTILES] + ["max"]
+        width = max([5] + [len(x) for m in (self.op_map, self.srv_map, self.conn_map) for x in m])
+        fmt = "%-" + str(width) + "s %9s" + " %10s" * (len(header) - 1)
+        out = [fmt % tuple([""] + header)]
+        def add_row(name, hist):
+            values = [hist.mean()] + [hist.percentile(x) for x in _PERCENTILES] + [hist.max]
+            out.append(fmt % tuple([name, hist.count] + ["%.3f" % (x * unit) for x in values]))
+        for title, hmap in (("Operation", self.op_map), ("Server", self.srv_map),
+                            ("Connection", self.conn_map)):
+            if hmap:
+                out.append(title + ":")
+                for key in sorted(hmap):
+                    add_row(key, hmap[key])
+        if self.total.count:
+            add_row("Total", self.total)
+        return "\n".join(out)
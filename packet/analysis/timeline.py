@@ -0,0 +1,183 @@
+#===============================================================================
+# Copyright 2012 NetApp, Inc. All Rights Reserved,
+# contribution by Jorge Mora <mora@netapp.com>
+#
+# This program is free software; you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation; either version 2 of the License, or (at your option) any later
+# version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#===============================================================================
+"""
+Timeline module
+
+Provides the object to count the NFS throughput, operations and errors
+of a trace file in fixed time intervals, e.g., to find out when the
+throughput collapses during a layout recall or a grace period.
+"""
+import csv
+from array import array
+import nfstest_config as c
+from baseobj import BaseObj
+from packet.nfs.nfs4_const import OP_READ, OP_WRITE, NFS4_OK
+from packet.nfs.nfs4_type import COMPOUND4args, COMPOUND4res
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Module constants
+__author__    = 'Jorge Mora (%s)' % c.NFSTEST_AUTHOR_EMAIL
+__version__   = '1.0'
+__copyright__ = "Copyright (C) 2012 NetApp, Inc."
+__license__   = "GPL v2"
+
+# Counters kept for every interval
+_COUNTERS = ("calls", "replies", "errors", "read_ops", "write_ops",
+             "read_bytes", "write_bytes")
+
+class Timeline(BaseObj):
+    """Timeline object
+
+       Usage:
+           from packet.pktt import Pktt
+           from packet.analysis.timeline import Timeline
+
+           x = Pktt("/traces/tracefile.cap")
+
+           # Decode the trace file and count everything in 100ms intervals
+           tl = Timeline(x, interval=0.1)
+           tl.run()
+
+           # Save the timeline as a CSV file
+           tl.to_csv("/tmp/timeline.csv")
+
+           # Number of bytes read in the fourth interval
+           nbytes = tl.read_bytes[3]
+
+           # Count the packets while processing them
+           tl = Timeline(x)
+           for pkt in x:
+               tl.add_packet(pkt)
+
+       Object definition:
+
+       Timeline(
+           interval    = float, # Length of each interval in seconds
+           calls       = array, # Number of COMPOUND calls
+           replies     = array, # Number of COMPOUND replies
+           errors      = array, # Number of COMPOUND replies with an error
+           read_ops    = array, # Number of READ operations in calls
+           write_ops   = array, # Number of WRITE operations in calls
+           read_bytes  = array, # Number of bytes returned by READ replies
+           write_bytes = array, # Number of bytes sent by WRITE calls
+       )
+
+       Each array has an entry for every interval, interval i starts at
+       i*interval seconds relative to the first packet in the trace file
+       (Record.rsecs). The number of bytes are taken from the data in
+       READ4resok and WRITE4args.
+    """
+    # Class attributes
+    _attrlist = ("interval",) + _COUNTERS
+
+    def __init__(self, pktt, interval=1.0):
+        """Constructor
+
+           Initialize object's private data.
+
+           pktt:
+               Packet trace object (packet.pktt.Pktt)
+           interval:
+               Length of each interval in seconds [default: 1.0]
+        """
+        self._pktt = pktt
+        self.interval = float(interval)
+        for name in _COUNTERS:
+            setattr(self, name, array('L'))
+
+    def __len__(self):
+        """Return the number of intervals"""
+        return len(self.calls)
+
+    def _bucket(self, rsecs):
+        """Return the interval for the given relative time, all counters
+           are extended so they include the interval
+        """
+        bucket = max(0, int(rsecs / self.interval))
+        count = bucket + 1 - len(self.calls)
+        if count > 0:
+            zeros = array('L', [0]) * count
+            for name in _COUNTERS:
+                getattr(self, name).extend(zeros)
+        return bucket
+
+    def add_packet(self, pkt):
+        """Add counters for the packet if it is an NFS COMPOUND.
+
+           pkt:
+               Packet object (packet.pkt.Pkt)
+        """
+        nfs = getattr(pkt, 'nfs', None)
+        if isinstance(nfs, COMPOUND4args):
+            idx = self._bucket(pkt.record.rsecs)
+            self.calls[idx] += 1
+            for item in nfs.argarray:
+                if item.argop == OP_READ:
+                    self.read_ops[idx] += 1
+                elif item.argop == OP_WRITE:
+                    self.write_ops[idx] += 1
+                    self.write_bytes[idx] += len(item.opwrite.data)
+        elif isinstance(nfs, COMPOUND4res):
+            idx = self._bucket(pkt.record.rsecs)
+            self.replies[idx] += 1
+            if nfs.status != NFS4_OK:
+                self.errors[idx] += 1
+            for item in nfs.resarray:
+                if item.resop == OP_READ and item.opread.status == NFS4_OK:
+                    self.read_bytes[idx] += len(item.opread.resok4.data)
+
+    def run(self):
+        """Decode the whole trace file in a single pass and add the counters
+           of every packet, return this object.
+        """
+        pktt = self._pktt
+        position = pktt.get_position()
+        pktt.rewind(0)
+        for pkt in pktt:
+            self.add_packet(pkt)
+        # Go back to where the caller was
+        pktt.set_position(position)
+        return self
+
+    def to_numpy(self):
+        """Return a dictionary of NumPy arrays keyed by counter name
+           including the start time of each interval as "secs"
+        """
+        if numpy is None:
+            raise Exception("NumPy is needed to convert the timeline")
+        ret = dict((name, numpy.array(getattr(self, name), dtype='L')) for name in _COUNTERS)
+        ret['secs'] = numpy.arange(len(self), dtype='d') * self.interval
+        return ret
+
+    def to_csv(self, cfile):
+        """Write the timeline as CSV, the first row is the header and each
+           row after it is an interval starting with its relative time.
+
+           cfile:
+               Name of the CSV file or a file object
+        """
+        fd = open(cfile, 'wb') if isinstance(cfile, basestring) else cfile
+        try:
+            writer = csv.writer(fd)
+            writer.writerow(("secs",) + _COUNTERS)
+            columns = [getattr(self, name) for name in _COUNTERS]
+            for idx in xrange(len(self)):
+                writer.writerow(["%g" % (idx * self.interval)] + [x[idx] for x in columns])
+        finally:
+            if fd is not cfile:
+                fd.close()
@@ -0,0 +1,297 @@
+#===============================================================================
+# Copyright 2012 NetApp, Inc. All Rights Reserved,
+# contribution by Jorge Mora <mora@netapp.com>
+#
+# This program is free software; you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation; either version 2 of the License, or (at your option) any later
+# version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#===============================================================================
+"""
+Transport analysis module
+
+Provides the objects to analyze the TCP connections in a trace file:
+retransmissions, duplicate ACKs, zero window advertisements, round trip
+time and goodput for each direction of every connection, so network
+stalls can be told apart from a slow server.
+"""
+from collections import deque
+import nfstest_config as c
+from baseobj import BaseObj
+from packet.analysis.latency import LogHistogram
+
+# Module constants
+__author__    = 'Jorge Mora (%s)' % c.NFSTEST_AUTHOR_EMAIL
+__version__   = '1.0'
+__copyright__ = "Copyright (C) 2012 NetApp, Inc."
+__license__   = "GPL v2"
+
+# Maximum number of segments waiting for an ACK to measure the RTT
+_MAX_PENDING = 4096
+
+def _unwrap(raw, ref_raw, ref_rel):
+    """Convert a 32bit sequence number to a relative number which does
+       not wrap around using a reference sequence number and its
+       relative number
+    """
+    delta = (raw - ref_raw) & 0xFFFFFFFF
+    if delta >= 0x80000000:
+        delta -= 0x100000000
+    return ref_rel + delta
+
+class TCPStream(BaseObj):
+    """TCP stream object
+
+       Object definition:
+
+       TCPStream(
+           streamid     = string, # "src:port-dst:port" as used by the
+                                  # TCP layer in Pktt._tcp_stream_map
+           packets      = int,    # Number of packets
+           data_packets = int,    # Number of packets having data
+           bytes        = int,    # Number of data bytes including
+                                  # retransmissions
+           goodput_bytes = int,   # Number of unique data bytes
+           retransmits  = int,    # Number of retransmitted segments
+           dup_acks     = int,    # Number of duplicate ACKs
+           zero_windows = int,    # Number of zero window advertisements
+           rtt = LogHistogram(),  # Round trip time of data segments sent
+                                  # in this direction
+           first_secs   = float,  # Timestamp of first packet
+           last_secs    = float,  # Timestamp of last packet
+       )
+
+       A data segment is a retransmission if it does not have any data
+       after the highest sequence number already sent. A duplicate ACK
+       is a packet with no data, no SYN, FIN or RST flags, the same ACK
+       number and window size as the previous ACK and there is data not
+       acknowledged yet in the other direction. The RTT is measured from
+       a data segment to the first ACK covering it, segments sent before
+       a retransmission are not used (Karn's algorithm). The number of
+       data bytes in a segment is taken from the IP header so the padding
+       added by the link layer is not counted.
+    """
+    # Class attributes
+    _attrlist = ("streamid", "packets", "data_packets", "bytes",
+                 "goodput_bytes", "retransmits", "dup_acks", "zero_windows",
+                 "rtt", "first_secs", "last_secs")
+
+    def __init__(self, streamid, seq, secs):
+        """Constructor
+
+           Initialize object's private data.
+
+           streamid:
+               Stream identifier "src:port-dst:port"
+           seq:
+               Sequence number of first packet
+           secs:
+               Timestamp of first packet
+        """
+        self.streamid      = streamid
+        self.packets       = 0
+        self.data_packets  = 0
+        self.bytes         = 0
+        self.goodput_bytes = 0
+        self.retransmits   = 0
+        self.dup_acks      = 0
+        self.zero_windows  = 0
+        self.rtt           = LogHistogram()
+        self.first_secs    = secs
+        self.last_secs     = secs
+        self._last_raw = seq   # Last sequence number seen
+        self._last_rel = 0     # Relative number of _last_raw
+        self._next_seq = 0     # Highest relative sequence number sent
+        self._last_ack = None  # Last relative ACK number sent
+        self._last_win = None  # Last window size sent
+        self._pending  = deque() # (end sequence, timestamp) not acked yet
+        self._last_seg = None  # (sequence, length, timestamp) of last segment
+
+    def goodput(self):
+        """Return the number of unique data bytes per second"""
+        duration = self.last_secs - self.first_secs
+        if duration > 0:
+            return self.goodput_bytes / duration
+        return 0.0
+
+    def relative(self, raw):
+        """Return the relative sequence number of a sequence number in
+           this direction
+        """
+        return _unwrap(raw, self._last_raw, self._last_rel)
+
+class TCPAnalyzer(BaseObj):
+    """TCP analyzer object
+
+       Usage:
+           from packet.pktt import Pktt
+           from packet.analysis.transport import TCPAnalyzer
+
+           x = Pktt("/traces/tracefile.cap")
+
+           # Decode the trace file and analyze all TCP connections
+           tcpa = TCPAnalyzer(x)
+           tcpa.run()
+           print tcpa.report()
+
+           # Number of retransmissions from the client
+           stream = tcpa.stream_map["192.168.0.17:708-192.168.0.62:2049"]
+           count = stream.retransmits
+
+           # Analyze the packets while processing them
+           tcpa = TCPAnalyzer(x)
+           for pkt in x:
+               tcpa.add_packet(pkt)
+
+       Object definition:
+
+       TCPAnalyzer(
+           stream_map = dict, # TCPStream object for each direction of every
+                              # connection keyed by "src:port-dst:port"
+       )
+
+       The analyzer keeps its own state for each direction using the same
+       stream identifiers as the TCP layer (Pktt._tcp_stream_map), the
+       decoder state is not modified so it is not affected by rewind()
+       or the decoder state checkpoints.
+    """
+    # Class attributes
+    _attrlist = ("stream_map",)
+
+    def __init__(self, pktt):
+        """Constructor
+
+           Initialize object's private data.
+
+           pktt:
+               Packet trace object (packet.pktt.Pktt)
+        """
+        self._pktt = pktt
+        self.stream_map = {}
+
+    def _get_stream(self, streamid, seq, secs):
+        """Return the stream object for the given stream identifier,
+           create the object if it does not exist
+        """
+        stream = self.stream_map.get(streamid)
+        if stream is None:
+            stream = TCPStream(streamid, seq, secs)
+            self.stream_map[streamid] = stream
+        return stream
+
+    def add_packet(self, pkt):
+        """Add the packet to the analysis if it is a TCP packet.
+
+           pkt:
+               Packet object (packet.pkt.Pkt)
+        """
+        tcp = getattr(pkt, 'tcp', None)
+        if tcp is None:
+            return
+        ip = pkt.ip
+        secs = pkt.record.secs
+        fwdid = "%s:%d-%s:%d" % (ip.src, tcp.src_port, ip.dst, tcp.dst_port)
+        revid = "%s:%d-%s:%d" % (ip.dst, tcp.dst_port, ip.src, tcp.src_port)
+        stream = self._get_stream(fwdid, tcp.seq_number, secs)
+        peer = self.stream_map.get(revid)
+        flags = tcp.flags
+
+        # Number of data bytes in the segment
+        if ip.version == 4:
+            length = ip.total_size - ip.header_size - tcp.header_size
+        else:
+            length = ip.total_size - tcp.header_size
+        if length < 0:
+            # IP total length is not valid, e.g., TCP segmentation offload
+            length = getattr(tcp, 'length', 0)
+
+        segment = (tcp.seq_number, length, secs)
+        if segment == stream._last_seg:
+            # A segment having multiple RPC packets is given once
+            # for every RPC packet, count the segment only once
+            return
+        stream._last_seg = segment
+
+        stream.packets  += 1
+        stream.last_secs = secs
+        if flags.SYN:
+            # Sequence numbers are relative to the SYN
+            stream._last_raw = tcp.seq_number
+            stream._last_rel = 0
+            stream._next_seq = 0
+        seq = stream.relative(tcp.seq_number)
+        if seq > stream._last_rel:
+            stream._last_raw = tcp.seq_number
+            stream._last_rel = seq
+        end = seq + length + flags.SYN + flags.FIN
+
+        if length > 0:
+            stream.data_packets += 1
+            stream.bytes += length
+            if end <= stream._next_seq:
+                # No new data in this segment
+                stream.retransmits += 1
+                stream._pending.clear()
+            else:
+                stream.goodput_bytes += end - max(seq, stream._next_seq) - flags.FIN
+                if len(stream._pending) < _MAX_PENDING:
+                    stream._pending.append((end, secs))
+        if end > stream._next_seq:
+            stream._next_seq = end
+
+        if tcp.window_size == 0 and not flags.RST:
+            stream.zero_windows += 1
+
+        if flags.ACK and peer is not None:
+            ack = peer.relative(tcp.ack_number)
+            if length == 0 and not (flags.SYN or flags.FIN or flags.RST) and \
+               ack == stream._last_ack and tcp.window_size == stream._last_win and \
+               peer._next_seq > ack:
+                stream.dup_acks += 1
+            # Measure RTT using the last segment covered by this ACK
+            sent = None
+            pending = peer._pending
+            while pending and pending[0][0] <= ack:
+                sent = pending.popleft()[1]
+            if sent is not None:
+                peer.rtt.add(secs - sent)
+            stream._last_ack = ack
+        stream._last_win = tcp.window_size
+
+    def run(self):
+        """Decode the whole trace file in a single pass and analyze every
+           TCP packet, return this object.
+        """
+        pktt = self._pktt
+        position = pktt.get_position()
+        pktt.rewind(0)
+        for pkt in pktt:
+            self.add_packet(pkt)
+        # Go back to where the caller was
+        pktt.set_position(position)
+        return self
+
+    def report(self):
+        """Return a table with the counters, median and maximum RTT in
+           milliseconds and goodput in bytes per second for each direction
+           of every connection
+        """
+        header = ("packets", "retrans", "dupacks", "zerowin", "rtt_p50", "rtt_max", "goodput")
+        width = max([6] + [len(x) for x in self.stream_map])
+        fmt = "%-" + str(width) + "s" + " %9s" * len(header)
+        out = [fmt % (("Stream",) + header)]
+        for streamid in sorted(self.stream_map):
+            stream = self.stream_map[streamid]
+            rtt = stream.rtt
+            if rtt.count:
+                rtts = ("%.3f" % (1000 * rtt.percentile(50)), "%.3f" % (1000 * rtt.max))
+            else:
+                rtts = ("-", "-")
+            out.append(fmt % ((streamid, stream.packets, stream.retransmits,
+                               stream.dup_acks, stream.zero_windows) + rtts +
+                              ("%.0f" % stream.goodput(),)))
+        return "\n".join(out)
@@ -109,6 +109,7 @@ class GSS(BaseObj):
            # Decode data following the RPC payload when flavor is RPCSEC_GSS
            x.decode_gss_checksum()
     """
+    __slots__ = ()
     def _gss_data_call(self):
         """Internal method to decode GSS data on a CALL"""
         if self.credential.flavor != RPCSEC_GSS:
@@ -23,7 +23,7 @@ from rpc_const import *
 import nfstest_config as c
 from baseobj import BaseObj
 from rpc_creds import rpc_credential
-from packet.nfs.nfs4lib import FancyNFS4Unpacker
+from packet.nfs.nfs4lib import FancyNFS4Unpacker, PayloadNFS4Unpacker
 
 # Module constants
 __author__    = 'Jorge Mora (%s)' % c.NFSTEST_AUTHOR_EMAIL
@@ -35,6 +35,7 @@ class Header(BaseObj):
     """Header object"""
     # Class attributes
     _attrlist = ("size", "last_fragment")
+    __slots__ = _attrlist
 
     def __init__(self, size, last_fragment):
         """Constructor which takes the size and last fragment as inputs"""
@@ -51,6 +52,51 @@ class Prog(BaseObj):
         self.low  = unpack.unpack_uint()
         self.high = unpack.unpack_uint()
 
+class CallInfo(BaseObj):
+    """CallInfo object
+
+       Summary of an RPC call kept in the xid map until its reply is
+       decoded instead of the whole call packet, so calls having large
+       payloads, e.g., NFS WRITE, do not keep their data around.
+
+       CallInfo(
+           xid         = int,  # Transaction identifier
+           program     = int,  # RPC program number
+           version     = int,  # RPC program version
+           procedure   = int,  # RPC procedure number
+           flavor      = int,  # Credential flavor
+           gss_proc    = int,  # Only for RPCSEC_GSS credentials
+           gss_service = int,  # Only for RPCSEC_GSS credentials
+           gss_version = int,  # Only for RPCSEC_GSS credentials
+           index       = int,  # Packet index of call
+           secs        = float,# Timestamp of call
+       )
+    """
+    # Class attributes
+    _attrlist = ("xid", "program", "version", "procedure", "flavor",
+                 "gss_proc", "gss_service", "gss_version", "index", "secs")
+    __slots__ = _attrlist
+
+    def __init__(self, rpc, index, secs):
+        """Constructor which takes the RPC call object, the packet index
+           and timestamp of the call as inputs
+        """
+        self.xid       = rpc.xid
+        self.program   = rpc.program
+        self.version   = rpc.version
+        self.procedure = rpc.procedure
+        self.flavor    = rpc.credential.flavor
+        if self.flavor == RPCSEC_GSS:
+            self.gss_proc    = rpc.credential.gss_proc
+            self.gss_service = rpc.credential.gss_service
+            self.gss_version = rpc.credential.gss_version
+        else:
+            self.gss_proc    = None
+            self.gss_service = None
+            self.gss_version = None
+        self.index = index
+        self.secs  = secs
+
 class RPC(GSS):
     """RPC object
 
@@ -133,6 +179,8 @@ class RPC(GSS):
                  "procedure", "reply_status", "credential", "verifier",
                  "accepted_status", "prog_mismatch", "rejected_status",
                  "rpc_mismatch", "auth_status")
+    __slots__ = _attrlist + ("fragment_hdr", "data", "_rpc", "_pktt",
+                             "_proto", "_state")
 
     def __init__(self, pktt, proto, state=True):
         """Constructor
@@ -240,29 +288,44 @@ class RPC(GSS):
 
         xid = self.xid
         if self.type == CALL:
-            # Save call packet in the xid map
-            pktt._rpc_xid_map[xid] = pktt.pkt
+            # Save call summary in the xid map, a re-transmitted call is
+            # moved to the end of the map as the most recent call
+            record = pktt.pkt.record
+            pkt_call = pktt._rpc_xid_map.pop(xid, None)
+            if pkt_call is not None and pktt._rpc_removed is not None:
+                pktt._rpc_removed.append(pkt_call.index)
+            pktt._rpc_xid_map[xid] = CallInfo(self, record.index, record.secs)
             pktt.pkt_call = None
+            pktt._evict_calls(record.secs)
         elif self.type == REPLY:
-            try:
-                pkt_call = pktt._rpc_xid_map.get(self.xid, None)
-                rpc_header = pkt_call.rpc
+            pkt_call = pktt._rpc_xid_map.get(xid, None)
+            if pkt_call is not None:
                 pktt.pkt_call = pkt_call
-
-                self.program   = rpc_header.program
-                self.version   = rpc_header.version
-                self.procedure = rpc_header.procedure
-                if rpc_header.credential.flavor == RPCSEC_GSS:
-                    self.verifier.gss_proc    = rpc_header.credential.gss_proc
-                    self.verifier.gss_service = rpc_header.credential.gss_service
-                    self.verifier.gss_version = rpc_header.credential.gss_version
-            except Exception:
-                pass
+                self.program   = pkt_call.program
+                self.version   = pkt_call.version
+                self.procedure = pkt_call.procedure
+                if pkt_call.flavor == RPCSEC_GSS and getattr(self, 'verifier', None) is not None:
+                    self.verifier.gss_proc    = pkt_call.gss_proc
+                    self.verifier.gss_service = pkt_call.gss_service
+                    self.verifier.gss_version = pkt_call.gss_version
 
     def __nonzero__(self):
         """Truth value testing for the built-in operation bool()"""
         return self._rpc
 
+    def __getstate__(self):
+        """Return state of object for pickling, the packet trace object
+           is not included since it is only needed while decoding.
+        """
+        state = self._attrdict()
+        state.pop('_pktt', None)
+        return state
+
+    def __setstate__(self, state):
+        """Restore state of object after unpickling"""
+        for name, value in state.iteritems():
+            setattr(self, name, value)
+
     def __str__(self):
         """String representation of object
 
@@ -383,8 +446,13 @@ class RPC(GSS):
         try:
             if procedure == 1 and ((not cb_flag and version == 4) or
                                    (cb_flag and version == 1)):
-                # Create object to unpack the NFS layer
-                unpacker = FancyNFS4Unpacker(unpack.getbytes())
+                # Create object to unpack the NFS layer directly from the
+                # working buffer starting at the current offset
+                if pktt.payload_views:
+                    unpacker = PayloadNFS4Unpacker(unpack.getbuffer())
+                else:
+                    unpacker = FancyNFS4Unpacker(unpack.getbuffer())
+                unpacker.set_position(unpack.tell())
                 unpacker.check_enum = False
                 if self.type == CALL:
                     # RPC call
@@ -406,7 +474,7 @@ class RPC(GSS):
                         ret = unpacker.unpack_COMPOUND4res()
 
                 # Position data pointer to include bytes processed by NFS
-                unpack.seek(unpack.tell() + unpacker.get_position())
+                unpack.seek(unpacker.get_position())
                 self.decode_gss_checksum()
         except Exception:
             # Could not decode NFS packet
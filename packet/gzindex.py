@@ -0,0 +1,407 @@
+#===============================================================================
+# Copyright 2012 NetApp, Inc. All Rights Reserved,
+# contribution by Jorge Mora <mora@netapp.com>
+#
+# This program is free software; you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation; either version 2 of the License, or (at your option) any later
+# version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#===============================================================================
+"""
+Gzip index module
+
+Provides a read-only file object for gzip compressed files which supports
+random access by keeping an index of access points into the compressed data.
+The zlib library is used through ctypes so the access points can be saved
+and given to a new object, if it is not available the access points are
+copies of the decompressor state which can only be used by this process.
+"""
+import zlib
+import ctypes
+import bisect
+import ctypes.util
+import nfstest_config as c
+
+# Module constants
+__author__    = 'Jorge Mora (%s)' % c.NFSTEST_AUTHOR_EMAIL
+__version__   = '1.0'
+__copyright__ = "Copyright (C) 2012 NetApp, Inc."
+__license__   = "GPL v2"
+
+# Decompress gzip header and trailer
+_GZIP_WBITS = 16 + zlib.MAX_WBITS
+# Number of compressed bytes read at a time
+_CHUNK_SIZE = 32768
+# Size of the deflate history window kept for each access point
+_WINDOW_SIZE = 32768
+# Size of the output buffer of the zlib inflate interface
+_OUT_SIZE = 262144
+
+# zlib return codes and flush values
+Z_OK         = 0
+Z_STREAM_END = 1
+Z_BUF_ERROR  = -5
+Z_BLOCK      = 5
+
+class _ZStream(ctypes.Structure):
+    """zlib z_stream structure"""
+    _fields_ = [
+        ("next_in",   ctypes.c_void_p),
+        ("avail_in",  ctypes.c_uint),
+        ("total_in",  ctypes.c_ulong),
+        ("next_out",  ctypes.c_void_p),
+        ("avail_out", ctypes.c_uint),
+        ("total_out", ctypes.c_ulong),
+        ("msg",       ctypes.c_char_p),
+        ("state",     ctypes.c_void_p),
+        ("zalloc",    ctypes.c_void_p),
+        ("zfree",     ctypes.c_void_p),
+        ("opaque",    ctypes.c_void_p),
+        ("data_type", ctypes.c_int),
+        ("adler",     ctypes.c_ulong),
+        ("reserved",  ctypes.c_ulong),
+    ]
+
+def _libz():
+    """Return the zlib library or None if it is not available."""
+    try:
+        libz = ctypes.CDLL(ctypes.util.find_library('z') or 'libz.so.1')
+        pstrm = ctypes.POINTER(_ZStream)
+        libz.zlibVersion.restype = ctypes.c_char_p
+        libz.inflateInit2_.argtypes = [pstrm, ctypes.c_int, ctypes.c_char_p, ctypes.c_int]
+        libz.inflate.argtypes = [pstrm, ctypes.c_int]
+        libz.inflatePrime.argtypes = [pstrm, ctypes.c_int, ctypes.c_int]
+        libz.inflateSetDictionary.argtypes = [pstrm, ctypes.c_char_p, ctypes.c_uint]
+        libz.inflateEnd.argtypes = [pstrm]
+        return libz
+    except (OSError, AttributeError):
+        return None
+
+_LIBZ = _libz()
+
+class _Inflate(object):
+    """Decompressor object using the zlib library directly. It has the
+       same interface as the object returned by zlib.decompressobj() but
+       it also gives the deflate block boundaries found by the last call
+       to decompress() so decompression can be restarted at any of them
+       using only the history window and the bits of the last byte used.
+    """
+    def __init__(self, wbits, bits=0, value=0, window=''):
+        """Constructor
+
+           Initialize object's private data.
+
+           wbits:
+               Window size and format as in zlib.decompressobj(), raw
+               deflate data is expected to be followed by the gzip trailer
+           bits:
+               Number of bits to insert before the compressed data
+               [default: 0]
+           value:
+               Value of the bits to insert [default: 0]
+           window:
+               History window for raw deflate data [default: '']
+        """
+        self.unused_data = ''
+        # Block boundaries as (output offset, input offset, bits) where
+        # bits is the number of bits of the last input byte not yet used
+        self.blocks = []
+        self._strm = _ZStream()
+        self._out  = ctypes.create_string_buffer(_OUT_SIZE)
+        self._hist = window[-_WINDOW_SIZE:] # History after last output
+        self._prev = ''    # History before last output
+        self._data = ''    # Last output
+        self._end  = False # End of deflate stream
+        # Number of bytes in the gzip trailer to skip
+        self._trailer = 8 if wbits < 0 else 0
+        ret = _LIBZ.inflateInit2_(ctypes.byref(self._strm), wbits,
+                                  _LIBZ.zlibVersion(), ctypes.sizeof(_ZStream))
+        if ret != Z_OK:
+            self._strm = None
+            raise zlib.error("Error %d while initializing decompressor" % ret)
+        if bits:
+            _LIBZ.inflatePrime(ctypes.byref(self._strm), bits, value)
+        if wbits < 0 and self._hist:
+            _LIBZ.inflateSetDictionary(ctypes.byref(self._strm), self._hist, len(self._hist))
+
+    def __del__(self):
+        """Destructor
+
+           Free the decompressor state.
+        """
+        if _LIBZ is not None and self._strm is not None:
+            _LIBZ.inflateEnd(ctypes.byref(self._strm))
+
+    def _unused(self, data):
+        """Add data after the end of the deflate stream to unused_data."""
+        skip = min(self._trailer, len(data))
+        self._trailer -= skip
+        self.unused_data += data[skip:]
+
+    def decompress(self, data):
+        """Decompress data and return the uncompressed data."""
+        self.blocks = []
+        self._prev = self._hist
+        self._data = ''
+        if self._end:
+            self._unused(data)
+            return ''
+        strm = self._strm
+        cbuf = ctypes.c_char_p(data)
+        strm.next_in = ctypes.cast(cbuf, ctypes.c_void_p)
+        strm.avail_in = len(data)
+        addr = ctypes.addressof(self._out)
+        out = []
+        size = 0
+        while True:
+            strm.next_out = addr
+            strm.avail_out = _OUT_SIZE
+            ret = _LIBZ.inflate(ctypes.byref(strm), Z_BLOCK)
+            count = _OUT_SIZE - strm.avail_out
+            if count:
+                out.append(ctypes.string_at(addr, count))
+                size += count
+            if ret == Z_STREAM_END:
+                self._end = True
+                self._unused(data[len(data)-strm.avail_in:])
+                break
+            elif ret == Z_BUF_ERROR:
+                # No progress is possible, all input has been used
+                break
+            elif ret != Z_OK:
+                raise zlib.error("Error %d while decompressing data: %s" % (ret, strm.msg))
+            if strm.data_type & 128 and not strm.data_type & 64:
+                # End of a deflate block which is not the last one
+                self.blocks.append((size, len(data) - strm.avail_in, strm.data_type & 7))
+        self._data = ''.join(out)
+        self._hist = (self._hist + self._data[-_WINDOW_SIZE:])[-_WINDOW_SIZE:]
+        return self._data
+
+    def flush(self):
+        """Return the uncompressed data not yet returned."""
+        return self.decompress('')
+
+    def window(self, offset):
+        """Return the history window at the given offset of the data
+           returned by the last call to decompress().
+        """
+        data = self._data[max(0, offset - _WINDOW_SIZE):offset]
+        return (self._prev + data)[-_WINDOW_SIZE:]
+
+class GzipIndex(object):
+    """Gzip index object
+
+       Usage:
+           from packet.gzindex import GzipIndex
+
+           x = GzipIndex(open("/traces/tracefile.cap.gz", "rb"))
+
+           # Read data
+           data = x.read(16)
+
+           # Re-position the file pointer, decompression is resumed from
+           # the nearest access point before the given offset instead of
+           # decompressing the file from the beginning
+           x.seek(offset)
+
+           # Get current uncompressed offset
+           offset = x.tell()
+
+       An access point is added to the index every span bytes of
+       uncompressed data while the file is being read. Each access point
+       is the end of a deflate block at a known offset in the compressed
+       file together with the last 32KB of uncompressed data before it,
+       so it is returned by points() to be saved along with the packet
+       index and given back to a new object by add_points(). The start
+       of each gzip member is also an access point which does not depend
+       on any previous data. If the zlib library cannot be used through
+       ctypes, each access point is a copy of the decompressor state and
+       only the start of each gzip member is returned by points().
+    """
+    def __init__(self, fh, span=8388608, index=None):
+        """Constructor
+
+           Initialize object's private data.
+
+           fh:
+               File object opened for reading the compressed file
+           span:
+               Distance in bytes of uncompressed data between access
+               points, each access point takes about 32KB of memory
+               [default: 8388608]
+           index:
+               GzipIndex object of the same compressed file to start with
+               all its access points, e.g., when the file is re-opened
+               [default: None]
+        """
+        self.fh   = fh
+        self.span = span
+        if index is None:
+            self._uoff   = [0]        # Uncompressed offsets of access points
+            # Compressed offset and decompressor state: None for the
+            # start of a gzip member, (bits, window) for the end of a
+            # deflate block or a copy of the decompressor
+            self._points = [(0, None)]
+        else:
+            self._uoff   = index._uoff
+            self._points = index._points
+        self._restore(0)
+
+    def _restore(self, idx):
+        """Restart decompression from the access point given by idx."""
+        coffset, state = self._points[idx]
+        if state is None:
+            self.fh.seek(coffset)
+            self._dobj = self._decompressobj()
+        elif isinstance(state, tuple):
+            # Insert the bits of the last byte not yet used
+            bits, window = state
+            value = 0
+            self.fh.seek(coffset - (1 if bits else 0))
+            if bits:
+                value = ord(self.fh.read(1)) >> (8 - bits)
+            self._dobj = _Inflate(-zlib.MAX_WBITS, bits, value, window)
+        else:
+            self.fh.seek(coffset)
+            self._dobj = state.copy()
+        self._coff  = coffset       # Compressed offset of next input
+        self._data  = ''            # Uncompressed data not yet read
+        self._start = self._uoff[idx] # Uncompressed offset of self._data
+        self._pos   = self._start   # Current uncompressed offset
+        self._eof   = False
+
+    def _decompressobj(self):
+        """Return a new decompressor for a gzip member."""
+        if _LIBZ is None:
+            return zlib.decompressobj(_GZIP_WBITS)
+        return _Inflate(_GZIP_WBITS)
+
+    def _add_point(self, uoffset, coffset, state):
+        """Add access point to the index if it is not there yet."""
+        idx = bisect.bisect_left(self._uoff, uoffset)
+        if idx == len(self._uoff) or self._uoff[idx] != uoffset:
+            self._uoff.insert(idx, uoffset)
+            self._points.insert(idx, (coffset, state))
+
+    def _add_blocks(self, uoffset, coffset):
+        """Add an access point at the end of the deflate blocks found by
+           the last call to decompress() every span bytes.
+
+           uoffset:
+               Uncompressed offset of the data returned by decompress()
+           coffset:
+               Compressed offset of the data given to decompress()
+        """
+        for outpos, inpos, bits in getattr(self._dobj, 'blocks', ()):
+            if uoffset + outpos >= self._uoff[-1] + self.span:
+                window = self._dobj.window(outpos)
+                self._add_point(uoffset + outpos, coffset + inpos, (bits, window))
+
+    def _decompress(self):
+        """Decompress the next chunk of data and append it to the
+           uncompressed data not yet read. Return False on end of file.
+        """
+        if self._eof:
+            return False
+        cdata = self.fh.read(_CHUNK_SIZE)
+        if not cdata:
+            self._eof = True
+            self._data += self._dobj.flush()
+            return False
+        self._coff += len(cdata)
+        data = self._dobj.decompress(cdata)
+        self._add_blocks(self._start + len(self._data), self._coff - len(cdata))
+        udata = self._dobj.unused_data
+        while udata:
+            # End of gzip member, next member starts right after it
+            # skipping any zero padding
+            data += self._dobj.flush()
+            udata = udata.lstrip('\x00')
+            if not udata:
+                break
+            uoffset = self._start + len(self._data) + len(data)
+            coffset = self._coff - len(udata)
+            self._add_point(uoffset, coffset, None)
+            self._dobj = self._decompressobj()
+            data += self._dobj.decompress(udata)
+            self._add_blocks(uoffset, coffset)
+            udata = self._dobj.unused_data
+        self._data += data
+
+        uoffset = self._start + len(self._data)
+        if _LIBZ is None and uoffset >= self._uoff[-1] + self.span and \
+           not self._dobj.unused_data:
+            # All input consumed, save decompressor state
+            self._add_point(uoffset, self._coff, self._dobj.copy())
+        return True
+
+    def read(self, size=-1):
+        """Read at most size bytes, if size is negative read until
+           the end of file.
+        """
+        offset = self._pos - self._start
+        while (size < 0 or len(self._data) - offset < size) and self._decompress():
+            pass
+        if size < 0:
+            data = self._data[offset:]
+        else:
+            data = self._data[offset:offset+size]
+        self._pos += len(data)
+        if self._pos - self._start > _CHUNK_SIZE:
+            # Discard the data already read
+            self._data  = self._data[self._pos - self._start:]
+            self._start = self._pos
+        return data
+
+    def seek(self, offset, whence=0):
+        """Set the current uncompressed offset, the whence argument
+           is 0 (absolute) or 1 (relative to the current offset).
+        """
+        if whence == 1:
+            offset += self._pos
+        elif whence != 0:
+            raise IOError("Seek from end not supported")
+        end = self._start + len(self._data)
+        if offset < self._start or offset > end:
+            # Restart decompression from the nearest access point
+            # unless the current position is closer
+            idx = bisect.bisect_right(self._uoff, offset) - 1
+            if offset < self._start or self._uoff[idx] > end:
+                self._restore(idx)
+            # Decompress and discard data up to the given offset
+            while self._start + len(self._data) < offset:
+                if not self._decompress():
+                    break
+                if len(self._data) > _CHUNK_SIZE:
+                    skip = min(len(self._data), offset - self._start)
+                    self._data  = self._data[skip:]
+                    self._start += skip
+        self._pos = offset
+
+    def tell(self):
+        """Return current uncompressed offset."""
+        return self._pos
+
+    def points(self):
+        """Return a list of (uoffset, coffset, state) for all access points
+           found so far which can be saved, where uoffset is the
+           uncompressed offset, coffset is the compressed offset and state
+           is None for the start of a gzip member or (bits, window) for
+           the end of a deflate block.
+        """
+        return [(self._uoff[i], p[0], p[1]) for i, p in enumerate(self._points)
+                if p[1] is None or isinstance(p[1], tuple)]
+
+    def add_points(self, plist):
+        """Add list of access points as returned by points()."""
+        for uoffset, coffset, state in plist:
+            if state is None or _LIBZ is not None:
+                self._add_point(uoffset, coffset, state)
+
+    def close(self):
+        """Close the compressed file."""
+        self.fh.close()
@@ -0,0 +1,161 @@
+#===============================================================================
+# Copyright 2012 NetApp, Inc. All Rights Reserved,
+# contribution by Jorge Mora <mora@netapp.com>
+#
+# This program is free software; you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation; either version 2 of the License, or (at your option) any later
+# version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#===============================================================================
+"""
+Inotify module
+
+Provides a way to wait for a file to be written or for a new file to be
+created in the same directory. It uses the Linux inotify interface through
+ctypes, if it is not available it falls back to sleeping for the given
+timeout.
+"""
+import os
+import time
+import errno
+import ctypes
+import select
+import struct
+import ctypes.util
+import nfstest_config as c
+
+# Module constants
+__author__    = 'Jorge Mora (%s)' % c.NFSTEST_AUTHOR_EMAIL
+__version__   = '1.0'
+__copyright__ = "Copyright (C) 2012 NetApp, Inc."
+__license__   = "GPL v2"
+
+# Inotify event masks
+IN_MODIFY      = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO    = 0x00000080
+IN_CREATE      = 0x00000100
+IN_CLOEXEC     = 0o2000000
+IN_NONBLOCK    = 0o4000
+
+# Inotify event header: wd, mask, cookie and length of name
+_EVENT_HEADER = struct.Struct('iIII')
+
+def _libc():
+    """Return the C library or None if inotify is not supported."""
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+        libc.inotify_init1
+        libc.inotify_add_watch
+        return libc
+    except (OSError, AttributeError):
+        return None
+
+class Inotify(object):
+    """Inotify object
+
+       Usage:
+           from packet.inotify import Inotify
+
+           x = Inotify("/traces/tracefile.cap")
+
+           # Wait at most a second for the file to be written or for
+           # another file starting with the same name to be created
+           x.wait(1)
+
+           # Release resources
+           x.close()
+    """
+    def __init__(self, path):
+        """Constructor
+
+           Initialize object's private data and start watching the
+           directory of the given file.
+
+           path:
+               Name of file to follow, all events in its directory for
+               files starting with the same name are reported, e.g.,
+               writes to the file and the creation of the next file
+               by tcpdump when using the '-C' option
+        """
+        self.fd = None
+        self.prefix = os.path.basename(path)
+        libc = _libc()
+        if libc is None:
+            return
+        fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if fd < 0:
+            return
+        dirname = os.path.dirname(os.path.abspath(path))
+        mask = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE
+        if libc.inotify_add_watch(fd, dirname, mask) < 0:
+            os.close(fd)
+            return
+        self.fd = fd
+
+    def __del__(self):
+        """Destructor
+
+           Gracefully close the inotify file descriptor.
+        """
+        self.close()
+
+    def _events(self):
+        """Read all pending events and return True if any of them is for
+           a file starting with the name given in the constructor.
+        """
+        ret = False
+        while True:
+            try:
+                data = os.read(self.fd, 65536)
+            except OSError as e:
+                if e.errno == errno.EINTR:
+                    continue
+                break
+            if not data:
+                break
+            offset = 0
+            while offset < len(data):
+                wd, mask, cookie, size = _EVENT_HEADER.unpack_from(data, offset)
+                offset += _EVENT_HEADER.size
+                name = data[offset:offset+size].rstrip('\0')
+                offset += size
+                if name.startswith(self.prefix):
+                    ret = True
+        return ret
+
+    def wait(self, timeout):
+        """Wait for the file to be written or for another file starting
+           with the same name to be created. Return True if an event was
+           received or False if the timeout expired.
+
+           timeout:
+               Maximum number of seconds to wait, it is also used in case
+               the file is modified without generating any events, e.g.,
+               a file in an NFS mount written by another client
+        """
+        if self.fd is None:
+            time.sleep(timeout)
+            return False
+        etime = time.time() + timeout
+        while True:
+            try:
+                rlist = select.select([self.fd], [], [], max(0, etime - time.time()))[0]
+            except select.error as e:
+                if e.args[0] == errno.EINTR:
+                    continue
+                raise
+            if not rlist:
+                return False
+            if self._events():
+                return True
+
+    def close(self):
+        """Stop watching the directory."""
+        if self.fd is not None:
+            os.close(self.fd)
+            self.fd = None
@@ -31,14 +31,20 @@ __license__   = "GPL v2"
 _IP_map = {1:'ICMP', 2:'IGMP', 6:'TCP', 17:'UDP' }
 
 class Flags(BaseObj):
-    """Flags object"""
+    """Flags object
+
+       Only the raw value is stored, each flag is computed when accessed.
+    """
     # Class attributes
     _attrlist = ("DF", "MF")
+    __slots__ = ("_data",)
 
     def __init__(self, data):
         """Constructor which takes a single byte as input"""
-        self.DF = ((data >> 14) & 0x01) # Don't Fragment
-        self.MF = ((data >> 13) & 0x01) # More Fragments
+        self._data = data
+
+    DF = property(lambda self: (self._data >> 14) & 0x01) # Don't Fragment
+    MF = property(lambda self: (self._data >> 13) & 0x01) # More Fragments
 
 class IPv4(BaseObj):
     """IPv4 object
@@ -77,6 +83,7 @@ class IPv4(BaseObj):
     _attrlist = ("version", "IHL", "header_size", "DSCP", "ECN", "total_size",
                  "id", "flags", "fragment_offset", "TTL", "protocol",
                  "checksum", "src", "dst", "options", "data")
+    __slots__ = _attrlist
 
     def __init__(self, pktt):
         """Constructor
@@ -113,8 +120,9 @@ class IPv4(BaseObj):
             self.options = unpack.read(osize)
 
         if self.protocol == 6:
-            # Decode TCP
-            TCP(pktt)
+            if 'tcp' in pktt._decode_layers:
+                # Decode TCP
+                TCP(pktt)
         else:
             self.data = unpack.getbytes()
 
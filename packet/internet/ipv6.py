@@ -78,7 +78,8 @@ class IPv6(IPv4):
         pktt.pkt.ip = self
 
         if self.protocol == 6:
-            # Decode TCP
-            TCP(pktt)
+            if 'tcp' in pktt._decode_layers:
+                # Decode TCP
+                TCP(pktt)
         else:
             self.data = unpack.getbytes()
@@ -52,6 +52,7 @@ class ETHERNET(BaseObj):
     """
     # Class attributes
     _attrlist = ("dst", "src", "type", "data")
+    __slots__ = _attrlist
 
     def __init__(self, pktt):
         """Constructor
@@ -69,7 +70,10 @@ class ETHERNET(BaseObj):
         self.type = ulist[2]
         pktt.pkt.ethernet = self
 
-        if self.type == 0x0800:
+        if 'ip' not in pktt._decode_layers:
+            # Decoding stops at this layer
+            return
+        elif self.type == 0x0800:
             # Decode IPv4 packet
             IPv4(pktt)
         elif self.type == 0x86dd:
@@ -0,0 +1,457 @@
+# Generated by create_opattr.py from nfs4_type.py on Fri Oct 16 22:37:05 2026
+"""
+Maps of attribute name to the set of operation numbers where the attribute
+is reachable from the nfs_argop4/nfs_resop4 object (including callbacks),
+the attribute is reachable from all operations if the set is None.
+"""
+import nfs4_const as const
+
+# Arguments: nfs_argop4 and nfs_cb_argop4
+opattr_args = {
+    'access':              frozenset([const.OP_ACCESS]),
+    'argop':               None,
+    'attr_request':        frozenset([const.OP_CB_GETATTR, const.OP_GETATTR, const.OP_READDIR]),
+    'attr_vals':           frozenset([const.OP_NVERIFY, const.OP_VERIFY]),
+    'attrmask':            frozenset([const.OP_NVERIFY, const.OP_VERIFY]),
+    'bca_cb_program':      frozenset([const.OP_BACKCHANNEL_CTL]),
+    'bca_sec_parms':       frozenset([const.OP_BACKCHANNEL_CTL]),
+    'bctsa_dir':           frozenset([const.OP_BIND_CONN_TO_SESSION]),
+    'bctsa_sessid':        frozenset([const.OP_BIND_CONN_TO_SESSION]),
+    'bctsa_use_conn_in_rdma_mode': frozenset([const.OP_BIND_CONN_TO_SESSION]),
+    'callback':            frozenset([const.OP_SETCLIENTID]),
+    'callback_ident':      frozenset([const.OP_SETCLIENTID]),
+    'claim':               frozenset([const.OP_OPEN]),
+    'client':              frozenset([const.OP_SETCLIENTID]),
+    'clientid':            frozenset([const.OP_DELEGPURGE, const.OP_CB_NOTIFY_LOCK, const.OP_LOCKT, const.OP_RENEW, const.OP_SETCLIENTID_CONFIRM, const.OP_RELEASE_LOCKOWNER]),
+    'clora_changed':       frozenset([const.OP_CB_LAYOUTRECALL]),
+    'clora_iomode':        frozenset([const.OP_CB_LAYOUTRECALL]),
+    'clora_recall':        frozenset([const.OP_CB_LAYOUTRECALL]),
+    'clora_type':          frozenset([const.OP_CB_LAYOUTRECALL]),
+    'cna_changes':         frozenset([const.OP_CB_NOTIFY]),
+    'cna_fh':              frozenset([const.OP_CB_NOTIFY]),
+    'cna_stateid':         frozenset([const.OP_CB_NOTIFY]),
+    'cnda_changes':        frozenset([const.OP_CB_NOTIFY_DEVICEID]),
+    'cnla_fh':             frozenset([const.OP_CB_NOTIFY_LOCK]),
+    'cnla_lock_owner':     frozenset([const.OP_CB_NOTIFY_LOCK]),
+    'cookie':              frozenset([const.OP_READDIR]),
+    'cookieverf':          frozenset([const.OP_READDIR]),
+    'count':               frozenset([const.OP_COMMIT, const.OP_READ]),
+    'cpda_delegation':     frozenset([const.OP_CB_PUSH_DELEG]),
+    'cpda_fh':             frozenset([const.OP_CB_PUSH_DELEG]),
+    'craa_objects_to_keep': frozenset([const.OP_CB_RECALL_ANY, const.OP_CB_RECALLABLE_OBJ_AVAIL]),
+    'craa_type_mask':      frozenset([const.OP_CB_RECALL_ANY, const.OP_CB_RECALLABLE_OBJ_AVAIL]),
+    'createattrs':         frozenset([const.OP_CREATE]),
+    'createdir':           frozenset([const.OP_OPENATTR]),
+    'csa_back_chan_attrs': frozenset([const.OP_CREATE_SESSION]),
+    'csa_cachethis':       frozenset([const.OP_CB_SEQUENCE]),
+    'csa_cb_program':      frozenset([const.OP_CREATE_SESSION]),
+    'csa_clientid':        frozenset([const.OP_CREATE_SESSION]),
+    'csa_flags':           frozenset([const.OP_CREATE_SESSION]),
+    'csa_fore_chan_attrs': frozenset([const.OP_CREATE_SESSION]),
+    'csa_highest_slotid':  frozenset([const.OP_CB_SEQUENCE]),
+    'csa_referring_call_lists': frozenset([const.OP_CB_SEQUENCE]),
+    'csa_sec_parms':       frozenset([const.OP_CREATE_SESSION]),
+    'csa_sequence':        frozenset([const.OP_CREATE_SESSION]),
+    'csa_sequenceid':      frozenset([const.OP_CB_SEQUENCE]),
+    'csa_sessionid':       frozenset([const.OP_CB_SEQUENCE]),
+    'csa_slotid':          frozenset([const.OP_CB_SEQUENCE]),
+    'cwca_contended_wants_cancelled': frozenset([const.OP_CB_WANTS_CANCELLED]),
+    'cwca_resourced_wants_cancelled': frozenset([const.OP_CB_WANTS_CANCELLED]),
+    'data':                frozenset([const.OP_WRITE]),
+    'dc_claim':            frozenset([const.OP_WANT_DELEGATION]),
+    'dc_delegate_type':    frozenset([const.OP_WANT_DELEGATION]),
+    'dca_clientid':        frozenset([const.OP_DESTROY_CLIENTID]),
+    'definition':          None,
+    'deleg_stateid':       frozenset([const.OP_DELEGRETURN]),
+    'delegation_type':     frozenset([const.OP_CB_PUSH_DELEG]),
+    'dircount':            frozenset([const.OP_READDIR]),
+    'dsa_sessionid':       frozenset([const.OP_DESTROY_SESSION]),
+    'eia_client_impl_id':  frozenset([const.OP_EXCHANGE_ID]),
+    'eia_clientowner':     frozenset([const.OP_EXCHANGE_ID]),
+    'eia_flags':           frozenset([const.OP_EXCHANGE_ID]),
+    'eia_state_protect':   frozenset([const.OP_EXCHANGE_ID]),
+    'fh':                  frozenset([const.OP_CB_GETATTR, const.OP_CB_RECALL]),
+    'fsa_stateid':         frozenset([const.OP_FREE_STATEID]),
+    'gdda_child_attr_delay': frozenset([const.OP_GET_DIR_DELEGATION]),
+    'gdda_child_attributes': frozenset([const.OP_GET_DIR_DELEGATION]),
+    'gdda_dir_attr_delay': frozenset([const.OP_GET_DIR_DELEGATION]),
+    'gdda_dir_attributes': frozenset([const.OP_GET_DIR_DELEGATION]),
+    'gdda_notification_types': frozenset([const.OP_GET_DIR_DELEGATION]),
+    'gdda_signal_deleg_avail': frozenset([const.OP_GET_DIR_DELEGATION]),
+    'gdia_device_id':      frozenset([const.OP_GETDEVICEINFO]),
+    'gdia_layout_type':    frozenset([const.OP_GETDEVICEINFO]),
+    'gdia_maxcount':       frozenset([const.OP_GETDEVICEINFO]),
+    'gdia_notify_types':   frozenset([const.OP_GETDEVICEINFO]),
+    'gdla_cookie':         frozenset([const.OP_GETDEVICELIST]),
+    'gdla_cookieverf':     frozenset([const.OP_GETDEVICELIST]),
+    'gdla_layout_type':    frozenset([const.OP_GETDEVICELIST]),
+    'gdla_maxdevices':     frozenset([const.OP_GETDEVICELIST]),
+    'length':              frozenset([const.OP_LOCK, const.OP_LOCKT, const.OP_LOCKU]),
+    'loca_last_write_offset': frozenset([const.OP_LAYOUTCOMMIT]),
+    'loca_layoutupdate':   frozenset([const.OP_LAYOUTCOMMIT]),
+    'loca_length':         frozenset([const.OP_LAYOUTCOMMIT]),
+    'loca_offset':         frozenset([const.OP_LAYOUTCOMMIT]),
+    'loca_reclaim':        frozenset([const.OP_LAYOUTCOMMIT]),
+    'loca_stateid':        frozenset([const.OP_LAYOUTCOMMIT]),
+    'loca_time_modify':    frozenset([const.OP_LAYOUTCOMMIT]),
+    'lock_owner':          frozenset([const.OP_LOCK, const.OP_RELEASE_LOCKOWNER]),
+    'lock_seqid':          frozenset([const.OP_LOCK]),
+    'lock_stateid':        frozenset([const.OP_LOCK, const.OP_LOCKU]),
+    'locker':              frozenset([const.OP_LOCK]),
+    'locktype':            frozenset([const.OP_LOCK, const.OP_LOCKT, const.OP_LOCKU]),
+    'loga_iomode':         frozenset([const.OP_LAYOUTGET]),
+    'loga_layout_type':    frozenset([const.OP_LAYOUTGET]),
+    'loga_length':         frozenset([const.OP_LAYOUTGET]),
+    'loga_maxcount':       frozenset([const.OP_LAYOUTGET]),
+    'loga_minlength':      frozenset([const.OP_LAYOUTGET]),
+    'loga_offset':         frozenset([const.OP_LAYOUTGET]),
+    'loga_signal_layout_avail': frozenset([const.OP_LAYOUTGET]),
+    'loga_stateid':        frozenset([const.OP_LAYOUTGET]),
+    'lor_fh':              frozenset([const.OP_CB_LAYOUTRECALL]),
+    'lor_fsid':            frozenset([const.OP_CB_LAYOUTRECALL]),
+    'lor_layout':          frozenset([const.OP_CB_LAYOUTRECALL]),
+    'lor_length':          frozenset([const.OP_CB_LAYOUTRECALL]),
+    'lor_offset':          frozenset([const.OP_CB_LAYOUTRECALL]),
+    'lor_recalltype':      frozenset([const.OP_CB_LAYOUTRECALL]),
+    'lor_stateid':         frozenset([const.OP_CB_LAYOUTRECALL]),
+    'lora_iomode':         frozenset([const.OP_LAYOUTRETURN]),
+    'lora_layout_type':    frozenset([const.OP_LAYOUTRETURN]),
+    'lora_layoutreturn':   frozenset([const.OP_LAYOUTRETURN]),
+    'lora_reclaim':        frozenset([const.OP_LAYOUTRETURN]),
+    'lr_layout':           frozenset([const.OP_LAYOUTRETURN]),
+    'lr_returntype':       frozenset([const.OP_LAYOUTRETURN]),
+    'lrf_body':            frozenset([const.OP_LAYOUTRETURN]),
+    'lrf_length':          frozenset([const.OP_LAYOUTRETURN]),
+    'lrf_offset':          frozenset([const.OP_LAYOUTRETURN]),
+    'lrf_stateid':         frozenset([const.OP_LAYOUTRETURN]),
+    'major':               frozenset([const.OP_CB_LAYOUTRECALL]),
+    'maxcount':            frozenset([const.OP_READDIR]),
+    'minor':               frozenset([const.OP_CB_LAYOUTRECALL]),
+    'name':                frozenset([const.OP_SECINFO]),
+    'new_lock_owner':      frozenset([const.OP_LOCK]),
+    'newname':             frozenset([const.OP_LINK, const.OP_RENAME]),
+    'obj_attributes':      frozenset([const.OP_NVERIFY, const.OP_SETATTR, const.OP_VERIFY]),
+    'object':              frozenset([const.OP_PUTFH]),
+    'objname':             frozenset([const.OP_CREATE, const.OP_LOOKUP]),
+    'objtype':             frozenset([const.OP_CREATE]),
+    'od_whynone':          frozenset([const.OP_CB_PUSH_DELEG]),
+    'offset':              frozenset([const.OP_COMMIT, const.OP_LOCK, const.OP_LOCKT, const.OP_LOCKU, const.OP_READ, const.OP_WRITE]),
+    'oldname':             frozenset([const.OP_RENAME]),
+    'ond_server_will_push_deleg': frozenset([const.OP_CB_PUSH_DELEG]),
+    'ond_server_will_signal_avail': frozenset([const.OP_CB_PUSH_DELEG]),
+    'ond_why':             frozenset([const.OP_CB_PUSH_DELEG]),
+    'opaccess':            None,
+    'opbackchannel_ctl':   None,
+    'opbind_conn_to_session': None,
+    'opcbgetattr':         None,
+    'opcblayoutrecall':    None,
+    'opcbnotify':          None,
+    'opcbnotify_deviceid': None,
+    'opcbnotify_lock':     None,
+    'opcbpush_deleg':      None,
+    'opcbrecall':          None,
+    'opcbrecall_any':      None,
+    'opcbrecall_slot':     None,
+    'opcbrecallable_obj_avail': None,
+    'opcbsequence':        None,
+    'opcbwants_cancelled': None,
+    'opclose':             None,
+    'opcommit':            None,
+    'opcreate':            None,
+    'opcreate_session':    None,
+    'opdelegpurge':        None,
+    'opdelegreturn':       None,
+    'opdestroy_clientid':  None,
+    'opdestroy_session':   None,
+    'open_owner':          frozenset([const.OP_LOCK]),
+    'open_seqid':          frozenset([const.OP_LOCK]),
+    'open_stateid':        frozenset([const.OP_CLOSE, const.OP_LOCK, const.OP_OPEN_CONFIRM, const.OP_OPEN_DOWNGRADE]),
+    'openhow':             frozenset([const.OP_OPEN]),
+    'opexchange_id':       None,
+    'opfree_stateid':      None,
+    'opget_dir_delegation': None,
+    'opgetattr':           None,
+    'opgetdeviceinfo':     None,
+    'opgetdevicelist':     None,
+    'oplayoutcommit':      None,
+    'oplayoutget':         None,
+    'oplayoutreturn':      None,
+    'oplink':              None,
+    'oplock':              None,
+    'oplockt':             None,
+    'oplocku':             None,
+    'oplookup':            None,
+    'opnverify':           None,
+    'opopen':              None,
+    'opopen_confirm':      None,
+    'opopen_downgrade':    None,
+    'opopenattr':          None,
+    'opputfh':             None,
+    'opread':              None,
+    'opreaddir':           None,
+    'opreclaim_complete':  None,
+    'oprelease_lockowner': None,
+    'opremove':            None,
+    'oprename':            None,
+    'oprenew':             None,
+    'opsecinfo':           None,
+    'opsecinfo_no_name':   None,
+    'opsequence':          None,
+    'opset_ssv':           None,
+    'opsetattr':           None,
+    'opsetclientid':       None,
+    'opsetclientid_confirm': None,
+    'optest_stateid':      None,
+    'opverify':            None,
+    'opwant_delegation':   None,
+    'opwrite':             None,
+    'other':               frozenset([const.OP_CB_RECALL, const.OP_CLOSE, const.OP_CB_LAYOUTRECALL, const.OP_CB_NOTIFY, const.OP_DELEGRETURN, const.OP_LOCK, const.OP_LOCKU, const.OP_OPEN_CONFIRM, const.OP_OPEN_DOWNGRADE, const.OP_READ, const.OP_WRITE, const.OP_FREE_STATEID, const.OP_LAYOUTGET, const.OP_LAYOUTRETURN]),
+    'owner':               frozenset([const.OP_CB_NOTIFY_LOCK, const.OP_LOCKT, const.OP_OPEN, const.OP_RELEASE_LOCKOWNER]),
+    'permissions':         frozenset([const.OP_CB_PUSH_DELEG]),
+    'rca_one_fs':          frozenset([const.OP_RECLAIM_COMPLETE]),
+    'read':                frozenset([const.OP_CB_PUSH_DELEG]),
+    'recall':              frozenset([const.OP_CB_PUSH_DELEG]),
+    'reclaim':             frozenset([const.OP_LOCK]),
+    'rsa_target_highest_slotid': frozenset([const.OP_CB_RECALL_SLOT]),
+    'sa_cachethis':        frozenset([const.OP_SEQUENCE]),
+    'sa_highest_slotid':   frozenset([const.OP_SEQUENCE]),
+    'sa_sequenceid':       frozenset([const.OP_SEQUENCE]),
+    'sa_sessionid':        frozenset([const.OP_SEQUENCE]),
+    'sa_slotid':           frozenset([const.OP_SEQUENCE]),
+    'seqid':               frozenset([const.OP_CB_RECALL, const.OP_CLOSE, const.OP_CB_LAYOUTRECALL, const.OP_CB_NOTIFY, const.OP_DELEGRETURN, const.OP_LOCK, const.OP_LOCKU, const.OP_OPEN, const.OP_OPEN_CONFIRM, const.OP_OPEN_DOWNGRADE, const.OP_READ, const.OP_WRITE, const.OP_FREE_STATEID, const.OP_LAYOUTGET, const.OP_LAYOUTRETURN]),
+    'setclientid_confirm': frozenset([const.OP_SETCLIENTID_CONFIRM]),
+    'share_access':        frozenset([const.OP_OPEN, const.OP_OPEN_DOWNGRADE]),
+    'share_deny':          frozenset([const.OP_OPEN, const.OP_OPEN_DOWNGRADE]),
+    'space_limit':         frozenset([const.OP_CB_PUSH_DELEG]),
+    'ssa_digest':          frozenset([const.OP_SET_SSV]),
+    'ssa_ssv':             frozenset([const.OP_SET_SSV]),
+    'stable':              frozenset([const.OP_WRITE]),
+    'stateid':             frozenset([const.OP_CB_RECALL, const.OP_CB_PUSH_DELEG, const.OP_READ, const.OP_SETATTR, const.OP_WRITE]),
+    'target':              frozenset([const.OP_REMOVE]),
+    'truncate':            frozenset([const.OP_CB_RECALL]),
+    'ts_stateids':         frozenset([const.OP_TEST_STATEID]),
+    'wda_claim':           frozenset([const.OP_WANT_DELEGATION]),
+    'wda_want':            frozenset([const.OP_WANT_DELEGATION]),
+    'write':               frozenset([const.OP_CB_PUSH_DELEG]),
+}
+
+# Results: nfs_resop4 and nfs_cb_resop4
+opattr_res = {
+    'access':              frozenset([const.OP_ACCESS]),
+    'after':               frozenset([const.OP_CREATE, const.OP_LINK, const.OP_REMOVE]),
+    'atomic':              frozenset([const.OP_CREATE, const.OP_LINK, const.OP_REMOVE]),
+    'attr_vals':           frozenset([const.OP_CB_GETATTR, const.OP_GETATTR]),
+    'attrmask':            frozenset([const.OP_CB_GETATTR, const.OP_GETATTR]),
+    'attrset':             frozenset([const.OP_CREATE, const.OP_OPEN]),
+    'attrsset':            frozenset([const.OP_SETATTR]),
+    'bcr_status':          frozenset([const.OP_BACKCHANNEL_CTL]),
+    'bctsr_dir':           frozenset([const.OP_BIND_CONN_TO_SESSION]),
+    'bctsr_resok4':        frozenset([const.OP_BIND_CONN_TO_SESSION]),
+    'bctsr_sessid':        frozenset([const.OP_BIND_CONN_TO_SESSION]),
+    'bctsr_status':        frozenset([const.OP_BIND_CONN_TO_SESSION]),
+    'bctsr_use_conn_in_rdma_mode': frozenset([const.OP_BIND_CONN_TO_SESSION]),
+    'before':              frozenset([const.OP_CREATE, const.OP_LINK, const.OP_REMOVE]),
+    'cinfo':               frozenset([const.OP_CREATE, const.OP_LINK, const.OP_OPEN, const.OP_REMOVE]),
+    'client_using':        frozenset([const.OP_SETCLIENTID]),
+    'clientid':            frozenset([const.OP_LOCK, const.OP_LOCKT, const.OP_SETCLIENTID]),
+    'clorr_status':        frozenset([const.OP_CB_LAYOUTRECALL]),
+    'cndr_status':         frozenset([const.OP_CB_NOTIFY_DEVICEID]),
+    'cnlr_status':         frozenset([const.OP_CB_NOTIFY_LOCK]),
+    'cnr_status':          frozenset([const.OP_CB_NOTIFY]),
+    'committed':           frozenset([const.OP_WRITE]),
+    'cookieverf':          frozenset([const.OP_READDIR]),
+    'count':               frozenset([const.OP_WRITE]),
+    'cpdr_status':         frozenset([const.OP_CB_PUSH_DELEG]),
+    'crar_status':         frozenset([const.OP_CB_RECALL_ANY]),
+    'croa_status':         frozenset([const.OP_CB_RECALLABLE_OBJ_AVAIL]),
+    'csr_back_chan_attrs': frozenset([const.OP_CREATE_SESSION]),
+    'csr_flags':           frozenset([const.OP_CREATE_SESSION]),
+    'csr_fore_chan_attrs': frozenset([const.OP_CREATE_SESSION]),
+    'csr_highest_slotid':  frozenset([const.OP_CB_SEQUENCE]),
+    'csr_resok4':          frozenset([const.OP_CB_SEQUENCE, const.OP_CREATE_SESSION]),
+    'csr_sequence':        frozenset([const.OP_CREATE_SESSION]),
+    'csr_sequenceid':      frozenset([const.OP_CB_SEQUENCE]),
+    'csr_sessionid':       frozenset([const.OP_CB_SEQUENCE, const.OP_CREATE_SESSION]),
+    'csr_slotid':          frozenset([const.OP_CB_SEQUENCE]),
+    'csr_status':          frozenset([const.OP_CB_SEQUENCE, const.OP_CREATE_SESSION]),
+    'csr_target_highest_slotid': frozenset([const.OP_CB_SEQUENCE]),
+    'cwcr_status':         frozenset([const.OP_CB_WANTS_CANCELLED]),
+    'da_addr_body':        frozenset([const.OP_GETDEVICEINFO]),
+    'da_layout_type':      frozenset([const.OP_GETDEVICEINFO]),
+    'data':                frozenset([const.OP_READ]),
+    'dcr_status':          frozenset([const.OP_DESTROY_CLIENTID]),
+    'definition':          None,
+    'delegation':          frozenset([const.OP_OPEN]),
+    'delegation_type':     frozenset([const.OP_WANT_DELEGATION]),
+    'denied':              frozenset([const.OP_LOCK, const.OP_LOCKT]),
+    'dsr_status':          frozenset([const.OP_DESTROY_SESSION]),
+    'eir_clientid':        frozenset([const.OP_EXCHANGE_ID]),
+    'eir_flags':           frozenset([const.OP_EXCHANGE_ID]),
+    'eir_resok4':          frozenset([const.OP_EXCHANGE_ID]),
+    'eir_sequenceid':      frozenset([const.OP_EXCHANGE_ID]),
+    'eir_server_impl_id':  frozenset([const.OP_EXCHANGE_ID]),
+    'eir_server_owner':    frozenset([const.OP_EXCHANGE_ID]),
+    'eir_server_scope':    frozenset([const.OP_EXCHANGE_ID]),
+    'eir_state_protect':   frozenset([const.OP_EXCHANGE_ID]),
+    'eir_status':          frozenset([const.OP_EXCHANGE_ID]),
+    'entries':             frozenset([const.OP_READDIR]),
+    'eof':                 frozenset([const.OP_READ, const.OP_READDIR]),
+    'fsr_status':          frozenset([const.OP_FREE_STATEID]),
+    'gddr_child_attributes': frozenset([const.OP_GET_DIR_DELEGATION]),
+    'gddr_cookieverf':     frozenset([const.OP_GET_DIR_DELEGATION]),
+    'gddr_dir_attributes': frozenset([const.OP_GET_DIR_DELEGATION]),
+    'gddr_notification':   frozenset([const.OP_GET_DIR_DELEGATION]),
+    'gddr_res_non_fatal4': frozenset([const.OP_GET_DIR_DELEGATION]),
+    'gddr_stateid':        frozenset([const.OP_GET_DIR_DELEGATION]),
+    'gddr_status':         frozenset([const.OP_GET_DIR_DELEGATION]),
+    'gddrnf_resok4':       frozenset([const.OP_GET_DIR_DELEGATION]),
+    'gddrnf_status':       frozenset([const.OP_GET_DIR_DELEGATION]),
+    'gddrnf_will_signal_deleg_avail': frozenset([const.OP_GET_DIR_DELEGATION]),
+    'gdir_device_addr':    frozenset([const.OP_GETDEVICEINFO]),
+    'gdir_mincount':       frozenset([const.OP_GETDEVICEINFO]),
+    'gdir_notification':   frozenset([const.OP_GETDEVICEINFO]),
+    'gdir_resok4':         frozenset([const.OP_GETDEVICEINFO]),
+    'gdir_status':         frozenset([const.OP_GETDEVICEINFO]),
+    'gdlr_cookie':         frozenset([const.OP_GETDEVICELIST]),
+    'gdlr_cookieverf':     frozenset([const.OP_GETDEVICELIST]),
+    'gdlr_deviceid_list':  frozenset([const.OP_GETDEVICELIST]),
+    'gdlr_eof':            frozenset([const.OP_GETDEVICELIST]),
+    'gdlr_resok4':         frozenset([const.OP_GETDEVICELIST]),
+    'gdlr_status':         frozenset([const.OP_GETDEVICELIST]),
+    'length':              frozenset([const.OP_LOCK, const.OP_LOCKT]),
+    'link':                frozenset([const.OP_READLINK]),
+    'lock_stateid':        frozenset([const.OP_LOCK, const.OP_LOCKU]),
+    'locktype':            frozenset([const.OP_LOCK, const.OP_LOCKT]),
+    'locr_newsize':        frozenset([const.OP_LAYOUTCOMMIT]),
+    'locr_resok4':         frozenset([const.OP_LAYOUTCOMMIT]),
+    'locr_status':         frozenset([const.OP_LAYOUTCOMMIT]),
+    'logr_layout':         frozenset([const.OP_LAYOUTGET]),
+    'logr_resok4':         frozenset([const.OP_LAYOUTGET]),
+    'logr_return_on_close': frozenset([const.OP_LAYOUTGET]),
+    'logr_stateid':        frozenset([const.OP_LAYOUTGET]),
+    'logr_status':         frozenset([const.OP_LAYOUTGET]),
+    'logr_will_signal_layout_avail': frozenset([const.OP_LAYOUTGET]),
+    'lorr_stateid':        frozenset([const.OP_LAYOUTRETURN]),
+    'lorr_status':         frozenset([const.OP_LAYOUTRETURN]),
+    'lrs_present':         frozenset([const.OP_LAYOUTRETURN]),
+    'lrs_stateid':         frozenset([const.OP_LAYOUTRETURN]),
+    'na_r_addr':           frozenset([const.OP_SETCLIENTID]),
+    'na_r_netid':          frozenset([const.OP_SETCLIENTID]),
+    'ns_size':             frozenset([const.OP_LAYOUTCOMMIT]),
+    'ns_sizechanged':      frozenset([const.OP_LAYOUTCOMMIT]),
+    'obj_attributes':      frozenset([const.OP_CB_GETATTR, const.OP_GETATTR]),
+    'object':              frozenset([const.OP_GETFH]),
+    'od_whynone':          frozenset([const.OP_WANT_DELEGATION]),
+    'offset':              frozenset([const.OP_LOCK, const.OP_LOCKT]),
+    'ond_server_will_push_deleg': frozenset([const.OP_WANT_DELEGATION]),
+    'ond_server_will_signal_avail': frozenset([const.OP_WANT_DELEGATION]),
+    'ond_why':             frozenset([const.OP_WANT_DELEGATION]),
+    'opaccess':            None,
+    'opbackchannel_ctl':   None,
+    'opbind_conn_to_session': None,
+    'opcbgetattr':         None,
+    'opcbillegal':         None,
+    'opcblayoutrecall':    None,
+    'opcbnotify':          None,
+    'opcbnotify_deviceid': None,
+    'opcbnotify_lock':     None,
+    'opcbpush_deleg':      None,
+    'opcbrecall':          None,
+    'opcbrecall_any':      None,
+    'opcbrecall_slot':     None,
+    'opcbrecallable_obj_avail': None,
+    'opcbsequence':        None,
+    'opcbwants_cancelled': None,
+    'opclose':             None,
+    'opcommit':            None,
+    'opcreate':            None,
+    'opcreate_session':    None,
+    'opdelegpurge':        None,
+    'opdelegreturn':       None,
+    'opdestroy_clientid':  None,
+    'opdestroy_session':   None,
+    'open_stateid':        frozenset([const.OP_CLOSE, const.OP_OPEN_CONFIRM, const.OP_OPEN_DOWNGRADE]),
+    'opexchange_id':       None,
+    'opfree_stateid':      None,
+    'opget_dir_delegation': None,
+    'opgetattr':           None,
+    'opgetdeviceinfo':     None,
+    'opgetdevicelist':     None,
+    'opgetfh':             None,
+    'opillegal':           None,
+    'oplayoutcommit':      None,
+    'oplayoutget':         None,
+    'oplayoutreturn':      None,
+    'oplink':              None,
+    'oplock':              None,
+    'oplockt':             None,
+    'oplocku':             None,
+    'oplookup':            None,
+    'oplookupp':           None,
+    'opnverify':           None,
+    'opopen':              None,
+    'opopen_confirm':      None,
+    'opopen_downgrade':    None,
+    'opopenattr':          None,
+    'opputfh':             None,
+    'opputpubfh':          None,
+    'opputrootfh':         None,
+    'opread':              None,
+    'opreaddir':           None,
+    'opreadlink':          None,
+    'opreclaim_complete':  None,
+    'oprelease_lockowner': None,
+    'opremove':            None,
+    'oprename':            None,
+    'oprenew':             None,
+    'oprestorefh':         None,
+    'opsavefh':            None,
+    'opsecinfo':           None,
+    'opsecinfo_no_name':   None,
+    'opsequence':          None,
+    'opset_ssv':           None,
+    'opsetattr':           None,
+    'opsetclientid':       None,
+    'opsetclientid_confirm': None,
+    'optest_stateid':      None,
+    'opverify':            None,
+    'opwant_delegation':   None,
+    'opwrite':             None,
+    'other':               frozenset([const.OP_CLOSE, const.OP_LOCK, const.OP_LOCKU, const.OP_OPEN_CONFIRM, const.OP_OPEN_DOWNGRADE, const.OP_GET_DIR_DELEGATION, const.OP_LAYOUTGET, const.OP_LAYOUTRETURN]),
+    'owner':               frozenset([const.OP_LOCK, const.OP_LOCKT]),
+    'permissions':         frozenset([const.OP_WANT_DELEGATION]),
+    'rcr_status':          frozenset([const.OP_RECLAIM_COMPLETE]),
+    'read':                frozenset([const.OP_WANT_DELEGATION]),
+    'recall':              frozenset([const.OP_WANT_DELEGATION]),
+    'reply':               frozenset([const.OP_READDIR]),
+    'resok4':              frozenset([const.OP_CB_GETATTR, const.OP_ACCESS, const.OP_COMMIT, const.OP_CREATE, const.OP_GETATTR, const.OP_GETFH, const.OP_LINK, const.OP_LOCK, const.OP_OPEN, const.OP_OPEN_CONFIRM, const.OP_OPEN_DOWNGRADE, const.OP_READ, const.OP_READDIR, const.OP_READLINK, const.OP_REMOVE, const.OP_RENAME, const.OP_SECINFO, const.OP_SETCLIENTID, const.OP_WRITE, const.OP_SECINFO_NO_NAME]),
+    'resop':               None,
+    'rflags':              frozenset([const.OP_OPEN]),
+    'rsr_status':          frozenset([const.OP_CB_RECALL_SLOT]),
+    'seqid':               frozenset([const.OP_CLOSE, const.OP_LOCK, const.OP_LOCKU, const.OP_OPEN_CONFIRM, const.OP_OPEN_DOWNGRADE, const.OP_GET_DIR_DELEGATION, const.OP_LAYOUTGET, const.OP_LAYOUTRETURN]),
+    'setclientid_confirm': frozenset([const.OP_SETCLIENTID]),
+    'source_cinfo':        frozenset([const.OP_RENAME]),
+    'space_limit':         frozenset([const.OP_WANT_DELEGATION]),
+    'sr_highest_slotid':   frozenset([const.OP_SEQUENCE]),
+    'sr_resok4':           frozenset([const.OP_SEQUENCE]),
+    'sr_sequenceid':       frozenset([const.OP_SEQUENCE]),
+    'sr_sessionid':        frozenset([const.OP_SEQUENCE]),
+    'sr_slotid':           frozenset([const.OP_SEQUENCE]),
+    'sr_status':           frozenset([const.OP_SEQUENCE]),
+    'sr_status_flags':     frozenset([const.OP_SEQUENCE]),
+    'sr_target_highest_slotid': frozenset([const.OP_SEQUENCE]),
+    'ssr_digest':          frozenset([const.OP_SET_SSV]),
+    'ssr_resok4':          frozenset([const.OP_SET_SSV]),
+    'ssr_status':          frozenset([const.OP_SET_SSV]),
+    'stateid':             frozenset([const.OP_OPEN, const.OP_WANT_DELEGATION]),
+    'status':              frozenset([const.OP_CB_GETATTR, const.OP_ACCESS, const.OP_CB_RECALL, const.OP_CLOSE, const.OP_COMMIT, const.OP_CREATE, const.OP_DELEGPURGE, const.OP_DELEGRETURN, const.OP_GETATTR, const.OP_GETFH, const.OP_LINK, const.OP_LOCK, const.OP_LOCKT, const.OP_LOCKU, const.OP_LOOKUP, const.OP_LOOKUPP, const.OP_NVERIFY, const.OP_OPEN, const.OP_OPENATTR, const.OP_OPEN_CONFIRM, const.OP_OPEN_DOWNGRADE, const.OP_PUTFH, const.OP_PUTPUBFH, const.OP_PUTROOTFH, const.OP_READ, const.OP_READDIR, const.OP_READLINK, const.OP_REMOVE, const.OP_RENAME, const.OP_RENEW, const.OP_RESTOREFH, const.OP_SAVEFH, const.OP_SECINFO, const.OP_SETATTR, const.OP_SETCLIENTID, const.OP_SETCLIENTID_CONFIRM, const.OP_VERIFY, const.OP_WRITE, const.OP_RELEASE_LOCKOWNER, const.OP_SECINFO_NO_NAME, const.OP_ILLEGAL, const.OP_CB_ILLEGAL]),
+    'supported':           frozenset([const.OP_ACCESS]),
+    'target_cinfo':        frozenset([const.OP_RENAME]),
+    'tsr_resok4':          frozenset([const.OP_TEST_STATEID]),
+    'tsr_status':          frozenset([const.OP_TEST_STATEID]),
+    'tsr_status_codes':    frozenset([const.OP_TEST_STATEID]),
+    'wdr_resok4':          frozenset([const.OP_WANT_DELEGATION]),
+    'wdr_status':          frozenset([const.OP_WANT_DELEGATION]),
+    'write':               frozenset([const.OP_WANT_DELEGATION]),
+    'writeverf':           frozenset([const.OP_COMMIT, const.OP_WRITE]),
+}
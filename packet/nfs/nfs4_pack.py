@@ -1,4 +1,5 @@
 # Generated by rpcgen.py from nfs4.x on Wed Jul 11 08:30:29 2012
+# Maintained by hand since then, the filter lookups use _filter_table()
 import nfs4_const as const
 import nfs4_type as types
 import xdrlib
@@ -7,12 +8,48 @@ from xdrlib import Error as XDRError
 class nullclass(object):
     pass
 
+# Table of filter functions of each packer and unpacker class
+_filter_map = {}
+
+def _filter_table(obj):
+    """Return the table of filters of the given packer or unpacker object,
+       a filter is any method or instance attribute named filter_<type>
+       and it is called as filter(obj, data) with the packed or unpacked
+       data of the given type. The table of each class is built only once
+       and it is shared by all its instances unless an instance has its
+       own filters.
+    """
+    cls = obj.__class__
+    table = _filter_map.get(cls)
+    if table is None:
+        table = {}
+        for name in dir(cls):
+            if name.startswith('filter_'):
+                func = getattr(cls, name)
+                table[name[7:]] = getattr(func, 'im_func', func)
+        _filter_map[cls] = table
+    names = [x for x in vars(obj) if x.startswith('filter_')]
+    if names:
+        # Instance filters are not given the object
+        table = dict(table)
+        for name in names:
+            table[name[7:]] = lambda obj, data, func=getattr(obj, name): func(data)
+    return table
+
 class NFS4Packer(xdrlib.Packer):
     def __init__(self, check_enum=True, check_array=True):
         xdrlib.Packer.__init__(self)
         self.check_enum = check_enum
         self.check_array = check_array
 
+    def __getattr__(self, name):
+        if name == '_filters':
+            # Get the table of filters when it is first used so the
+            # filters set on the instance after it is created are included
+            self._filters = _filter_table(self)
+            return self._filters
+        raise AttributeError(name)
+
     pack_hyper = xdrlib.Packer.pack_hyper
     pack_string = xdrlib.Packer.pack_string
     pack_int = xdrlib.Packer.pack_int
@@ -33,8 +70,8 @@ class NFS4Packer(xdrlib.Packer):
     pack_uint64_t = pack_uhyper
 
     def pack_authsys_parms(self, data):
-        if hasattr(self, 'filter_authsys_parms'):
-            data = getattr(self, 'filter_authsys_parms')(data)
+        if 'authsys_parms' in self._filters:
+            data = self._filters['authsys_parms'](self, data)
         if data.stamp is None:
             raise TypeError, 'data.stamp == None'
         self.pack_uint(data.stamp)
@@ -56,27 +93,27 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_array(data.gids, self.pack_uint)
 
     def pack_nfs_ftype4(self, data):
-        if hasattr(self, 'filter_nfs_ftype4'):
-            data = getattr(self, 'filter_nfs_ftype4')(data)
+        if 'nfs_ftype4' in self._filters:
+            data = self._filters['nfs_ftype4'](self, data)
         if self.check_enum and data not in [const.NF4REG, const.NF4DIR, const.NF4BLK, const.NF4CHR, const.NF4LNK, const.NF4SOCK, const.NF4FIFO, const.NF4ATTRDIR, const.NF4NAMEDATTR]:
             raise XDRError, 'value=%s not in enum nfs_ftype4' % data
         self.pack_int(data)
 
     def pack_nfsstat4(self, data):
-        if hasattr(self, 'filter_nfsstat4'):
-            data = getattr(self, 'filter_nfsstat4')(data)
+        if 'nfsstat4' in self._filters:
+            data = self._filters['nfsstat4'](self, data)
         if self.check_enum and data not in [const.NFS4_OK, const.NFS4ERR_PERM, const.NFS4ERR_NOENT, const.NFS4ERR_IO, const.NFS4ERR_NXIO, const.NFS4ERR_ACCESS, const.NFS4ERR_EXIST, const.NFS4ERR_XDEV, const.NFS4ERR_NOTDIR, const.NFS4ERR_ISDIR, const.NFS4ERR_INVAL, const.NFS4ERR_FBIG, const.NFS4ERR_NOSPC, const.NFS4ERR_ROFS, const.NFS4ERR_MLINK, const.NFS4ERR_NAMETOOLONG, const.NFS4ERR_NOTEMPTY, const.NFS4ERR_DQUOT, const.NFS4ERR_STALE, const.NFS4ERR_BADHANDLE, const.NFS4ERR_BAD_COOKIE, const.NFS4ERR_NOTSUPP, const.NFS4ERR_TOOSMALL, const.NFS4ERR_SERVERFAULT, const.NFS4ERR_BADTYPE, const.NFS4ERR_DELAY, const.NFS4ERR_SAME, const.NFS4ERR_DENIED, const.NFS4ERR_EXPIRED, const.NFS4ERR_LOCKED, const.NFS4ERR_GRACE, const.NFS4ERR_FHEXPIRED, const.NFS4ERR_SHARE_DENIED, const.NFS4ERR_WRONGSEC, const.NFS4ERR_CLID_INUSE, const.NFS4ERR_RESOURCE, const.NFS4ERR_MOVED, const.NFS4ERR_NOFILEHANDLE, const.NFS4ERR_MINOR_VERS_MISMATCH, const.NFS4ERR_STALE_CLIENTID, const.NFS4ERR_STALE_STATEID, const.NFS4ERR_OLD_STATEID, const.NFS4ERR_BAD_STATEID, const.NFS4ERR_BAD_SEQID, const.NFS4ERR_NOT_SAME, const.NFS4ERR_LOCK_RANGE, const.NFS4ERR_SYMLINK, const.NFS4ERR_RESTOREFH, const.NFS4ERR_LEASE_MOVED, const.NFS4ERR_ATTRNOTSUPP, const.NFS4ERR_NO_GRACE, const.NFS4ERR_RECLAIM_BAD, const.NFS4ERR_RECLAIM_CONFLICT, const.NFS4ERR_BADXDR, const.NFS4ERR_LOCKS_HELD, const.NFS4ERR_OPENMODE, const.NFS4ERR_BADOWNER, const.NFS4ERR_BADCHAR, const.NFS4ERR_BADNAME, const.NFS4ERR_BAD_RANGE, const.NFS4ERR_LOCK_NOTSUPP, const.NFS4ERR_OP_ILLEGAL, const.NFS4ERR_DEADLOCK, const.NFS4ERR_FILE_OPEN, const.NFS4ERR_ADMIN_REVOKED, const.NFS4ERR_CB_PATH_DOWN, const.NFS4ERR_BADIOMODE, const.NFS4ERR_BADLAYOUT, const.NFS4ERR_BAD_SESSION_DIGEST, const.NFS4ERR_BADSESSION, const.NFS4ERR_BADSLOT, const.NFS4ERR_COMPLETE_ALREADY, const.NFS4ERR_CONN_NOT_BOUND_TO_SESSION, const.NFS4ERR_DELEG_ALREADY_WANTED, const.NFS4ERR_BACK_CHAN_BUSY, const.NFS4ERR_LAYOUTTRYLATER, const.NFS4ERR_LAYOUTUNAVAILABLE, const.NFS4ERR_NOMATCHING_LAYOUT, const.NFS4ERR_RECALLCONFLICT, const.NFS4ERR_UNKNOWN_LAYOUTTYPE, const.NFS4ERR_SEQ_MISORDERED, const.NFS4ERR_SEQUENCE_POS, const.NFS4ERR_REQ_TOO_BIG, const.NFS4ERR_REP_TOO_BIG, const.NFS4ERR_REP_TOO_BIG_TO_CACHE, const.NFS4ERR_RETRY_UNCACHED_REP, const.NFS4ERR_UNSAFE_COMPOUND, const.NFS4ERR_TOO_MANY_OPS, const.NFS4ERR_OP_NOT_IN_SESSION, const.NFS4ERR_HASH_ALG_UNSUPP, const.NFS4ERR_CONN_BINDING_NOT_ENFORCED, const.NFS4ERR_CLIENTID_BUSY, const.NFS4ERR_PNFS_IO_HOLE, const.NFS4ERR_SEQ_FALSE_RETRY, const.NFS4ERR_BAD_HIGH_SLOT, const.NFS4ERR_DEADSESSION, const.NFS4ERR_ENCR_ALG_UNSUPP, const.NFS4ERR_PNFS_NO_LAYOUT, const.NFS4ERR_NOT_ONLY_OP, const.NFS4ERR_WRONG_CRED, const.NFS4ERR_WRONG_TYPE, const.NFS4ERR_DIRDELEG_UNAVAIL, const.NFS4ERR_REJECT_DELEG, const.NFS4ERR_RETURNCONFLICT, const.NFS4ERR_DELEG_REVOKED]:
             raise XDRError, 'value=%s not in enum nfsstat4' % data
         self.pack_int(data)
 
     def pack_attrlist4(self, data):
-        if hasattr(self, 'filter_attrlist4'):
-            data = getattr(self, 'filter_attrlist4')(data)
+        if 'attrlist4' in self._filters:
+            data = self._filters['attrlist4'](self, data)
         self.pack_opaque(data)
 
     def pack_bitmap4(self, data):
-        if hasattr(self, 'filter_bitmap4'):
-            data = getattr(self, 'filter_bitmap4')(data)
+        if 'bitmap4' in self._filters:
+            data = self._filters['bitmap4'](self, data)
         self.pack_array(data, self.pack_uint32_t)
 
     pack_changeid4 = pack_uint64_t
@@ -92,8 +129,8 @@ class NFS4Packer(xdrlib.Packer):
     pack_nfs_cookie4 = pack_uint64_t
 
     def pack_nfs_fh4(self, data):
-        if hasattr(self, 'filter_nfs_fh4'):
-            data = getattr(self, 'filter_nfs_fh4')(data)
+        if 'nfs_fh4' in self._filters:
+            data = self._filters['nfs_fh4'](self, data)
         if len(data) > const.NFS4_FHSIZE and self.check_array:
             raise XDRError, 'array length too long for data'
         self.pack_opaque(data)
@@ -103,8 +140,8 @@ class NFS4Packer(xdrlib.Packer):
     pack_qop4 = pack_uint32_t
 
     def pack_sec_oid4(self, data):
-        if hasattr(self, 'filter_sec_oid4'):
-            data = getattr(self, 'filter_sec_oid4')(data)
+        if 'sec_oid4' in self._filters:
+            data = self._filters['sec_oid4'](self, data)
         self.pack_opaque(data)
 
     pack_sequenceid4 = pack_uint32_t
@@ -112,15 +149,15 @@ class NFS4Packer(xdrlib.Packer):
     pack_seqid4 = pack_uint32_t
 
     def pack_sessionid4(self, data):
-        if hasattr(self, 'filter_sessionid4'):
-            data = getattr(self, 'filter_sessionid4')(data)
+        if 'sessionid4' in self._filters:
+            data = self._filters['sessionid4'](self, data)
         self.pack_fopaque(const.NFS4_SESSIONID_SIZE, data)
 
     pack_slotid4 = pack_uint32_t
 
     def pack_utf8string(self, data):
-        if hasattr(self, 'filter_utf8string'):
-            data = getattr(self, 'filter_utf8string')(data)
+        if 'utf8string' in self._filters:
+            data = self._filters['utf8string'](self, data)
         self.pack_opaque(data)
 
     pack_utf8str_cis = pack_utf8string
@@ -134,18 +171,18 @@ class NFS4Packer(xdrlib.Packer):
     pack_linktext4 = pack_utf8str_cs
 
     def pack_pathname4(self, data):
-        if hasattr(self, 'filter_pathname4'):
-            data = getattr(self, 'filter_pathname4')(data)
+        if 'pathname4' in self._filters:
+            data = self._filters['pathname4'](self, data)
         self.pack_array(data, self.pack_component4)
 
     def pack_verifier4(self, data):
-        if hasattr(self, 'filter_verifier4'):
-            data = getattr(self, 'filter_verifier4')(data)
+        if 'verifier4' in self._filters:
+            data = self._filters['verifier4'](self, data)
         self.pack_fopaque(const.NFS4_VERIFIER_SIZE, data)
 
     def pack_nfstime4(self, data):
-        if hasattr(self, 'filter_nfstime4'):
-            data = getattr(self, 'filter_nfstime4')(data)
+        if 'nfstime4' in self._filters:
+            data = self._filters['nfstime4'](self, data)
         if data.seconds is None:
             raise TypeError, 'data.seconds == None'
         self.pack_int64_t(data.seconds)
@@ -154,15 +191,15 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_uint32_t(data.nseconds)
 
     def pack_time_how4(self, data):
-        if hasattr(self, 'filter_time_how4'):
-            data = getattr(self, 'filter_time_how4')(data)
+        if 'time_how4' in self._filters:
+            data = self._filters['time_how4'](self, data)
         if self.check_enum and data not in [const.SET_TO_SERVER_TIME4, const.SET_TO_CLIENT_TIME4]:
             raise XDRError, 'value=%s not in enum time_how4' % data
         self.pack_int(data)
 
     def pack_settime4(self, data):
-        if hasattr(self, 'filter_settime4'):
-            data = getattr(self, 'filter_settime4')(data)
+        if 'settime4' in self._filters:
+            data = self._filters['settime4'](self, data)
         if data.set_it is None:
             raise TypeError, 'data.set_it == None'
         self.pack_time_how4(data.set_it)
@@ -176,8 +213,8 @@ class NFS4Packer(xdrlib.Packer):
     pack_nfs_lease4 = pack_uint32_t
 
     def pack_fsid4(self, data):
-        if hasattr(self, 'filter_fsid4'):
-            data = getattr(self, 'filter_fsid4')(data)
+        if 'fsid4' in self._filters:
+            data = self._filters['fsid4'](self, data)
         if data.major is None:
             raise TypeError, 'data.major == None'
         self.pack_uint64_t(data.major)
@@ -186,8 +223,8 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_uint64_t(data.minor)
 
     def pack_change_policy4(self, data):
-        if hasattr(self, 'filter_change_policy4'):
-            data = getattr(self, 'filter_change_policy4')(data)
+        if 'change_policy4' in self._filters:
+            data = self._filters['change_policy4'](self, data)
         if data.cp_major is None:
             raise TypeError, 'data.cp_major == None'
         self.pack_uint64_t(data.cp_major)
@@ -196,8 +233,8 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_uint64_t(data.cp_minor)
 
     def pack_fs_location4(self, data):
-        if hasattr(self, 'filter_fs_location4'):
-            data = getattr(self, 'filter_fs_location4')(data)
+        if 'fs_location4' in self._filters:
+            data = self._filters['fs_location4'](self, data)
         if data.server is None:
             raise TypeError, 'data.server == None'
         self.pack_array(data.server, self.pack_utf8str_cis)
@@ -206,8 +243,8 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_pathname4(data.rootpath)
 
     def pack_fs_locations4(self, data):
-        if hasattr(self, 'filter_fs_locations4'):
-            data = getattr(self, 'filter_fs_locations4')(data)
+        if 'fs_locations4' in self._filters:
+            data = self._filters['fs_locations4'](self, data)
         if data.fs_root is None:
             raise TypeError, 'data.fs_root == None'
         self.pack_pathname4(data.fs_root)
@@ -222,8 +259,8 @@ class NFS4Packer(xdrlib.Packer):
     pack_acemask4 = pack_uint32_t
 
     def pack_nfsace4(self, data):
-        if hasattr(self, 'filter_nfsace4'):
-            data = getattr(self, 'filter_nfsace4')(data)
+        if 'nfsace4' in self._filters:
+            data = self._filters['nfsace4'](self, data)
         if data.type is None:
             raise TypeError, 'data.type == None'
         self.pack_acetype4(data.type)
@@ -240,8 +277,8 @@ class NFS4Packer(xdrlib.Packer):
     pack_aclflag4 = pack_uint32_t
 
     def pack_nfsacl41(self, data):
-        if hasattr(self, 'filter_nfsacl41'):
-            data = getattr(self, 'filter_nfsacl41')(data)
+        if 'nfsacl41' in self._filters:
+            data = self._filters['nfsacl41'](self, data)
         if data.na41_flag is None:
             raise TypeError, 'data.na41_flag == None'
         self.pack_aclflag4(data.na41_flag)
@@ -250,8 +287,8 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_array(data.na41_aces, self.pack_nfsace4)
 
     def pack_mode_masked4(self, data):
-        if hasattr(self, 'filter_mode_masked4'):
-            data = getattr(self, 'filter_mode_masked4')(data)
+        if 'mode_masked4' in self._filters:
+            data = self._filters['mode_masked4'](self, data)
         if data.mm_value_to_set is None:
             raise TypeError, 'data.mm_value_to_set == None'
         self.pack_mode4(data.mm_value_to_set)
@@ -260,8 +297,8 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_mode4(data.mm_mask_bits)
 
     def pack_specdata4(self, data):
-        if hasattr(self, 'filter_specdata4'):
-            data = getattr(self, 'filter_specdata4')(data)
+        if 'specdata4' in self._filters:
+            data = self._filters['specdata4'](self, data)
         if data.specdata1 is None:
             raise TypeError, 'data.specdata1 == None'
         self.pack_uint32_t(data.specdata1)
@@ -270,8 +307,8 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_uint32_t(data.specdata2)
 
     def pack_netaddr4(self, data):
-        if hasattr(self, 'filter_netaddr4'):
-            data = getattr(self, 'filter_netaddr4')(data)
+        if 'netaddr4' in self._filters:
+            data = self._filters['netaddr4'](self, data)
         if data.na_r_netid is None:
             raise TypeError, 'data.na_r_netid == None'
         self.pack_string(data.na_r_netid)
@@ -280,8 +317,8 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_string(data.na_r_addr)
 
     def pack_nfs_impl_id4(self, data):
-        if hasattr(self, 'filter_nfs_impl_id4'):
-            data = getattr(self, 'filter_nfs_impl_id4')(data)
+        if 'nfs_impl_id4' in self._filters:
+            data = self._filters['nfs_impl_id4'](self, data)
         if data.nii_domain is None:
             raise TypeError, 'data.nii_domain == None'
         self.pack_utf8str_cis(data.nii_domain)
@@ -293,8 +330,8 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_nfstime4(data.nii_date)
 
     def pack_stateid4(self, data):
-        if hasattr(self, 'filter_stateid4'):
-            data = getattr(self, 'filter_stateid4')(data)
+        if 'stateid4' in self._filters:
+            data = self._filters['stateid4'](self, data)
         if data.seqid is None:
             raise TypeError, 'data.seqid == None'
         self.pack_uint32_t(data.seqid)
@@ -303,15 +340,15 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_fopaque(12, data.other)
 
     def pack_layouttype4(self, data):
-        if hasattr(self, 'filter_layouttype4'):
-            data = getattr(self, 'filter_layouttype4')(data)
+        if 'layouttype4' in self._filters:
+            data = self._filters['layouttype4'](self, data)
         if self.check_enum and data not in [const.LAYOUT4_NFSV4_1_FILES, const.LAYOUT4_OSD2_OBJECTS, const.LAYOUT4_BLOCK_VOLUME]:
             raise XDRError, 'value=%s not in enum layouttype4' % data
         self.pack_int(data)
 
     def pack_layout_content4(self, data):
-        if hasattr(self, 'filter_layout_content4'):
-            data = getattr(self, 'filter_layout_content4')(data)
+        if 'layout_content4' in self._filters:
+            data = self._filters['layout_content4'](self, data)
         if data.loc_type is None:
             raise TypeError, 'data.loc_type == None'
         self.pack_layouttype4(data.loc_type)
@@ -320,8 +357,8 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_opaque(data.loc_body)
 
     def pack_layouthint4(self, data):
-        if hasattr(self, 'filter_layouthint4'):
-            data = getattr(self, 'filter_layouthint4')(data)
+        if 'layouthint4' in self._filters:
+            data = self._filters['layouthint4'](self, data)
         if data.loh_type is None:
             raise TypeError, 'data.loh_type == None'
         self.pack_layouttype4(data.loh_type)
@@ -330,15 +367,15 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_opaque(data.loh_body)
 
     def pack_layoutiomode4(self, data):
-        if hasattr(self, 'filter_layoutiomode4'):
-            data = getattr(self, 'filter_layoutiomode4')(data)
+        if 'layoutiomode4' in self._filters:
+            data = self._filters['layoutiomode4'](self, data)
         if self.check_enum and data not in [const.LAYOUTIOMODE4_READ, const.LAYOUTIOMODE4_RW, const.LAYOUTIOMODE4_ANY]:
             raise XDRError, 'value=%s not in enum layoutiomode4' % data
         self.pack_int(data)
 
     def pack_layout4(self, data):
-        if hasattr(self, 'filter_layout4'):
-            data = getattr(self, 'filter_layout4')(data)
+        if 'layout4' in self._filters:
+            data = self._filters['layout4'](self, data)
         if data.lo_offset is None:
             raise TypeError, 'data.lo_offset == None'
         self.pack_offset4(data.lo_offset)
@@ -353,13 +390,13 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_layout_content4(data.lo_content)
 
     def pack_deviceid4(self, data):
-        if hasattr(self, 'filter_deviceid4'):
-            data = getattr(self, 'filter_deviceid4')(data)
+        if 'deviceid4' in self._filters:
+            data = self._filters['deviceid4'](self, data)
         self.pack_fopaque(const.NFS4_DEVICEID4_SIZE, data)
 
     def pack_device_addr4(self, data):
-        if hasattr(self, 'filter_device_addr4'):
-            data = getattr(self, 'filter_device_addr4')(data)
+        if 'device_addr4' in self._filters:
+            data = self._filters['device_addr4'](self, data)
         if data.da_layout_type is None:
             raise TypeError, 'data.da_layout_type == None'
         self.pack_layouttype4(data.da_layout_type)
@@ -368,8 +405,8 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_opaque(data.da_addr_body)
 
     def pack_layoutupdate4(self, data):
-        if hasattr(self, 'filter_layoutupdate4'):
-            data = getattr(self, 'filter_layoutupdate4')(data)
+        if 'layoutupdate4' in self._filters:
+            data = self._filters['layoutupdate4'](self, data)
         if data.lou_type is None:
             raise TypeError, 'data.lou_type == None'
         self.pack_layouttype4(data.lou_type)
@@ -378,15 +415,15 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_opaque(data.lou_body)
 
     def pack_layoutreturn_type4(self, data):
-        if hasattr(self, 'filter_layoutreturn_type4'):
-            data = getattr(self, 'filter_layoutreturn_type4')(data)
+        if 'layoutreturn_type4' in self._filters:
+            data = self._filters['layoutreturn_type4'](self, data)
         if self.check_enum and data not in [const.LAYOUTRETURN4_FILE, const.LAYOUTRETURN4_FSID, const.LAYOUTRETURN4_ALL]:
             raise XDRError, 'value=%s not in enum layoutreturn_type4' % data
         self.pack_int(data)
 
     def pack_layoutreturn_file4(self, data):
-        if hasattr(self, 'filter_layoutreturn_file4'):
-            data = getattr(self, 'filter_layoutreturn_file4')(data)
+        if 'layoutreturn_file4' in self._filters:
+            data = self._filters['layoutreturn_file4'](self, data)
         if data.lrf_offset is None:
             raise TypeError, 'data.lrf_offset == None'
         self.pack_offset4(data.lrf_offset)
@@ -401,8 +438,8 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_opaque(data.lrf_body)
 
     def pack_layoutreturn4(self, data):
-        if hasattr(self, 'filter_layoutreturn4'):
-            data = getattr(self, 'filter_layoutreturn4')(data)
+        if 'layoutreturn4' in self._filters:
+            data = self._filters['layoutreturn4'](self, data)
         if data.lr_returntype is None:
             raise TypeError, 'data.lr_returntype == None'
         self.pack_layoutreturn_type4(data.lr_returntype)
@@ -414,15 +451,15 @@ class NFS4Packer(xdrlib.Packer):
             pass
 
     def pack_fs4_status_type(self, data):
-        if hasattr(self, 'filter_fs4_status_type'):
-            data = getattr(self, 'filter_fs4_status_type')(data)
+        if 'fs4_status_type' in self._filters:
+            data = self._filters['fs4_status_type'](self, data)
         if self.check_enum and data not in [const.STATUS4_FIXED, const.STATUS4_UPDATED, const.STATUS4_VERSIONED, const.STATUS4_WRITABLE, const.STATUS4_REFERRAL]:
             raise XDRError, 'value=%s not in enum fs4_status_type' % data
         self.pack_int(data)
 
     def pack_fs4_status(self, data):
-        if hasattr(self, 'filter_fs4_status'):
-            data = getattr(self, 'filter_fs4_status')(data)
+        if 'fs4_status' in self._filters:
+            data = self._filters['fs4_status'](self, data)
         if data.fss_absent is None:
             raise TypeError, 'data.fss_absent == None'
         self.pack_bool(data.fss_absent)
@@ -451,8 +488,8 @@ class NFS4Packer(xdrlib.Packer):
     pack_threshold4_write_iosize = pack_length4
 
     def pack_threshold_item4(self, data):
-        if hasattr(self, 'filter_threshold_item4'):
-            data = getattr(self, 'filter_threshold_item4')(data)
+        if 'threshold_item4' in self._filters:
+            data = self._filters['threshold_item4'](self, data)
         if data.thi_layout_type is None:
             raise TypeError, 'data.thi_layout_type == None'
         self.pack_layouttype4(data.thi_layout_type)
@@ -464,15 +501,15 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_opaque(data.thi_hintlist)
 
     def pack_mdsthreshold4(self, data):
-        if hasattr(self, 'filter_mdsthreshold4'):
-            data = getattr(self, 'filter_mdsthreshold4')(data)
+        if 'mdsthreshold4' in self._filters:
+            data = self._filters['mdsthreshold4'](self, data)
         if data.mth_hints is None:
             raise TypeError, 'data.mth_hints == None'
         self.pack_array(data.mth_hints, self.pack_threshold_item4)
 
     def pack_retention_get4(self, data):
-        if hasattr(self, 'filter_retention_get4'):
-            data = getattr(self, 'filter_retention_get4')(data)
+        if 'retention_get4' in self._filters:
+            data = self._filters['retention_get4'](self, data)
         if data.rg_duration is None:
             raise TypeError, 'data.rg_duration == None'
         self.pack_uint64_t(data.rg_duration)
@@ -483,8 +520,8 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_array(data.rg_begin_time, self.pack_nfstime4)
 
     def pack_retention_set4(self, data):
-        if hasattr(self, 'filter_retention_set4'):
-            data = getattr(self, 'filter_retention_set4')(data)
+        if 'retention_set4' in self._filters:
+            data = self._filters['retention_set4'](self, data)
         if data.rs_enable is None:
             raise TypeError, 'data.rs_enable == None'
         self.pack_bool(data.rs_enable)
@@ -523,8 +560,8 @@ class NFS4Packer(xdrlib.Packer):
     pack_fattr4_rdattr_error = pack_nfsstat4
 
     def pack_fattr4_acl(self, data):
-        if hasattr(self, 'filter_fattr4_acl'):
-            data = getattr(self, 'filter_fattr4_acl')(data)
+        if 'fattr4_acl' in self._filters:
+            data = self._filters['fattr4_acl'](self, data)
         self.pack_array(data, self.pack_nfsace4)
 
     pack_fattr4_aclsupport = pack_uint32_t
@@ -622,8 +659,8 @@ class NFS4Packer(xdrlib.Packer):
     pack_fattr4_absent = pack_bool
 
     def pack_fattr4_fs_layout_type(self, data):
-        if hasattr(self, 'filter_fattr4_fs_layout_type'):
-            data = getattr(self, 'filter_fattr4_fs_layout_type')(data)
+        if 'fattr4_fs_layout_type' in self._filters:
+            data = self._filters['fattr4_fs_layout_type'](self, data)
         self.pack_array(data, self.pack_layouttype4)
 
     pack_fattr4_fs_status = pack_fs4_status
@@ -637,8 +674,8 @@ class NFS4Packer(xdrlib.Packer):
     pack_fattr4_layout_hint = pack_layouthint4
 
     def pack_fattr4_layout_type(self, data):
-        if hasattr(self, 'filter_fattr4_layout_type'):
-            data = getattr(self, 'filter_fattr4_layout_type')(data)
+        if 'fattr4_layout_type' in self._filters:
+            data = self._filters['fattr4_layout_type'](self, data)
         self.pack_array(data, self.pack_layouttype4)
 
     pack_fattr4_mdsthreshold = pack_mdsthreshold4
@@ -658,8 +695,8 @@ class NFS4Packer(xdrlib.Packer):
     pack_fattr4_sacl = pack_nfsacl41
 
     def pack_fattr4(self, data):
-        if hasattr(self, 'filter_fattr4'):
-            data = getattr(self, 'filter_fattr4')(data)
+        if 'fattr4' in self._filters:
+            data = self._filters['fattr4'](self, data)
         if data.attrmask is None:
             raise TypeError, 'data.attrmask == None'
         self.pack_bitmap4(data.attrmask)
@@ -668,8 +705,8 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_attrlist4(data.attr_vals)
 
     def pack_change_info4(self, data):
-        if hasattr(self, 'filter_change_info4'):
-            data = getattr(self, 'filter_change_info4')(data)
+        if 'change_info4' in self._filters:
+            data = self._filters['change_info4'](self, data)
         if data.atomic is None:
             raise TypeError, 'data.atomic == None'
         self.pack_bool(data.atomic)
@@ -683,8 +720,8 @@ class NFS4Packer(xdrlib.Packer):
     pack_clientaddr4 = pack_netaddr4
 
     def pack_cb_client4(self, data):
-        if hasattr(self, 'filter_cb_client4'):
-            data = getattr(self, 'filter_cb_client4')(data)
+        if 'cb_client4' in self._filters:
+            data = self._filters['cb_client4'](self, data)
         if data.cb_program is None:
             raise TypeError, 'data.cb_program == None'
         self.pack_uint32_t(data.cb_program)
@@ -693,8 +730,8 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_netaddr4(data.cb_location)
 
     def pack_nfs_client_id4(self, data):
-        if hasattr(self, 'filter_nfs_client_id4'):
-            data = getattr(self, 'filter_nfs_client_id4')(data)
+        if 'nfs_client_id4' in self._filters:
+            data = self._filters['nfs_client_id4'](self, data)
         if data.verifier is None:
             raise TypeError, 'data.verifier == None'
         self.pack_verifier4(data.verifier)
@@ -705,8 +742,8 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_opaque(data.id)
 
     def pack_client_owner4(self, data):
-        if hasattr(self, 'filter_client_owner4'):
-            data = getattr(self, 'filter_client_owner4')(data)
+        if 'client_owner4' in self._filters:
+            data = self._filters['client_owner4'](self, data)
         if data.co_verifier is None:
             raise TypeError, 'data.co_verifier == None'
         self.pack_verifier4(data.co_verifier)
@@ -717,8 +754,8 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_opaque(data.co_ownerid)
 
     def pack_server_owner4(self, data):
-        if hasattr(self, 'filter_server_owner4'):
-            data = getattr(self, 'filter_server_owner4')(data)
+        if 'server_owner4' in self._filters:
+            data = self._filters['server_owner4'](self, data)
         if data.so_minor_id is None:
             raise TypeError, 'data.so_minor_id == None'
         self.pack_uint64_t(data.so_minor_id)
@@ -729,8 +766,8 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_opaque(data.so_major_id)
 
     def pack_state_owner4(self, data):
-        if hasattr(self, 'filter_state_owner4'):
-            data = getattr(self, 'filter_state_owner4')(data)
+        if 'state_owner4' in self._filters:
+            data = self._filters['state_owner4'](self, data)
         if data.clientid is None:
             raise TypeError, 'data.clientid == None'
         self.pack_clientid4(data.clientid)
@@ -745,22 +782,22 @@ class NFS4Packer(xdrlib.Packer):
     pack_lock_owner4 = pack_state_owner4
 
     def pack_nfs_lock_type4(self, data):
-        if hasattr(self, 'filter_nfs_lock_type4'):
-            data = getattr(self, 'filter_nfs_lock_type4')(data)
+        if 'nfs_lock_type4' in self._filters:
+            data = self._filters['nfs_lock_type4'](self, data)
         if self.check_enum and data not in [const.READ_LT, const.WRITE_LT, const.READW_LT, const.WRITEW_LT]:
             raise XDRError, 'value=%s not in enum nfs_lock_type4' % data
         self.pack_int(data)
 
     def pack_ssv_subkey4(self, data):
-        if hasattr(self, 'filter_ssv_subkey4'):
-            data = getattr(self, 'filter_ssv_subkey4')(data)
+        if 'ssv_subkey4' in self._filters:
+            data = self._filters['ssv_subkey4'](self, data)
         if self.check_enum and data not in [const.SSV4_SUBKEY_MIC_I2T, const.SSV4_SUBKEY_MIC_T2I, const.SSV4_SUBKEY_SEAL_I2T, const.SSV4_SUBKEY_SEAL_T2I]:
             raise XDRError, 'value=%s not in enum ssv_subkey4' % data
         self.pack_int(data)
 
     def pack_ssv_mic_plain_tkn4(self, data):
-        if hasattr(self, 'filter_ssv_mic_plain_tkn4'):
-            data = getattr(self, 'filter_ssv_mic_plain_tkn4')(data)
+        if 'ssv_mic_plain_tkn4' in self._filters:
+            data = self._filters['ssv_mic_plain_tkn4'](self, data)
         if data.smpt_ssv_seq is None:
             raise TypeError, 'data.smpt_ssv_seq == None'
         self.pack_uint32_t(data.smpt_ssv_seq)
@@ -769,8 +806,8 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_opaque(data.smpt_orig_plain)
 
     def pack_ssv_mic_tkn4(self, data):
-        if hasattr(self, 'filter_ssv_mic_tkn4'):
-            data = getattr(self, 'filter_ssv_mic_tkn4')(data)
+        if 'ssv_mic_tkn4' in self._filters:
+            data = self._filters['ssv_mic_tkn4'](self, data)
         if data.smt_ssv_seq is None:
             raise TypeError, 'data.smt_ssv_seq == None'
         self.pack_uint32_t(data.smt_ssv_seq)
@@ -779,8 +816,8 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_opaque(data.smt_hmac)
 
     def pack_ssv_seal_plain_tkn4(self, data):
-        if hasattr(self, 'filter_ssv_seal_plain_tkn4'):
-            data = getattr(self, 'filter_ssv_seal_plain_tkn4')(data)
+        if 'ssv_seal_plain_tkn4' in self._filters:
+            data = self._filters['ssv_seal_plain_tkn4'](self, data)
         if data.sspt_confounder is None:
             raise TypeError, 'data.sspt_confounder == None'
         self.pack_opaque(data.sspt_confounder)
@@ -795,8 +832,8 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_opaque(data.sspt_pad)
 
     def pack_ssv_seal_cipher_tkn4(self, data):
-        if hasattr(self, 'filter_ssv_seal_cipher_tkn4'):
-            data = getattr(self, 'filter_ssv_seal_cipher_tkn4')(data)
+        if 'ssv_seal_cipher_tkn4' in self._filters:
+            data = self._filters['ssv_seal_cipher_tkn4'](self, data)
         if data.ssct_ssv_seq is None:
             raise TypeError, 'data.ssct_ssv_seq == None'
         self.pack_uint32_t(data.ssct_ssv_seq)
@@ -811,8 +848,8 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_opaque(data.ssct_hmac)
 
     def pack_fs_locations_server4(self, data):
-        if hasattr(self, 'filter_fs_locations_server4'):
-            data = getattr(self, 'filter_fs_locations_server4')(data)
+        if 'fs_locations_server4' in self._filters:
+            data = self._filters['fs_locations_server4'](self, data)
         if data.fls_currency is None:
             raise TypeError, 'data.fls_currency == None'
         self.pack_int32_t(data.fls_currency)
@@ -824,8 +861,8 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_utf8str_cis(data.fls_server)
 
     def pack_fs_locations_item4(self, data):
-        if hasattr(self, 'filter_fs_locations_item4'):
-            data = getattr(self, 'filter_fs_locations_item4')(data)
+        if 'fs_locations_item4' in self._filters:
+            data = self._filters['fs_locations_item4'](self, data)
         if data.fli_entries is None:
             raise TypeError, 'data.fli_entries == None'
         self.pack_array(data.fli_entries, self.pack_fs_locations_server4)
@@ -834,8 +871,8 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_pathname4(data.fli_rootpath)
 
     def pack_fs_locations_info4(self, data):
-        if hasattr(self, 'filter_fs_locations_info4'):
-            data = getattr(self, 'filter_fs_locations_info4')(data)
+        if 'fs_locations_info4' in self._filters:
+            data = self._filters['fs_locations_info4'](self, data)
         if data.fli_flags is None:
             raise TypeError, 'data.fli_flags == None'
         self.pack_uint32_t(data.fli_flags)
@@ -854,15 +891,15 @@ class NFS4Packer(xdrlib.Packer):
     pack_nfl_util4 = pack_uint32_t
 
     def pack_filelayout_hint_care4(self, data):
-        if hasattr(self, 'filter_filelayout_hint_care4'):
-            data = getattr(self, 'filter_filelayout_hint_care4')(data)
+        if 'filelayout_hint_care4' in self._filters:
+            data = self._filters['filelayout_hint_care4'](self, data)
         if self.check_enum and data not in [const.NFLH4_CARE_DENSE, const.NFLH4_CARE_COMMIT_THRU_MDS, const.NFLH4_CARE_STRIPE_UNIT_SIZE, const.NFLH4_CARE_STRIPE_COUNT]:
             raise XDRError, 'value=%s not in enum filelayout_hint_care4' % data
         self.pack_int(data)
 
     def pack_nfsv4_1_file_layouthint4(self, data):
-        if hasattr(self, 'filter_nfsv4_1_file_layouthint4'):
-            data = getattr(self, 'filter_nfsv4_1_file_layouthint4')(data)
+        if 'nfsv4_1_file_layouthint4' in self._filters:
+            data = self._filters['nfsv4_1_file_layouthint4'](self, data)
         if data.nflh_care is None:
             raise TypeError, 'data.nflh_care == None'
         self.pack_uint32_t(data.nflh_care)
@@ -874,13 +911,13 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_count4(data.nflh_stripe_count)
 
     def pack_multipath_list4(self, data):
-        if hasattr(self, 'filter_multipath_list4'):
-            data = getattr(self, 'filter_multipath_list4')(data)
+        if 'multipath_list4' in self._filters:
+            data = self._filters['multipath_list4'](self, data)
         self.pack_array(data, self.pack_netaddr4)
 
     def pack_nfsv4_1_file_layout_ds_addr4(self, data):
-        if hasattr(self, 'filter_nfsv4_1_file_layout_ds_addr4'):
-            data = getattr(self, 'filter_nfsv4_1_file_layout_ds_addr4')(data)
+        if 'nfsv4_1_file_layout_ds_addr4' in self._filters:
+            data = self._filters['nfsv4_1_file_layout_ds_addr4'](self, data)
         if data.nflda_stripe_indices is None:
             raise TypeError, 'data.nflda_stripe_indices == None'
         self.pack_array(data.nflda_stripe_indices, self.pack_uint32_t)
@@ -889,8 +926,8 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_array(data.nflda_multipath_ds_list, self.pack_multipath_list4)
 
     def pack_nfsv4_1_file_layout4(self, data):
-        if hasattr(self, 'filter_nfsv4_1_file_layout4'):
-            data = getattr(self, 'filter_nfsv4_1_file_layout4')(data)
+        if 'nfsv4_1_file_layout4' in self._filters:
+            data = self._filters['nfsv4_1_file_layout4'](self, data)
         if data.nfl_deviceid is None:
             raise TypeError, 'data.nfl_deviceid == None'
         self.pack_deviceid4(data.nfl_deviceid)
@@ -908,15 +945,15 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_array(data.nfl_fh_list, self.pack_nfs_fh4)
 
     def pack_ACCESS4args(self, data):
-        if hasattr(self, 'filter_ACCESS4args'):
-            data = getattr(self, 'filter_ACCESS4args')(data)
+        if 'ACCESS4args' in self._filters:
+            data = self._filters['ACCESS4args'](self, data)
         if data.access is None:
             raise TypeError, 'data.access == None'
         self.pack_uint32_t(data.access)
 
     def pack_ACCESS4resok(self, data):
-        if hasattr(self, 'filter_ACCESS4resok'):
-            data = getattr(self, 'filter_ACCESS4resok')(data)
+        if 'ACCESS4resok' in self._filters:
+            data = self._filters['ACCESS4resok'](self, data)
         if data.supported is None:
             raise TypeError, 'data.supported == None'
         self.pack_uint32_t(data.supported)
@@ -925,8 +962,8 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_uint32_t(data.access)
 
     def pack_ACCESS4res(self, data):
-        if hasattr(self, 'filter_ACCESS4res'):
-            data = getattr(self, 'filter_ACCESS4res')(data)
+        if 'ACCESS4res' in self._filters:
+            data = self._filters['ACCESS4res'](self, data)
         if data.status is None:
             raise TypeError, 'data.status == None'
         self.pack_nfsstat4(data.status)
@@ -938,8 +975,8 @@ class NFS4Packer(xdrlib.Packer):
             pass
 
     def pack_CLOSE4args(self, data):
-        if hasattr(self, 'filter_CLOSE4args'):
-            data = getattr(self, 'filter_CLOSE4args')(data)
+        if 'CLOSE4args' in self._filters:
+            data = self._filters['CLOSE4args'](self, data)
         if data.seqid is None:
             raise TypeError, 'data.seqid == None'
         self.pack_seqid4(data.seqid)
@@ -948,8 +985,8 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_stateid4(data.open_stateid)
 
     def pack_CLOSE4res(self, data):
-        if hasattr(self, 'filter_CLOSE4res'):
-            data = getattr(self, 'filter_CLOSE4res')(data)
+        if 'CLOSE4res' in self._filters:
+            data = self._filters['CLOSE4res'](self, data)
         if data.status is None:
             raise TypeError, 'data.status == None'
         self.pack_nfsstat4(data.status)
@@ -961,8 +998,8 @@ class NFS4Packer(xdrlib.Packer):
             pass
 
     def pack_COMMIT4args(self, data):
-        if hasattr(self, 'filter_COMMIT4args'):
-            data = getattr(self, 'filter_COMMIT4args')(data)
+        if 'COMMIT4args' in self._filters:
+            data = self._filters['COMMIT4args'](self, data)
         if data.offset is None:
             raise TypeError, 'data.offset == None'
         self.pack_offset4(data.offset)
@@ -971,15 +1008,15 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_count4(data.count)
 
     def pack_COMMIT4resok(self, data):
-        if hasattr(self, 'filter_COMMIT4resok'):
-            data = getattr(self, 'filter_COMMIT4resok')(data)
+        if 'COMMIT4resok' in self._filters:
+            data = self._filters['COMMIT4resok'](self, data)
         if data.writeverf is None:
             raise TypeError, 'data.writeverf == None'
         self.pack_verifier4(data.writeverf)
 
     def pack_COMMIT4res(self, data):
-        if hasattr(self, 'filter_COMMIT4res'):
-            data = getattr(self, 'filter_COMMIT4res')(data)
+        if 'COMMIT4res' in self._filters:
+            data = self._filters['COMMIT4res'](self, data)
         if data.status is None:
             raise TypeError, 'data.status == None'
         self.pack_nfsstat4(data.status)
@@ -991,8 +1028,8 @@ class NFS4Packer(xdrlib.Packer):
             pass
 
     def pack_createtype4(self, data):
-        if hasattr(self, 'filter_createtype4'):
-            data = getattr(self, 'filter_createtype4')(data)
+        if 'createtype4' in self._filters:
+            data = self._filters['createtype4'](self, data)
         if data.type is None:
             raise TypeError, 'data.type == None'
         self.pack_nfs_ftype4(data.type)
@@ -1010,8 +1047,8 @@ class NFS4Packer(xdrlib.Packer):
             pass
 
     def pack_CREATE4args(self, data):
-        if hasattr(self, 'filter_CREATE4args'):
-            data = getattr(self, 'filter_CREATE4args')(data)
+        if 'CREATE4args' in self._filters:
+            data = self._filters['CREATE4args'](self, data)
         if data.objtype is None:
             raise TypeError, 'data.objtype == None'
         self.pack_createtype4(data.objtype)
@@ -1023,8 +1060,8 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_fattr4(data.createattrs)
 
     def pack_CREATE4resok(self, data):
-        if hasattr(self, 'filter_CREATE4resok'):
-            data = getattr(self, 'filter_CREATE4resok')(data)
+        if 'CREATE4resok' in self._filters:
+            data = self._filters['CREATE4resok'](self, data)
         if data.cinfo is None:
             raise TypeError, 'data.cinfo == None'
         self.pack_change_info4(data.cinfo)
@@ -1033,8 +1070,8 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_bitmap4(data.attrset)
 
     def pack_CREATE4res(self, data):
-        if hasattr(self, 'filter_CREATE4res'):
-            data = getattr(self, 'filter_CREATE4res')(data)
+        if 'CREATE4res' in self._filters:
+            data = self._filters['CREATE4res'](self, data)
         if data.status is None:
             raise TypeError, 'data.status == None'
         self.pack_nfsstat4(data.status)
@@ -1046,50 +1083,50 @@ class NFS4Packer(xdrlib.Packer):
             pass
 
     def pack_DELEGPURGE4args(self, data):
-        if hasattr(self, 'filter_DELEGPURGE4args'):
-            data = getattr(self, 'filter_DELEGPURGE4args')(data)
+        if 'DELEGPURGE4args' in self._filters:
+            data = self._filters['DELEGPURGE4args'](self, data)
         if data.clientid is None:
             raise TypeError, 'data.clientid == None'
         self.pack_clientid4(data.clientid)
 
     def pack_DELEGPURGE4res(self, data):
-        if hasattr(self, 'filter_DELEGPURGE4res'):
-            data = getattr(self, 'filter_DELEGPURGE4res')(data)
+        if 'DELEGPURGE4res' in self._filters:
+            data = self._filters['DELEGPURGE4res'](self, data)
         if data.status is None:
             raise TypeError, 'data.status == None'
         self.pack_nfsstat4(data.status)
 
     def pack_DELEGRETURN4args(self, data):
-        if hasattr(self, 'filter_DELEGRETURN4args'):
-            data = getattr(self, 'filter_DELEGRETURN4args')(data)
+        if 'DELEGRETURN4args' in self._filters:
+            data = self._filters['DELEGRETURN4args'](self, data)
         if data.deleg_stateid is None:
             raise TypeError, 'data.deleg_stateid == None'
         self.pack_stateid4(data.deleg_stateid)
 
     def pack_DELEGRETURN4res(self, data):
-        if hasattr(self, 'filter_DELEGRETURN4res'):
-            data = getattr(self, 'filter_DELEGRETURN4res')(data)
+        if 'DELEGRETURN4res' in self._filters:
+            data = self._filters['DELEGRETURN4res'](self, data)
         if data.status is None:
             raise TypeError, 'data.status == None'
         self.pack_nfsstat4(data.status)
 
     def pack_GETATTR4args(self, data):
-        if hasattr(self, 'filter_GETATTR4args'):
-            data = getattr(self, 'filter_GETATTR4args')(data)
+        if 'GETATTR4args' in self._filters:
+            data = self._filters['GETATTR4args'](self, data)
         if data.attr_request is None:
             raise TypeError, 'data.attr_request == None'
         self.pack_bitmap4(data.attr_request)
 
     def pack_GETATTR4resok(self, data):
-        if hasattr(self, 'filter_GETATTR4resok'):
-            data = getattr(self, 'filter_GETATTR4resok')(data)
+        if 'GETATTR4resok' in self._filters:
+            data = self._filters['GETATTR4resok'](self, data)
         if data.obj_attributes is None:
             raise TypeError, 'data.obj_attributes == None'
         self.pack_fattr4(data.obj_attributes)
 
     def pack_GETATTR4res(self, data):
-        if hasattr(self, 'filter_GETATTR4res'):
-            data = getattr(self, 'filter_GETATTR4res')(data)
+        if 'GETATTR4res' in self._filters:
+            data = self._filters['GETATTR4res'](self, data)
         if data.status is None:
             raise TypeError, 'data.status == None'
         self.pack_nfsstat4(data.status)
@@ -1101,15 +1138,15 @@ class NFS4Packer(xdrlib.Packer):
             pass
 
     def pack_GETFH4resok(self, data):
-        if hasattr(self, 'filter_GETFH4resok'):
-            data = getattr(self, 'filter_GETFH4resok')(data)
+        if 'GETFH4resok' in self._filters:
+            data = self._filters['GETFH4resok'](self, data)
         if data.object is None:
             raise TypeError, 'data.object == None'
         self.pack_nfs_fh4(data.object)
 
     def pack_GETFH4res(self, data):
-        if hasattr(self, 'filter_GETFH4res'):
-            data = getattr(self, 'filter_GETFH4res')(data)
+        if 'GETFH4res' in self._filters:
+            data = self._filters['GETFH4res'](self, data)
         if data.status is None:
             raise TypeError, 'data.status == None'
         self.pack_nfsstat4(data.status)
@@ -1121,22 +1158,22 @@ class NFS4Packer(xdrlib.Packer):
             pass
 
     def pack_LINK4args(self, data):
-        if hasattr(self, 'filter_LINK4args'):
-            data = getattr(self, 'filter_LINK4args')(data)
+        if 'LINK4args' in self._filters:
+            data = self._filters['LINK4args'](self, data)
         if data.newname is None:
             raise TypeError, 'data.newname == None'
         self.pack_component4(data.newname)
 
     def pack_LINK4resok(self, data):
-        if hasattr(self, 'filter_LINK4resok'):
-            data = getattr(self, 'filter_LINK4resok')(data)
+        if 'LINK4resok' in self._filters:
+            data = self._filters['LINK4resok'](self, data)
         if data.cinfo is None:
             raise TypeError, 'data.cinfo == None'
         self.pack_change_info4(data.cinfo)
 
     def pack_LINK4res(self, data):
-        if hasattr(self, 'filter_LINK4res'):
-            data = getattr(self, 'filter_LINK4res')(data)
+        if 'LINK4res' in self._filters:
+            data = self._filters['LINK4res'](self, data)
         if data.status is None:
             raise TypeError, 'data.status == None'
         self.pack_nfsstat4(data.status)
@@ -1148,8 +1185,8 @@ class NFS4Packer(xdrlib.Packer):
             pass
 
     def pack_open_to_lock_owner4(self, data):
-        if hasattr(self, 'filter_open_to_lock_owner4'):
-            data = getattr(self, 'filter_open_to_lock_owner4')(data)
+        if 'open_to_lock_owner4' in self._filters:
+            data = self._filters['open_to_lock_owner4'](self, data)
         if data.open_seqid is None:
             raise TypeError, 'data.open_seqid == None'
         self.pack_seqid4(data.open_seqid)
@@ -1164,8 +1201,8 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_lock_owner4(data.lock_owner)
 
     def pack_exist_lock_owner4(self, data):
-        if hasattr(self, 'filter_exist_lock_owner4'):
-            data = getattr(self, 'filter_exist_lock_owner4')(data)
+        if 'exist_lock_owner4' in self._filters:
+            data = self._filters['exist_lock_owner4'](self, data)
         if data.lock_stateid is None:
             raise TypeError, 'data.lock_stateid == None'
         self.pack_stateid4(data.lock_stateid)
@@ -1174,8 +1211,8 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_seqid4(data.lock_seqid)
 
     def pack_locker4(self, data):
-        if hasattr(self, 'filter_locker4'):
-            data = getattr(self, 'filter_locker4')(data)
+        if 'locker4' in self._filters:
+            data = self._filters['locker4'](self, data)
         if data.new_lock_owner is None:
             raise TypeError, 'data.new_lock_owner == None'
         self.pack_bool(data.new_lock_owner)
@@ -1191,8 +1228,8 @@ class NFS4Packer(xdrlib.Packer):
             raise XDRError, 'bad switch=%s' % data.new_lock_owner
 
     def pack_LOCK4args(self, data):
-        if hasattr(self, 'filter_LOCK4args'):
-            data = getattr(self, 'filter_LOCK4args')(data)
+        if 'LOCK4args' in self._filters:
+            data = self._filters['LOCK4args'](self, data)
         if data.locktype is None:
             raise TypeError, 'data.locktype == None'
         self.pack_nfs_lock_type4(data.locktype)
@@ -1210,8 +1247,8 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_locker4(data.locker)
 
     def pack_LOCK4denied(self, data):
-        if hasattr(self, 'filter_LOCK4denied'):
-            data = getattr(self, 'filter_LOCK4denied')(data)
+        if 'LOCK4denied' in self._filters:
+            data = self._filters['LOCK4denied'](self, data)
         if data.offset is None:
             raise TypeError, 'data.offset == None'
         self.pack_offset4(data.offset)
@@ -1226,15 +1263,15 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_lock_owner4(data.owner)
 
     def pack_LOCK4resok(self, data):
-        if hasattr(self, 'filter_LOCK4resok'):
-            data = getattr(self, 'filter_LOCK4resok')(data)
+        if 'LOCK4resok' in self._filters:
+            data = self._filters['LOCK4resok'](self, data)
         if data.lock_stateid is None:
             raise TypeError, 'data.lock_stateid == None'
         self.pack_stateid4(data.lock_stateid)
 
     def pack_LOCK4res(self, data):
-        if hasattr(self, 'filter_LOCK4res'):
-            data = getattr(self, 'filter_LOCK4res')(data)
+        if 'LOCK4res' in self._filters:
+            data = self._filters['LOCK4res'](self, data)
         if data.status is None:
             raise TypeError, 'data.status == None'
         self.pack_nfsstat4(data.status)
@@ -1250,8 +1287,8 @@ class NFS4Packer(xdrlib.Packer):
             pass
 
     def pack_LOCKT4args(self, data):
-        if hasattr(self, 'filter_LOCKT4args'):
-            data = getattr(self, 'filter_LOCKT4args')(data)
+        if 'LOCKT4args' in self._filters:
+            data = self._filters['LOCKT4args'](self, data)
         if data.locktype is None:
             raise TypeError, 'data.locktype == None'
         self.pack_nfs_lock_type4(data.locktype)
@@ -1266,8 +1303,8 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_lock_owner4(data.owner)
 
     def pack_LOCKT4res(self, data):
-        if hasattr(self, 'filter_LOCKT4res'):
-            data = getattr(self, 'filter_LOCKT4res')(data)
+        if 'LOCKT4res' in self._filters:
+            data = self._filters['LOCKT4res'](self, data)
         if data.status is None:
             raise TypeError, 'data.status == None'
         self.pack_nfsstat4(data.status)
@@ -1281,8 +1318,8 @@ class NFS4Packer(xdrlib.Packer):
             pass
 
     def pack_LOCKU4args(self, data):
-        if hasattr(self, 'filter_LOCKU4args'):
-            data = getattr(self, 'filter_LOCKU4args')(data)
+        if 'LOCKU4args' in self._filters:
+            data = self._filters['LOCKU4args'](self, data)
         if data.locktype is None:
             raise TypeError, 'data.locktype == None'
         self.pack_nfs_lock_type4(data.locktype)
@@ -1300,8 +1337,8 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_length4(data.length)
 
     def pack_LOCKU4res(self, data):
-        if hasattr(self, 'filter_LOCKU4res'):
-            data = getattr(self, 'filter_LOCKU4res')(data)
+        if 'LOCKU4res' in self._filters:
+            data = self._filters['LOCKU4res'](self, data)
         if data.status is None:
             raise TypeError, 'data.status == None'
         self.pack_nfsstat4(data.status)
@@ -1313,50 +1350,50 @@ class NFS4Packer(xdrlib.Packer):
             pass
 
     def pack_LOOKUP4args(self, data):
-        if hasattr(self, 'filter_LOOKUP4args'):
-            data = getattr(self, 'filter_LOOKUP4args')(data)
+        if 'LOOKUP4args' in self._filters:
+            data = self._filters['LOOKUP4args'](self, data)
         if data.objname is None:
             raise TypeError, 'data.objname == None'
         self.pack_component4(data.objname)
 
     def pack_LOOKUP4res(self, data):
-        if hasattr(self, 'filter_LOOKUP4res'):
-            data = getattr(self, 'filter_LOOKUP4res')(data)
+        if 'LOOKUP4res' in self._filters:
+            data = self._filters['LOOKUP4res'](self, data)
         if data.status is None:
             raise TypeError, 'data.status == None'
         self.pack_nfsstat4(data.status)
 
     def pack_LOOKUPP4res(self, data):
-        if hasattr(self, 'filter_LOOKUPP4res'):
-            data = getattr(self, 'filter_LOOKUPP4res')(data)
+        if 'LOOKUPP4res' in self._filters:
+            data = self._filters['LOOKUPP4res'](self, data)
         if data.status is None:
             raise TypeError, 'data.status == None'
         self.pack_nfsstat4(data.status)
 
     def pack_NVERIFY4args(self, data):
-        if hasattr(self, 'filter_NVERIFY4args'):
-            data = getattr(self, 'filter_NVERIFY4args')(data)
+        if 'NVERIFY4args' in self._filters:
+            data = self._filters['NVERIFY4args'](self, data)
         if data.obj_attributes is None:
             raise TypeError, 'data.obj_attributes == None'
         self.pack_fattr4(data.obj_attributes)
 
     def pack_NVERIFY4res(self, data):
-        if hasattr(self, 'filter_NVERIFY4res'):
-            data = getattr(self, 'filter_NVERIFY4res')(data)
+        if 'NVERIFY4res' in self._filters:
+            data = self._filters['NVERIFY4res'](self, data)
         if data.status is None:
             raise TypeError, 'data.status == None'
         self.pack_nfsstat4(data.status)
 
     def pack_createmode4(self, data):
-        if hasattr(self, 'filter_createmode4'):
-            data = getattr(self, 'filter_createmode4')(data)
+        if 'createmode4' in self._filters:
+            data = self._filters['createmode4'](self, data)
         if self.check_enum and data not in [const.UNCHECKED4, const.GUARDED4, const.EXCLUSIVE4, const.EXCLUSIVE4_1]:
             raise XDRError, 'value=%s not in enum createmode4' % data
         self.pack_int(data)
 
     def pack_creatverfattr(self, data):
-        if hasattr(self, 'filter_creatverfattr'):
-            data = getattr(self, 'filter_creatverfattr')(data)
+        if 'creatverfattr' in self._filters:
+            data = self._filters['creatverfattr'](self, data)
         if data.cva_verf is None:
             raise TypeError, 'data.cva_verf == None'
         self.pack_verifier4(data.cva_verf)
@@ -1365,8 +1402,8 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_fattr4(data.cva_attrs)
 
     def pack_createhow4(self, data):
-        if hasattr(self, 'filter_createhow4'):
-            data = getattr(self, 'filter_createhow4')(data)
+        if 'createhow4' in self._filters:
+            data = self._filters['createhow4'](self, data)
         if data.mode is None:
             raise TypeError, 'data.mode == None'
         self.pack_createmode4(data.mode)
@@ -1386,15 +1423,15 @@ class NFS4Packer(xdrlib.Packer):
             raise XDRError, 'bad switch=%s' % data.mode
 
     def pack_opentype4(self, data):
-        if hasattr(self, 'filter_opentype4'):
-            data = getattr(self, 'filter_opentype4')(data)
+        if 'opentype4' in self._filters:
+            data = self._filters['opentype4'](self, data)
         if self.check_enum and data not in [const.OPEN4_NOCREATE, const.OPEN4_CREATE]:
             raise XDRError, 'value=%s not in enum opentype4' % data
         self.pack_int(data)
 
     def pack_openflag4(self, data):
-        if hasattr(self, 'filter_openflag4'):
-            data = getattr(self, 'filter_openflag4')(data)
+        if 'openflag4' in self._filters:
+            data = self._filters['openflag4'](self, data)
         if data.opentype is None:
             raise TypeError, 'data.opentype == None'
         self.pack_opentype4(data.opentype)
@@ -1406,15 +1443,15 @@ class NFS4Packer(xdrlib.Packer):
             pass
 
     def pack_limit_by4(self, data):
-        if hasattr(self, 'filter_limit_by4'):
-            data = getattr(self, 'filter_limit_by4')(data)
+        if 'limit_by4' in self._filters:
+            data = self._filters['limit_by4'](self, data)
         if self.check_enum and data not in [const.NFS_LIMIT_SIZE, const.NFS_LIMIT_BLOCKS]:
             raise XDRError, 'value=%s not in enum limit_by4' % data
         self.pack_int(data)
 
     def pack_nfs_modified_limit4(self, data):
-        if hasattr(self, 'filter_nfs_modified_limit4'):
-            data = getattr(self, 'filter_nfs_modified_limit4')(data)
+        if 'nfs_modified_limit4' in self._filters:
+            data = self._filters['nfs_modified_limit4'](self, data)
         if data.num_blocks is None:
             raise TypeError, 'data.num_blocks == None'
         self.pack_uint32_t(data.num_blocks)
@@ -1423,8 +1460,8 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_uint32_t(data.bytes_per_block)
 
     def pack_nfs_space_limit4(self, data):
-        if hasattr(self, 'filter_nfs_space_limit4'):
-            data = getattr(self, 'filter_nfs_space_limit4')(data)
+        if 'nfs_space_limit4' in self._filters:
+            data = self._filters['nfs_space_limit4'](self, data)
         if data.limitby is None:
             raise TypeError, 'data.limitby == None'
         self.pack_limit_by4(data.limitby)
@@ -1440,22 +1477,22 @@ class NFS4Packer(xdrlib.Packer):
             raise XDRError, 'bad switch=%s' % data.limitby
 
     def pack_open_delegation_type4(self, data):
-        if hasattr(self, 'filter_open_delegation_type4'):
-            data = getattr(self, 'filter_open_delegation_type4')(data)
+        if 'open_delegation_type4' in self._filters:
+            data = self._filters['open_delegation_type4'](self, data)
         if self.check_enum and data not in [const.OPEN_DELEGATE_NONE, const.OPEN_DELEGATE_READ, const.OPEN_DELEGATE_WRITE, const.OPEN_DELEGATE_NONE_EXT]:
             raise XDRError, 'value=%s not in enum open_delegation_type4' % data
         self.pack_int(data)
 
     def pack_open_claim_type4(self, data):
-        if hasattr(self, 'filter_open_claim_type4'):
-            data = getattr(self, 'filter_open_claim_type4')(data)
+        if 'open_claim_type4' in self._filters:
+            data = self._filters['open_claim_type4'](self, data)
         if self.check_enum and data not in [const.CLAIM_NULL, const.CLAIM_PREVIOUS, const.CLAIM_DELEGATE_CUR, const.CLAIM_DELEGATE_PREV, const.CLAIM_FH, const.CLAIM_DELEG_CUR_FH, const.CLAIM_DELEG_PREV_FH]:
             raise XDRError, 'value=%s not in enum open_claim_type4' % data
         self.pack_int(data)
 
     def pack_open_claim_delegate_cur4(self, data):
-        if hasattr(self, 'filter_open_claim_delegate_cur4'):
-            data = getattr(self, 'filter_open_claim_delegate_cur4')(data)
+        if 'open_claim_delegate_cur4' in self._filters:
+            data = self._filters['open_claim_delegate_cur4'](self, data)
         if data.delegate_stateid is None:
             raise TypeError, 'data.delegate_stateid == None'
         self.pack_stateid4(data.delegate_stateid)
@@ -1464,8 +1501,8 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_component4(data.file)
 
     def pack_open_claim4(self, data):
-        if hasattr(self, 'filter_open_claim4'):
-            data = getattr(self, 'filter_open_claim4')(data)
+        if 'open_claim4' in self._filters:
+            data = self._filters['open_claim4'](self, data)
         if data.claim is None:
             raise TypeError, 'data.claim == None'
         self.pack_open_claim_type4(data.claim)
@@ -1497,8 +1534,8 @@ class NFS4Packer(xdrlib.Packer):
             raise XDRError, 'bad switch=%s' % data.claim
 
     def pack_OPEN4args(self, data):
-        if hasattr(self, 'filter_OPEN4args'):
-            data = getattr(self, 'filter_OPEN4args')(data)
+        if 'OPEN4args' in self._filters:
+            data = self._filters['OPEN4args'](self, data)
         if data.seqid is None:
             raise TypeError, 'data.seqid == None'
         self.pack_seqid4(data.seqid)
@@ -1519,8 +1556,8 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_open_claim4(data.claim)
 
     def pack_open_read_delegation4(self, data):
-        if hasattr(self, 'filter_open_read_delegation4'):
-            data = getattr(self, 'filter_open_read_delegation4')(data)
+        if 'open_read_delegation4' in self._filters:
+            data = self._filters['open_read_delegation4'](self, data)
         if data.stateid is None:
             raise TypeError, 'data.stateid == None'
         self.pack_stateid4(data.stateid)
@@ -1532,8 +1569,8 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_nfsace4(data.permissions)
 
     def pack_open_write_delegation4(self, data):
-        if hasattr(self, 'filter_open_write_delegation4'):
-            data = getattr(self, 'filter_open_write_delegation4')(data)
+        if 'open_write_delegation4' in self._filters:
+            data = self._filters['open_write_delegation4'](self, data)
         if data.stateid is None:
             raise TypeError, 'data.stateid == None'
         self.pack_stateid4(data.stateid)
@@ -1548,15 +1585,15 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_nfsace4(data.permissions)
 
     def pack_why_no_delegation4(self, data):
-        if hasattr(self, 'filter_why_no_delegation4'):
-            data = getattr(self, 'filter_why_no_delegation4')(data)
+        if 'why_no_delegation4' in self._filters:
+            data = self._filters['why_no_delegation4'](self, data)
         if self.check_enum and data not in [const.WND4_NOT_WANTED, const.WND4_CONTENTION, const.WND4_RESOURCE, const.WND4_NOT_SUPP_FTYPE, const.WND4_WRITE_DELEG_NOT_SUPP_FTYPE, const.WND4_NOT_SUPP_UPGRADE, const.WND4_NOT_SUPP_DOWNGRADE, const.WND4_CANCELED, const.WND4_IS_DIR]:
             raise XDRError, 'value=%s not in enum why_no_delegation4' % data
         self.pack_int(data)
 
     def pack_open_none_delegation4(self, data):
-        if hasattr(self, 'filter_open_none_delegation4'):
-            data = getattr(self, 'filter_open_none_delegation4')(data)
+        if 'open_none_delegation4' in self._filters:
+            data = self._filters['open_none_delegation4'](self, data)
         if data.ond_why is None:
             raise TypeError, 'data.ond_why == None'
         self.pack_why_no_delegation4(data.ond_why)
@@ -1572,8 +1609,8 @@ class NFS4Packer(xdrlib.Packer):
             pass
 
     def pack_open_delegation4(self, data):
-        if hasattr(self, 'filter_open_delegation4'):
-            data = getattr(self, 'filter_open_delegation4')(data)
+        if 'open_delegation4' in self._filters:
+            data = self._filters['open_delegation4'](self, data)
         if data.delegation_type is None:
             raise TypeError, 'data.delegation_type == None'
         self.pack_open_delegation_type4(data.delegation_type)
@@ -1595,8 +1632,8 @@ class NFS4Packer(xdrlib.Packer):
             raise XDRError, 'bad switch=%s' % data.delegation_type
 
     def pack_OPEN4resok(self, data):
-        if hasattr(self, 'filter_OPEN4resok'):
-            data = getattr(self, 'filter_OPEN4resok')(data)
+        if 'OPEN4resok' in self._filters:
+            data = self._filters['OPEN4resok'](self, data)
         if data.stateid is None:
             raise TypeError, 'data.stateid == None'
         self.pack_stateid4(data.stateid)
@@ -1614,8 +1651,8 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_open_delegation4(data.delegation)
 
     def pack_OPEN4res(self, data):
-        if hasattr(self, 'filter_OPEN4res'):
-            data = getattr(self, 'filter_OPEN4res')(data)
+        if 'OPEN4res' in self._filters:
+            data = self._filters['OPEN4res'](self, data)
         if data.status is None:
             raise TypeError, 'data.status == None'
         self.pack_nfsstat4(data.status)
@@ -1627,22 +1664,22 @@ class NFS4Packer(xdrlib.Packer):
             pass
 
     def pack_OPENATTR4args(self, data):
-        if hasattr(self, 'filter_OPENATTR4args'):
-            data = getattr(self, 'filter_OPENATTR4args')(data)
+        if 'OPENATTR4args' in self._filters:
+            data = self._filters['OPENATTR4args'](self, data)
         if data.createdir is None:
             raise TypeError, 'data.createdir == None'
         self.pack_bool(data.createdir)
 
     def pack_OPENATTR4res(self, data):
-        if hasattr(self, 'filter_OPENATTR4res'):
-            data = getattr(self, 'filter_OPENATTR4res')(data)
+        if 'OPENATTR4res' in self._filters:
+            data = self._filters['OPENATTR4res'](self, data)
         if data.status is None:
             raise TypeError, 'data.status == None'
         self.pack_nfsstat4(data.status)
 
     def pack_OPEN_CONFIRM4args(self, data):
-        if hasattr(self, 'filter_OPEN_CONFIRM4args'):
-            data = getattr(self, 'filter_OPEN_CONFIRM4args')(data)
+        if 'OPEN_CONFIRM4args' in self._filters:
+            data = self._filters['OPEN_CONFIRM4args'](self, data)
         if data.open_stateid is None:
             raise TypeError, 'data.open_stateid == None'
         self.pack_stateid4(data.open_stateid)
@@ -1651,15 +1688,15 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_seqid4(data.seqid)
 
     def pack_OPEN_CONFIRM4resok(self, data):
-        if hasattr(self, 'filter_OPEN_CONFIRM4resok'):
-            data = getattr(self, 'filter_OPEN_CONFIRM4resok')(data)
+        if 'OPEN_CONFIRM4resok' in self._filters:
+            data = self._filters['OPEN_CONFIRM4resok'](self, data)
         if data.open_stateid is None:
             raise TypeError, 'data.open_stateid == None'
         self.pack_stateid4(data.open_stateid)
 
     def pack_OPEN_CONFIRM4res(self, data):
-        if hasattr(self, 'filter_OPEN_CONFIRM4res'):
-            data = getattr(self, 'filter_OPEN_CONFIRM4res')(data)
+        if 'OPEN_CONFIRM4res' in self._filters:
+            data = self._filters['OPEN_CONFIRM4res'](self, data)
         if data.status is None:
             raise TypeError, 'data.status == None'
         self.pack_nfsstat4(data.status)
@@ -1671,8 +1708,8 @@ class NFS4Packer(xdrlib.Packer):
             pass
 
     def pack_OPEN_DOWNGRADE4args(self, data):
-        if hasattr(self, 'filter_OPEN_DOWNGRADE4args'):
-            data = getattr(self, 'filter_OPEN_DOWNGRADE4args')(data)
+        if 'OPEN_DOWNGRADE4args' in self._filters:
+            data = self._filters['OPEN_DOWNGRADE4args'](self, data)
         if data.open_stateid is None:
             raise TypeError, 'data.open_stateid == None'
         self.pack_stateid4(data.open_stateid)
@@ -1687,15 +1724,15 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_uint32_t(data.share_deny)
 
     def pack_OPEN_DOWNGRADE4resok(self, data):
-        if hasattr(self, 'filter_OPEN_DOWNGRADE4resok'):
-            data = getattr(self, 'filter_OPEN_DOWNGRADE4resok')(data)
+        if 'OPEN_DOWNGRADE4resok' in self._filters:
+            data = self._filters['OPEN_DOWNGRADE4resok'](self, data)
         if data.open_stateid is None:
             raise TypeError, 'data.open_stateid == None'
         self.pack_stateid4(data.open_stateid)
 
     def pack_OPEN_DOWNGRADE4res(self, data):
-        if hasattr(self, 'filter_OPEN_DOWNGRADE4res'):
-            data = getattr(self, 'filter_OPEN_DOWNGRADE4res')(data)
+        if 'OPEN_DOWNGRADE4res' in self._filters:
+            data = self._filters['OPEN_DOWNGRADE4res'](self, data)
         if data.status is None:
             raise TypeError, 'data.status == None'
         self.pack_nfsstat4(data.status)
@@ -1707,36 +1744,36 @@ class NFS4Packer(xdrlib.Packer):
             pass
 
     def pack_PUTFH4args(self, data):
-        if hasattr(self, 'filter_PUTFH4args'):
-            data = getattr(self, 'filter_PUTFH4args')(data)
+        if 'PUTFH4args' in self._filters:
+            data = self._filters['PUTFH4args'](self, data)
         if data.object is None:
             raise TypeError, 'data.object == None'
         self.pack_nfs_fh4(data.object)
 
     def pack_PUTFH4res(self, data):
-        if hasattr(self, 'filter_PUTFH4res'):
-            data = getattr(self, 'filter_PUTFH4res')(data)
+        if 'PUTFH4res' in self._filters:
+            data = self._filters['PUTFH4res'](self, data)
         if data.status is None:
             raise TypeError, 'data.status == None'
         self.pack_nfsstat4(data.status)
 
     def pack_PUTPUBFH4res(self, data):
-        if hasattr(self, 'filter_PUTPUBFH4res'):
-            data = getattr(self, 'filter_PUTPUBFH4res')(data)
+        if 'PUTPUBFH4res' in self._filters:
+            data = self._filters['PUTPUBFH4res'](self, data)
         if data.status is None:
             raise TypeError, 'data.status == None'
         self.pack_nfsstat4(data.status)
 
     def pack_PUTROOTFH4res(self, data):
-        if hasattr(self, 'filter_PUTROOTFH4res'):
-            data = getattr(self, 'filter_PUTROOTFH4res')(data)
+        if 'PUTROOTFH4res' in self._filters:
+            data = self._filters['PUTROOTFH4res'](self, data)
         if data.status is None:
             raise TypeError, 'data.status == None'
         self.pack_nfsstat4(data.status)
 
     def pack_READ4args(self, data):
-        if hasattr(self, 'filter_READ4args'):
-            data = getattr(self, 'filter_READ4args')(data)
+        if 'READ4args' in self._filters:
+            data = self._filters['READ4args'](self, data)
         if data.stateid is None:
             raise TypeError, 'data.stateid == None'
         self.pack_stateid4(data.stateid)
@@ -1748,8 +1785,8 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_count4(data.count)
 
     def pack_READ4resok(self, data):
-        if hasattr(self, 'filter_READ4resok'):
-            data = getattr(self, 'filter_READ4resok')(data)
+        if 'READ4resok' in self._filters:
+            data = self._filters['READ4resok'](self, data)
         if data.eof is None:
             raise TypeError, 'data.eof == None'
         self.pack_bool(data.eof)
@@ -1758,8 +1795,8 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_opaque(data.data)
 
     def pack_READ4res(self, data):
-        if hasattr(self, 'filter_READ4res'):
-            data = getattr(self, 'filter_READ4res')(data)
+        if 'READ4res' in self._filters:
+            data = self._filters['READ4res'](self, data)
         if data.status is None:
             raise TypeError, 'data.status == None'
         self.pack_nfsstat4(data.status)
@@ -1771,8 +1808,8 @@ class NFS4Packer(xdrlib.Packer):
             pass
 
     def pack_READDIR4args(self, data):
-        if hasattr(self, 'filter_READDIR4args'):
-            data = getattr(self, 'filter_READDIR4args')(data)
+        if 'READDIR4args' in self._filters:
+            data = self._filters['READDIR4args'](self, data)
         if data.cookie is None:
             raise TypeError, 'data.cookie == None'
         self.pack_nfs_cookie4(data.cookie)
@@ -1790,8 +1827,8 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_bitmap4(data.attr_request)
 
     def pack_entry4(self, data):
-        if hasattr(self, 'filter_entry4'):
-            data = getattr(self, 'filter_entry4')(data)
+        if 'entry4' in self._filters:
+            data = self._filters['entry4'](self, data)
         if data.cookie is None:
             raise TypeError, 'data.cookie == None'
         self.pack_nfs_cookie4(data.cookie)
@@ -1803,8 +1840,8 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_fattr4(data.attrs)
 
     def pack_dirlist4(self, data):
-        if hasattr(self, 'filter_dirlist4'):
-            data = getattr(self, 'filter_dirlist4')(data)
+        if 'dirlist4' in self._filters:
+            data = self._filters['dirlist4'](self, data)
         if data.entries is None:
             raise TypeError, 'data.entries == None'
         self.pack_list(data.entries, self.pack_entry4)
@@ -1813,8 +1850,8 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_bool(data.eof)
 
     def pack_READDIR4resok(self, data):
-        if hasattr(self, 'filter_READDIR4resok'):
-            data = getattr(self, 'filter_READDIR4resok')(data)
+        if 'READDIR4resok' in self._filters:
+            data = self._filters['READDIR4resok'](self, data)
         if data.cookieverf is None:
             raise TypeError, 'data.cookieverf == None'
         self.pack_verifier4(data.cookieverf)
@@ -1823,8 +1860,8 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_dirlist4(data.reply)
 
     def pack_READDIR4res(self, data):
-        if hasattr(self, 'filter_READDIR4res'):
-            data = getattr(self, 'filter_READDIR4res')(data)
+        if 'READDIR4res' in self._filters:
+            data = self._filters['READDIR4res'](self, data)
         if data.status is None:
             raise TypeError, 'data.status == None'
         self.pack_nfsstat4(data.status)
@@ -1836,15 +1873,15 @@ class NFS4Packer(xdrlib.Packer):
             pass
 
     def pack_READLINK4resok(self, data):
-        if hasattr(self, 'filter_READLINK4resok'):
-            data = getattr(self, 'filter_READLINK4resok')(data)
+        if 'READLINK4resok' in self._filters:
+            data = self._filters['READLINK4resok'](self, data)
         if data.link is None:
             raise TypeError, 'data.link == None'
         self.pack_linktext4(data.link)
 
     def pack_READLINK4res(self, data):
-        if hasattr(self, 'filter_READLINK4res'):
-            data = getattr(self, 'filter_READLINK4res')(data)
+        if 'READLINK4res' in self._filters:
+            data = self._filters['READLINK4res'](self, data)
         if data.status is None:
             raise TypeError, 'data.status == None'
         self.pack_nfsstat4(data.status)
@@ -1856,22 +1893,22 @@ class NFS4Packer(xdrlib.Packer):
             pass
 
     def pack_REMOVE4args(self, data):
-        if hasattr(self, 'filter_REMOVE4args'):
-            data = getattr(self, 'filter_REMOVE4args')(data)
+        if 'REMOVE4args' in self._filters:
+            data = self._filters['REMOVE4args'](self, data)
         if data.target is None:
             raise TypeError, 'data.target == None'
         self.pack_component4(data.target)
 
     def pack_REMOVE4resok(self, data):
-        if hasattr(self, 'filter_REMOVE4resok'):
-            data = getattr(self, 'filter_REMOVE4resok')(data)
+        if 'REMOVE4resok' in self._filters:
+            data = self._filters['REMOVE4resok'](self, data)
         if data.cinfo is None:
             raise TypeError, 'data.cinfo == None'
         self.pack_change_info4(data.cinfo)
 
     def pack_REMOVE4res(self, data):
-        if hasattr(self, 'filter_REMOVE4res'):
-            data = getattr(self, 'filter_REMOVE4res')(data)
+        if 'REMOVE4res' in self._filters:
+            data = self._filters['REMOVE4res'](self, data)
         if data.status is None:
             raise TypeError, 'data.status == None'
         self.pack_nfsstat4(data.status)
@@ -1883,8 +1920,8 @@ class NFS4Packer(xdrlib.Packer):
             pass
 
     def pack_RENAME4args(self, data):
-        if hasattr(self, 'filter_RENAME4args'):
-            data = getattr(self, 'filter_RENAME4args')(data)
+        if 'RENAME4args' in self._filters:
+            data = self._filters['RENAME4args'](self, data)
         if data.oldname is None:
             raise TypeError, 'data.oldname == None'
         self.pack_component4(data.oldname)
@@ -1893,8 +1930,8 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_component4(data.newname)
 
     def pack_RENAME4resok(self, data):
-        if hasattr(self, 'filter_RENAME4resok'):
-            data = getattr(self, 'filter_RENAME4resok')(data)
+        if 'RENAME4resok' in self._filters:
+            data = self._filters['RENAME4resok'](self, data)
         if data.source_cinfo is None:
             raise TypeError, 'data.source_cinfo == None'
         self.pack_change_info4(data.source_cinfo)
@@ -1903,8 +1940,8 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_change_info4(data.target_cinfo)
 
     def pack_RENAME4res(self, data):
-        if hasattr(self, 'filter_RENAME4res'):
-            data = getattr(self, 'filter_RENAME4res')(data)
+        if 'RENAME4res' in self._filters:
+            data = self._filters['RENAME4res'](self, data)
         if data.status is None:
             raise TypeError, 'data.status == None'
         self.pack_nfsstat4(data.status)
@@ -1916,50 +1953,50 @@ class NFS4Packer(xdrlib.Packer):
             pass
 
     def pack_RENEW4args(self, data):
-        if hasattr(self, 'filter_RENEW4args'):
-            data = getattr(self, 'filter_RENEW4args')(data)
+        if 'RENEW4args' in self._filters:
+            data = self._filters['RENEW4args'](self, data)
         if data.clientid is None:
             raise TypeError, 'data.clientid == None'
         self.pack_clientid4(data.clientid)
 
     def pack_RENEW4res(self, data):
-        if hasattr(self, 'filter_RENEW4res'):
-            data = getattr(self, 'filter_RENEW4res')(data)
+        if 'RENEW4res' in self._filters:
+            data = self._filters['RENEW4res'](self, data)
         if data.status is None:
             raise TypeError, 'data.status == None'
         self.pack_nfsstat4(data.status)
 
     def pack_RESTOREFH4res(self, data):
-        if hasattr(self, 'filter_RESTOREFH4res'):
-            data = getattr(self, 'filter_RESTOREFH4res')(data)
+        if 'RESTOREFH4res' in self._filters:
+            data = self._filters['RESTOREFH4res'](self, data)
         if data.status is None:
             raise TypeError, 'data.status == None'
         self.pack_nfsstat4(data.status)
 
     def pack_SAVEFH4res(self, data):
-        if hasattr(self, 'filter_SAVEFH4res'):
-            data = getattr(self, 'filter_SAVEFH4res')(data)
+        if 'SAVEFH4res' in self._filters:
+            data = self._filters['SAVEFH4res'](self, data)
         if data.status is None:
             raise TypeError, 'data.status == None'
         self.pack_nfsstat4(data.status)
 
     def pack_SECINFO4args(self, data):
-        if hasattr(self, 'filter_SECINFO4args'):
-            data = getattr(self, 'filter_SECINFO4args')(data)
+        if 'SECINFO4args' in self._filters:
+            data = self._filters['SECINFO4args'](self, data)
         if data.name is None:
             raise TypeError, 'data.name == None'
         self.pack_component4(data.name)
 
     def pack_rpc_gss_svc_t(self, data):
-        if hasattr(self, 'filter_rpc_gss_svc_t'):
-            data = getattr(self, 'filter_rpc_gss_svc_t')(data)
+        if 'rpc_gss_svc_t' in self._filters:
+            data = self._filters['rpc_gss_svc_t'](self, data)
         if self.check_enum and data not in [const.RPC_GSS_SVC_NONE, const.RPC_GSS_SVC_INTEGRITY, const.RPC_GSS_SVC_PRIVACY]:
             raise XDRError, 'value=%s not in enum rpc_gss_svc_t' % data
         self.pack_int(data)
 
     def pack_rpcsec_gss_info(self, data):
-        if hasattr(self, 'filter_rpcsec_gss_info'):
-            data = getattr(self, 'filter_rpcsec_gss_info')(data)
+        if 'rpcsec_gss_info' in self._filters:
+            data = self._filters['rpcsec_gss_info'](self, data)
         if data.oid is None:
             raise TypeError, 'data.oid == None'
         self.pack_sec_oid4(data.oid)
@@ -1971,8 +2008,8 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_rpc_gss_svc_t(data.service)
 
     def pack_secinfo4(self, data):
-        if hasattr(self, 'filter_secinfo4'):
-            data = getattr(self, 'filter_secinfo4')(data)
+        if 'secinfo4' in self._filters:
+            data = self._filters['secinfo4'](self, data)
         if data.flavor is None:
             raise TypeError, 'data.flavor == None'
         self.pack_uint32_t(data.flavor)
@@ -1984,13 +2021,13 @@ class NFS4Packer(xdrlib.Packer):
             pass
 
     def pack_SECINFO4resok(self, data):
-        if hasattr(self, 'filter_SECINFO4resok'):
-            data = getattr(self, 'filter_SECINFO4resok')(data)
+        if 'SECINFO4resok' in self._filters:
+            data = self._filters['SECINFO4resok'](self, data)
         self.pack_array(data, self.pack_secinfo4)
 
     def pack_SECINFO4res(self, data):
-        if hasattr(self, 'filter_SECINFO4res'):
-            data = getattr(self, 'filter_SECINFO4res')(data)
+        if 'SECINFO4res' in self._filters:
+            data = self._filters['SECINFO4res'](self, data)
         if data.status is None:
             raise TypeError, 'data.status == None'
         self.pack_nfsstat4(data.status)
@@ -2002,8 +2039,8 @@ class NFS4Packer(xdrlib.Packer):
             pass
 
     def pack_SETATTR4args(self, data):
-        if hasattr(self, 'filter_SETATTR4args'):
-            data = getattr(self, 'filter_SETATTR4args')(data)
+        if 'SETATTR4args' in self._filters:
+            data = self._filters['SETATTR4args'](self, data)
         if data.stateid is None:
             raise TypeError, 'data.stateid == None'
         self.pack_stateid4(data.stateid)
@@ -2012,8 +2049,8 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_fattr4(data.obj_attributes)
 
     def pack_SETATTR4res(self, data):
-        if hasattr(self, 'filter_SETATTR4res'):
-            data = getattr(self, 'filter_SETATTR4res')(data)
+        if 'SETATTR4res' in self._filters:
+            data = self._filters['SETATTR4res'](self, data)
         if data.status is None:
             raise TypeError, 'data.status == None'
         self.pack_nfsstat4(data.status)
@@ -2022,8 +2059,8 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_bitmap4(data.attrsset)
 
     def pack_SETCLIENTID4args(self, data):
-        if hasattr(self, 'filter_SETCLIENTID4args'):
-            data = getattr(self, 'filter_SETCLIENTID4args')(data)
+        if 'SETCLIENTID4args' in self._filters:
+            data = self._filters['SETCLIENTID4args'](self, data)
         if data.client is None:
             raise TypeError, 'data.client == None'
         self.pack_nfs_client_id4(data.client)
@@ -2035,8 +2072,8 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_uint32_t(data.callback_ident)
 
     def pack_SETCLIENTID4resok(self, data):
-        if hasattr(self, 'filter_SETCLIENTID4resok'):
-            data = getattr(self, 'filter_SETCLIENTID4resok')(data)
+        if 'SETCLIENTID4resok' in self._filters:
+            data = self._filters['SETCLIENTID4resok'](self, data)
         if data.clientid is None:
             raise TypeError, 'data.clientid == None'
         self.pack_clientid4(data.clientid)
@@ -2045,8 +2082,8 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_verifier4(data.setclientid_confirm)
 
     def pack_SETCLIENTID4res(self, data):
-        if hasattr(self, 'filter_SETCLIENTID4res'):
-            data = getattr(self, 'filter_SETCLIENTID4res')(data)
+        if 'SETCLIENTID4res' in self._filters:
+            data = self._filters['SETCLIENTID4res'](self, data)
         if data.status is None:
             raise TypeError, 'data.status == None'
         self.pack_nfsstat4(data.status)
@@ -2062,8 +2099,8 @@ class NFS4Packer(xdrlib.Packer):
             pass
 
     def pack_SETCLIENTID_CONFIRM4args(self, data):
-        if hasattr(self, 'filter_SETCLIENTID_CONFIRM4args'):
-            data = getattr(self, 'filter_SETCLIENTID_CONFIRM4args')(data)
+        if 'SETCLIENTID_CONFIRM4args' in self._filters:
+            data = self._filters['SETCLIENTID_CONFIRM4args'](self, data)
         if data.clientid is None:
             raise TypeError, 'data.clientid == None'
         self.pack_clientid4(data.clientid)
@@ -2072,36 +2109,36 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_verifier4(data.setclientid_confirm)
 
     def pack_SETCLIENTID_CONFIRM4res(self, data):
-        if hasattr(self, 'filter_SETCLIENTID_CONFIRM4res'):
-            data = getattr(self, 'filter_SETCLIENTID_CONFIRM4res')(data)
+        if 'SETCLIENTID_CONFIRM4res' in self._filters:
+            data = self._filters['SETCLIENTID_CONFIRM4res'](self, data)
         if data.status is None:
             raise TypeError, 'data.status == None'
         self.pack_nfsstat4(data.status)
 
     def pack_VERIFY4args(self, data):
-        if hasattr(self, 'filter_VERIFY4args'):
-            data = getattr(self, 'filter_VERIFY4args')(data)
+        if 'VERIFY4args' in self._filters:
+            data = self._filters['VERIFY4args'](self, data)
         if data.obj_attributes is None:
             raise TypeError, 'data.obj_attributes == None'
         self.pack_fattr4(data.obj_attributes)
 
     def pack_VERIFY4res(self, data):
-        if hasattr(self, 'filter_VERIFY4res'):
-            data = getattr(self, 'filter_VERIFY4res')(data)
+        if 'VERIFY4res' in self._filters:
+            data = self._filters['VERIFY4res'](self, data)
         if data.status is None:
             raise TypeError, 'data.status == None'
         self.pack_nfsstat4(data.status)
 
     def pack_stable_how4(self, data):
-        if hasattr(self, 'filter_stable_how4'):
-            data = getattr(self, 'filter_stable_how4')(data)
+        if 'stable_how4' in self._filters:
+            data = self._filters['stable_how4'](self, data)
         if self.check_enum and data not in [const.UNSTABLE4, const.DATA_SYNC4, const.FILE_SYNC4]:
             raise XDRError, 'value=%s not in enum stable_how4' % data
         self.pack_int(data)
 
     def pack_WRITE4args(self, data):
-        if hasattr(self, 'filter_WRITE4args'):
-            data = getattr(self, 'filter_WRITE4args')(data)
+        if 'WRITE4args' in self._filters:
+            data = self._filters['WRITE4args'](self, data)
         if data.stateid is None:
             raise TypeError, 'data.stateid == None'
         self.pack_stateid4(data.stateid)
@@ -2116,8 +2153,8 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_opaque(data.data)
 
     def pack_WRITE4resok(self, data):
-        if hasattr(self, 'filter_WRITE4resok'):
-            data = getattr(self, 'filter_WRITE4resok')(data)
+        if 'WRITE4resok' in self._filters:
+            data = self._filters['WRITE4resok'](self, data)
         if data.count is None:
             raise TypeError, 'data.count == None'
         self.pack_count4(data.count)
@@ -2129,8 +2166,8 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_verifier4(data.writeverf)
 
     def pack_WRITE4res(self, data):
-        if hasattr(self, 'filter_WRITE4res'):
-            data = getattr(self, 'filter_WRITE4res')(data)
+        if 'WRITE4res' in self._filters:
+            data = self._filters['WRITE4res'](self, data)
         if data.status is None:
             raise TypeError, 'data.status == None'
         self.pack_nfsstat4(data.status)
@@ -2142,34 +2179,34 @@ class NFS4Packer(xdrlib.Packer):
             pass
 
     def pack_RELEASE_LOCKOWNER4args(self, data):
-        if hasattr(self, 'filter_RELEASE_LOCKOWNER4args'):
-            data = getattr(self, 'filter_RELEASE_LOCKOWNER4args')(data)
+        if 'RELEASE_LOCKOWNER4args' in self._filters:
+            data = self._filters['RELEASE_LOCKOWNER4args'](self, data)
         if data.lock_owner is None:
             raise TypeError, 'data.lock_owner == None'
         self.pack_lock_owner4(data.lock_owner)
 
     def pack_RELEASE_LOCKOWNER4res(self, data):
-        if hasattr(self, 'filter_RELEASE_LOCKOWNER4res'):
-            data = getattr(self, 'filter_RELEASE_LOCKOWNER4res')(data)
+        if 'RELEASE_LOCKOWNER4res' in self._filters:
+            data = self._filters['RELEASE_LOCKOWNER4res'](self, data)
         if data.status is None:
             raise TypeError, 'data.status == None'
         self.pack_nfsstat4(data.status)
 
     def pack_ILLEGAL4res(self, data):
-        if hasattr(self, 'filter_ILLEGAL4res'):
-            data = getattr(self, 'filter_ILLEGAL4res')(data)
+        if 'ILLEGAL4res' in self._filters:
+            data = self._filters['ILLEGAL4res'](self, data)
         if data.status is None:
             raise TypeError, 'data.status == None'
         self.pack_nfsstat4(data.status)
 
     def pack_gsshandle4_t(self, data):
-        if hasattr(self, 'filter_gsshandle4_t'):
-            data = getattr(self, 'filter_gsshandle4_t')(data)
+        if 'gsshandle4_t' in self._filters:
+            data = self._filters['gsshandle4_t'](self, data)
         self.pack_opaque(data)
 
     def pack_gss_cb_handles4(self, data):
-        if hasattr(self, 'filter_gss_cb_handles4'):
-            data = getattr(self, 'filter_gss_cb_handles4')(data)
+        if 'gss_cb_handles4' in self._filters:
+            data = self._filters['gss_cb_handles4'](self, data)
         if data.gcbp_service is None:
             raise TypeError, 'data.gcbp_service == None'
         self.pack_rpc_gss_svc_t(data.gcbp_service)
@@ -2181,8 +2218,8 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_gsshandle4_t(data.gcbp_handle_from_client)
 
     def pack_callback_sec_parms4(self, data):
-        if hasattr(self, 'filter_callback_sec_parms4'):
-            data = getattr(self, 'filter_callback_sec_parms4')(data)
+        if 'callback_sec_parms4' in self._filters:
+            data = self._filters['callback_sec_parms4'](self, data)
         if data.cb_secflavor is None:
             raise TypeError, 'data.cb_secflavor == None'
         self.pack_uint32_t(data.cb_secflavor)
@@ -2200,8 +2237,8 @@ class NFS4Packer(xdrlib.Packer):
             raise XDRError, 'bad switch=%s' % data.cb_secflavor
 
     def pack_BACKCHANNEL_CTL4args(self, data):
-        if hasattr(self, 'filter_BACKCHANNEL_CTL4args'):
-            data = getattr(self, 'filter_BACKCHANNEL_CTL4args')(data)
+        if 'BACKCHANNEL_CTL4args' in self._filters:
+            data = self._filters['BACKCHANNEL_CTL4args'](self, data)
         if data.bca_cb_program is None:
             raise TypeError, 'data.bca_cb_program == None'
         self.pack_uint32_t(data.bca_cb_program)
@@ -2210,22 +2247,22 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_array(data.bca_sec_parms, self.pack_callback_sec_parms4)
 
     def pack_BACKCHANNEL_CTL4res(self, data):
-        if hasattr(self, 'filter_BACKCHANNEL_CTL4res'):
-            data = getattr(self, 'filter_BACKCHANNEL_CTL4res')(data)
+        if 'BACKCHANNEL_CTL4res' in self._filters:
+            data = self._filters['BACKCHANNEL_CTL4res'](self, data)
         if data.bcr_status is None:
             raise TypeError, 'data.bcr_status == None'
         self.pack_nfsstat4(data.bcr_status)
 
     def pack_channel_dir_from_client4(self, data):
-        if hasattr(self, 'filter_channel_dir_from_client4'):
-            data = getattr(self, 'filter_channel_dir_from_client4')(data)
+        if 'channel_dir_from_client4' in self._filters:
+            data = self._filters['channel_dir_from_client4'](self, data)
         if self.check_enum and data not in [const.CDFC4_FORE, const.CDFC4_BACK, const.CDFC4_FORE_OR_BOTH, const.CDFC4_BACK_OR_BOTH]:
             raise XDRError, 'value=%s not in enum channel_dir_from_client4' % data
         self.pack_int(data)
 
     def pack_BIND_CONN_TO_SESSION4args(self, data):
-        if hasattr(self, 'filter_BIND_CONN_TO_SESSION4args'):
-            data = getattr(self, 'filter_BIND_CONN_TO_SESSION4args')(data)
+        if 'BIND_CONN_TO_SESSION4args' in self._filters:
+            data = self._filters['BIND_CONN_TO_SESSION4args'](self, data)
         if data.bctsa_sessid is None:
             raise TypeError, 'data.bctsa_sessid == None'
         self.pack_sessionid4(data.bctsa_sessid)
@@ -2237,15 +2274,15 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_bool(data.bctsa_use_conn_in_rdma_mode)
 
     def pack_channel_dir_from_server4(self, data):
-        if hasattr(self, 'filter_channel_dir_from_server4'):
-            data = getattr(self, 'filter_channel_dir_from_server4')(data)
+        if 'channel_dir_from_server4' in self._filters:
+            data = self._filters['channel_dir_from_server4'](self, data)
         if self.check_enum and data not in [const.CDFS4_FORE, const.CDFS4_BACK, const.CDFS4_BOTH]:
             raise XDRError, 'value=%s not in enum channel_dir_from_server4' % data
         self.pack_int(data)
 
     def pack_BIND_CONN_TO_SESSION4resok(self, data):
-        if hasattr(self, 'filter_BIND_CONN_TO_SESSION4resok'):
-            data = getattr(self, 'filter_BIND_CONN_TO_SESSION4resok')(data)
+        if 'BIND_CONN_TO_SESSION4resok' in self._filters:
+            data = self._filters['BIND_CONN_TO_SESSION4resok'](self, data)
         if data.bctsr_sessid is None:
             raise TypeError, 'data.bctsr_sessid == None'
         self.pack_sessionid4(data.bctsr_sessid)
@@ -2257,8 +2294,8 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_bool(data.bctsr_use_conn_in_rdma_mode)
 
     def pack_BIND_CONN_TO_SESSION4res(self, data):
-        if hasattr(self, 'filter_BIND_CONN_TO_SESSION4res'):
-            data = getattr(self, 'filter_BIND_CONN_TO_SESSION4res')(data)
+        if 'BIND_CONN_TO_SESSION4res' in self._filters:
+            data = self._filters['BIND_CONN_TO_SESSION4res'](self, data)
         if data.bctsr_status is None:
             raise TypeError, 'data.bctsr_status == None'
         self.pack_nfsstat4(data.bctsr_status)
@@ -2270,8 +2307,8 @@ class NFS4Packer(xdrlib.Packer):
             pass
 
     def pack_state_protect_ops4(self, data):
-        if hasattr(self, 'filter_state_protect_ops4'):
-            data = getattr(self, 'filter_state_protect_ops4')(data)
+        if 'state_protect_ops4' in self._filters:
+            data = self._filters['state_protect_ops4'](self, data)
         if data.spo_must_enforce is None:
             raise TypeError, 'data.spo_must_enforce == None'
         self.pack_bitmap4(data.spo_must_enforce)
@@ -2280,8 +2317,8 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_bitmap4(data.spo_must_allow)
 
     def pack_ssv_sp_parms4(self, data):
-        if hasattr(self, 'filter_ssv_sp_parms4'):
-            data = getattr(self, 'filter_ssv_sp_parms4')(data)
+        if 'ssv_sp_parms4' in self._filters:
+            data = self._filters['ssv_sp_parms4'](self, data)
         if data.ssp_ops is None:
             raise TypeError, 'data.ssp_ops == None'
         self.pack_state_protect_ops4(data.ssp_ops)
@@ -2299,15 +2336,15 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_uint32_t(data.ssp_num_gss_handles)
 
     def pack_state_protect_how4(self, data):
-        if hasattr(self, 'filter_state_protect_how4'):
-            data = getattr(self, 'filter_state_protect_how4')(data)
+        if 'state_protect_how4' in self._filters:
+            data = self._filters['state_protect_how4'](self, data)
         if self.check_enum and data not in [const.SP4_NONE, const.SP4_MACH_CRED, const.SP4_SSV]:
             raise XDRError, 'value=%s not in enum state_protect_how4' % data
         self.pack_int(data)
 
     def pack_state_protect4_a(self, data):
-        if hasattr(self, 'filter_state_protect4_a'):
-            data = getattr(self, 'filter_state_protect4_a')(data)
+        if 'state_protect4_a' in self._filters:
+            data = self._filters['state_protect4_a'](self, data)
         if data.spa_how is None:
             raise TypeError, 'data.spa_how == None'
         self.pack_state_protect_how4(data.spa_how)
@@ -2325,8 +2362,8 @@ class NFS4Packer(xdrlib.Packer):
             raise XDRError, 'bad switch=%s' % data.spa_how
 
     def pack_EXCHANGE_ID4args(self, data):
-        if hasattr(self, 'filter_EXCHANGE_ID4args'):
-            data = getattr(self, 'filter_EXCHANGE_ID4args')(data)
+        if 'EXCHANGE_ID4args' in self._filters:
+            data = self._filters['EXCHANGE_ID4args'](self, data)
         if data.eia_clientowner is None:
             raise TypeError, 'data.eia_clientowner == None'
         self.pack_client_owner4(data.eia_clientowner)
@@ -2343,8 +2380,8 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_array(data.eia_client_impl_id, self.pack_nfs_impl_id4)
 
     def pack_ssv_prot_info4(self, data):
-        if hasattr(self, 'filter_ssv_prot_info4'):
-            data = getattr(self, 'filter_ssv_prot_info4')(data)
+        if 'ssv_prot_info4' in self._filters:
+            data = self._filters['ssv_prot_info4'](self, data)
         if data.spi_ops is None:
             raise TypeError, 'data.spi_ops == None'
         self.pack_state_protect_ops4(data.spi_ops)
@@ -2365,8 +2402,8 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_array(data.spi_handles, self.pack_gsshandle4_t)
 
     def pack_state_protect4_r(self, data):
-        if hasattr(self, 'filter_state_protect4_r'):
-            data = getattr(self, 'filter_state_protect4_r')(data)
+        if 'state_protect4_r' in self._filters:
+            data = self._filters['state_protect4_r'](self, data)
         if data.spr_how is None:
             raise TypeError, 'data.spr_how == None'
         self.pack_state_protect_how4(data.spr_how)
@@ -2384,8 +2421,8 @@ class NFS4Packer(xdrlib.Packer):
             raise XDRError, 'bad switch=%s' % data.spr_how
 
     def pack_EXCHANGE_ID4resok(self, data):
-        if hasattr(self, 'filter_EXCHANGE_ID4resok'):
-            data = getattr(self, 'filter_EXCHANGE_ID4resok')(data)
+        if 'EXCHANGE_ID4resok' in self._filters:
+            data = self._filters['EXCHANGE_ID4resok'](self, data)
         if data.eir_clientid is None:
             raise TypeError, 'data.eir_clientid == None'
         self.pack_clientid4(data.eir_clientid)
@@ -2413,8 +2450,8 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_array(data.eir_server_impl_id, self.pack_nfs_impl_id4)
 
     def pack_EXCHANGE_ID4res(self, data):
-        if hasattr(self, 'filter_EXCHANGE_ID4res'):
-            data = getattr(self, 'filter_EXCHANGE_ID4res')(data)
+        if 'EXCHANGE_ID4res' in self._filters:
+            data = self._filters['EXCHANGE_ID4res'](self, data)
         if data.eir_status is None:
             raise TypeError, 'data.eir_status == None'
         self.pack_nfsstat4(data.eir_status)
@@ -2426,8 +2463,8 @@ class NFS4Packer(xdrlib.Packer):
             pass
 
     def pack_channel_attrs4(self, data):
-        if hasattr(self, 'filter_channel_attrs4'):
-            data = getattr(self, 'filter_channel_attrs4')(data)
+        if 'channel_attrs4' in self._filters:
+            data = self._filters['channel_attrs4'](self, data)
         if data.ca_headerpadsize is None:
             raise TypeError, 'data.ca_headerpadsize == None'
         self.pack_count4(data.ca_headerpadsize)
@@ -2453,8 +2490,8 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_array(data.ca_rdma_ird, self.pack_uint32_t)
 
     def pack_CREATE_SESSION4args(self, data):
-        if hasattr(self, 'filter_CREATE_SESSION4args'):
-            data = getattr(self, 'filter_CREATE_SESSION4args')(data)
+        if 'CREATE_SESSION4args' in self._filters:
+            data = self._filters['CREATE_SESSION4args'](self, data)
         if data.csa_clientid is None:
             raise TypeError, 'data.csa_clientid == None'
         self.pack_clientid4(data.csa_clientid)
@@ -2478,8 +2515,8 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_array(data.csa_sec_parms, self.pack_callback_sec_parms4)
 
     def pack_CREATE_SESSION4resok(self, data):
-        if hasattr(self, 'filter_CREATE_SESSION4resok'):
-            data = getattr(self, 'filter_CREATE_SESSION4resok')(data)
+        if 'CREATE_SESSION4resok' in self._filters:
+            data = self._filters['CREATE_SESSION4resok'](self, data)
         if data.csr_sessionid is None:
             raise TypeError, 'data.csr_sessionid == None'
         self.pack_sessionid4(data.csr_sessionid)
@@ -2497,8 +2534,8 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_channel_attrs4(data.csr_back_chan_attrs)
 
     def pack_CREATE_SESSION4res(self, data):
-        if hasattr(self, 'filter_CREATE_SESSION4res'):
-            data = getattr(self, 'filter_CREATE_SESSION4res')(data)
+        if 'CREATE_SESSION4res' in self._filters:
+            data = self._filters['CREATE_SESSION4res'](self, data)
         if data.csr_status is None:
             raise TypeError, 'data.csr_status == None'
         self.pack_nfsstat4(data.csr_status)
@@ -2510,29 +2547,29 @@ class NFS4Packer(xdrlib.Packer):
             pass
 
     def pack_DESTROY_SESSION4args(self, data):
-        if hasattr(self, 'filter_DESTROY_SESSION4args'):
-            data = getattr(self, 'filter_DESTROY_SESSION4args')(data)
+        if 'DESTROY_SESSION4args' in self._filters:
+            data = self._filters['DESTROY_SESSION4args'](self, data)
         if data.dsa_sessionid is None:
             raise TypeError, 'data.dsa_sessionid == None'
         self.pack_sessionid4(data.dsa_sessionid)
 
     def pack_DESTROY_SESSION4res(self, data):
-        if hasattr(self, 'filter_DESTROY_SESSION4res'):
-            data = getattr(self, 'filter_DESTROY_SESSION4res')(data)
+        if 'DESTROY_SESSION4res' in self._filters:
+            data = self._filters['DESTROY_SESSION4res'](self, data)
         if data.dsr_status is None:
             raise TypeError, 'data.dsr_status == None'
         self.pack_nfsstat4(data.dsr_status)
 
     def pack_FREE_STATEID4args(self, data):
-        if hasattr(self, 'filter_FREE_STATEID4args'):
-            data = getattr(self, 'filter_FREE_STATEID4args')(data)
+        if 'FREE_STATEID4args' in self._filters:
+            data = self._filters['FREE_STATEID4args'](self, data)
         if data.fsa_stateid is None:
             raise TypeError, 'data.fsa_stateid == None'
         self.pack_stateid4(data.fsa_stateid)
 
     def pack_FREE_STATEID4res(self, data):
-        if hasattr(self, 'filter_FREE_STATEID4res'):
-            data = getattr(self, 'filter_FREE_STATEID4res')(data)
+        if 'FREE_STATEID4res' in self._filters:
+            data = self._filters['FREE_STATEID4res'](self, data)
         if data.fsr_status is None:
             raise TypeError, 'data.fsr_status == None'
         self.pack_nfsstat4(data.fsr_status)
@@ -2540,8 +2577,8 @@ class NFS4Packer(xdrlib.Packer):
     pack_attr_notice4 = pack_nfstime4
 
     def pack_GET_DIR_DELEGATION4args(self, data):
-        if hasattr(self, 'filter_GET_DIR_DELEGATION4args'):
-            data = getattr(self, 'filter_GET_DIR_DELEGATION4args')(data)
+        if 'GET_DIR_DELEGATION4args' in self._filters:
+            data = self._filters['GET_DIR_DELEGATION4args'](self, data)
         if data.gdda_signal_deleg_avail is None:
             raise TypeError, 'data.gdda_signal_deleg_avail == None'
         self.pack_bool(data.gdda_signal_deleg_avail)
@@ -2562,8 +2599,8 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_bitmap4(data.gdda_dir_attributes)
 
     def pack_GET_DIR_DELEGATION4resok(self, data):
-        if hasattr(self, 'filter_GET_DIR_DELEGATION4resok'):
-            data = getattr(self, 'filter_GET_DIR_DELEGATION4resok')(data)
+        if 'GET_DIR_DELEGATION4resok' in self._filters:
+            data = self._filters['GET_DIR_DELEGATION4resok'](self, data)
         if data.gddr_cookieverf is None:
             raise TypeError, 'data.gddr_cookieverf == None'
         self.pack_verifier4(data.gddr_cookieverf)
@@ -2581,15 +2618,15 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_bitmap4(data.gddr_dir_attributes)
 
     def pack_gddrnf4_status(self, data):
-        if hasattr(self, 'filter_gddrnf4_status'):
-            data = getattr(self, 'filter_gddrnf4_status')(data)
+        if 'gddrnf4_status' in self._filters:
+            data = self._filters['gddrnf4_status'](self, data)
         if self.check_enum and data not in [const.GDD4_OK, const.GDD4_UNAVAIL]:
             raise XDRError, 'value=%s not in enum gddrnf4_status' % data
         self.pack_int(data)
 
     def pack_GET_DIR_DELEGATION4res_non_fatal(self, data):
-        if hasattr(self, 'filter_GET_DIR_DELEGATION4res_non_fatal'):
-            data = getattr(self, 'filter_GET_DIR_DELEGATION4res_non_fatal')(data)
+        if 'GET_DIR_DELEGATION4res_non_fatal' in self._filters:
+            data = self._filters['GET_DIR_DELEGATION4res_non_fatal'](self, data)
         if data.gddrnf_status is None:
             raise TypeError, 'data.gddrnf_status == None'
         self.pack_gddrnf4_status(data.gddrnf_status)
@@ -2605,8 +2642,8 @@ class NFS4Packer(xdrlib.Packer):
             raise XDRError, 'bad switch=%s' % data.gddrnf_status
 
     def pack_GET_DIR_DELEGATION4res(self, data):
-        if hasattr(self, 'filter_GET_DIR_DELEGATION4res'):
-            data = getattr(self, 'filter_GET_DIR_DELEGATION4res')(data)
+        if 'GET_DIR_DELEGATION4res' in self._filters:
+            data = self._filters['GET_DIR_DELEGATION4res'](self, data)
         if data.gddr_status is None:
             raise TypeError, 'data.gddr_status == None'
         self.pack_nfsstat4(data.gddr_status)
@@ -2618,8 +2655,8 @@ class NFS4Packer(xdrlib.Packer):
             pass
 
     def pack_GETDEVICEINFO4args(self, data):
-        if hasattr(self, 'filter_GETDEVICEINFO4args'):
-            data = getattr(self, 'filter_GETDEVICEINFO4args')(data)
+        if 'GETDEVICEINFO4args' in self._filters:
+            data = self._filters['GETDEVICEINFO4args'](self, data)
         if data.gdia_device_id is None:
             raise TypeError, 'data.gdia_device_id == None'
         self.pack_deviceid4(data.gdia_device_id)
@@ -2634,8 +2671,8 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_bitmap4(data.gdia_notify_types)
 
     def pack_GETDEVICEINFO4resok(self, data):
-        if hasattr(self, 'filter_GETDEVICEINFO4resok'):
-            data = getattr(self, 'filter_GETDEVICEINFO4resok')(data)
+        if 'GETDEVICEINFO4resok' in self._filters:
+            data = self._filters['GETDEVICEINFO4resok'](self, data)
         if data.gdir_device_addr is None:
             raise TypeError, 'data.gdir_device_addr == None'
         self.pack_device_addr4(data.gdir_device_addr)
@@ -2644,8 +2681,8 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_bitmap4(data.gdir_notification)
 
     def pack_GETDEVICEINFO4res(self, data):
-        if hasattr(self, 'filter_GETDEVICEINFO4res'):
-            data = getattr(self, 'filter_GETDEVICEINFO4res')(data)
+        if 'GETDEVICEINFO4res' in self._filters:
+            data = self._filters['GETDEVICEINFO4res'](self, data)
         if data.gdir_status is None:
             raise TypeError, 'data.gdir_status == None'
         self.pack_nfsstat4(data.gdir_status)
@@ -2661,8 +2698,8 @@ class NFS4Packer(xdrlib.Packer):
             pass
 
     def pack_GETDEVICELIST4args(self, data):
-        if hasattr(self, 'filter_GETDEVICELIST4args'):
-            data = getattr(self, 'filter_GETDEVICELIST4args')(data)
+        if 'GETDEVICELIST4args' in self._filters:
+            data = self._filters['GETDEVICELIST4args'](self, data)
         if data.gdla_layout_type is None:
             raise TypeError, 'data.gdla_layout_type == None'
         self.pack_layouttype4(data.gdla_layout_type)
@@ -2677,8 +2714,8 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_verifier4(data.gdla_cookieverf)
 
     def pack_GETDEVICELIST4resok(self, data):
-        if hasattr(self, 'filter_GETDEVICELIST4resok'):
-            data = getattr(self, 'filter_GETDEVICELIST4resok')(data)
+        if 'GETDEVICELIST4resok' in self._filters:
+            data = self._filters['GETDEVICELIST4resok'](self, data)
         if data.gdlr_cookie is None:
             raise TypeError, 'data.gdlr_cookie == None'
         self.pack_nfs_cookie4(data.gdlr_cookie)
@@ -2693,8 +2730,8 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_bool(data.gdlr_eof)
 
     def pack_GETDEVICELIST4res(self, data):
-        if hasattr(self, 'filter_GETDEVICELIST4res'):
-            data = getattr(self, 'filter_GETDEVICELIST4res')(data)
+        if 'GETDEVICELIST4res' in self._filters:
+            data = self._filters['GETDEVICELIST4res'](self, data)
         if data.gdlr_status is None:
             raise TypeError, 'data.gdlr_status == None'
         self.pack_nfsstat4(data.gdlr_status)
@@ -2706,8 +2743,8 @@ class NFS4Packer(xdrlib.Packer):
             pass
 
     def pack_newtime4(self, data):
-        if hasattr(self, 'filter_newtime4'):
-            data = getattr(self, 'filter_newtime4')(data)
+        if 'newtime4' in self._filters:
+            data = self._filters['newtime4'](self, data)
         if data.nt_timechanged is None:
             raise TypeError, 'data.nt_timechanged == None'
         self.pack_bool(data.nt_timechanged)
@@ -2721,8 +2758,8 @@ class NFS4Packer(xdrlib.Packer):
             raise XDRError, 'bad switch=%s' % data.nt_timechanged
 
     def pack_newoffset4(self, data):
-        if hasattr(self, 'filter_newoffset4'):
-            data = getattr(self, 'filter_newoffset4')(data)
+        if 'newoffset4' in self._filters:
+            data = self._filters['newoffset4'](self, data)
         if data.no_newoffset is None:
             raise TypeError, 'data.no_newoffset == None'
         self.pack_bool(data.no_newoffset)
@@ -2736,8 +2773,8 @@ class NFS4Packer(xdrlib.Packer):
             raise XDRError, 'bad switch=%s' % data.no_newoffset
 
     def pack_LAYOUTCOMMIT4args(self, data):
-        if hasattr(self, 'filter_LAYOUTCOMMIT4args'):
-            data = getattr(self, 'filter_LAYOUTCOMMIT4args')(data)
+        if 'LAYOUTCOMMIT4args' in self._filters:
+            data = self._filters['LAYOUTCOMMIT4args'](self, data)
         if data.loca_offset is None:
             raise TypeError, 'data.loca_offset == None'
         self.pack_offset4(data.loca_offset)
@@ -2761,8 +2798,8 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_layoutupdate4(data.loca_layoutupdate)
 
     def pack_newsize4(self, data):
-        if hasattr(self, 'filter_newsize4'):
-            data = getattr(self, 'filter_newsize4')(data)
+        if 'newsize4' in self._filters:
+            data = self._filters['newsize4'](self, data)
         if data.ns_sizechanged is None:
             raise TypeError, 'data.ns_sizechanged == None'
         self.pack_bool(data.ns_sizechanged)
@@ -2776,15 +2813,15 @@ class NFS4Packer(xdrlib.Packer):
             raise XDRError, 'bad switch=%s' % data.ns_sizechanged
 
     def pack_LAYOUTCOMMIT4resok(self, data):
-        if hasattr(self, 'filter_LAYOUTCOMMIT4resok'):
-            data = getattr(self, 'filter_LAYOUTCOMMIT4resok')(data)
+        if 'LAYOUTCOMMIT4resok' in self._filters:
+            data = self._filters['LAYOUTCOMMIT4resok'](self, data)
         if data.locr_newsize is None:
             raise TypeError, 'data.locr_newsize == None'
         self.pack_newsize4(data.locr_newsize)
 
     def pack_LAYOUTCOMMIT4res(self, data):
-        if hasattr(self, 'filter_LAYOUTCOMMIT4res'):
-            data = getattr(self, 'filter_LAYOUTCOMMIT4res')(data)
+        if 'LAYOUTCOMMIT4res' in self._filters:
+            data = self._filters['LAYOUTCOMMIT4res'](self, data)
         if data.locr_status is None:
             raise TypeError, 'data.locr_status == None'
         self.pack_nfsstat4(data.locr_status)
@@ -2796,8 +2833,8 @@ class NFS4Packer(xdrlib.Packer):
             pass
 
     def pack_LAYOUTGET4args(self, data):
-        if hasattr(self, 'filter_LAYOUTGET4args'):
-            data = getattr(self, 'filter_LAYOUTGET4args')(data)
+        if 'LAYOUTGET4args' in self._filters:
+            data = self._filters['LAYOUTGET4args'](self, data)
         if data.loga_signal_layout_avail is None:
             raise TypeError, 'data.loga_signal_layout_avail == None'
         self.pack_bool(data.loga_signal_layout_avail)
@@ -2824,8 +2861,8 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_count4(data.loga_maxcount)
 
     def pack_LAYOUTGET4resok(self, data):
-        if hasattr(self, 'filter_LAYOUTGET4resok'):
-            data = getattr(self, 'filter_LAYOUTGET4resok')(data)
+        if 'LAYOUTGET4resok' in self._filters:
+            data = self._filters['LAYOUTGET4resok'](self, data)
         if data.logr_return_on_close is None:
             raise TypeError, 'data.logr_return_on_close == None'
         self.pack_bool(data.logr_return_on_close)
@@ -2837,8 +2874,8 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_array(data.logr_layout, self.pack_layout4)
 
     def pack_LAYOUTGET4res(self, data):
-        if hasattr(self, 'filter_LAYOUTGET4res'):
-            data = getattr(self, 'filter_LAYOUTGET4res')(data)
+        if 'LAYOUTGET4res' in self._filters:
+            data = self._filters['LAYOUTGET4res'](self, data)
         if data.logr_status is None:
             raise TypeError, 'data.logr_status == None'
         self.pack_nfsstat4(data.logr_status)
@@ -2854,8 +2891,8 @@ class NFS4Packer(xdrlib.Packer):
             pass
 
     def pack_LAYOUTRETURN4args(self, data):
-        if hasattr(self, 'filter_LAYOUTRETURN4args'):
-            data = getattr(self, 'filter_LAYOUTRETURN4args')(data)
+        if 'LAYOUTRETURN4args' in self._filters:
+            data = self._filters['LAYOUTRETURN4args'](self, data)
         if data.lora_reclaim is None:
             raise TypeError, 'data.lora_reclaim == None'
         self.pack_bool(data.lora_reclaim)
@@ -2870,8 +2907,8 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_layoutreturn4(data.lora_layoutreturn)
 
     def pack_layoutreturn_stateid(self, data):
-        if hasattr(self, 'filter_layoutreturn_stateid'):
-            data = getattr(self, 'filter_layoutreturn_stateid')(data)
+        if 'layoutreturn_stateid' in self._filters:
+            data = self._filters['layoutreturn_stateid'](self, data)
         if data.lrs_present is None:
             raise TypeError, 'data.lrs_present == None'
         self.pack_bool(data.lrs_present)
@@ -2885,8 +2922,8 @@ class NFS4Packer(xdrlib.Packer):
             raise XDRError, 'bad switch=%s' % data.lrs_present
 
     def pack_LAYOUTRETURN4res(self, data):
-        if hasattr(self, 'filter_LAYOUTRETURN4res'):
-            data = getattr(self, 'filter_LAYOUTRETURN4res')(data)
+        if 'LAYOUTRETURN4res' in self._filters:
+            data = self._filters['LAYOUTRETURN4res'](self, data)
         if data.lorr_status is None:
             raise TypeError, 'data.lorr_status == None'
         self.pack_nfsstat4(data.lorr_status)
@@ -2898,8 +2935,8 @@ class NFS4Packer(xdrlib.Packer):
             pass
 
     def pack_secinfo_style4(self, data):
-        if hasattr(self, 'filter_secinfo_style4'):
-            data = getattr(self, 'filter_secinfo_style4')(data)
+        if 'secinfo_style4' in self._filters:
+            data = self._filters['secinfo_style4'](self, data)
         if self.check_enum and data not in [const.SECINFO_STYLE4_CURRENT_FH, const.SECINFO_STYLE4_PARENT]:
             raise XDRError, 'value=%s not in enum secinfo_style4' % data
         self.pack_int(data)
@@ -2909,8 +2946,8 @@ class NFS4Packer(xdrlib.Packer):
     pack_SECINFO_NO_NAME4res = pack_SECINFO4res
 
     def pack_SEQUENCE4args(self, data):
-        if hasattr(self, 'filter_SEQUENCE4args'):
-            data = getattr(self, 'filter_SEQUENCE4args')(data)
+        if 'SEQUENCE4args' in self._filters:
+            data = self._filters['SEQUENCE4args'](self, data)
         if data.sa_sessionid is None:
             raise TypeError, 'data.sa_sessionid == None'
         self.pack_sessionid4(data.sa_sessionid)
@@ -2928,8 +2965,8 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_bool(data.sa_cachethis)
 
     def pack_SEQUENCE4resok(self, data):
-        if hasattr(self, 'filter_SEQUENCE4resok'):
-            data = getattr(self, 'filter_SEQUENCE4resok')(data)
+        if 'SEQUENCE4resok' in self._filters:
+            data = self._filters['SEQUENCE4resok'](self, data)
         if data.sr_sessionid is None:
             raise TypeError, 'data.sr_sessionid == None'
         self.pack_sessionid4(data.sr_sessionid)
@@ -2950,8 +2987,8 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_uint32_t(data.sr_status_flags)
 
     def pack_SEQUENCE4res(self, data):
-        if hasattr(self, 'filter_SEQUENCE4res'):
-            data = getattr(self, 'filter_SEQUENCE4res')(data)
+        if 'SEQUENCE4res' in self._filters:
+            data = self._filters['SEQUENCE4res'](self, data)
         if data.sr_status is None:
             raise TypeError, 'data.sr_status == None'
         self.pack_nfsstat4(data.sr_status)
@@ -2963,15 +3000,15 @@ class NFS4Packer(xdrlib.Packer):
             pass
 
     def pack_ssa_digest_input4(self, data):
-        if hasattr(self, 'filter_ssa_digest_input4'):
-            data = getattr(self, 'filter_ssa_digest_input4')(data)
+        if 'ssa_digest_input4' in self._filters:
+            data = self._filters['ssa_digest_input4'](self, data)
         if data.sdi_seqargs is None:
             raise TypeError, 'data.sdi_seqargs == None'
         self.pack_SEQUENCE4args(data.sdi_seqargs)
 
     def pack_SET_SSV4args(self, data):
-        if hasattr(self, 'filter_SET_SSV4args'):
-            data = getattr(self, 'filter_SET_SSV4args')(data)
+        if 'SET_SSV4args' in self._filters:
+            data = self._filters['SET_SSV4args'](self, data)
         if data.ssa_ssv is None:
             raise TypeError, 'data.ssa_ssv == None'
         self.pack_opaque(data.ssa_ssv)
@@ -2980,22 +3017,22 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_opaque(data.ssa_digest)
 
     def pack_ssr_digest_input4(self, data):
-        if hasattr(self, 'filter_ssr_digest_input4'):
-            data = getattr(self, 'filter_ssr_digest_input4')(data)
+        if 'ssr_digest_input4' in self._filters:
+            data = self._filters['ssr_digest_input4'](self, data)
         if data.sdi_seqres is None:
             raise TypeError, 'data.sdi_seqres == None'
         self.pack_SEQUENCE4res(data.sdi_seqres)
 
     def pack_SET_SSV4resok(self, data):
-        if hasattr(self, 'filter_SET_SSV4resok'):
-            data = getattr(self, 'filter_SET_SSV4resok')(data)
+        if 'SET_SSV4resok' in self._filters:
+            data = self._filters['SET_SSV4resok'](self, data)
         if data.ssr_digest is None:
             raise TypeError, 'data.ssr_digest == None'
         self.pack_opaque(data.ssr_digest)
 
     def pack_SET_SSV4res(self, data):
-        if hasattr(self, 'filter_SET_SSV4res'):
-            data = getattr(self, 'filter_SET_SSV4res')(data)
+        if 'SET_SSV4res' in self._filters:
+            data = self._filters['SET_SSV4res'](self, data)
         if data.ssr_status is None:
             raise TypeError, 'data.ssr_status == None'
         self.pack_nfsstat4(data.ssr_status)
@@ -3007,22 +3044,22 @@ class NFS4Packer(xdrlib.Packer):
             pass
 
     def pack_TEST_STATEID4args(self, data):
-        if hasattr(self, 'filter_TEST_STATEID4args'):
-            data = getattr(self, 'filter_TEST_STATEID4args')(data)
+        if 'TEST_STATEID4args' in self._filters:
+            data = self._filters['TEST_STATEID4args'](self, data)
         if data.ts_stateids is None:
             raise TypeError, 'data.ts_stateids == None'
         self.pack_array(data.ts_stateids, self.pack_stateid4)
 
     def pack_TEST_STATEID4resok(self, data):
-        if hasattr(self, 'filter_TEST_STATEID4resok'):
-            data = getattr(self, 'filter_TEST_STATEID4resok')(data)
+        if 'TEST_STATEID4resok' in self._filters:
+            data = self._filters['TEST_STATEID4resok'](self, data)
         if data.tsr_status_codes is None:
             raise TypeError, 'data.tsr_status_codes == None'
         self.pack_array(data.tsr_status_codes, self.pack_nfsstat4)
 
     def pack_TEST_STATEID4res(self, data):
-        if hasattr(self, 'filter_TEST_STATEID4res'):
-            data = getattr(self, 'filter_TEST_STATEID4res')(data)
+        if 'TEST_STATEID4res' in self._filters:
+            data = self._filters['TEST_STATEID4res'](self, data)
         if data.tsr_status is None:
             raise TypeError, 'data.tsr_status == None'
         self.pack_nfsstat4(data.tsr_status)
@@ -3034,8 +3071,8 @@ class NFS4Packer(xdrlib.Packer):
             pass
 
     def pack_deleg_claim4(self, data):
-        if hasattr(self, 'filter_deleg_claim4'):
-            data = getattr(self, 'filter_deleg_claim4')(data)
+        if 'deleg_claim4' in self._filters:
+            data = self._filters['deleg_claim4'](self, data)
         if data.dc_claim is None:
             raise TypeError, 'data.dc_claim == None'
         self.pack_open_claim_type4(data.dc_claim)
@@ -3051,8 +3088,8 @@ class NFS4Packer(xdrlib.Packer):
             raise XDRError, 'bad switch=%s' % data.dc_claim
 
     def pack_WANT_DELEGATION4args(self, data):
-        if hasattr(self, 'filter_WANT_DELEGATION4args'):
-            data = getattr(self, 'filter_WANT_DELEGATION4args')(data)
+        if 'WANT_DELEGATION4args' in self._filters:
+            data = self._filters['WANT_DELEGATION4args'](self, data)
         if data.wda_want is None:
             raise TypeError, 'data.wda_want == None'
         self.pack_uint32_t(data.wda_want)
@@ -3061,8 +3098,8 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_deleg_claim4(data.wda_claim)
 
     def pack_WANT_DELEGATION4res(self, data):
-        if hasattr(self, 'filter_WANT_DELEGATION4res'):
-            data = getattr(self, 'filter_WANT_DELEGATION4res')(data)
+        if 'WANT_DELEGATION4res' in self._filters:
+            data = self._filters['WANT_DELEGATION4res'](self, data)
         if data.wdr_status is None:
             raise TypeError, 'data.wdr_status == None'
         self.pack_nfsstat4(data.wdr_status)
@@ -3074,43 +3111,43 @@ class NFS4Packer(xdrlib.Packer):
             pass
 
     def pack_DESTROY_CLIENTID4args(self, data):
-        if hasattr(self, 'filter_DESTROY_CLIENTID4args'):
-            data = getattr(self, 'filter_DESTROY_CLIENTID4args')(data)
+        if 'DESTROY_CLIENTID4args' in self._filters:
+            data = self._filters['DESTROY_CLIENTID4args'](self, data)
         if data.dca_clientid is None:
             raise TypeError, 'data.dca_clientid == None'
         self.pack_clientid4(data.dca_clientid)
 
     def pack_DESTROY_CLIENTID4res(self, data):
-        if hasattr(self, 'filter_DESTROY_CLIENTID4res'):
-            data = getattr(self, 'filter_DESTROY_CLIENTID4res')(data)
+        if 'DESTROY_CLIENTID4res' in self._filters:
+            data = self._filters['DESTROY_CLIENTID4res'](self, data)
         if data.dcr_status is None:
             raise TypeError, 'data.dcr_status == None'
         self.pack_nfsstat4(data.dcr_status)
 
     def pack_RECLAIM_COMPLETE4args(self, data):
-        if hasattr(self, 'filter_RECLAIM_COMPLETE4args'):
-            data = getattr(self, 'filter_RECLAIM_COMPLETE4args')(data)
+        if 'RECLAIM_COMPLETE4args' in self._filters:
+            data = self._filters['RECLAIM_COMPLETE4args'](self, data)
         if data.rca_one_fs is None:
             raise TypeError, 'data.rca_one_fs == None'
         self.pack_bool(data.rca_one_fs)
 
     def pack_RECLAIM_COMPLETE4res(self, data):
-        if hasattr(self, 'filter_RECLAIM_COMPLETE4res'):
-            data = getattr(self, 'filter_RECLAIM_COMPLETE4res')(data)
+        if 'RECLAIM_COMPLETE4res' in self._filters:
+            data = self._filters['RECLAIM_COMPLETE4res'](self, data)
         if data.rcr_status is None:
             raise TypeError, 'data.rcr_status == None'
         self.pack_nfsstat4(data.rcr_status)
 
     def pack_nfs_opnum4(self, data):
-        if hasattr(self, 'filter_nfs_opnum4'):
-            data = getattr(self, 'filter_nfs_opnum4')(data)
+        if 'nfs_opnum4' in self._filters:
+            data = self._filters['nfs_opnum4'](self, data)
         if self.check_enum and data not in [const.OP_ACCESS, const.OP_CLOSE, const.OP_COMMIT, const.OP_CREATE, const.OP_DELEGPURGE, const.OP_DELEGRETURN, const.OP_GETATTR, const.OP_GETFH, const.OP_LINK, const.OP_LOCK, const.OP_LOCKT, const.OP_LOCKU, const.OP_LOOKUP, const.OP_LOOKUPP, const.OP_NVERIFY, const.OP_OPEN, const.OP_OPENATTR, const.OP_OPEN_CONFIRM, const.OP_OPEN_DOWNGRADE, const.OP_PUTFH, const.OP_PUTPUBFH, const.OP_PUTROOTFH, const.OP_READ, const.OP_READDIR, const.OP_READLINK, const.OP_REMOVE, const.OP_RENAME, const.OP_RENEW, const.OP_RESTOREFH, const.OP_SAVEFH, const.OP_SECINFO, const.OP_SETATTR, const.OP_SETCLIENTID, const.OP_SETCLIENTID_CONFIRM, const.OP_VERIFY, const.OP_WRITE, const.OP_RELEASE_LOCKOWNER, const.OP_BACKCHANNEL_CTL, const.OP_BIND_CONN_TO_SESSION, const.OP_EXCHANGE_ID, const.OP_CREATE_SESSION, const.OP_DESTROY_SESSION, const.OP_FREE_STATEID, const.OP_GET_DIR_DELEGATION, const.OP_GETDEVICEINFO, const.OP_GETDEVICELIST, const.OP_LAYOUTCOMMIT, const.OP_LAYOUTGET, const.OP_LAYOUTRETURN, const.OP_SECINFO_NO_NAME, const.OP_SEQUENCE, const.OP_SET_SSV, const.OP_TEST_STATEID, const.OP_WANT_DELEGATION, const.OP_DESTROY_CLIENTID, const.OP_RECLAIM_COMPLETE, const.OP_ILLEGAL]:
             raise XDRError, 'value=%s not in enum nfs_opnum4' % data
         self.pack_int(data)
 
     def pack_nfs_argop4(self, data):
-        if hasattr(self, 'filter_nfs_argop4'):
-            data = getattr(self, 'filter_nfs_argop4')(data)
+        if 'nfs_argop4' in self._filters:
+            data = self._filters['nfs_argop4'](self, data)
         if data.argop is None:
             raise TypeError, 'data.argop == None'
         self.pack_nfs_opnum4(data.argop)
@@ -3330,8 +3367,8 @@ class NFS4Packer(xdrlib.Packer):
             raise XDRError, 'bad switch=%s' % data.argop
 
     def pack_nfs_resop4(self, data):
-        if hasattr(self, 'filter_nfs_resop4'):
-            data = getattr(self, 'filter_nfs_resop4')(data)
+        if 'nfs_resop4' in self._filters:
+            data = self._filters['nfs_resop4'](self, data)
         if data.resop is None:
             raise TypeError, 'data.resop == None'
         self.pack_nfs_opnum4(data.resop)
@@ -3567,8 +3604,8 @@ class NFS4Packer(xdrlib.Packer):
             raise XDRError, 'bad switch=%s' % data.resop
 
     def pack_COMPOUND4args(self, data):
-        if hasattr(self, 'filter_COMPOUND4args'):
-            data = getattr(self, 'filter_COMPOUND4args')(data)
+        if 'COMPOUND4args' in self._filters:
+            data = self._filters['COMPOUND4args'](self, data)
         if data.tag is None:
             raise TypeError, 'data.tag == None'
         self.pack_utf8str_cs(data.tag)
@@ -3580,8 +3617,8 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_array(data.argarray, self.pack_nfs_argop4)
 
     def pack_COMPOUND4res(self, data):
-        if hasattr(self, 'filter_COMPOUND4res'):
-            data = getattr(self, 'filter_COMPOUND4res')(data)
+        if 'COMPOUND4res' in self._filters:
+            data = self._filters['COMPOUND4res'](self, data)
         if data.status is None:
             raise TypeError, 'data.status == None'
         self.pack_nfsstat4(data.status)
@@ -3593,8 +3630,8 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_array(data.resarray, self.pack_nfs_resop4)
 
     def pack_CB_GETATTR4args(self, data):
-        if hasattr(self, 'filter_CB_GETATTR4args'):
-            data = getattr(self, 'filter_CB_GETATTR4args')(data)
+        if 'CB_GETATTR4args' in self._filters:
+            data = self._filters['CB_GETATTR4args'](self, data)
         if data.fh is None:
             raise TypeError, 'data.fh == None'
         self.pack_nfs_fh4(data.fh)
@@ -3603,15 +3640,15 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_bitmap4(data.attr_request)
 
     def pack_CB_GETATTR4resok(self, data):
-        if hasattr(self, 'filter_CB_GETATTR4resok'):
-            data = getattr(self, 'filter_CB_GETATTR4resok')(data)
+        if 'CB_GETATTR4resok' in self._filters:
+            data = self._filters['CB_GETATTR4resok'](self, data)
         if data.obj_attributes is None:
             raise TypeError, 'data.obj_attributes == None'
         self.pack_fattr4(data.obj_attributes)
 
     def pack_CB_GETATTR4res(self, data):
-        if hasattr(self, 'filter_CB_GETATTR4res'):
-            data = getattr(self, 'filter_CB_GETATTR4res')(data)
+        if 'CB_GETATTR4res' in self._filters:
+            data = self._filters['CB_GETATTR4res'](self, data)
         if data.status is None:
             raise TypeError, 'data.status == None'
         self.pack_nfsstat4(data.status)
@@ -3623,8 +3660,8 @@ class NFS4Packer(xdrlib.Packer):
             pass
 
     def pack_CB_RECALL4args(self, data):
-        if hasattr(self, 'filter_CB_RECALL4args'):
-            data = getattr(self, 'filter_CB_RECALL4args')(data)
+        if 'CB_RECALL4args' in self._filters:
+            data = self._filters['CB_RECALL4args'](self, data)
         if data.stateid is None:
             raise TypeError, 'data.stateid == None'
         self.pack_stateid4(data.stateid)
@@ -3636,29 +3673,29 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_nfs_fh4(data.fh)
 
     def pack_CB_RECALL4res(self, data):
-        if hasattr(self, 'filter_CB_RECALL4res'):
-            data = getattr(self, 'filter_CB_RECALL4res')(data)
+        if 'CB_RECALL4res' in self._filters:
+            data = self._filters['CB_RECALL4res'](self, data)
         if data.status is None:
             raise TypeError, 'data.status == None'
         self.pack_nfsstat4(data.status)
 
     def pack_CB_ILLEGAL4res(self, data):
-        if hasattr(self, 'filter_CB_ILLEGAL4res'):
-            data = getattr(self, 'filter_CB_ILLEGAL4res')(data)
+        if 'CB_ILLEGAL4res' in self._filters:
+            data = self._filters['CB_ILLEGAL4res'](self, data)
         if data.status is None:
             raise TypeError, 'data.status == None'
         self.pack_nfsstat4(data.status)
 
     def pack_layoutrecall_type4(self, data):
-        if hasattr(self, 'filter_layoutrecall_type4'):
-            data = getattr(self, 'filter_layoutrecall_type4')(data)
+        if 'layoutrecall_type4' in self._filters:
+            data = self._filters['layoutrecall_type4'](self, data)
         if self.check_enum and data not in [const.LAYOUTRECALL4_FILE, const.LAYOUTRECALL4_FSID, const.LAYOUTRECALL4_ALL]:
             raise XDRError, 'value=%s not in enum layoutrecall_type4' % data
         self.pack_int(data)
 
     def pack_layoutrecall_file4(self, data):
-        if hasattr(self, 'filter_layoutrecall_file4'):
-            data = getattr(self, 'filter_layoutrecall_file4')(data)
+        if 'layoutrecall_file4' in self._filters:
+            data = self._filters['layoutrecall_file4'](self, data)
         if data.lor_fh is None:
             raise TypeError, 'data.lor_fh == None'
         self.pack_nfs_fh4(data.lor_fh)
@@ -3673,8 +3710,8 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_stateid4(data.lor_stateid)
 
     def pack_layoutrecall4(self, data):
-        if hasattr(self, 'filter_layoutrecall4'):
-            data = getattr(self, 'filter_layoutrecall4')(data)
+        if 'layoutrecall4' in self._filters:
+            data = self._filters['layoutrecall4'](self, data)
         if data.lor_recalltype is None:
             raise TypeError, 'data.lor_recalltype == None'
         self.pack_layoutrecall_type4(data.lor_recalltype)
@@ -3692,8 +3729,8 @@ class NFS4Packer(xdrlib.Packer):
             raise XDRError, 'bad switch=%s' % data.lor_recalltype
 
     def pack_CB_LAYOUTRECALL4args(self, data):
-        if hasattr(self, 'filter_CB_LAYOUTRECALL4args'):
-            data = getattr(self, 'filter_CB_LAYOUTRECALL4args')(data)
+        if 'CB_LAYOUTRECALL4args' in self._filters:
+            data = self._filters['CB_LAYOUTRECALL4args'](self, data)
         if data.clora_type is None:
             raise TypeError, 'data.clora_type == None'
         self.pack_layouttype4(data.clora_type)
@@ -3708,22 +3745,22 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_layoutrecall4(data.clora_recall)
 
     def pack_CB_LAYOUTRECALL4res(self, data):
-        if hasattr(self, 'filter_CB_LAYOUTRECALL4res'):
-            data = getattr(self, 'filter_CB_LAYOUTRECALL4res')(data)
+        if 'CB_LAYOUTRECALL4res' in self._filters:
+            data = self._filters['CB_LAYOUTRECALL4res'](self, data)
         if data.clorr_status is None:
             raise TypeError, 'data.clorr_status == None'
         self.pack_nfsstat4(data.clorr_status)
 
     def pack_notify_type4(self, data):
-        if hasattr(self, 'filter_notify_type4'):
-            data = getattr(self, 'filter_notify_type4')(data)
+        if 'notify_type4' in self._filters:
+            data = self._filters['notify_type4'](self, data)
         if self.check_enum and data not in [const.NOTIFY4_CHANGE_CHILD_ATTRS, const.NOTIFY4_CHANGE_DIR_ATTRS, const.NOTIFY4_REMOVE_ENTRY, const.NOTIFY4_ADD_ENTRY, const.NOTIFY4_RENAME_ENTRY, const.NOTIFY4_CHANGE_COOKIE_VERIFIER]:
             raise XDRError, 'value=%s not in enum notify_type4' % data
         self.pack_int(data)
 
     def pack_notify_entry4(self, data):
-        if hasattr(self, 'filter_notify_entry4'):
-            data = getattr(self, 'filter_notify_entry4')(data)
+        if 'notify_entry4' in self._filters:
+            data = self._filters['notify_entry4'](self, data)
         if data.ne_file is None:
             raise TypeError, 'data.ne_file == None'
         self.pack_component4(data.ne_file)
@@ -3732,8 +3769,8 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_fattr4(data.ne_attrs)
 
     def pack_prev_entry4(self, data):
-        if hasattr(self, 'filter_prev_entry4'):
-            data = getattr(self, 'filter_prev_entry4')(data)
+        if 'prev_entry4' in self._filters:
+            data = self._filters['prev_entry4'](self, data)
         if data.pe_prev_entry is None:
             raise TypeError, 'data.pe_prev_entry == None'
         self.pack_notify_entry4(data.pe_prev_entry)
@@ -3742,8 +3779,8 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_nfs_cookie4(data.pe_prev_entry_cookie)
 
     def pack_notify_remove4(self, data):
-        if hasattr(self, 'filter_notify_remove4'):
-            data = getattr(self, 'filter_notify_remove4')(data)
+        if 'notify_remove4' in self._filters:
+            data = self._filters['notify_remove4'](self, data)
         if data.nrm_old_entry is None:
             raise TypeError, 'data.nrm_old_entry == None'
         self.pack_notify_entry4(data.nrm_old_entry)
@@ -3752,8 +3789,8 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_nfs_cookie4(data.nrm_old_entry_cookie)
 
     def pack_notify_add4(self, data):
-        if hasattr(self, 'filter_notify_add4'):
-            data = getattr(self, 'filter_notify_add4')(data)
+        if 'notify_add4' in self._filters:
+            data = self._filters['notify_add4'](self, data)
         if data.nad_old_entry is None:
             raise TypeError, 'data.nad_old_entry == None'
         if len(data.nad_old_entry) > 1 and self.check_array:
@@ -3777,15 +3814,15 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_bool(data.nad_last_entry)
 
     def pack_notify_attr4(self, data):
-        if hasattr(self, 'filter_notify_attr4'):
-            data = getattr(self, 'filter_notify_attr4')(data)
+        if 'notify_attr4' in self._filters:
+            data = self._filters['notify_attr4'](self, data)
         if data.na_changed_entry is None:
             raise TypeError, 'data.na_changed_entry == None'
         self.pack_notify_entry4(data.na_changed_entry)
 
     def pack_notify_rename4(self, data):
-        if hasattr(self, 'filter_notify_rename4'):
-            data = getattr(self, 'filter_notify_rename4')(data)
+        if 'notify_rename4' in self._filters:
+            data = self._filters['notify_rename4'](self, data)
         if data.nrn_old_entry is None:
             raise TypeError, 'data.nrn_old_entry == None'
         self.pack_notify_remove4(data.nrn_old_entry)
@@ -3794,8 +3831,8 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_notify_add4(data.nrn_new_entry)
 
     def pack_notify_verifier4(self, data):
-        if hasattr(self, 'filter_notify_verifier4'):
-            data = getattr(self, 'filter_notify_verifier4')(data)
+        if 'notify_verifier4' in self._filters:
+            data = self._filters['notify_verifier4'](self, data)
         if data.nv_old_cookieverf is None:
             raise TypeError, 'data.nv_old_cookieverf == None'
         self.pack_verifier4(data.nv_old_cookieverf)
@@ -3804,13 +3841,13 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_verifier4(data.nv_new_cookieverf)
 
     def pack_notifylist4(self, data):
-        if hasattr(self, 'filter_notifylist4'):
-            data = getattr(self, 'filter_notifylist4')(data)
+        if 'notifylist4' in self._filters:
+            data = self._filters['notifylist4'](self, data)
         self.pack_opaque(data)
 
     def pack_notify4(self, data):
-        if hasattr(self, 'filter_notify4'):
-            data = getattr(self, 'filter_notify4')(data)
+        if 'notify4' in self._filters:
+            data = self._filters['notify4'](self, data)
         if data.notify_mask is None:
             raise TypeError, 'data.notify_mask == None'
         self.pack_bitmap4(data.notify_mask)
@@ -3819,8 +3856,8 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_notifylist4(data.notify_vals)
 
     def pack_CB_NOTIFY4args(self, data):
-        if hasattr(self, 'filter_CB_NOTIFY4args'):
-            data = getattr(self, 'filter_CB_NOTIFY4args')(data)
+        if 'CB_NOTIFY4args' in self._filters:
+            data = self._filters['CB_NOTIFY4args'](self, data)
         if data.cna_stateid is None:
             raise TypeError, 'data.cna_stateid == None'
         self.pack_stateid4(data.cna_stateid)
@@ -3832,15 +3869,15 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_array(data.cna_changes, self.pack_notify4)
 
     def pack_CB_NOTIFY4res(self, data):
-        if hasattr(self, 'filter_CB_NOTIFY4res'):
-            data = getattr(self, 'filter_CB_NOTIFY4res')(data)
+        if 'CB_NOTIFY4res' in self._filters:
+            data = self._filters['CB_NOTIFY4res'](self, data)
         if data.cnr_status is None:
             raise TypeError, 'data.cnr_status == None'
         self.pack_nfsstat4(data.cnr_status)
 
     def pack_CB_PUSH_DELEG4args(self, data):
-        if hasattr(self, 'filter_CB_PUSH_DELEG4args'):
-            data = getattr(self, 'filter_CB_PUSH_DELEG4args')(data)
+        if 'CB_PUSH_DELEG4args' in self._filters:
+            data = self._filters['CB_PUSH_DELEG4args'](self, data)
         if data.cpda_fh is None:
             raise TypeError, 'data.cpda_fh == None'
         self.pack_nfs_fh4(data.cpda_fh)
@@ -3849,15 +3886,15 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_open_delegation4(data.cpda_delegation)
 
     def pack_CB_PUSH_DELEG4res(self, data):
-        if hasattr(self, 'filter_CB_PUSH_DELEG4res'):
-            data = getattr(self, 'filter_CB_PUSH_DELEG4res')(data)
+        if 'CB_PUSH_DELEG4res' in self._filters:
+            data = self._filters['CB_PUSH_DELEG4res'](self, data)
         if data.cpdr_status is None:
             raise TypeError, 'data.cpdr_status == None'
         self.pack_nfsstat4(data.cpdr_status)
 
     def pack_CB_RECALL_ANY4args(self, data):
-        if hasattr(self, 'filter_CB_RECALL_ANY4args'):
-            data = getattr(self, 'filter_CB_RECALL_ANY4args')(data)
+        if 'CB_RECALL_ANY4args' in self._filters:
+            data = self._filters['CB_RECALL_ANY4args'](self, data)
         if data.craa_objects_to_keep is None:
             raise TypeError, 'data.craa_objects_to_keep == None'
         self.pack_uint32_t(data.craa_objects_to_keep)
@@ -3866,8 +3903,8 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_bitmap4(data.craa_type_mask)
 
     def pack_CB_RECALL_ANY4res(self, data):
-        if hasattr(self, 'filter_CB_RECALL_ANY4res'):
-            data = getattr(self, 'filter_CB_RECALL_ANY4res')(data)
+        if 'CB_RECALL_ANY4res' in self._filters:
+            data = self._filters['CB_RECALL_ANY4res'](self, data)
         if data.crar_status is None:
             raise TypeError, 'data.crar_status == None'
         self.pack_nfsstat4(data.crar_status)
@@ -3875,29 +3912,29 @@ class NFS4Packer(xdrlib.Packer):
     pack_CB_RECALLABLE_OBJ_AVAIL4args = pack_CB_RECALL_ANY4args
 
     def pack_CB_RECALLABLE_OBJ_AVAIL4res(self, data):
-        if hasattr(self, 'filter_CB_RECALLABLE_OBJ_AVAIL4res'):
-            data = getattr(self, 'filter_CB_RECALLABLE_OBJ_AVAIL4res')(data)
+        if 'CB_RECALLABLE_OBJ_AVAIL4res' in self._filters:
+            data = self._filters['CB_RECALLABLE_OBJ_AVAIL4res'](self, data)
         if data.croa_status is None:
             raise TypeError, 'data.croa_status == None'
         self.pack_nfsstat4(data.croa_status)
 
     def pack_CB_RECALL_SLOT4args(self, data):
-        if hasattr(self, 'filter_CB_RECALL_SLOT4args'):
-            data = getattr(self, 'filter_CB_RECALL_SLOT4args')(data)
+        if 'CB_RECALL_SLOT4args' in self._filters:
+            data = self._filters['CB_RECALL_SLOT4args'](self, data)
         if data.rsa_target_highest_slotid is None:
             raise TypeError, 'data.rsa_target_highest_slotid == None'
         self.pack_slotid4(data.rsa_target_highest_slotid)
 
     def pack_CB_RECALL_SLOT4res(self, data):
-        if hasattr(self, 'filter_CB_RECALL_SLOT4res'):
-            data = getattr(self, 'filter_CB_RECALL_SLOT4res')(data)
+        if 'CB_RECALL_SLOT4res' in self._filters:
+            data = self._filters['CB_RECALL_SLOT4res'](self, data)
         if data.rsr_status is None:
             raise TypeError, 'data.rsr_status == None'
         self.pack_nfsstat4(data.rsr_status)
 
     def pack_referring_call4(self, data):
-        if hasattr(self, 'filter_referring_call4'):
-            data = getattr(self, 'filter_referring_call4')(data)
+        if 'referring_call4' in self._filters:
+            data = self._filters['referring_call4'](self, data)
         if data.rc_sequenceid is None:
             raise TypeError, 'data.rc_sequenceid == None'
         self.pack_sequenceid4(data.rc_sequenceid)
@@ -3906,8 +3943,8 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_slotid4(data.rc_slotid)
 
     def pack_referring_call_list4(self, data):
-        if hasattr(self, 'filter_referring_call_list4'):
-            data = getattr(self, 'filter_referring_call_list4')(data)
+        if 'referring_call_list4' in self._filters:
+            data = self._filters['referring_call_list4'](self, data)
         if data.rcl_sessionid is None:
             raise TypeError, 'data.rcl_sessionid == None'
         self.pack_sessionid4(data.rcl_sessionid)
@@ -3916,8 +3953,8 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_array(data.rcl_referring_calls, self.pack_referring_call4)
 
     def pack_CB_SEQUENCE4args(self, data):
-        if hasattr(self, 'filter_CB_SEQUENCE4args'):
-            data = getattr(self, 'filter_CB_SEQUENCE4args')(data)
+        if 'CB_SEQUENCE4args' in self._filters:
+            data = self._filters['CB_SEQUENCE4args'](self, data)
         if data.csa_sessionid is None:
             raise TypeError, 'data.csa_sessionid == None'
         self.pack_sessionid4(data.csa_sessionid)
@@ -3938,8 +3975,8 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_array(data.csa_referring_call_lists, self.pack_referring_call_list4)
 
     def pack_CB_SEQUENCE4resok(self, data):
-        if hasattr(self, 'filter_CB_SEQUENCE4resok'):
-            data = getattr(self, 'filter_CB_SEQUENCE4resok')(data)
+        if 'CB_SEQUENCE4resok' in self._filters:
+            data = self._filters['CB_SEQUENCE4resok'](self, data)
         if data.csr_sessionid is None:
             raise TypeError, 'data.csr_sessionid == None'
         self.pack_sessionid4(data.csr_sessionid)
@@ -3957,8 +3994,8 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_slotid4(data.csr_target_highest_slotid)
 
     def pack_CB_SEQUENCE4res(self, data):
-        if hasattr(self, 'filter_CB_SEQUENCE4res'):
-            data = getattr(self, 'filter_CB_SEQUENCE4res')(data)
+        if 'CB_SEQUENCE4res' in self._filters:
+            data = self._filters['CB_SEQUENCE4res'](self, data)
         if data.csr_status is None:
             raise TypeError, 'data.csr_status == None'
         self.pack_nfsstat4(data.csr_status)
@@ -3970,8 +4007,8 @@ class NFS4Packer(xdrlib.Packer):
             pass
 
     def pack_CB_WANTS_CANCELLED4args(self, data):
-        if hasattr(self, 'filter_CB_WANTS_CANCELLED4args'):
-            data = getattr(self, 'filter_CB_WANTS_CANCELLED4args')(data)
+        if 'CB_WANTS_CANCELLED4args' in self._filters:
+            data = self._filters['CB_WANTS_CANCELLED4args'](self, data)
         if data.cwca_contended_wants_cancelled is None:
             raise TypeError, 'data.cwca_contended_wants_cancelled == None'
         self.pack_bool(data.cwca_contended_wants_cancelled)
@@ -3980,15 +4017,15 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_bool(data.cwca_resourced_wants_cancelled)
 
     def pack_CB_WANTS_CANCELLED4res(self, data):
-        if hasattr(self, 'filter_CB_WANTS_CANCELLED4res'):
-            data = getattr(self, 'filter_CB_WANTS_CANCELLED4res')(data)
+        if 'CB_WANTS_CANCELLED4res' in self._filters:
+            data = self._filters['CB_WANTS_CANCELLED4res'](self, data)
         if data.cwcr_status is None:
             raise TypeError, 'data.cwcr_status == None'
         self.pack_nfsstat4(data.cwcr_status)
 
     def pack_CB_NOTIFY_LOCK4args(self, data):
-        if hasattr(self, 'filter_CB_NOTIFY_LOCK4args'):
-            data = getattr(self, 'filter_CB_NOTIFY_LOCK4args')(data)
+        if 'CB_NOTIFY_LOCK4args' in self._filters:
+            data = self._filters['CB_NOTIFY_LOCK4args'](self, data)
         if data.cnla_fh is None:
             raise TypeError, 'data.cnla_fh == None'
         self.pack_nfs_fh4(data.cnla_fh)
@@ -3997,22 +4034,22 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_lock_owner4(data.cnla_lock_owner)
 
     def pack_CB_NOTIFY_LOCK4res(self, data):
-        if hasattr(self, 'filter_CB_NOTIFY_LOCK4res'):
-            data = getattr(self, 'filter_CB_NOTIFY_LOCK4res')(data)
+        if 'CB_NOTIFY_LOCK4res' in self._filters:
+            data = self._filters['CB_NOTIFY_LOCK4res'](self, data)
         if data.cnlr_status is None:
             raise TypeError, 'data.cnlr_status == None'
         self.pack_nfsstat4(data.cnlr_status)
 
     def pack_notify_deviceid_type4(self, data):
-        if hasattr(self, 'filter_notify_deviceid_type4'):
-            data = getattr(self, 'filter_notify_deviceid_type4')(data)
+        if 'notify_deviceid_type4' in self._filters:
+            data = self._filters['notify_deviceid_type4'](self, data)
         if self.check_enum and data not in [const.NOTIFY_DEVICEID4_CHANGE, const.NOTIFY_DEVICEID4_DELETE]:
             raise XDRError, 'value=%s not in enum notify_deviceid_type4' % data
         self.pack_int(data)
 
     def pack_notify_deviceid_delete4(self, data):
-        if hasattr(self, 'filter_notify_deviceid_delete4'):
-            data = getattr(self, 'filter_notify_deviceid_delete4')(data)
+        if 'notify_deviceid_delete4' in self._filters:
+            data = self._filters['notify_deviceid_delete4'](self, data)
         if data.ndd_layouttype is None:
             raise TypeError, 'data.ndd_layouttype == None'
         self.pack_layouttype4(data.ndd_layouttype)
@@ -4021,8 +4058,8 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_deviceid4(data.ndd_deviceid)
 
     def pack_notify_deviceid_change4(self, data):
-        if hasattr(self, 'filter_notify_deviceid_change4'):
-            data = getattr(self, 'filter_notify_deviceid_change4')(data)
+        if 'notify_deviceid_change4' in self._filters:
+            data = self._filters['notify_deviceid_change4'](self, data)
         if data.ndc_layouttype is None:
             raise TypeError, 'data.ndc_layouttype == None'
         self.pack_layouttype4(data.ndc_layouttype)
@@ -4034,29 +4071,29 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_bool(data.ndc_immediate)
 
     def pack_CB_NOTIFY_DEVICEID4args(self, data):
-        if hasattr(self, 'filter_CB_NOTIFY_DEVICEID4args'):
-            data = getattr(self, 'filter_CB_NOTIFY_DEVICEID4args')(data)
+        if 'CB_NOTIFY_DEVICEID4args' in self._filters:
+            data = self._filters['CB_NOTIFY_DEVICEID4args'](self, data)
         if data.cnda_changes is None:
             raise TypeError, 'data.cnda_changes == None'
         self.pack_array(data.cnda_changes, self.pack_notify4)
 
     def pack_CB_NOTIFY_DEVICEID4res(self, data):
-        if hasattr(self, 'filter_CB_NOTIFY_DEVICEID4res'):
-            data = getattr(self, 'filter_CB_NOTIFY_DEVICEID4res')(data)
+        if 'CB_NOTIFY_DEVICEID4res' in self._filters:
+            data = self._filters['CB_NOTIFY_DEVICEID4res'](self, data)
         if data.cndr_status is None:
             raise TypeError, 'data.cndr_status == None'
         self.pack_nfsstat4(data.cndr_status)
 
     def pack_nfs_cb_opnum4(self, data):
-        if hasattr(self, 'filter_nfs_cb_opnum4'):
-            data = getattr(self, 'filter_nfs_cb_opnum4')(data)
+        if 'nfs_cb_opnum4' in self._filters:
+            data = self._filters['nfs_cb_opnum4'](self, data)
         if self.check_enum and data not in [const.OP_CB_GETATTR, const.OP_CB_RECALL, const.OP_CB_LAYOUTRECALL, const.OP_CB_NOTIFY, const.OP_CB_PUSH_DELEG, const.OP_CB_RECALL_ANY, const.OP_CB_RECALLABLE_OBJ_AVAIL, const.OP_CB_RECALL_SLOT, const.OP_CB_SEQUENCE, const.OP_CB_WANTS_CANCELLED, const.OP_CB_NOTIFY_LOCK, const.OP_CB_NOTIFY_DEVICEID, const.OP_CB_ILLEGAL]:
             raise XDRError, 'value=%s not in enum nfs_cb_opnum4' % data
         self.pack_int(data)
 
     def pack_nfs_cb_argop4(self, data):
-        if hasattr(self, 'filter_nfs_cb_argop4'):
-            data = getattr(self, 'filter_nfs_cb_argop4')(data)
+        if 'nfs_cb_argop4' in self._filters:
+            data = self._filters['nfs_cb_argop4'](self, data)
         if data.argop is None:
             raise TypeError, 'data.argop == None'
         self.pack_nfs_cb_opnum4(data.argop)
@@ -4114,8 +4151,8 @@ class NFS4Packer(xdrlib.Packer):
             raise XDRError, 'bad switch=%s' % data.argop
 
     def pack_nfs_cb_resop4(self, data):
-        if hasattr(self, 'filter_nfs_cb_resop4'):
-            data = getattr(self, 'filter_nfs_cb_resop4')(data)
+        if 'nfs_cb_resop4' in self._filters:
+            data = self._filters['nfs_cb_resop4'](self, data)
         if data.resop is None:
             raise TypeError, 'data.resop == None'
         self.pack_nfs_cb_opnum4(data.resop)
@@ -4175,8 +4212,8 @@ class NFS4Packer(xdrlib.Packer):
             raise XDRError, 'bad switch=%s' % data.resop
 
     def pack_CB_COMPOUND4args(self, data):
-        if hasattr(self, 'filter_CB_COMPOUND4args'):
-            data = getattr(self, 'filter_CB_COMPOUND4args')(data)
+        if 'CB_COMPOUND4args' in self._filters:
+            data = self._filters['CB_COMPOUND4args'](self, data)
         if data.tag is None:
             raise TypeError, 'data.tag == None'
         self.pack_utf8str_cs(data.tag)
@@ -4191,8 +4228,8 @@ class NFS4Packer(xdrlib.Packer):
         self.pack_array(data.argarray, self.pack_nfs_cb_argop4)
 
     def pack_CB_COMPOUND4res(self, data):
-        if hasattr(self, 'filter_CB_COMPOUND4res'):
-            data = getattr(self, 'filter_CB_COMPOUND4res')(data)
+        if 'CB_COMPOUND4res' in self._filters:
+            data = self._filters['CB_COMPOUND4res'](self, data)
         if data.status is None:
             raise TypeError, 'data.status == None'
         self.pack_nfsstat4(data.status)
@@ -4203,12 +4240,176 @@ class NFS4Packer(xdrlib.Packer):
             raise TypeError, 'data.resarray == None'
         self.pack_array(data.resarray, self.pack_nfs_cb_resop4)
 
+# Union arms of nfs_argop4: argop -> (attribute, unpack method)
+_nfs_argop4_arms = {
+    const.OP_ACCESS: ('opaccess', 'unpack_ACCESS4args'),
+    const.OP_CLOSE: ('opclose', 'unpack_CLOSE4args'),
+    const.OP_COMMIT: ('opcommit', 'unpack_COMMIT4args'),
+    const.OP_CREATE: ('opcreate', 'unpack_CREATE4args'),
+    const.OP_DELEGPURGE: ('opdelegpurge', 'unpack_DELEGPURGE4args'),
+    const.OP_DELEGRETURN: ('opdelegreturn', 'unpack_DELEGRETURN4args'),
+    const.OP_GETATTR: ('opgetattr', 'unpack_GETATTR4args'),
+    const.OP_GETFH: None,
+    const.OP_LINK: ('oplink', 'unpack_LINK4args'),
+    const.OP_LOCK: ('oplock', 'unpack_LOCK4args'),
+    const.OP_LOCKT: ('oplockt', 'unpack_LOCKT4args'),
+    const.OP_LOCKU: ('oplocku', 'unpack_LOCKU4args'),
+    const.OP_LOOKUP: ('oplookup', 'unpack_LOOKUP4args'),
+    const.OP_LOOKUPP: None,
+    const.OP_NVERIFY: ('opnverify', 'unpack_NVERIFY4args'),
+    const.OP_OPEN: ('opopen', 'unpack_OPEN4args'),
+    const.OP_OPENATTR: ('opopenattr', 'unpack_OPENATTR4args'),
+    const.OP_OPEN_CONFIRM: ('opopen_confirm', 'unpack_OPEN_CONFIRM4args'),
+    const.OP_OPEN_DOWNGRADE: ('opopen_downgrade', 'unpack_OPEN_DOWNGRADE4args'),
+    const.OP_PUTFH: ('opputfh', 'unpack_PUTFH4args'),
+    const.OP_PUTPUBFH: None,
+    const.OP_PUTROOTFH: None,
+    const.OP_READ: ('opread', 'unpack_READ4args'),
+    const.OP_READDIR: ('opreaddir', 'unpack_READDIR4args'),
+    const.OP_READLINK: None,
+    const.OP_REMOVE: ('opremove', 'unpack_REMOVE4args'),
+    const.OP_RENAME: ('oprename', 'unpack_RENAME4args'),
+    const.OP_RENEW: ('oprenew', 'unpack_RENEW4args'),
+    const.OP_RESTOREFH: None,
+    const.OP_SAVEFH: None,
+    const.OP_SECINFO: ('opsecinfo', 'unpack_SECINFO4args'),
+    const.OP_SETATTR: ('opsetattr', 'unpack_SETATTR4args'),
+    const.OP_SETCLIENTID: ('opsetclientid', 'unpack_SETCLIENTID4args'),
+    const.OP_SETCLIENTID_CONFIRM: ('opsetclientid_confirm', 'unpack_SETCLIENTID_CONFIRM4args'),
+    const.OP_VERIFY: ('opverify', 'unpack_VERIFY4args'),
+    const.OP_WRITE: ('opwrite', 'unpack_WRITE4args'),
+    const.OP_RELEASE_LOCKOWNER: ('oprelease_lockowner', 'unpack_RELEASE_LOCKOWNER4args'),
+    const.OP_BACKCHANNEL_CTL: ('opbackchannel_ctl', 'unpack_BACKCHANNEL_CTL4args'),
+    const.OP_BIND_CONN_TO_SESSION: ('opbind_conn_to_session', 'unpack_BIND_CONN_TO_SESSION4args'),
+    const.OP_EXCHANGE_ID: ('opexchange_id', 'unpack_EXCHANGE_ID4args'),
+    const.OP_CREATE_SESSION: ('opcreate_session', 'unpack_CREATE_SESSION4args'),
+    const.OP_DESTROY_SESSION: ('opdestroy_session', 'unpack_DESTROY_SESSION4args'),
+    const.OP_FREE_STATEID: ('opfree_stateid', 'unpack_FREE_STATEID4args'),
+    const.OP_GET_DIR_DELEGATION: ('opget_dir_delegation', 'unpack_GET_DIR_DELEGATION4args'),
+    const.OP_GETDEVICEINFO: ('opgetdeviceinfo', 'unpack_GETDEVICEINFO4args'),
+    const.OP_GETDEVICELIST: ('opgetdevicelist', 'unpack_GETDEVICELIST4args'),
+    const.OP_LAYOUTCOMMIT: ('oplayoutcommit', 'unpack_LAYOUTCOMMIT4args'),
+    const.OP_LAYOUTGET: ('oplayoutget', 'unpack_LAYOUTGET4args'),
+    const.OP_LAYOUTRETURN: ('oplayoutreturn', 'unpack_LAYOUTRETURN4args'),
+    const.OP_SECINFO_NO_NAME: ('opsecinfo_no_name', 'unpack_SECINFO_NO_NAME4args'),
+    const.OP_SEQUENCE: ('opsequence', 'unpack_SEQUENCE4args'),
+    const.OP_SET_SSV: ('opset_ssv', 'unpack_SET_SSV4args'),
+    const.OP_TEST_STATEID: ('optest_stateid', 'unpack_TEST_STATEID4args'),
+    const.OP_WANT_DELEGATION: ('opwant_delegation', 'unpack_WANT_DELEGATION4args'),
+    const.OP_DESTROY_CLIENTID: ('opdestroy_clientid', 'unpack_DESTROY_CLIENTID4args'),
+    const.OP_RECLAIM_COMPLETE: ('opreclaim_complete', 'unpack_RECLAIM_COMPLETE4args'),
+    const.OP_ILLEGAL: None,
+}
+
+# Union arms of nfs_resop4: resop -> (attribute, unpack method)
+_nfs_resop4_arms = {
+    const.OP_ACCESS: ('opaccess', 'unpack_ACCESS4res'),
+    const.OP_CLOSE: ('opclose', 'unpack_CLOSE4res'),
+    const.OP_COMMIT: ('opcommit', 'unpack_COMMIT4res'),
+    const.OP_CREATE: ('opcreate', 'unpack_CREATE4res'),
+    const.OP_DELEGPURGE: ('opdelegpurge', 'unpack_DELEGPURGE4res'),
+    const.OP_DELEGRETURN: ('opdelegreturn', 'unpack_DELEGRETURN4res'),
+    const.OP_GETATTR: ('opgetattr', 'unpack_GETATTR4res'),
+    const.OP_GETFH: ('opgetfh', 'unpack_GETFH4res'),
+    const.OP_LINK: ('oplink', 'unpack_LINK4res'),
+    const.OP_LOCK: ('oplock', 'unpack_LOCK4res'),
+    const.OP_LOCKT: ('oplockt', 'unpack_LOCKT4res'),
+    const.OP_LOCKU: ('oplocku', 'unpack_LOCKU4res'),
+    const.OP_LOOKUP: ('oplookup', 'unpack_LOOKUP4res'),
+    const.OP_LOOKUPP: ('oplookupp', 'unpack_LOOKUPP4res'),
+    const.OP_NVERIFY: ('opnverify', 'unpack_NVERIFY4res'),
+    const.OP_OPEN: ('opopen', 'unpack_OPEN4res'),
+    const.OP_OPENATTR: ('opopenattr', 'unpack_OPENATTR4res'),
+    const.OP_OPEN_CONFIRM: ('opopen_confirm', 'unpack_OPEN_CONFIRM4res'),
+    const.OP_OPEN_DOWNGRADE: ('opopen_downgrade', 'unpack_OPEN_DOWNGRADE4res'),
+    const.OP_PUTFH: ('opputfh', 'unpack_PUTFH4res'),
+    const.OP_PUTPUBFH: ('opputpubfh', 'unpack_PUTPUBFH4res'),
+    const.OP_PUTROOTFH: ('opputrootfh', 'unpack_PUTROOTFH4res'),
+    const.OP_READ: ('opread', 'unpack_READ4res'),
+    const.OP_READDIR: ('opreaddir', 'unpack_READDIR4res'),
+    const.OP_READLINK: ('opreadlink', 'unpack_READLINK4res'),
+    const.OP_REMOVE: ('opremove', 'unpack_REMOVE4res'),
+    const.OP_RENAME: ('oprename', 'unpack_RENAME4res'),
+    const.OP_RENEW: ('oprenew', 'unpack_RENEW4res'),
+    const.OP_RESTOREFH: ('oprestorefh', 'unpack_RESTOREFH4res'),
+    const.OP_SAVEFH: ('opsavefh', 'unpack_SAVEFH4res'),
+    const.OP_SECINFO: ('opsecinfo', 'unpack_SECINFO4res'),
+    const.OP_SETATTR: ('opsetattr', 'unpack_SETATTR4res'),
+    const.OP_SETCLIENTID: ('opsetclientid', 'unpack_SETCLIENTID4res'),
+    const.OP_SETCLIENTID_CONFIRM: ('opsetclientid_confirm', 'unpack_SETCLIENTID_CONFIRM4res'),
+    const.OP_VERIFY: ('opverify', 'unpack_VERIFY4res'),
+    const.OP_WRITE: ('opwrite', 'unpack_WRITE4res'),
+    const.OP_RELEASE_LOCKOWNER: ('oprelease_lockowner', 'unpack_RELEASE_LOCKOWNER4res'),
+    const.OP_BACKCHANNEL_CTL: ('opbackchannel_ctl', 'unpack_BACKCHANNEL_CTL4res'),
+    const.OP_BIND_CONN_TO_SESSION: ('opbind_conn_to_session', 'unpack_BIND_CONN_TO_SESSION4res'),
+    const.OP_EXCHANGE_ID: ('opexchange_id', 'unpack_EXCHANGE_ID4res'),
+    const.OP_CREATE_SESSION: ('opcreate_session', 'unpack_CREATE_SESSION4res'),
+    const.OP_DESTROY_SESSION: ('opdestroy_session', 'unpack_DESTROY_SESSION4res'),
+    const.OP_FREE_STATEID: ('opfree_stateid', 'unpack_FREE_STATEID4res'),
+    const.OP_GET_DIR_DELEGATION: ('opget_dir_delegation', 'unpack_GET_DIR_DELEGATION4res'),
+    const.OP_GETDEVICEINFO: ('opgetdeviceinfo', 'unpack_GETDEVICEINFO4res'),
+    const.OP_GETDEVICELIST: ('opgetdevicelist', 'unpack_GETDEVICELIST4res'),
+    const.OP_LAYOUTCOMMIT: ('oplayoutcommit', 'unpack_LAYOUTCOMMIT4res'),
+    const.OP_LAYOUTGET: ('oplayoutget', 'unpack_LAYOUTGET4res'),
+    const.OP_LAYOUTRETURN: ('oplayoutreturn', 'unpack_LAYOUTRETURN4res'),
+    const.OP_SECINFO_NO_NAME: ('opsecinfo_no_name', 'unpack_SECINFO_NO_NAME4res'),
+    const.OP_SEQUENCE: ('opsequence', 'unpack_SEQUENCE4res'),
+    const.OP_SET_SSV: ('opset_ssv', 'unpack_SET_SSV4res'),
+    const.OP_TEST_STATEID: ('optest_stateid', 'unpack_TEST_STATEID4res'),
+    const.OP_WANT_DELEGATION: ('opwant_delegation', 'unpack_WANT_DELEGATION4res'),
+    const.OP_DESTROY_CLIENTID: ('opdestroy_clientid', 'unpack_DESTROY_CLIENTID4res'),
+    const.OP_RECLAIM_COMPLETE: ('opreclaim_complete', 'unpack_RECLAIM_COMPLETE4res'),
+    const.OP_ILLEGAL: ('opillegal', 'unpack_ILLEGAL4res'),
+}
+
+# Union arms of nfs_cb_argop4: argop -> (attribute, unpack method)
+_nfs_cb_argop4_arms = {
+    const.OP_CB_GETATTR: ('opcbgetattr', 'unpack_CB_GETATTR4args'),
+    const.OP_CB_RECALL: ('opcbrecall', 'unpack_CB_RECALL4args'),
+    const.OP_CB_LAYOUTRECALL: ('opcblayoutrecall', 'unpack_CB_LAYOUTRECALL4args'),
+    const.OP_CB_NOTIFY: ('opcbnotify', 'unpack_CB_NOTIFY4args'),
+    const.OP_CB_PUSH_DELEG: ('opcbpush_deleg', 'unpack_CB_PUSH_DELEG4args'),
+    const.OP_CB_RECALL_ANY: ('opcbrecall_any', 'unpack_CB_RECALL_ANY4args'),
+    const.OP_CB_RECALLABLE_OBJ_AVAIL: ('opcbrecallable_obj_avail', 'unpack_CB_RECALLABLE_OBJ_AVAIL4args'),
+    const.OP_CB_RECALL_SLOT: ('opcbrecall_slot', 'unpack_CB_RECALL_SLOT4args'),
+    const.OP_CB_SEQUENCE: ('opcbsequence', 'unpack_CB_SEQUENCE4args'),
+    const.OP_CB_WANTS_CANCELLED: ('opcbwants_cancelled', 'unpack_CB_WANTS_CANCELLED4args'),
+    const.OP_CB_NOTIFY_LOCK: ('opcbnotify_lock', 'unpack_CB_NOTIFY_LOCK4args'),
+    const.OP_CB_NOTIFY_DEVICEID: ('opcbnotify_deviceid', 'unpack_CB_NOTIFY_DEVICEID4args'),
+    const.OP_CB_ILLEGAL: None,
+}
+
+# Union arms of nfs_cb_resop4: resop -> (attribute, unpack method)
+_nfs_cb_resop4_arms = {
+    const.OP_CB_GETATTR: ('opcbgetattr', 'unpack_CB_GETATTR4res'),
+    const.OP_CB_RECALL: ('opcbrecall', 'unpack_CB_RECALL4res'),
+    const.OP_CB_LAYOUTRECALL: ('opcblayoutrecall', 'unpack_CB_LAYOUTRECALL4res'),
+    const.OP_CB_NOTIFY: ('opcbnotify', 'unpack_CB_NOTIFY4res'),
+    const.OP_CB_PUSH_DELEG: ('opcbpush_deleg', 'unpack_CB_PUSH_DELEG4res'),
+    const.OP_CB_RECALL_ANY: ('opcbrecall_any', 'unpack_CB_RECALL_ANY4res'),
+    const.OP_CB_RECALLABLE_OBJ_AVAIL: ('opcbrecallable_obj_avail', 'unpack_CB_RECALLABLE_OBJ_AVAIL4res'),
+    const.OP_CB_RECALL_SLOT: ('opcbrecall_slot', 'unpack_CB_RECALL_SLOT4res'),
+    const.OP_CB_SEQUENCE: ('opcbsequence', 'unpack_CB_SEQUENCE4res'),
+    const.OP_CB_WANTS_CANCELLED: ('opcbwants_cancelled', 'unpack_CB_WANTS_CANCELLED4res'),
+    const.OP_CB_NOTIFY_LOCK: ('opcbnotify_lock', 'unpack_CB_NOTIFY_LOCK4res'),
+    const.OP_CB_NOTIFY_DEVICEID: ('opcbnotify_deviceid', 'unpack_CB_NOTIFY_DEVICEID4res'),
+    const.OP_CB_ILLEGAL: ('opcbillegal', 'unpack_CB_ILLEGAL4res'),
+}
+
 class NFS4Unpacker(xdrlib.Unpacker):
     def __init__(self, data, check_enum=True, check_array=True):
         xdrlib.Unpacker.__init__(self, data)
         self.check_enum = check_enum
         self.check_array = check_array
 
+    def __getattr__(self, name):
+        if name == '_filters':
+            # Get the table of filters when it is first used so the
+            # filters set on the instance after it is created are included
+            self._filters = _filter_table(self)
+            return self._filters
+        raise AttributeError(name)
+
     unpack_hyper = xdrlib.Unpacker.unpack_hyper
     unpack_string = xdrlib.Unpacker.unpack_string
     unpack_int = xdrlib.Unpacker.unpack_int
@@ -4239,36 +4440,36 @@ class NFS4Unpacker(xdrlib.Unpacker):
         data.gids = self.unpack_array(self.unpack_uint)
         if len(data.gids) > 16 and self.check_array:
             raise XDRError, 'array length too long for data.gids'
-        if hasattr(self, 'filter_authsys_parms'):
-            data = getattr(self, 'filter_authsys_parms')(data)
+        if 'authsys_parms' in self._filters:
+            data = self._filters['authsys_parms'](self, data)
         return data
 
     def unpack_nfs_ftype4(self):
         data = self.unpack_int()
         if self.check_enum and data not in [const.NF4REG, const.NF4DIR, const.NF4BLK, const.NF4CHR, const.NF4LNK, const.NF4SOCK, const.NF4FIFO, const.NF4ATTRDIR, const.NF4NAMEDATTR]:
             raise XDRError, 'value=%s not in enum nfs_ftype4' % data
-        if hasattr(self, 'filter_nfs_ftype4'):
-            data = getattr(self, 'filter_nfs_ftype4')(data)
+        if 'nfs_ftype4' in self._filters:
+            data = self._filters['nfs_ftype4'](self, data)
         return data
 
     def unpack_nfsstat4(self):
         data = self.unpack_int()
         if self.check_enum and data not in [const.NFS4_OK, const.NFS4ERR_PERM, const.NFS4ERR_NOENT, const.NFS4ERR_IO, const.NFS4ERR_NXIO, const.NFS4ERR_ACCESS, const.NFS4ERR_EXIST, const.NFS4ERR_XDEV, const.NFS4ERR_NOTDIR, const.NFS4ERR_ISDIR, const.NFS4ERR_INVAL, const.NFS4ERR_FBIG, const.NFS4ERR_NOSPC, const.NFS4ERR_ROFS, const.NFS4ERR_MLINK, const.NFS4ERR_NAMETOOLONG, const.NFS4ERR_NOTEMPTY, const.NFS4ERR_DQUOT, const.NFS4ERR_STALE, const.NFS4ERR_BADHANDLE, const.NFS4ERR_BAD_COOKIE, const.NFS4ERR_NOTSUPP, const.NFS4ERR_TOOSMALL, const.NFS4ERR_SERVERFAULT, const.NFS4ERR_BADTYPE, const.NFS4ERR_DELAY, const.NFS4ERR_SAME, const.NFS4ERR_DENIED, const.NFS4ERR_EXPIRED, const.NFS4ERR_LOCKED, const.NFS4ERR_GRACE, const.NFS4ERR_FHEXPIRED, const.NFS4ERR_SHARE_DENIED, const.NFS4ERR_WRONGSEC, const.NFS4ERR_CLID_INUSE, const.NFS4ERR_RESOURCE, const.NFS4ERR_MOVED, const.NFS4ERR_NOFILEHANDLE, const.NFS4ERR_MINOR_VERS_MISMATCH, const.NFS4ERR_STALE_CLIENTID, const.NFS4ERR_STALE_STATEID, const.NFS4ERR_OLD_STATEID, const.NFS4ERR_BAD_STATEID, const.NFS4ERR_BAD_SEQID, const.NFS4ERR_NOT_SAME, const.NFS4ERR_LOCK_RANGE, const.NFS4ERR_SYMLINK, const.NFS4ERR_RESTOREFH, const.NFS4ERR_LEASE_MOVED, const.NFS4ERR_ATTRNOTSUPP, const.NFS4ERR_NO_GRACE, const.NFS4ERR_RECLAIM_BAD, const.NFS4ERR_RECLAIM_CONFLICT, const.NFS4ERR_BADXDR, const.NFS4ERR_LOCKS_HELD, const.NFS4ERR_OPENMODE, const.NFS4ERR_BADOWNER, const.NFS4ERR_BADCHAR, const.NFS4ERR_BADNAME, const.NFS4ERR_BAD_RANGE, const.NFS4ERR_LOCK_NOTSUPP, const.NFS4ERR_OP_ILLEGAL, const.NFS4ERR_DEADLOCK, const.NFS4ERR_FILE_OPEN, const.NFS4ERR_ADMIN_REVOKED, const.NFS4ERR_CB_PATH_DOWN, const.NFS4ERR_BADIOMODE, const.NFS4ERR_BADLAYOUT, const.NFS4ERR_BAD_SESSION_DIGEST, const.NFS4ERR_BADSESSION, const.NFS4ERR_BADSLOT, const.NFS4ERR_COMPLETE_ALREADY, const.NFS4ERR_CONN_NOT_BOUND_TO_SESSION, const.NFS4ERR_DELEG_ALREADY_WANTED, const.NFS4ERR_BACK_CHAN_BUSY, const.NFS4ERR_LAYOUTTRYLATER, const.NFS4ERR_LAYOUTUNAVAILABLE, const.NFS4ERR_NOMATCHING_LAYOUT, const.NFS4ERR_RECALLCONFLICT, const.NFS4ERR_UNKNOWN_LAYOUTTYPE, const.NFS4ERR_SEQ_MISORDERED, const.NFS4ERR_SEQUENCE_POS, const.NFS4ERR_REQ_TOO_BIG, const.NFS4ERR_REP_TOO_BIG, const.NFS4ERR_REP_TOO_BIG_TO_CACHE, const.NFS4ERR_RETRY_UNCACHED_REP, const.NFS4ERR_UNSAFE_COMPOUND, const.NFS4ERR_TOO_MANY_OPS, const.NFS4ERR_OP_NOT_IN_SESSION, const.NFS4ERR_HASH_ALG_UNSUPP, const.NFS4ERR_CONN_BINDING_NOT_ENFORCED, const.NFS4ERR_CLIENTID_BUSY, const.NFS4ERR_PNFS_IO_HOLE, const.NFS4ERR_SEQ_FALSE_RETRY, const.NFS4ERR_BAD_HIGH_SLOT, const.NFS4ERR_DEADSESSION, const.NFS4ERR_ENCR_ALG_UNSUPP, const.NFS4ERR_PNFS_NO_LAYOUT, const.NFS4ERR_NOT_ONLY_OP, const.NFS4ERR_WRONG_CRED, const.NFS4ERR_WRONG_TYPE, const.NFS4ERR_DIRDELEG_UNAVAIL, const.NFS4ERR_REJECT_DELEG, const.NFS4ERR_RETURNCONFLICT, const.NFS4ERR_DELEG_REVOKED]:
             raise XDRError, 'value=%s not in enum nfsstat4' % data
-        if hasattr(self, 'filter_nfsstat4'):
-            data = getattr(self, 'filter_nfsstat4')(data)
+        if 'nfsstat4' in self._filters:
+            data = self._filters['nfsstat4'](self, data)
         return data
 
     def unpack_attrlist4(self):
         data = self.unpack_opaque()
-        if hasattr(self, 'filter_attrlist4'):
-            data = getattr(self, 'filter_attrlist4')(data)
+        if 'attrlist4' in self._filters:
+            data = self._filters['attrlist4'](self, data)
         return data
 
     def unpack_bitmap4(self):
         data = self.unpack_array(self.unpack_uint32_t)
-        if hasattr(self, 'filter_bitmap4'):
-            data = getattr(self, 'filter_bitmap4')(data)
+        if 'bitmap4' in self._filters:
+            data = self._filters['bitmap4'](self, data)
         return data
 
     unpack_changeid4 = unpack_uint64_t
@@ -4287,8 +4488,8 @@ class NFS4Unpacker(xdrlib.Unpacker):
         data = self.unpack_opaque()
         if len(data) > const.NFS4_FHSIZE and self.check_array:
             raise XDRError, 'array length too long for data'
-        if hasattr(self, 'filter_nfs_fh4'):
-            data = getattr(self, 'filter_nfs_fh4')(data)
+        if 'nfs_fh4' in self._filters:
+            data = self._filters['nfs_fh4'](self, data)
         return data
 
     unpack_offset4 = unpack_uint64_t
@@ -4297,8 +4498,8 @@ class NFS4Unpacker(xdrlib.Unpacker):
 
     def unpack_sec_oid4(self):
         data = self.unpack_opaque()
-        if hasattr(self, 'filter_sec_oid4'):
-            data = getattr(self, 'filter_sec_oid4')(data)
+        if 'sec_oid4' in self._filters:
+            data = self._filters['sec_oid4'](self, data)
         return data
 
     unpack_sequenceid4 = unpack_uint32_t
@@ -4307,16 +4508,16 @@ class NFS4Unpacker(xdrlib.Unpacker):
 
     def unpack_sessionid4(self):
         data = self.unpack_fopaque(const.NFS4_SESSIONID_SIZE)
-        if hasattr(self, 'filter_sessionid4'):
-            data = getattr(self, 'filter_sessionid4')(data)
+        if 'sessionid4' in self._filters:
+            data = self._filters['sessionid4'](self, data)
         return data
 
     unpack_slotid4 = unpack_uint32_t
 
     def unpack_utf8string(self):
         data = self.unpack_opaque()
-        if hasattr(self, 'filter_utf8string'):
-            data = getattr(self, 'filter_utf8string')(data)
+        if 'utf8string' in self._filters:
+            data = self._filters['utf8string'](self, data)
         return data
 
     unpack_utf8str_cis = unpack_utf8string
@@ -4331,30 +4532,30 @@ class NFS4Unpacker(xdrlib.Unpacker):
 
     def unpack_pathname4(self):
         data = self.unpack_array(self.unpack_component4)
-        if hasattr(self, 'filter_pathname4'):
-            data = getattr(self, 'filter_pathname4')(data)
+        if 'pathname4' in self._filters:
+            data = self._filters['pathname4'](self, data)
         return data
 
     def unpack_verifier4(self):
         data = self.unpack_fopaque(const.NFS4_VERIFIER_SIZE)
-        if hasattr(self, 'filter_verifier4'):
-            data = getattr(self, 'filter_verifier4')(data)
+        if 'verifier4' in self._filters:
+            data = self._filters['verifier4'](self, data)
         return data
 
     def unpack_nfstime4(self):
         data = types.nfstime4()
         data.seconds = self.unpack_int64_t()
         data.nseconds = self.unpack_uint32_t()
-        if hasattr(self, 'filter_nfstime4'):
-            data = getattr(self, 'filter_nfstime4')(data)
+        if 'nfstime4' in self._filters:
+            data = self._filters['nfstime4'](self, data)
         return data
 
     def unpack_time_how4(self):
         data = self.unpack_int()
         if self.check_enum and data not in [const.SET_TO_SERVER_TIME4, const.SET_TO_CLIENT_TIME4]:
             raise XDRError, 'value=%s not in enum time_how4' % data
-        if hasattr(self, 'filter_time_how4'):
-            data = getattr(self, 'filter_time_how4')(data)
+        if 'time_how4' in self._filters:
+            data = self._filters['time_how4'](self, data)
         return data
 
     def unpack_settime4(self):
@@ -4364,8 +4565,8 @@ class NFS4Unpacker(xdrlib.Unpacker):
             data.time = self.unpack_nfstime4()
         else:
             pass
-        if hasattr(self, 'filter_settime4'):
-            data = getattr(self, 'filter_settime4')(data)
+        if 'settime4' in self._filters:
+            data = self._filters['settime4'](self, data)
         return data
 
     unpack_nfs_lease4 = unpack_uint32_t
@@ -4374,32 +4575,32 @@ class NFS4Unpacker(xdrlib.Unpacker):
         data = types.fsid4()
         data.major = self.unpack_uint64_t()
         data.minor = self.unpack_uint64_t()
-        if hasattr(self, 'filter_fsid4'):
-            data = getattr(self, 'filter_fsid4')(data)
+        if 'fsid4' in self._filters:
+            data = self._filters['fsid4'](self, data)
         return data
 
     def unpack_change_policy4(self):
         data = types.change_policy4()
         data.cp_major = self.unpack_uint64_t()
         data.cp_minor = self.unpack_uint64_t()
-        if hasattr(self, 'filter_change_policy4'):
-            data = getattr(self, 'filter_change_policy4')(data)
+        if 'change_policy4' in self._filters:
+            data = self._filters['change_policy4'](self, data)
         return data
 
     def unpack_fs_location4(self):
         data = types.fs_location4()
         data.server = self.unpack_array(self.unpack_utf8str_cis)
         data.rootpath = self.unpack_pathname4()
-        if hasattr(self, 'filter_fs_location4'):
-            data = getattr(self, 'filter_fs_location4')(data)
+        if 'fs_location4' in self._filters:
+            data = self._filters['fs_location4'](self, data)
         return data
 
     def unpack_fs_locations4(self):
         data = types.fs_locations4()
         data.fs_root = self.unpack_pathname4()
         data.locations = self.unpack_array(self.unpack_fs_location4)
-        if hasattr(self, 'filter_fs_locations4'):
-            data = getattr(self, 'filter_fs_locations4')(data)
+        if 'fs_locations4' in self._filters:
+            data = self._filters['fs_locations4'](self, data)
         return data
 
     unpack_acetype4 = unpack_uint32_t
@@ -4414,8 +4615,8 @@ class NFS4Unpacker(xdrlib.Unpacker):
         data.flag = self.unpack_aceflag4()
         data.access_mask = self.unpack_acemask4()
         data.who = self.unpack_utf8str_mixed()
-        if hasattr(self, 'filter_nfsace4'):
-            data = getattr(self, 'filter_nfsace4')(data)
+        if 'nfsace4' in self._filters:
+            data = self._filters['nfsace4'](self, data)
         return data
 
     unpack_aclflag4 = unpack_uint32_t
@@ -4424,32 +4625,32 @@ class NFS4Unpacker(xdrlib.Unpacker):
         data = types.nfsacl41()
         data.na41_flag = self.unpack_aclflag4()
         data.na41_aces = self.unpack_array(self.unpack_nfsace4)
-        if hasattr(self, 'filter_nfsacl41'):
-            data = getattr(self, 'filter_nfsacl41')(data)
+        if 'nfsacl41' in self._filters:
+            data = self._filters['nfsacl41'](self, data)
         return data
 
     def unpack_mode_masked4(self):
         data = types.mode_masked4()
         data.mm_value_to_set = self.unpack_mode4()
         data.mm_mask_bits = self.unpack_mode4()
-        if hasattr(self, 'filter_mode_masked4'):
-            data = getattr(self, 'filter_mode_masked4')(data)
+        if 'mode_masked4' in self._filters:
+            data = self._filters['mode_masked4'](self, data)
         return data
 
     def unpack_specdata4(self):
         data = types.specdata4()
         data.specdata1 = self.unpack_uint32_t()
         data.specdata2 = self.unpack_uint32_t()
-        if hasattr(self, 'filter_specdata4'):
-            data = getattr(self, 'filter_specdata4')(data)
+        if 'specdata4' in self._filters:
+            data = self._filters['specdata4'](self, data)
         return data
 
     def unpack_netaddr4(self):
         data = types.netaddr4()
         data.na_r_netid = self.unpack_string()
         data.na_r_addr = self.unpack_string()
-        if hasattr(self, 'filter_netaddr4'):
-            data = getattr(self, 'filter_netaddr4')(data)
+        if 'netaddr4' in self._filters:
+            data = self._filters['netaddr4'](self, data)
         return data
 
     def unpack_nfs_impl_id4(self):
@@ -4457,48 +4658,48 @@ class NFS4Unpacker(xdrlib.Unpacker):
         data.nii_domain = self.unpack_utf8str_cis()
         data.nii_name = self.unpack_utf8str_cs()
         data.nii_date = self.unpack_nfstime4()
-        if hasattr(self, 'filter_nfs_impl_id4'):
-            data = getattr(self, 'filter_nfs_impl_id4')(data)
+        if 'nfs_impl_id4' in self._filters:
+            data = self._filters['nfs_impl_id4'](self, data)
         return data
 
     def unpack_stateid4(self):
         data = types.stateid4()
         data.seqid = self.unpack_uint32_t()
         data.other = self.unpack_fopaque(12)
-        if hasattr(self, 'filter_stateid4'):
-            data = getattr(self, 'filter_stateid4')(data)
+        if 'stateid4' in self._filters:
+            data = self._filters['stateid4'](self, data)
         return data
 
     def unpack_layouttype4(self):
         data = self.unpack_int()
         if self.check_enum and data not in [const.LAYOUT4_NFSV4_1_FILES, const.LAYOUT4_OSD2_OBJECTS, const.LAYOUT4_BLOCK_VOLUME]:
             raise XDRError, 'value=%s not in enum layouttype4' % data
-        if hasattr(self, 'filter_layouttype4'):
-            data = getattr(self, 'filter_layouttype4')(data)
+        if 'layouttype4' in self._filters:
+            data = self._filters['layouttype4'](self, data)
         return data
 
     def unpack_layout_content4(self):
         data = types.layout_content4()
         data.loc_type = self.unpack_layouttype4()
         data.loc_body = self.unpack_opaque()
-        if hasattr(self, 'filter_layout_content4'):
-            data = getattr(self, 'filter_layout_content4')(data)
+        if 'layout_content4' in self._filters:
+            data = self._filters['layout_content4'](self, data)
         return data
 
     def unpack_layouthint4(self):
         data = types.layouthint4()
         data.loh_type = self.unpack_layouttype4()
         data.loh_body = self.unpack_opaque()
-        if hasattr(self, 'filter_layouthint4'):
-            data = getattr(self, 'filter_layouthint4')(data)
+        if 'layouthint4' in self._filters:
+            data = self._filters['layouthint4'](self, data)
         return data
 
     def unpack_layoutiomode4(self):
         data = self.unpack_int()
         if self.check_enum and data not in [const.LAYOUTIOMODE4_READ, const.LAYOUTIOMODE4_RW, const.LAYOUTIOMODE4_ANY]:
             raise XDRError, 'value=%s not in enum layoutiomode4' % data
-        if hasattr(self, 'filter_layoutiomode4'):
-            data = getattr(self, 'filter_layoutiomode4')(data)
+        if 'layoutiomode4' in self._filters:
+            data = self._filters['layoutiomode4'](self, data)
         return data
 
     def unpack_layout4(self):
@@ -4507,38 +4708,38 @@ class NFS4Unpacker(xdrlib.Unpacker):
         data.lo_length = self.unpack_length4()
         data.lo_iomode = self.unpack_layoutiomode4()
         data.lo_content = self.unpack_layout_content4()
-        if hasattr(self, 'filter_layout4'):
-            data = getattr(self, 'filter_layout4')(data)
+        if 'layout4' in self._filters:
+            data = self._filters['layout4'](self, data)
         return data
 
     def unpack_deviceid4(self):
         data = self.unpack_fopaque(const.NFS4_DEVICEID4_SIZE)
-        if hasattr(self, 'filter_deviceid4'):
-            data = getattr(self, 'filter_deviceid4')(data)
+        if 'deviceid4' in self._filters:
+            data = self._filters['deviceid4'](self, data)
         return data
 
     def unpack_device_addr4(self):
         data = types.device_addr4()
         data.da_layout_type = self.unpack_layouttype4()
         data.da_addr_body = self.unpack_opaque()
-        if hasattr(self, 'filter_device_addr4'):
-            data = getattr(self, 'filter_device_addr4')(data)
+        if 'device_addr4' in self._filters:
+            data = self._filters['device_addr4'](self, data)
         return data
 
     def unpack_layoutupdate4(self):
         data = types.layoutupdate4()
         data.lou_type = self.unpack_layouttype4()
         data.lou_body = self.unpack_opaque()
-        if hasattr(self, 'filter_layoutupdate4'):
-            data = getattr(self, 'filter_layoutupdate4')(data)
+        if 'layoutupdate4' in self._filters:
+            data = self._filters['layoutupdate4'](self, data)
         return data
 
     def unpack_layoutreturn_type4(self):
         data = self.unpack_int()
         if self.check_enum and data not in [const.LAYOUTRETURN4_FILE, const.LAYOUTRETURN4_FSID, const.LAYOUTRETURN4_ALL]:
             raise XDRError, 'value=%s not in enum layoutreturn_type4' % data
-        if hasattr(self, 'filter_layoutreturn_type4'):
-            data = getattr(self, 'filter_layoutreturn_type4')(data)
+        if 'layoutreturn_type4' in self._filters:
+            data = self._filters['layoutreturn_type4'](self, data)
         return data
 
     def unpack_layoutreturn_file4(self):
@@ -4547,8 +4748,8 @@ class NFS4Unpacker(xdrlib.Unpacker):
         data.lrf_length = self.unpack_length4()
         data.lrf_stateid = self.unpack_stateid4()
         data.lrf_body = self.unpack_opaque()
-        if hasattr(self, 'filter_layoutreturn_file4'):
-            data = getattr(self, 'filter_layoutreturn_file4')(data)
+        if 'layoutreturn_file4' in self._filters:
+            data = self._filters['layoutreturn_file4'](self, data)
         return data
 
     def unpack_layoutreturn4(self):
@@ -4558,16 +4759,16 @@ class NFS4Unpacker(xdrlib.Unpacker):
             data.lr_layout = self.unpack_layoutreturn_file4()
         else:
             pass
-        if hasattr(self, 'filter_layoutreturn4'):
-            data = getattr(self, 'filter_layoutreturn4')(data)
+        if 'layoutreturn4' in self._filters:
+            data = self._filters['layoutreturn4'](self, data)
         return data
 
     def unpack_fs4_status_type(self):
         data = self.unpack_int()
         if self.check_enum and data not in [const.STATUS4_FIXED, const.STATUS4_UPDATED, const.STATUS4_VERSIONED, const.STATUS4_WRITABLE, const.STATUS4_REFERRAL]:
             raise XDRError, 'value=%s not in enum fs4_status_type' % data
-        if hasattr(self, 'filter_fs4_status_type'):
-            data = getattr(self, 'filter_fs4_status_type')(data)
+        if 'fs4_status_type' in self._filters:
+            data = self._filters['fs4_status_type'](self, data)
         return data
 
     def unpack_fs4_status(self):
@@ -4578,8 +4779,8 @@ class NFS4Unpacker(xdrlib.Unpacker):
         data.fss_current = self.unpack_utf8str_cs()
         data.fss_age = self.unpack_int32_t()
         data.fss_version = self.unpack_nfstime4()
-        if hasattr(self, 'filter_fs4_status'):
-            data = getattr(self, 'filter_fs4_status')(data)
+        if 'fs4_status' in self._filters:
+            data = self._filters['fs4_status'](self, data)
         return data
 
     unpack_threshold4_read_size = unpack_length4
@@ -4595,15 +4796,15 @@ class NFS4Unpacker(xdrlib.Unpacker):
         data.thi_layout_type = self.unpack_layouttype4()
         data.thi_hintset = self.unpack_bitmap4()
         data.thi_hintlist = self.unpack_opaque()
-        if hasattr(self, 'filter_threshold_item4'):
-            data = getattr(self, 'filter_threshold_item4')(data)
+        if 'threshold_item4' in self._filters:
+            data = self._filters['threshold_item4'](self, data)
         return data
 
     def unpack_mdsthreshold4(self):
         data = types.mdsthreshold4()
         data.mth_hints = self.unpack_array(self.unpack_threshold_item4)
-        if hasattr(self, 'filter_mdsthreshold4'):
-            data = getattr(self, 'filter_mdsthreshold4')(data)
+        if 'mdsthreshold4' in self._filters:
+            data = self._filters['mdsthreshold4'](self, data)
         return data
 
     def unpack_retention_get4(self):
@@ -4612,8 +4813,8 @@ class NFS4Unpacker(xdrlib.Unpacker):
         data.rg_begin_time = self.unpack_array(self.unpack_nfstime4)
         if len(data.rg_begin_time) > 1 and self.check_array:
             raise XDRError, 'array length too long for data.rg_begin_time'
-        if hasattr(self, 'filter_retention_get4'):
-            data = getattr(self, 'filter_retention_get4')(data)
+        if 'retention_get4' in self._filters:
+            data = self._filters['retention_get4'](self, data)
         return data
 
     def unpack_retention_set4(self):
@@ -4622,8 +4823,8 @@ class NFS4Unpacker(xdrlib.Unpacker):
         data.rs_duration = self.unpack_array(self.unpack_uint64_t)
         if len(data.rs_duration) > 1 and self.check_array:
             raise XDRError, 'array length too long for data.rs_duration'
-        if hasattr(self, 'filter_retention_set4'):
-            data = getattr(self, 'filter_retention_set4')(data)
+        if 'retention_set4' in self._filters:
+            data = self._filters['retention_set4'](self, data)
         return data
 
     unpack_fs_charset_cap4 = unpack_uint32_t
@@ -4656,8 +4857,8 @@ class NFS4Unpacker(xdrlib.Unpacker):
 
     def unpack_fattr4_acl(self):
         data = self.unpack_array(self.unpack_nfsace4)
-        if hasattr(self, 'filter_fattr4_acl'):
-            data = getattr(self, 'filter_fattr4_acl')(data)
+        if 'fattr4_acl' in self._filters:
+            data = self._filters['fattr4_acl'](self, data)
         return data
 
     unpack_fattr4_aclsupport = unpack_uint32_t
@@ -4756,8 +4957,8 @@ class NFS4Unpacker(xdrlib.Unpacker):
 
     def unpack_fattr4_fs_layout_type(self):
         data = self.unpack_array(self.unpack_layouttype4)
-        if hasattr(self, 'filter_fattr4_fs_layout_type'):
-            data = getattr(self, 'filter_fattr4_fs_layout_type')(data)
+        if 'fattr4_fs_layout_type' in self._filters:
+            data = self._filters['fattr4_fs_layout_type'](self, data)
         return data
 
     unpack_fattr4_fs_status = unpack_fs4_status
@@ -4772,8 +4973,8 @@ class NFS4Unpacker(xdrlib.Unpacker):
 
     def unpack_fattr4_layout_type(self):
         data = self.unpack_array(self.unpack_layouttype4)
-        if hasattr(self, 'filter_fattr4_layout_type'):
-            data = getattr(self, 'filter_fattr4_layout_type')(data)
+        if 'fattr4_layout_type' in self._filters:
+            data = self._filters['fattr4_layout_type'](self, data)
         return data
 
     unpack_fattr4_mdsthreshold = unpack_mdsthreshold4
@@ -4796,8 +4997,8 @@ class NFS4Unpacker(xdrlib.Unpacker):
         data = types.fattr4()
         data.attrmask = self.unpack_bitmap4()
         data.attr_vals = self.unpack_attrlist4()
-        if hasattr(self, 'filter_fattr4'):
-            data = getattr(self, 'filter_fattr4')(data)
+        if 'fattr4' in self._filters:
+            data = self._filters['fattr4'](self, data)
         return data
 
     def unpack_change_info4(self):
@@ -4805,8 +5006,8 @@ class NFS4Unpacker(xdrlib.Unpacker):
         data.atomic = self.unpack_bool()
         data.before = self.unpack_changeid4()
         data.after = self.unpack_changeid4()
-        if hasattr(self, 'filter_change_info4'):
-            data = getattr(self, 'filter_change_info4')(data)
+        if 'change_info4' in self._filters:
+            data = self._filters['change_info4'](self, data)
         return data
 
     unpack_clientaddr4 = unpack_netaddr4
@@ -4815,8 +5016,8 @@ class NFS4Unpacker(xdrlib.Unpacker):
         data = types.cb_client4()
         data.cb_program = self.unpack_uint32_t()
         data.cb_location = self.unpack_netaddr4()
-        if hasattr(self, 'filter_cb_client4'):
-            data = getattr(self, 'filter_cb_client4')(data)
+        if 'cb_client4' in self._filters:
+            data = self._filters['cb_client4'](self, data)
         return data
 
     def unpack_nfs_client_id4(self):
@@ -4825,8 +5026,8 @@ class NFS4Unpacker(xdrlib.Unpacker):
         data.id = self.unpack_opaque()
         if len(data.id) > const.NFS4_OPAQUE_LIMIT and self.check_array:
             raise XDRError, 'array length too long for data.id'
-        if hasattr(self, 'filter_nfs_client_id4'):
-            data = getattr(self, 'filter_nfs_client_id4')(data)
+        if 'nfs_client_id4' in self._filters:
+            data = self._filters['nfs_client_id4'](self, data)
         return data
 
     def unpack_client_owner4(self):
@@ -4835,8 +5036,8 @@ class NFS4Unpacker(xdrlib.Unpacker):
         data.co_ownerid = self.unpack_opaque()
         if len(data.co_ownerid) > const.NFS4_OPAQUE_LIMIT and self.check_array:
             raise XDRError, 'array length too long for data.co_ownerid'
-        if hasattr(self, 'filter_client_owner4'):
-            data = getattr(self, 'filter_client_owner4')(data)
+        if 'client_owner4' in self._filters:
+            data = self._filters['client_owner4'](self, data)
         return data
 
     def unpack_server_owner4(self):
@@ -4845,8 +5046,8 @@ class NFS4Unpacker(xdrlib.Unpacker):
         data.so_major_id = self.unpack_opaque()
         if len(data.so_major_id) > const.NFS4_OPAQUE_LIMIT and self.check_array:
             raise XDRError, 'array length too long for data.so_major_id'
-        if hasattr(self, 'filter_server_owner4'):
-            data = getattr(self, 'filter_server_owner4')(data)
+        if 'server_owner4' in self._filters:
+            data = self._filters['server_owner4'](self, data)
         return data
 
     def unpack_state_owner4(self):
@@ -4855,8 +5056,8 @@ class NFS4Unpacker(xdrlib.Unpacker):
         data.owner = self.unpack_opaque()
         if len(data.owner) > const.NFS4_OPAQUE_LIMIT and self.check_array:
             raise XDRError, 'array length too long for data.owner'
-        if hasattr(self, 'filter_state_owner4'):
-            data = getattr(self, 'filter_state_owner4')(data)
+        if 'state_owner4' in self._filters:
+            data = self._filters['state_owner4'](self, data)
         return data
 
     unpack_open_owner4 = unpack_state_owner4
@@ -4867,32 +5068,32 @@ class NFS4Unpacker(xdrlib.Unpacker):
         data = self.unpack_int()
         if self.check_enum and data not in [const.READ_LT, const.WRITE_LT, const.READW_LT, const.WRITEW_LT]:
             raise XDRError, 'value=%s not in enum nfs_lock_type4' % data
-        if hasattr(self, 'filter_nfs_lock_type4'):
-            data = getattr(self, 'filter_nfs_lock_type4')(data)
+        if 'nfs_lock_type4' in self._filters:
+            data = self._filters['nfs_lock_type4'](self, data)
         return data
 
     def unpack_ssv_subkey4(self):
         data = self.unpack_int()
         if self.check_enum and data not in [const.SSV4_SUBKEY_MIC_I2T, const.SSV4_SUBKEY_MIC_T2I, const.SSV4_SUBKEY_SEAL_I2T, const.SSV4_SUBKEY_SEAL_T2I]:
             raise XDRError, 'value=%s not in enum ssv_subkey4' % data
-        if hasattr(self, 'filter_ssv_subkey4'):
-            data = getattr(self, 'filter_ssv_subkey4')(data)
+        if 'ssv_subkey4' in self._filters:
+            data = self._filters['ssv_subkey4'](self, data)
         return data
 
     def unpack_ssv_mic_plain_tkn4(self):
         data = types.ssv_mic_plain_tkn4()
         data.smpt_ssv_seq = self.unpack_uint32_t()
         data.smpt_orig_plain = self.unpack_opaque()
-        if hasattr(self, 'filter_ssv_mic_plain_tkn4'):
-            data = getattr(self, 'filter_ssv_mic_plain_tkn4')(data)
+        if 'ssv_mic_plain_tkn4' in self._filters:
+            data = self._filters['ssv_mic_plain_tkn4'](self, data)
         return data
 
     def unpack_ssv_mic_tkn4(self):
         data = types.ssv_mic_tkn4()
         data.smt_ssv_seq = self.unpack_uint32_t()
         data.smt_hmac = self.unpack_opaque()
-        if hasattr(self, 'filter_ssv_mic_tkn4'):
-            data = getattr(self, 'filter_ssv_mic_tkn4')(data)
+        if 'ssv_mic_tkn4' in self._filters:
+            data = self._filters['ssv_mic_tkn4'](self, data)
         return data
 
     def unpack_ssv_seal_plain_tkn4(self):
@@ -4901,8 +5102,8 @@ class NFS4Unpacker(xdrlib.Unpacker):
         data.sspt_ssv_seq = self.unpack_uint32_t()
         data.sspt_orig_plain = self.unpack_opaque()
         data.sspt_pad = self.unpack_opaque()
-        if hasattr(self, 'filter_ssv_seal_plain_tkn4'):
-            data = getattr(self, 'filter_ssv_seal_plain_tkn4')(data)
+        if 'ssv_seal_plain_tkn4' in self._filters:
+            data = self._filters['ssv_seal_plain_tkn4'](self, data)
         return data
 
     def unpack_ssv_seal_cipher_tkn4(self):
@@ -4911,8 +5112,8 @@ class NFS4Unpacker(xdrlib.Unpacker):
         data.ssct_iv = self.unpack_opaque()
         data.ssct_encr_data = self.unpack_opaque()
         data.ssct_hmac = self.unpack_opaque()
-        if hasattr(self, 'filter_ssv_seal_cipher_tkn4'):
-            data = getattr(self, 'filter_ssv_seal_cipher_tkn4')(data)
+        if 'ssv_seal_cipher_tkn4' in self._filters:
+            data = self._filters['ssv_seal_cipher_tkn4'](self, data)
         return data
 
     def unpack_fs_locations_server4(self):
@@ -4920,16 +5121,16 @@ class NFS4Unpacker(xdrlib.Unpacker):
         data.fls_currency = self.unpack_int32_t()
         data.fls_info = self.unpack_opaque()
         data.fls_server = self.unpack_utf8str_cis()
-        if hasattr(self, 'filter_fs_locations_server4'):
-            data = getattr(self, 'filter_fs_locations_server4')(data)
+        if 'fs_locations_server4' in self._filters:
+            data = self._filters['fs_locations_server4'](self, data)
         return data
 
     def unpack_fs_locations_item4(self):
         data = types.fs_locations_item4()
         data.fli_entries = self.unpack_array(self.unpack_fs_locations_server4)
         data.fli_rootpath = self.unpack_pathname4()
-        if hasattr(self, 'filter_fs_locations_item4'):
-            data = getattr(self, 'filter_fs_locations_item4')(data)
+        if 'fs_locations_item4' in self._filters:
+            data = self._filters['fs_locations_item4'](self, data)
         return data
 
     def unpack_fs_locations_info4(self):
@@ -4938,8 +5139,8 @@ class NFS4Unpacker(xdrlib.Unpacker):
         data.fli_valid_for = self.unpack_int32_t()
         data.fli_fs_root = self.unpack_pathname4()
         data.fli_items = self.unpack_array(self.unpack_fs_locations_item4)
-        if hasattr(self, 'filter_fs_locations_info4'):
-            data = getattr(self, 'filter_fs_locations_info4')(data)
+        if 'fs_locations_info4' in self._filters:
+            data = self._filters['fs_locations_info4'](self, data)
         return data
 
     unpack_fattr4_fs_locations_info = unpack_fs_locations_info4
@@ -4950,8 +5151,8 @@ class NFS4Unpacker(xdrlib.Unpacker):
         data = self.unpack_int()
         if self.check_enum and data not in [const.NFLH4_CARE_DENSE, const.NFLH4_CARE_COMMIT_THRU_MDS, const.NFLH4_CARE_STRIPE_UNIT_SIZE, const.NFLH4_CARE_STRIPE_COUNT]:
             raise XDRError, 'value=%s not in enum filelayout_hint_care4' % data
-        if hasattr(self, 'filter_filelayout_hint_care4'):
-            data = getattr(self, 'filter_filelayout_hint_care4')(data)
+        if 'filelayout_hint_care4' in self._filters:
+            data = self._filters['filelayout_hint_care4'](self, data)
         return data
 
     def unpack_nfsv4_1_file_layouthint4(self):
@@ -4959,22 +5160,22 @@ class NFS4Unpacker(xdrlib.Unpacker):
         data.nflh_care = self.unpack_uint32_t()
         data.nflh_util = self.unpack_nfl_util4()
         data.nflh_stripe_count = self.unpack_count4()
-        if hasattr(self, 'filter_nfsv4_1_file_layouthint4'):
-            data = getattr(self, 'filter_nfsv4_1_file_layouthint4')(data)
+        if 'nfsv4_1_file_layouthint4' in self._filters:
+            data = self._filters['nfsv4_1_file_layouthint4'](self, data)
         return data
 
     def unpack_multipath_list4(self):
         data = self.unpack_array(self.unpack_netaddr4)
-        if hasattr(self, 'filter_multipath_list4'):
-            data = getattr(self, 'filter_multipath_list4')(data)
+        if 'multipath_list4' in self._filters:
+            data = self._filters['multipath_list4'](self, data)
         return data
 
     def unpack_nfsv4_1_file_layout_ds_addr4(self):
         data = types.nfsv4_1_file_layout_ds_addr4()
         data.nflda_stripe_indices = self.unpack_array(self.unpack_uint32_t)
         data.nflda_multipath_ds_list = self.unpack_array(self.unpack_multipath_list4)
-        if hasattr(self, 'filter_nfsv4_1_file_layout_ds_addr4'):
-            data = getattr(self, 'filter_nfsv4_1_file_layout_ds_addr4')(data)
+        if 'nfsv4_1_file_layout_ds_addr4' in self._filters:
+            data = self._filters['nfsv4_1_file_layout_ds_addr4'](self, data)
         return data
 
     def unpack_nfsv4_1_file_layout4(self):
@@ -4984,23 +5185,23 @@ class NFS4Unpacker(xdrlib.Unpacker):
         data.nfl_first_stripe_index = self.unpack_uint32_t()
         data.nfl_pattern_offset = self.unpack_offset4()
         data.nfl_fh_list = self.unpack_array(self.unpack_nfs_fh4)
-        if hasattr(self, 'filter_nfsv4_1_file_layout4'):
-            data = getattr(self, 'filter_nfsv4_1_file_layout4')(data)
+        if 'nfsv4_1_file_layout4' in self._filters:
+            data = self._filters['nfsv4_1_file_layout4'](self, data)
         return data
 
     def unpack_ACCESS4args(self):
         data = types.ACCESS4args()
         data.access = self.unpack_uint32_t()
-        if hasattr(self, 'filter_ACCESS4args'):
-            data = getattr(self, 'filter_ACCESS4args')(data)
+        if 'ACCESS4args' in self._filters:
+            data = self._filters['ACCESS4args'](self, data)
         return data
 
     def unpack_ACCESS4resok(self):
         data = types.ACCESS4resok()
         data.supported = self.unpack_uint32_t()
         data.access = self.unpack_uint32_t()
-        if hasattr(self, 'filter_ACCESS4resok'):
-            data = getattr(self, 'filter_ACCESS4resok')(data)
+        if 'ACCESS4resok' in self._filters:
+            data = self._filters['ACCESS4resok'](self, data)
         return data
 
     def unpack_ACCESS4res(self):
@@ -5010,16 +5211,16 @@ class NFS4Unpacker(xdrlib.Unpacker):
             data.resok4 = self.unpack_ACCESS4resok()
         else:
             pass
-        if hasattr(self, 'filter_ACCESS4res'):
-            data = getattr(self, 'filter_ACCESS4res')(data)
+        if 'ACCESS4res' in self._filters:
+            data = self._filters['ACCESS4res'](self, data)
         return data
 
     def unpack_CLOSE4args(self):
         data = types.CLOSE4args()
         data.seqid = self.unpack_seqid4()
         data.open_stateid = self.unpack_stateid4()
-        if hasattr(self, 'filter_CLOSE4args'):
-            data = getattr(self, 'filter_CLOSE4args')(data)
+        if 'CLOSE4args' in self._filters:
+            data = self._filters['CLOSE4args'](self, data)
         return data
 
     def unpack_CLOSE4res(self):
@@ -5029,23 +5230,23 @@ class NFS4Unpacker(xdrlib.Unpacker):
             data.open_stateid = self.unpack_stateid4()
         else:
             pass
-        if hasattr(self, 'filter_CLOSE4res'):
-            data = getattr(self, 'filter_CLOSE4res')(data)
+        if 'CLOSE4res' in self._filters:
+            data = self._filters['CLOSE4res'](self, data)
         return data
 
     def unpack_COMMIT4args(self):
         data = types.COMMIT4args()
         data.offset = self.unpack_offset4()
         data.count = self.unpack_count4()
-        if hasattr(self, 'filter_COMMIT4args'):
-            data = getattr(self, 'filter_COMMIT4args')(data)
+        if 'COMMIT4args' in self._filters:
+            data = self._filters['COMMIT4args'](self, data)
         return data
 
     def unpack_COMMIT4resok(self):
         data = types.COMMIT4resok()
         data.writeverf = self.unpack_verifier4()
-        if hasattr(self, 'filter_COMMIT4resok'):
-            data = getattr(self, 'filter_COMMIT4resok')(data)
+        if 'COMMIT4resok' in self._filters:
+            data = self._filters['COMMIT4resok'](self, data)
         return data
 
     def unpack_COMMIT4res(self):
@@ -5055,8 +5256,8 @@ class NFS4Unpacker(xdrlib.Unpacker):
             data.resok4 = self.unpack_COMMIT4resok()
         else:
             pass
-        if hasattr(self, 'filter_COMMIT4res'):
-            data = getattr(self, 'filter_COMMIT4res')(data)
+        if 'COMMIT4res' in self._filters:
+            data = self._filters['COMMIT4res'](self, data)
         return data
 
     def unpack_createtype4(self):
@@ -5070,8 +5271,8 @@ class NFS4Unpacker(xdrlib.Unpacker):
             pass
         else:
             pass
-        if hasattr(self, 'filter_createtype4'):
-            data = getattr(self, 'filter_createtype4')(data)
+        if 'createtype4' in self._filters:
+            data = self._filters['createtype4'](self, data)
         return data
 
     def unpack_CREATE4args(self):
@@ -5079,16 +5280,16 @@ class NFS4Unpacker(xdrlib.Unpacker):
         data.objtype = self.unpack_createtype4()
         data.objname = self.unpack_component4()
         data.createattrs = self.unpack_fattr4()
-        if hasattr(self, 'filter_CREATE4args'):
-            data = getattr(self, 'filter_CREATE4args')(data)
+        if 'CREATE4args' in self._filters:
+            data = self._filters['CREATE4args'](self, data)
         return data
 
     def unpack_CREATE4resok(self):
         data = types.CREATE4resok()
         data.cinfo = self.unpack_change_info4()
         data.attrset = self.unpack_bitmap4()
-        if hasattr(self, 'filter_CREATE4resok'):
-            data = getattr(self, 'filter_CREATE4resok')(data)
+        if 'CREATE4resok' in self._filters:
+            data = self._filters['CREATE4resok'](self, data)
         return data
 
     def unpack_CREATE4res(self):
@@ -5098,50 +5299,50 @@ class NFS4Unpacker(xdrlib.Unpacker):
             data.resok4 = self.unpack_CREATE4resok()
         else:
             pass
-        if hasattr(self, 'filter_CREATE4res'):
-            data = getattr(self, 'filter_CREATE4res')(data)
+        if 'CREATE4res' in self._filters:
+            data = self._filters['CREATE4res'](self, data)
         return data
 
     def unpack_DELEGPURGE4args(self):
         data = types.DELEGPURGE4args()
         data.clientid = self.unpack_clientid4()
-        if hasattr(self, 'filter_DELEGPURGE4args'):
-            data = getattr(self, 'filter_DELEGPURGE4args')(data)
+        if 'DELEGPURGE4args' in self._filters:
+            data = self._filters['DELEGPURGE4args'](self, data)
         return data
 
     def unpack_DELEGPURGE4res(self):
         data = types.DELEGPURGE4res()
         data.status = self.unpack_nfsstat4()
-        if hasattr(self, 'filter_DELEGPURGE4res'):
-            data = getattr(self, 'filter_DELEGPURGE4res')(data)
+        if 'DELEGPURGE4res' in self._filters:
+            data = self._filters['DELEGPURGE4res'](self, data)
         return data
 
     def unpack_DELEGRETURN4args(self):
         data = types.DELEGRETURN4args()
         data.deleg_stateid = self.unpack_stateid4()
-        if hasattr(self, 'filter_DELEGRETURN4args'):
-            data = getattr(self, 'filter_DELEGRETURN4args')(data)
+        if 'DELEGRETURN4args' in self._filters:
+            data = self._filters['DELEGRETURN4args'](self, data)
         return data
 
     def unpack_DELEGRETURN4res(self):
         data = types.DELEGRETURN4res()
         data.status = self.unpack_nfsstat4()
-        if hasattr(self, 'filter_DELEGRETURN4res'):
-            data = getattr(self, 'filter_DELEGRETURN4res')(data)
+        if 'DELEGRETURN4res' in self._filters:
+            data = self._filters['DELEGRETURN4res'](self, data)
         return data
 
     def unpack_GETATTR4args(self):
         data = types.GETATTR4args()
         data.attr_request = self.unpack_bitmap4()
-        if hasattr(self, 'filter_GETATTR4args'):
-            data = getattr(self, 'filter_GETATTR4args')(data)
+        if 'GETATTR4args' in self._filters:
+            data = self._filters['GETATTR4args'](self, data)
         return data
 
     def unpack_GETATTR4resok(self):
         data = types.GETATTR4resok()
         data.obj_attributes = self.unpack_fattr4()
-        if hasattr(self, 'filter_GETATTR4resok'):
-            data = getattr(self, 'filter_GETATTR4resok')(data)
+        if 'GETATTR4resok' in self._filters:
+            data = self._filters['GETATTR4resok'](self, data)
         return data
 
     def unpack_GETATTR4res(self):
@@ -5151,15 +5352,15 @@ class NFS4Unpacker(xdrlib.Unpacker):
             data.resok4 = self.unpack_GETATTR4resok()
         else:
             pass
-        if hasattr(self, 'filter_GETATTR4res'):
-            data = getattr(self, 'filter_GETATTR4res')(data)
+        if 'GETATTR4res' in self._filters:
+            data = self._filters['GETATTR4res'](self, data)
         return data
 
     def unpack_GETFH4resok(self):
         data = types.GETFH4resok()
         data.object = self.unpack_nfs_fh4()
-        if hasattr(self, 'filter_GETFH4resok'):
-            data = getattr(self, 'filter_GETFH4resok')(data)
+        if 'GETFH4resok' in self._filters:
+            data = self._filters['GETFH4resok'](self, data)
         return data
 
     def unpack_GETFH4res(self):
@@ -5169,22 +5370,22 @@ class NFS4Unpacker(xdrlib.Unpacker):
             data.resok4 = self.unpack_GETFH4resok()
         else:
             pass
-        if hasattr(self, 'filter_GETFH4res'):
-            data = getattr(self, 'filter_GETFH4res')(data)
+        if 'GETFH4res' in self._filters:
+            data = self._filters['GETFH4res'](self, data)
         return data
 
     def unpack_LINK4args(self):
         data = types.LINK4args()
         data.newname = self.unpack_component4()
-        if hasattr(self, 'filter_LINK4args'):
-            data = getattr(self, 'filter_LINK4args')(data)
+        if 'LINK4args' in self._filters:
+            data = self._filters['LINK4args'](self, data)
         return data
 
     def unpack_LINK4resok(self):
         data = types.LINK4resok()
         data.cinfo = self.unpack_change_info4()
-        if hasattr(self, 'filter_LINK4resok'):
-            data = getattr(self, 'filter_LINK4resok')(data)
+        if 'LINK4resok' in self._filters:
+            data = self._filters['LINK4resok'](self, data)
         return data
 
     def unpack_LINK4res(self):
@@ -5194,8 +5395,8 @@ class NFS4Unpacker(xdrlib.Unpacker):
             data.resok4 = self.unpack_LINK4resok()
         else:
             pass
-        if hasattr(self, 'filter_LINK4res'):
-            data = getattr(self, 'filter_LINK4res')(data)
+        if 'LINK4res' in self._filters:
+            data = self._filters['LINK4res'](self, data)
         return data
 
     def unpack_open_to_lock_owner4(self):
@@ -5204,16 +5405,16 @@ class NFS4Unpacker(xdrlib.Unpacker):
         data.open_stateid = self.unpack_stateid4()
         data.lock_seqid = self.unpack_seqid4()
         data.lock_owner = self.unpack_lock_owner4()
-        if hasattr(self, 'filter_open_to_lock_owner4'):
-            data = getattr(self, 'filter_open_to_lock_owner4')(data)
+        if 'open_to_lock_owner4' in self._filters:
+            data = self._filters['open_to_lock_owner4'](self, data)
         return data
 
     def unpack_exist_lock_owner4(self):
         data = types.exist_lock_owner4()
         data.lock_stateid = self.unpack_stateid4()
         data.lock_seqid = self.unpack_seqid4()
-        if hasattr(self, 'filter_exist_lock_owner4'):
-            data = getattr(self, 'filter_exist_lock_owner4')(data)
+        if 'exist_lock_owner4' in self._filters:
+            data = self._filters['exist_lock_owner4'](self, data)
         return data
 
     def unpack_locker4(self):
@@ -5225,8 +5426,8 @@ class NFS4Unpacker(xdrlib.Unpacker):
             data.lock_owner = self.unpack_exist_lock_owner4()
         else:
             raise XDRError, 'bad switch=%s' % data.new_lock_owner
-        if hasattr(self, 'filter_locker4'):
-            data = getattr(self, 'filter_locker4')(data)
+        if 'locker4' in self._filters:
+            data = self._filters['locker4'](self, data)
         return data
 
     def unpack_LOCK4args(self):
@@ -5236,8 +5437,8 @@ class NFS4Unpacker(xdrlib.Unpacker):
         data.offset = self.unpack_offset4()
         data.length = self.unpack_length4()
         data.locker = self.unpack_locker4()
-        if hasattr(self, 'filter_LOCK4args'):
-            data = getattr(self, 'filter_LOCK4args')(data)
+        if 'LOCK4args' in self._filters:
+            data = self._filters['LOCK4args'](self, data)
         return data
 
     def unpack_LOCK4denied(self):
@@ -5246,15 +5447,15 @@ class NFS4Unpacker(xdrlib.Unpacker):
         data.length = self.unpack_length4()
         data.locktype = self.unpack_nfs_lock_type4()
         data.owner = self.unpack_lock_owner4()
-        if hasattr(self, 'filter_LOCK4denied'):
-            data = getattr(self, 'filter_LOCK4denied')(data)
+        if 'LOCK4denied' in self._filters:
+            data = self._filters['LOCK4denied'](self, data)
         return data
 
     def unpack_LOCK4resok(self):
         data = types.LOCK4resok()
         data.lock_stateid = self.unpack_stateid4()
-        if hasattr(self, 'filter_LOCK4resok'):
-            data = getattr(self, 'filter_LOCK4resok')(data)
+        if 'LOCK4resok' in self._filters:
+            data = self._filters['LOCK4resok'](self, data)
         return data
 
     def unpack_LOCK4res(self):
@@ -5266,8 +5467,8 @@ class NFS4Unpacker(xdrlib.Unpacker):
             data.denied = self.unpack_LOCK4denied()
         else:
             pass
-        if hasattr(self, 'filter_LOCK4res'):
-            data = getattr(self, 'filter_LOCK4res')(data)
+        if 'LOCK4res' in self._filters:
+            data = self._filters['LOCK4res'](self, data)
         return data
 
     def unpack_LOCKT4args(self):
@@ -5276,8 +5477,8 @@ class NFS4Unpacker(xdrlib.Unpacker):
         data.offset = self.unpack_offset4()
         data.length = self.unpack_length4()
         data.owner = self.unpack_lock_owner4()
-        if hasattr(self, 'filter_LOCKT4args'):
-            data = getattr(self, 'filter_LOCKT4args')(data)
+        if 'LOCKT4args' in self._filters:
+            data = self._filters['LOCKT4args'](self, data)
         return data
 
     def unpack_LOCKT4res(self):
@@ -5289,8 +5490,8 @@ class NFS4Unpacker(xdrlib.Unpacker):
             pass
         else:
             pass
-        if hasattr(self, 'filter_LOCKT4res'):
-            data = getattr(self, 'filter_LOCKT4res')(data)
+        if 'LOCKT4res' in self._filters:
+            data = self._filters['LOCKT4res'](self, data)
         return data
 
     def unpack_LOCKU4args(self):
@@ -5300,8 +5501,8 @@ class NFS4Unpacker(xdrlib.Unpacker):
         data.lock_stateid = self.unpack_stateid4()
         data.offset = self.unpack_offset4()
         data.length = self.unpack_length4()
-        if hasattr(self, 'filter_LOCKU4args'):
-            data = getattr(self, 'filter_LOCKU4args')(data)
+        if 'LOCKU4args' in self._filters:
+            data = self._filters['LOCKU4args'](self, data)
         return data
 
     def unpack_LOCKU4res(self):
@@ -5311,59 +5512,59 @@ class NFS4Unpacker(xdrlib.Unpacker):
             data.lock_stateid = self.unpack_stateid4()
         else:
             pass
-        if hasattr(self, 'filter_LOCKU4res'):
-            data = getattr(self, 'filter_LOCKU4res')(data)
+        if 'LOCKU4res' in self._filters:
+            data = self._filters['LOCKU4res'](self, data)
         return data
 
     def unpack_LOOKUP4args(self):
         data = types.LOOKUP4args()
         data.objname = self.unpack_component4()
-        if hasattr(self, 'filter_LOOKUP4args'):
-            data = getattr(self, 'filter_LOOKUP4args')(data)
+        if 'LOOKUP4args' in self._filters:
+            data = self._filters['LOOKUP4args'](self, data)
         return data
 
     def unpack_LOOKUP4res(self):
         data = types.LOOKUP4res()
         data.status = self.unpack_nfsstat4()
-        if hasattr(self, 'filter_LOOKUP4res'):
-            data = getattr(self, 'filter_LOOKUP4res')(data)
+        if 'LOOKUP4res' in self._filters:
+            data = self._filters['LOOKUP4res'](self, data)
         return data
 
     def unpack_LOOKUPP4res(self):
         data = types.LOOKUPP4res()
         data.status = self.unpack_nfsstat4()
-        if hasattr(self, 'filter_LOOKUPP4res'):
-            data = getattr(self, 'filter_LOOKUPP4res')(data)
+        if 'LOOKUPP4res' in self._filters:
+            data = self._filters['LOOKUPP4res'](self, data)
         return data
 
     def unpack_NVERIFY4args(self):
         data = types.NVERIFY4args()
         data.obj_attributes = self.unpack_fattr4()
-        if hasattr(self, 'filter_NVERIFY4args'):
-            data = getattr(self, 'filter_NVERIFY4args')(data)
+        if 'NVERIFY4args' in self._filters:
+            data = self._filters['NVERIFY4args'](self, data)
         return data
 
     def unpack_NVERIFY4res(self):
         data = types.NVERIFY4res()
         data.status = self.unpack_nfsstat4()
-        if hasattr(self, 'filter_NVERIFY4res'):
-            data = getattr(self, 'filter_NVERIFY4res')(data)
+        if 'NVERIFY4res' in self._filters:
+            data = self._filters['NVERIFY4res'](self, data)
         return data
 
     def unpack_createmode4(self):
         data = self.unpack_int()
         if self.check_enum and data not in [const.UNCHECKED4, const.GUARDED4, const.EXCLUSIVE4, const.EXCLUSIVE4_1]:
             raise XDRError, 'value=%s not in enum createmode4' % data
-        if hasattr(self, 'filter_createmode4'):
-            data = getattr(self, 'filter_createmode4')(data)
+        if 'createmode4' in self._filters:
+            data = self._filters['createmode4'](self, data)
         return data
 
     def unpack_creatverfattr(self):
         data = types.creatverfattr()
         data.cva_verf = self.unpack_verifier4()
         data.cva_attrs = self.unpack_fattr4()
-        if hasattr(self, 'filter_creatverfattr'):
-            data = getattr(self, 'filter_creatverfattr')(data)
+        if 'creatverfattr' in self._filters:
+            data = self._filters['creatverfattr'](self, data)
         return data
 
     def unpack_createhow4(self):
@@ -5377,16 +5578,16 @@ class NFS4Unpacker(xdrlib.Unpacker):
             data.ch_createboth = self.unpack_creatverfattr()
         else:
             raise XDRError, 'bad switch=%s' % data.mode
-        if hasattr(self, 'filter_createhow4'):
-            data = getattr(self, 'filter_createhow4')(data)
+        if 'createhow4' in self._filters:
+            data = self._filters['createhow4'](self, data)
         return data
 
     def unpack_opentype4(self):
         data = self.unpack_int()
         if self.check_enum and data not in [const.OPEN4_NOCREATE, const.OPEN4_CREATE]:
             raise XDRError, 'value=%s not in enum opentype4' % data
-        if hasattr(self, 'filter_opentype4'):
-            data = getattr(self, 'filter_opentype4')(data)
+        if 'opentype4' in self._filters:
+            data = self._filters['opentype4'](self, data)
         return data
 
     def unpack_openflag4(self):
@@ -5396,24 +5597,24 @@ class NFS4Unpacker(xdrlib.Unpacker):
             data.how = self.unpack_createhow4()
         else:
             pass
-        if hasattr(self, 'filter_openflag4'):
-            data = getattr(self, 'filter_openflag4')(data)
+        if 'openflag4' in self._filters:
+            data = self._filters['openflag4'](self, data)
         return data
 
     def unpack_limit_by4(self):
         data = self.unpack_int()
         if self.check_enum and data not in [const.NFS_LIMIT_SIZE, const.NFS_LIMIT_BLOCKS]:
             raise XDRError, 'value=%s not in enum limit_by4' % data
-        if hasattr(self, 'filter_limit_by4'):
-            data = getattr(self, 'filter_limit_by4')(data)
+        if 'limit_by4' in self._filters:
+            data = self._filters['limit_by4'](self, data)
         return data
 
     def unpack_nfs_modified_limit4(self):
         data = types.nfs_modified_limit4()
         data.num_blocks = self.unpack_uint32_t()
         data.bytes_per_block = self.unpack_uint32_t()
-        if hasattr(self, 'filter_nfs_modified_limit4'):
-            data = getattr(self, 'filter_nfs_modified_limit4')(data)
+        if 'nfs_modified_limit4' in self._filters:
+            data = self._filters['nfs_modified_limit4'](self, data)
         return data
 
     def unpack_nfs_space_limit4(self):
@@ -5425,32 +5626,32 @@ class NFS4Unpacker(xdrlib.Unpacker):
             data.mod_blocks = self.unpack_nfs_modified_limit4()
         else:
             raise XDRError, 'bad switch=%s' % data.limitby
-        if hasattr(self, 'filter_nfs_space_limit4'):
-            data = getattr(self, 'filter_nfs_space_limit4')(data)
+        if 'nfs_space_limit4' in self._filters:
+            data = self._filters['nfs_space_limit4'](self, data)
         return data
 
     def unpack_open_delegation_type4(self):
         data = self.unpack_int()
         if self.check_enum and data not in [const.OPEN_DELEGATE_NONE, const.OPEN_DELEGATE_READ, const.OPEN_DELEGATE_WRITE, const.OPEN_DELEGATE_NONE_EXT]:
             raise XDRError, 'value=%s not in enum open_delegation_type4' % data
-        if hasattr(self, 'filter_open_delegation_type4'):
-            data = getattr(self, 'filter_open_delegation_type4')(data)
+        if 'open_delegation_type4' in self._filters:
+            data = self._filters['open_delegation_type4'](self, data)
         return data
 
     def unpack_open_claim_type4(self):
         data = self.unpack_int()
         if self.check_enum and data not in [const.CLAIM_NULL, const.CLAIM_PREVIOUS, const.CLAIM_DELEGATE_CUR, const.CLAIM_DELEGATE_PREV, const.CLAIM_FH, const.CLAIM_DELEG_CUR_FH, const.CLAIM_DELEG_PREV_FH]:
             raise XDRError, 'value=%s not in enum open_claim_type4' % data
-        if hasattr(self, 'filter_open_claim_type4'):
-            data = getattr(self, 'filter_open_claim_type4')(data)
+        if 'open_claim_type4' in self._filters:
+            data = self._filters['open_claim_type4'](self, data)
         return data
 
     def unpack_open_claim_delegate_cur4(self):
         data = types.open_claim_delegate_cur4()
         data.delegate_stateid = self.unpack_stateid4()
         data.file = self.unpack_component4()
-        if hasattr(self, 'filter_open_claim_delegate_cur4'):
-            data = getattr(self, 'filter_open_claim_delegate_cur4')(data)
+        if 'open_claim_delegate_cur4' in self._filters:
+            data = self._filters['open_claim_delegate_cur4'](self, data)
         return data
 
     def unpack_open_claim4(self):
@@ -5472,8 +5673,8 @@ class NFS4Unpacker(xdrlib.Unpacker):
             data.oc_delegate_stateid = self.unpack_stateid4()
         else:
             raise XDRError, 'bad switch=%s' % data.claim
-        if hasattr(self, 'filter_open_claim4'):
-            data = getattr(self, 'filter_open_claim4')(data)
+        if 'open_claim4' in self._filters:
+            data = self._filters['open_claim4'](self, data)
         return data
 
     def unpack_OPEN4args(self):
@@ -5484,8 +5685,8 @@ class NFS4Unpacker(xdrlib.Unpacker):
         data.owner = self.unpack_open_owner4()
         data.openhow = self.unpack_openflag4()
         data.claim = self.unpack_open_claim4()
-        if hasattr(self, 'filter_OPEN4args'):
-            data = getattr(self, 'filter_OPEN4args')(data)
+        if 'OPEN4args' in self._filters:
+            data = self._filters['OPEN4args'](self, data)
         return data
 
     def unpack_open_read_delegation4(self):
@@ -5493,8 +5694,8 @@ class NFS4Unpacker(xdrlib.Unpacker):
         data.stateid = self.unpack_stateid4()
         data.recall = self.unpack_bool()
         data.permissions = self.unpack_nfsace4()
-        if hasattr(self, 'filter_open_read_delegation4'):
-            data = getattr(self, 'filter_open_read_delegation4')(data)
+        if 'open_read_delegation4' in self._filters:
+            data = self._filters['open_read_delegation4'](self, data)
         return data
 
     def unpack_open_write_delegation4(self):
@@ -5503,16 +5704,16 @@ class NFS4Unpacker(xdrlib.Unpacker):
         data.recall = self.unpack_bool()
         data.space_limit = self.unpack_nfs_space_limit4()
         data.permissions = self.unpack_nfsace4()
-        if hasattr(self, 'filter_open_write_delegation4'):
-            data = getattr(self, 'filter_open_write_delegation4')(data)
+        if 'open_write_delegation4' in self._filters:
+            data = self._filters['open_write_delegation4'](self, data)
         return data
 
     def unpack_why_no_delegation4(self):
         data = self.unpack_int()
         if self.check_enum and data not in [const.WND4_NOT_WANTED, const.WND4_CONTENTION, const.WND4_RESOURCE, const.WND4_NOT_SUPP_FTYPE, const.WND4_WRITE_DELEG_NOT_SUPP_FTYPE, const.WND4_NOT_SUPP_UPGRADE, const.WND4_NOT_SUPP_DOWNGRADE, const.WND4_CANCELED, const.WND4_IS_DIR]:
             raise XDRError, 'value=%s not in enum why_no_delegation4' % data
-        if hasattr(self, 'filter_why_no_delegation4'):
-            data = getattr(self, 'filter_why_no_delegation4')(data)
+        if 'why_no_delegation4' in self._filters:
+            data = self._filters['why_no_delegation4'](self, data)
         return data
 
     def unpack_open_none_delegation4(self):
@@ -5524,8 +5725,8 @@ class NFS4Unpacker(xdrlib.Unpacker):
             data.ond_server_will_signal_avail = self.unpack_bool()
         else:
             pass
-        if hasattr(self, 'filter_open_none_delegation4'):
-            data = getattr(self, 'filter_open_none_delegation4')(data)
+        if 'open_none_delegation4' in self._filters:
+            data = self._filters['open_none_delegation4'](self, data)
         return data
 
     def unpack_open_delegation4(self):
@@ -5541,8 +5742,8 @@ class NFS4Unpacker(xdrlib.Unpacker):
             data.od_whynone = self.unpack_open_none_delegation4()
         else:
             raise XDRError, 'bad switch=%s' % data.delegation_type
-        if hasattr(self, 'filter_open_delegation4'):
-            data = getattr(self, 'filter_open_delegation4')(data)
+        if 'open_delegation4' in self._filters:
+            data = self._filters['open_delegation4'](self, data)
         return data
 
     def unpack_OPEN4resok(self):
@@ -5552,8 +5753,8 @@ class NFS4Unpacker(xdrlib.Unpacker):
         data.rflags = self.unpack_uint32_t()
         data.attrset = self.unpack_bitmap4()
         data.delegation = self.unpack_open_delegation4()
-        if hasattr(self, 'filter_OPEN4resok'):
-            data = getattr(self, 'filter_OPEN4resok')(data)
+        if 'OPEN4resok' in self._filters:
+            data = self._filters['OPEN4resok'](self, data)
         return data
 
     def unpack_OPEN4res(self):
@@ -5563,37 +5764,37 @@ class NFS4Unpacker(xdrlib.Unpacker):
             data.resok4 = self.unpack_OPEN4resok()
         else:
             pass
-        if hasattr(self, 'filter_OPEN4res'):
-            data = getattr(self, 'filter_OPEN4res')(data)
+        if 'OPEN4res' in self._filters:
+            data = self._filters['OPEN4res'](self, data)
         return data
 
     def unpack_OPENATTR4args(self):
         data = types.OPENATTR4args()
         data.createdir = self.unpack_bool()
-        if hasattr(self, 'filter_OPENATTR4args'):
-            data = getattr(self, 'filter_OPENATTR4args')(data)
+        if 'OPENATTR4args' in self._filters:
+            data = self._filters['OPENATTR4args'](self, data)
         return data
 
     def unpack_OPENATTR4res(self):
         data = types.OPENATTR4res()
         data.status = self.unpack_nfsstat4()
-        if hasattr(self, 'filter_OPENATTR4res'):
-            data = getattr(self, 'filter_OPENATTR4res')(data)
+        if 'OPENATTR4res' in self._filters:
+            data = self._filters['OPENATTR4res'](self, data)
         return data
 
     def unpack_OPEN_CONFIRM4args(self):
         data = types.OPEN_CONFIRM4args()
         data.open_stateid = self.unpack_stateid4()
         data.seqid = self.unpack_seqid4()
-        if hasattr(self, 'filter_OPEN_CONFIRM4args'):
-            data = getattr(self, 'filter_OPEN_CONFIRM4args')(data)
+        if 'OPEN_CONFIRM4args' in self._filters:
+            data = self._filters['OPEN_CONFIRM4args'](self, data)
         return data
 
     def unpack_OPEN_CONFIRM4resok(self):
         data = types.OPEN_CONFIRM4resok()
         data.open_stateid = self.unpack_stateid4()
-        if hasattr(self, 'filter_OPEN_CONFIRM4resok'):
-            data = getattr(self, 'filter_OPEN_CONFIRM4resok')(data)
+        if 'OPEN_CONFIRM4resok' in self._filters:
+            data = self._filters['OPEN_CONFIRM4resok'](self, data)
         return data
 
     def unpack_OPEN_CONFIRM4res(self):
@@ -5603,8 +5804,8 @@ class NFS4Unpacker(xdrlib.Unpacker):
             data.resok4 = self.unpack_OPEN_CONFIRM4resok()
         else:
             pass
-        if hasattr(self, 'filter_OPEN_CONFIRM4res'):
-            data = getattr(self, 'filter_OPEN_CONFIRM4res')(data)
+        if 'OPEN_CONFIRM4res' in self._filters:
+            data = self._filters['OPEN_CONFIRM4res'](self, data)
         return data
 
     def unpack_OPEN_DOWNGRADE4args(self):
@@ -5613,15 +5814,15 @@ class NFS4Unpacker(xdrlib.Unpacker):
         data.seqid = self.unpack_seqid4()
         data.share_access = self.unpack_uint32_t()
         data.share_deny = self.unpack_uint32_t()
-        if hasattr(self, 'filter_OPEN_DOWNGRADE4args'):
-            data = getattr(self, 'filter_OPEN_DOWNGRADE4args')(data)
+        if 'OPEN_DOWNGRADE4args' in self._filters:
+            data = self._filters['OPEN_DOWNGRADE4args'](self, data)
         return data
 
     def unpack_OPEN_DOWNGRADE4resok(self):
         data = types.OPEN_DOWNGRADE4resok()
         data.open_stateid = self.unpack_stateid4()
-        if hasattr(self, 'filter_OPEN_DOWNGRADE4resok'):
-            data = getattr(self, 'filter_OPEN_DOWNGRADE4resok')(data)
+        if 'OPEN_DOWNGRADE4resok' in self._filters:
+            data = self._filters['OPEN_DOWNGRADE4resok'](self, data)
         return data
 
     def unpack_OPEN_DOWNGRADE4res(self):
@@ -5631,36 +5832,36 @@ class NFS4Unpacker(xdrlib.Unpacker):
             data.resok4 = self.unpack_OPEN_DOWNGRADE4resok()
         else:
             pass
-        if hasattr(self, 'filter_OPEN_DOWNGRADE4res'):
-            data = getattr(self, 'filter_OPEN_DOWNGRADE4res')(data)
+        if 'OPEN_DOWNGRADE4res' in self._filters:
+            data = self._filters['OPEN_DOWNGRADE4res'](self, data)
         return data
 
     def unpack_PUTFH4args(self):
         data = types.PUTFH4args()
         data.object = self.unpack_nfs_fh4()
-        if hasattr(self, 'filter_PUTFH4args'):
-            data = getattr(self, 'filter_PUTFH4args')(data)
+        if 'PUTFH4args' in self._filters:
+            data = self._filters['PUTFH4args'](self, data)
         return data
 
     def unpack_PUTFH4res(self):
         data = types.PUTFH4res()
         data.status = self.unpack_nfsstat4()
-        if hasattr(self, 'filter_PUTFH4res'):
-            data = getattr(self, 'filter_PUTFH4res')(data)
+        if 'PUTFH4res' in self._filters:
+            data = self._filters['PUTFH4res'](self, data)
         return data
 
     def unpack_PUTPUBFH4res(self):
         data = types.PUTPUBFH4res()
         data.status = self.unpack_nfsstat4()
-        if hasattr(self, 'filter_PUTPUBFH4res'):
-            data = getattr(self, 'filter_PUTPUBFH4res')(data)
+        if 'PUTPUBFH4res' in self._filters:
+            data = self._filters['PUTPUBFH4res'](self, data)
         return data
 
     def unpack_PUTROOTFH4res(self):
         data = types.PUTROOTFH4res()
         data.status = self.unpack_nfsstat4()
-        if hasattr(self, 'filter_PUTROOTFH4res'):
-            data = getattr(self, 'filter_PUTROOTFH4res')(data)
+        if 'PUTROOTFH4res' in self._filters:
+            data = self._filters['PUTROOTFH4res'](self, data)
         return data
 
     def unpack_READ4args(self):
@@ -5668,16 +5869,16 @@ class NFS4Unpacker(xdrlib.Unpacker):
         data.stateid = self.unpack_stateid4()
         data.offset = self.unpack_offset4()
         data.count = self.unpack_count4()
-        if hasattr(self, 'filter_READ4args'):
-            data = getattr(self, 'filter_READ4args')(data)
+        if 'READ4args' in self._filters:
+            data = self._filters['READ4args'](self, data)
         return data
 
     def unpack_READ4resok(self):
         data = types.READ4resok()
         data.eof = self.unpack_bool()
         data.data = self.unpack_opaque()
-        if hasattr(self, 'filter_READ4resok'):
-            data = getattr(self, 'filter_READ4resok')(data)
+        if 'READ4resok' in self._filters:
+            data = self._filters['READ4resok'](self, data)
         return data
 
     def unpack_READ4res(self):
@@ -5687,8 +5888,8 @@ class NFS4Unpacker(xdrlib.Unpacker):
             data.resok4 = self.unpack_READ4resok()
         else:
             pass
-        if hasattr(self, 'filter_READ4res'):
-            data = getattr(self, 'filter_READ4res')(data)
+        if 'READ4res' in self._filters:
+            data = self._filters['READ4res'](self, data)
         return data
 
     def unpack_READDIR4args(self):
@@ -5698,8 +5899,8 @@ class NFS4Unpacker(xdrlib.Unpacker):
         data.dircount = self.unpack_count4()
         data.maxcount = self.unpack_count4()
         data.attr_request = self.unpack_bitmap4()
-        if hasattr(self, 'filter_READDIR4args'):
-            data = getattr(self, 'filter_READDIR4args')(data)
+        if 'READDIR4args' in self._filters:
+            data = self._filters['READDIR4args'](self, data)
         return data
 
     def unpack_entry4(self):
@@ -5707,24 +5908,24 @@ class NFS4Unpacker(xdrlib.Unpacker):
         data.cookie = self.unpack_nfs_cookie4()
         data.name = self.unpack_component4()
         data.attrs = self.unpack_fattr4()
-        if hasattr(self, 'filter_entry4'):
-            data = getattr(self, 'filter_entry4')(data)
+        if 'entry4' in self._filters:
+            data = self._filters['entry4'](self, data)
         return data
 
     def unpack_dirlist4(self):
         data = types.dirlist4()
         data.entries = self.unpack_list(self.unpack_entry4)
         data.eof = self.unpack_bool()
-        if hasattr(self, 'filter_dirlist4'):
-            data = getattr(self, 'filter_dirlist4')(data)
+        if 'dirlist4' in self._filters:
+            data = self._filters['dirlist4'](self, data)
         return data
 
     def unpack_READDIR4resok(self):
         data = types.READDIR4resok()
         data.cookieverf = self.unpack_verifier4()
         data.reply = self.unpack_dirlist4()
-        if hasattr(self, 'filter_READDIR4resok'):
-            data = getattr(self, 'filter_READDIR4resok')(data)
+        if 'READDIR4resok' in self._filters:
+            data = self._filters['READDIR4resok'](self, data)
         return data
 
     def unpack_READDIR4res(self):
@@ -5734,15 +5935,15 @@ class NFS4Unpacker(xdrlib.Unpacker):
             data.resok4 = self.unpack_READDIR4resok()
         else:
             pass
-        if hasattr(self, 'filter_READDIR4res'):
-            data = getattr(self, 'filter_READDIR4res')(data)
+        if 'READDIR4res' in self._filters:
+            data = self._filters['READDIR4res'](self, data)
         return data
 
     def unpack_READLINK4resok(self):
         data = types.READLINK4resok()
         data.link = self.unpack_linktext4()
-        if hasattr(self, 'filter_READLINK4resok'):
-            data = getattr(self, 'filter_READLINK4resok')(data)
+        if 'READLINK4resok' in self._filters:
+            data = self._filters['READLINK4resok'](self, data)
         return data
 
     def unpack_READLINK4res(self):
@@ -5752,22 +5953,22 @@ class NFS4Unpacker(xdrlib.Unpacker):
             data.resok4 = self.unpack_READLINK4resok()
         else:
             pass
-        if hasattr(self, 'filter_READLINK4res'):
-            data = getattr(self, 'filter_READLINK4res')(data)
+        if 'READLINK4res' in self._filters:
+            data = self._filters['READLINK4res'](self, data)
         return data
 
     def unpack_REMOVE4args(self):
         data = types.REMOVE4args()
         data.target = self.unpack_component4()
-        if hasattr(self, 'filter_REMOVE4args'):
-            data = getattr(self, 'filter_REMOVE4args')(data)
+        if 'REMOVE4args' in self._filters:
+            data = self._filters['REMOVE4args'](self, data)
         return data
 
     def unpack_REMOVE4resok(self):
         data = types.REMOVE4resok()
         data.cinfo = self.unpack_change_info4()
-        if hasattr(self, 'filter_REMOVE4resok'):
-            data = getattr(self, 'filter_REMOVE4resok')(data)
+        if 'REMOVE4resok' in self._filters:
+            data = self._filters['REMOVE4resok'](self, data)
         return data
 
     def unpack_REMOVE4res(self):
@@ -5777,24 +5978,24 @@ class NFS4Unpacker(xdrlib.Unpacker):
             data.resok4 = self.unpack_REMOVE4resok()
         else:
             pass
-        if hasattr(self, 'filter_REMOVE4res'):
-            data = getattr(self, 'filter_REMOVE4res')(data)
+        if 'REMOVE4res' in self._filters:
+            data = self._filters['REMOVE4res'](self, data)
         return data
 
     def unpack_RENAME4args(self):
         data = types.RENAME4args()
         data.oldname = self.unpack_component4()
         data.newname = self.unpack_component4()
-        if hasattr(self, 'filter_RENAME4args'):
-            data = getattr(self, 'filter_RENAME4args')(data)
+        if 'RENAME4args' in self._filters:
+            data = self._filters['RENAME4args'](self, data)
         return data
 
     def unpack_RENAME4resok(self):
         data = types.RENAME4resok()
         data.source_cinfo = self.unpack_change_info4()
         data.target_cinfo = self.unpack_change_info4()
-        if hasattr(self, 'filter_RENAME4resok'):
-            data = getattr(self, 'filter_RENAME4resok')(data)
+        if 'RENAME4resok' in self._filters:
+            data = self._filters['RENAME4resok'](self, data)
         return data
 
     def unpack_RENAME4res(self):
@@ -5804,51 +6005,51 @@ class NFS4Unpacker(xdrlib.Unpacker):
             data.resok4 = self.unpack_RENAME4resok()
         else:
             pass
-        if hasattr(self, 'filter_RENAME4res'):
-            data = getattr(self, 'filter_RENAME4res')(data)
+        if 'RENAME4res' in self._filters:
+            data = self._filters['RENAME4res'](self, data)
         return data
 
     def unpack_RENEW4args(self):
         data = types.RENEW4args()
         data.clientid = self.unpack_clientid4()
-        if hasattr(self, 'filter_RENEW4args'):
-            data = getattr(self, 'filter_RENEW4args')(data)
+        if 'RENEW4args' in self._filters:
+            data = self._filters['RENEW4args'](self, data)
         return data
 
     def unpack_RENEW4res(self):
         data = types.RENEW4res()
         data.status = self.unpack_nfsstat4()
-        if hasattr(self, 'filter_RENEW4res'):
-            data = getattr(self, 'filter_RENEW4res')(data)
+        if 'RENEW4res' in self._filters:
+            data = self._filters['RENEW4res'](self, data)
         return data
 
     def unpack_RESTOREFH4res(self):
         data = types.RESTOREFH4res()
         data.status = self.unpack_nfsstat4()
-        if hasattr(self, 'filter_RESTOREFH4res'):
-            data = getattr(self, 'filter_RESTOREFH4res')(data)
+        if 'RESTOREFH4res' in self._filters:
+            data = self._filters['RESTOREFH4res'](self, data)
         return data
 
     def unpack_SAVEFH4res(self):
         data = types.SAVEFH4res()
         data.status = self.unpack_nfsstat4()
-        if hasattr(self, 'filter_SAVEFH4res'):
-            data = getattr(self, 'filter_SAVEFH4res')(data)
+        if 'SAVEFH4res' in self._filters:
+            data = self._filters['SAVEFH4res'](self, data)
         return data
 
     def unpack_SECINFO4args(self):
         data = types.SECINFO4args()
         data.name = self.unpack_component4()
-        if hasattr(self, 'filter_SECINFO4args'):
-            data = getattr(self, 'filter_SECINFO4args')(data)
+        if 'SECINFO4args' in self._filters:
+            data = self._filters['SECINFO4args'](self, data)
         return data
 
     def unpack_rpc_gss_svc_t(self):
         data = self.unpack_int()
         if self.check_enum and data not in [const.RPC_GSS_SVC_NONE, const.RPC_GSS_SVC_INTEGRITY, const.RPC_GSS_SVC_PRIVACY]:
             raise XDRError, 'value=%s not in enum rpc_gss_svc_t' % data
-        if hasattr(self, 'filter_rpc_gss_svc_t'):
-            data = getattr(self, 'filter_rpc_gss_svc_t')(data)
+        if 'rpc_gss_svc_t' in self._filters:
+            data = self._filters['rpc_gss_svc_t'](self, data)
         return data
 
     def unpack_rpcsec_gss_info(self):
@@ -5856,8 +6057,8 @@ class NFS4Unpacker(xdrlib.Unpacker):
         data.oid = self.unpack_sec_oid4()
         data.qop = self.unpack_qop4()
         data.service = self.unpack_rpc_gss_svc_t()
-        if hasattr(self, 'filter_rpcsec_gss_info'):
-            data = getattr(self, 'filter_rpcsec_gss_info')(data)
+        if 'rpcsec_gss_info' in self._filters:
+            data = self._filters['rpcsec_gss_info'](self, data)
         return data
 
     def unpack_secinfo4(self):
@@ -5867,14 +6068,14 @@ class NFS4Unpacker(xdrlib.Unpacker):
             data.flavor_info = self.unpack_rpcsec_gss_info()
         else:
             pass
-        if hasattr(self, 'filter_secinfo4'):
-            data = getattr(self, 'filter_secinfo4')(data)
+        if 'secinfo4' in self._filters:
+            data = self._filters['secinfo4'](self, data)
         return data
 
     def unpack_SECINFO4resok(self):
         data = self.unpack_array(self.unpack_secinfo4)
-        if hasattr(self, 'filter_SECINFO4resok'):
-            data = getattr(self, 'filter_SECINFO4resok')(data)
+        if 'SECINFO4resok' in self._filters:
+            data = self._filters['SECINFO4resok'](self, data)
         return data
 
     def unpack_SECINFO4res(self):
@@ -5884,24 +6085,24 @@ class NFS4Unpacker(xdrlib.Unpacker):
             data.resok4 = self.unpack_SECINFO4resok()
         else:
             pass
-        if hasattr(self, 'filter_SECINFO4res'):
-            data = getattr(self, 'filter_SECINFO4res')(data)
+        if 'SECINFO4res' in self._filters:
+            data = self._filters['SECINFO4res'](self, data)
         return data
 
     def unpack_SETATTR4args(self):
         data = types.SETATTR4args()
         data.stateid = self.unpack_stateid4()
         data.obj_attributes = self.unpack_fattr4()
-        if hasattr(self, 'filter_SETATTR4args'):
-            data = getattr(self, 'filter_SETATTR4args')(data)
+        if 'SETATTR4args' in self._filters:
+            data = self._filters['SETATTR4args'](self, data)
         return data
 
     def unpack_SETATTR4res(self):
         data = types.SETATTR4res()
         data.status = self.unpack_nfsstat4()
         data.attrsset = self.unpack_bitmap4()
-        if hasattr(self, 'filter_SETATTR4res'):
-            data = getattr(self, 'filter_SETATTR4res')(data)
+        if 'SETATTR4res' in self._filters:
+            data = self._filters['SETATTR4res'](self, data)
         return data
 
     def unpack_SETCLIENTID4args(self):
@@ -5909,16 +6110,16 @@ class NFS4Unpacker(xdrlib.Unpacker):
         data.client = self.unpack_nfs_client_id4()
         data.callback = self.unpack_cb_client4()
         data.callback_ident = self.unpack_uint32_t()
-        if hasattr(self, 'filter_SETCLIENTID4args'):
-            data = getattr(self, 'filter_SETCLIENTID4args')(data)
+        if 'SETCLIENTID4args' in self._filters:
+            data = self._filters['SETCLIENTID4args'](self, data)
         return data
 
     def unpack_SETCLIENTID4resok(self):
         data = types.SETCLIENTID4resok()
         data.clientid = self.unpack_clientid4()
         data.setclientid_confirm = self.unpack_verifier4()
-        if hasattr(self, 'filter_SETCLIENTID4resok'):
-            data = getattr(self, 'filter_SETCLIENTID4resok')(data)
+        if 'SETCLIENTID4resok' in self._filters:
+            data = self._filters['SETCLIENTID4resok'](self, data)
         return data
 
     def unpack_SETCLIENTID4res(self):
@@ -5930,45 +6131,45 @@ class NFS4Unpacker(xdrlib.Unpacker):
             data.client_using = self.unpack_clientaddr4()
         else:
             pass
-        if hasattr(self, 'filter_SETCLIENTID4res'):
-            data = getattr(self, 'filter_SETCLIENTID4res')(data)
+        if 'SETCLIENTID4res' in self._filters:
+            data = self._filters['SETCLIENTID4res'](self, data)
         return data
 
     def unpack_SETCLIENTID_CONFIRM4args(self):
         data = types.SETCLIENTID_CONFIRM4args()
         data.clientid = self.unpack_clientid4()
         data.setclientid_confirm = self.unpack_verifier4()
-        if hasattr(self, 'filter_SETCLIENTID_CONFIRM4args'):
-            data = getattr(self, 'filter_SETCLIENTID_CONFIRM4args')(data)
+        if 'SETCLIENTID_CONFIRM4args' in self._filters:
+            data = self._filters['SETCLIENTID_CONFIRM4args'](self, data)
         return data
 
     def unpack_SETCLIENTID_CONFIRM4res(self):
         data = types.SETCLIENTID_CONFIRM4res()
         data.status = self.unpack_nfsstat4()
-        if hasattr(self, 'filter_SETCLIENTID_CONFIRM4res'):
-            data = getattr(self, 'filter_SETCLIENTID_CONFIRM4res')(data)
+        if 'SETCLIENTID_CONFIRM4res' in self._filters:
+            data = self._filters['SETCLIENTID_CONFIRM4res'](self, data)
         return data
 
     def unpack_VERIFY4args(self):
         data = types.VERIFY4args()
         data.obj_attributes = self.unpack_fattr4()
-        if hasattr(self, 'filter_VERIFY4args'):
-            data = getattr(self, 'filter_VERIFY4args')(data)
+        if 'VERIFY4args' in self._filters:
+            data = self._filters['VERIFY4args'](self, data)
         return data
 
     def unpack_VERIFY4res(self):
         data = types.VERIFY4res()
         data.status = self.unpack_nfsstat4()
-        if hasattr(self, 'filter_VERIFY4res'):
-            data = getattr(self, 'filter_VERIFY4res')(data)
+        if 'VERIFY4res' in self._filters:
+            data = self._filters['VERIFY4res'](self, data)
         return data
 
     def unpack_stable_how4(self):
         data = self.unpack_int()
         if self.check_enum and data not in [const.UNSTABLE4, const.DATA_SYNC4, const.FILE_SYNC4]:
             raise XDRError, 'value=%s not in enum stable_how4' % data
-        if hasattr(self, 'filter_stable_how4'):
-            data = getattr(self, 'filter_stable_how4')(data)
+        if 'stable_how4' in self._filters:
+            data = self._filters['stable_how4'](self, data)
         return data
 
     def unpack_WRITE4args(self):
@@ -5977,8 +6178,8 @@ class NFS4Unpacker(xdrlib.Unpacker):
         data.offset = self.unpack_offset4()
         data.stable = self.unpack_stable_how4()
         data.data = self.unpack_opaque()
-        if hasattr(self, 'filter_WRITE4args'):
-            data = getattr(self, 'filter_WRITE4args')(data)
+        if 'WRITE4args' in self._filters:
+            data = self._filters['WRITE4args'](self, data)
         return data
 
     def unpack_WRITE4resok(self):
@@ -5986,8 +6187,8 @@ class NFS4Unpacker(xdrlib.Unpacker):
         data.count = self.unpack_count4()
         data.committed = self.unpack_stable_how4()
         data.writeverf = self.unpack_verifier4()
-        if hasattr(self, 'filter_WRITE4resok'):
-            data = getattr(self, 'filter_WRITE4resok')(data)
+        if 'WRITE4resok' in self._filters:
+            data = self._filters['WRITE4resok'](self, data)
         return data
 
     def unpack_WRITE4res(self):
@@ -5997,35 +6198,35 @@ class NFS4Unpacker(xdrlib.Unpacker):
             data.resok4 = self.unpack_WRITE4resok()
         else:
             pass
-        if hasattr(self, 'filter_WRITE4res'):
-            data = getattr(self, 'filter_WRITE4res')(data)
+        if 'WRITE4res' in self._filters:
+            data = self._filters['WRITE4res'](self, data)
         return data
 
     def unpack_RELEASE_LOCKOWNER4args(self):
         data = types.RELEASE_LOCKOWNER4args()
         data.lock_owner = self.unpack_lock_owner4()
-        if hasattr(self, 'filter_RELEASE_LOCKOWNER4args'):
-            data = getattr(self, 'filter_RELEASE_LOCKOWNER4args')(data)
+        if 'RELEASE_LOCKOWNER4args' in self._filters:
+            data = self._filters['RELEASE_LOCKOWNER4args'](self, data)
         return data
 
     def unpack_RELEASE_LOCKOWNER4res(self):
         data = types.RELEASE_LOCKOWNER4res()
         data.status = self.unpack_nfsstat4()
-        if hasattr(self, 'filter_RELEASE_LOCKOWNER4res'):
-            data = getattr(self, 'filter_RELEASE_LOCKOWNER4res')(data)
+        if 'RELEASE_LOCKOWNER4res' in self._filters:
+            data = self._filters['RELEASE_LOCKOWNER4res'](self, data)
         return data
 
     def unpack_ILLEGAL4res(self):
         data = types.ILLEGAL4res()
         data.status = self.unpack_nfsstat4()
-        if hasattr(self, 'filter_ILLEGAL4res'):
-            data = getattr(self, 'filter_ILLEGAL4res')(data)
+        if 'ILLEGAL4res' in self._filters:
+            data = self._filters['ILLEGAL4res'](self, data)
         return data
 
     def unpack_gsshandle4_t(self):
         data = self.unpack_opaque()
-        if hasattr(self, 'filter_gsshandle4_t'):
-            data = getattr(self, 'filter_gsshandle4_t')(data)
+        if 'gsshandle4_t' in self._filters:
+            data = self._filters['gsshandle4_t'](self, data)
         return data
 
     def unpack_gss_cb_handles4(self):
@@ -6033,8 +6234,8 @@ class NFS4Unpacker(xdrlib.Unpacker):
         data.gcbp_service = self.unpack_rpc_gss_svc_t()
         data.gcbp_handle_from_server = self.unpack_gsshandle4_t()
         data.gcbp_handle_from_client = self.unpack_gsshandle4_t()
-        if hasattr(self, 'filter_gss_cb_handles4'):
-            data = getattr(self, 'filter_gss_cb_handles4')(data)
+        if 'gss_cb_handles4' in self._filters:
+            data = self._filters['gss_cb_handles4'](self, data)
         return data
 
     def unpack_callback_sec_parms4(self):
@@ -6048,31 +6249,31 @@ class NFS4Unpacker(xdrlib.Unpacker):
             data.cbsp_gss_handles = self.unpack_gss_cb_handles4()
         else:
             raise XDRError, 'bad switch=%s' % data.cb_secflavor
-        if hasattr(self, 'filter_callback_sec_parms4'):
-            data = getattr(self, 'filter_callback_sec_parms4')(data)
+        if 'callback_sec_parms4' in self._filters:
+            data = self._filters['callback_sec_parms4'](self, data)
         return data
 
     def unpack_BACKCHANNEL_CTL4args(self):
         data = types.BACKCHANNEL_CTL4args()
         data.bca_cb_program = self.unpack_uint32_t()
         data.bca_sec_parms = self.unpack_array(self.unpack_callback_sec_parms4)
-        if hasattr(self, 'filter_BACKCHANNEL_CTL4args'):
-            data = getattr(self, 'filter_BACKCHANNEL_CTL4args')(data)
+        if 'BACKCHANNEL_CTL4args' in self._filters:
+            data = self._filters['BACKCHANNEL_CTL4args'](self, data)
         return data
 
     def unpack_BACKCHANNEL_CTL4res(self):
         data = types.BACKCHANNEL_CTL4res()
         data.bcr_status = self.unpack_nfsstat4()
-        if hasattr(self, 'filter_BACKCHANNEL_CTL4res'):
-            data = getattr(self, 'filter_BACKCHANNEL_CTL4res')(data)
+        if 'BACKCHANNEL_CTL4res' in self._filters:
+            data = self._filters['BACKCHANNEL_CTL4res'](self, data)
         return data
 
     def unpack_channel_dir_from_client4(self):
         data = self.unpack_int()
         if self.check_enum and data not in [const.CDFC4_FORE, const.CDFC4_BACK, const.CDFC4_FORE_OR_BOTH, const.CDFC4_BACK_OR_BOTH]:
             raise XDRError, 'value=%s not in enum channel_dir_from_client4' % data
-        if hasattr(self, 'filter_channel_dir_from_client4'):
-            data = getattr(self, 'filter_channel_dir_from_client4')(data)
+        if 'channel_dir_from_client4' in self._filters:
+            data = self._filters['channel_dir_from_client4'](self, data)
         return data
 
     def unpack_BIND_CONN_TO_SESSION4args(self):
@@ -6080,16 +6281,16 @@ class NFS4Unpacker(xdrlib.Unpacker):
         data.bctsa_sessid = self.unpack_sessionid4()
         data.bctsa_dir = self.unpack_channel_dir_from_client4()
         data.bctsa_use_conn_in_rdma_mode = self.unpack_bool()
-        if hasattr(self, 'filter_BIND_CONN_TO_SESSION4args'):
-            data = getattr(self, 'filter_BIND_CONN_TO_SESSION4args')(data)
+        if 'BIND_CONN_TO_SESSION4args' in self._filters:
+            data = self._filters['BIND_CONN_TO_SESSION4args'](self, data)
         return data
 
     def unpack_channel_dir_from_server4(self):
         data = self.unpack_int()
         if self.check_enum and data not in [const.CDFS4_FORE, const.CDFS4_BACK, const.CDFS4_BOTH]:
             raise XDRError, 'value=%s not in enum channel_dir_from_server4' % data
-        if hasattr(self, 'filter_channel_dir_from_server4'):
-            data = getattr(self, 'filter_channel_dir_from_server4')(data)
+        if 'channel_dir_from_server4' in self._filters:
+            data = self._filters['channel_dir_from_server4'](self, data)
         return data
 
     def unpack_BIND_CONN_TO_SESSION4resok(self):
@@ -6097,8 +6298,8 @@ class NFS4Unpacker(xdrlib.Unpacker):
         data.bctsr_sessid = self.unpack_sessionid4()
         data.bctsr_dir = self.unpack_channel_dir_from_server4()
         data.bctsr_use_conn_in_rdma_mode = self.unpack_bool()
-        if hasattr(self, 'filter_BIND_CONN_TO_SESSION4resok'):
-            data = getattr(self, 'filter_BIND_CONN_TO_SESSION4resok')(data)
+        if 'BIND_CONN_TO_SESSION4resok' in self._filters:
+            data = self._filters['BIND_CONN_TO_SESSION4resok'](self, data)
         return data
 
     def unpack_BIND_CONN_TO_SESSION4res(self):
@@ -6108,16 +6309,16 @@ class NFS4Unpacker(xdrlib.Unpacker):
             data.bctsr_resok4 = self.unpack_BIND_CONN_TO_SESSION4resok()
         else:
             pass
-        if hasattr(self, 'filter_BIND_CONN_TO_SESSION4res'):
-            data = getattr(self, 'filter_BIND_CONN_TO_SESSION4res')(data)
+        if 'BIND_CONN_TO_SESSION4res' in self._filters:
+            data = self._filters['BIND_CONN_TO_SESSION4res'](self, data)
         return data
 
     def unpack_state_protect_ops4(self):
         data = types.state_protect_ops4()
         data.spo_must_enforce = self.unpack_bitmap4()
         data.spo_must_allow = self.unpack_bitmap4()
-        if hasattr(self, 'filter_state_protect_ops4'):
-            data = getattr(self, 'filter_state_protect_ops4')(data)
+        if 'state_protect_ops4' in self._filters:
+            data = self._filters['state_protect_ops4'](self, data)
         return data
 
     def unpack_ssv_sp_parms4(self):
@@ -6127,16 +6328,16 @@ class NFS4Unpacker(xdrlib.Unpacker):
         data.ssp_encr_algs = self.unpack_array(self.unpack_sec_oid4)
         data.ssp_window = self.unpack_uint32_t()
         data.ssp_num_gss_handles = self.unpack_uint32_t()
-        if hasattr(self, 'filter_ssv_sp_parms4'):
-            data = getattr(self, 'filter_ssv_sp_parms4')(data)
+        if 'ssv_sp_parms4' in self._filters:
+            data = self._filters['ssv_sp_parms4'](self, data)
         return data
 
     def unpack_state_protect_how4(self):
         data = self.unpack_int()
         if self.check_enum and data not in [const.SP4_NONE, const.SP4_MACH_CRED, const.SP4_SSV]:
             raise XDRError, 'value=%s not in enum state_protect_how4' % data
-        if hasattr(self, 'filter_state_protect_how4'):
-            data = getattr(self, 'filter_state_protect_how4')(data)
+        if 'state_protect_how4' in self._filters:
+            data = self._filters['state_protect_how4'](self, data)
         return data
 
     def unpack_state_protect4_a(self):
@@ -6150,8 +6351,8 @@ class NFS4Unpacker(xdrlib.Unpacker):
             data.spa_ssv_parms = self.unpack_ssv_sp_parms4()
         else:
             raise XDRError, 'bad switch=%s' % data.spa_how
-        if hasattr(self, 'filter_state_protect4_a'):
-            data = getattr(self, 'filter_state_protect4_a')(data)
+        if 'state_protect4_a' in self._filters:
+            data = self._filters['state_protect4_a'](self, data)
         return data
 
     def unpack_EXCHANGE_ID4args(self):
@@ -6162,8 +6363,8 @@ class NFS4Unpacker(xdrlib.Unpacker):
         data.eia_client_impl_id = self.unpack_array(self.unpack_nfs_impl_id4)
         if len(data.eia_client_impl_id) > 1 and self.check_array:
             raise XDRError, 'array length too long for data.eia_client_impl_id'
-        if hasattr(self, 'filter_EXCHANGE_ID4args'):
-            data = getattr(self, 'filter_EXCHANGE_ID4args')(data)
+        if 'EXCHANGE_ID4args' in self._filters:
+            data = self._filters['EXCHANGE_ID4args'](self, data)
         return data
 
     def unpack_ssv_prot_info4(self):
@@ -6174,8 +6375,8 @@ class NFS4Unpacker(xdrlib.Unpacker):
         data.spi_ssv_len = self.unpack_uint32_t()
         data.spi_window = self.unpack_uint32_t()
         data.spi_handles = self.unpack_array(self.unpack_gsshandle4_t)
-        if hasattr(self, 'filter_ssv_prot_info4'):
-            data = getattr(self, 'filter_ssv_prot_info4')(data)
+        if 'ssv_prot_info4' in self._filters:
+            data = self._filters['ssv_prot_info4'](self, data)
         return data
 
     def unpack_state_protect4_r(self):
@@ -6189,8 +6390,8 @@ class NFS4Unpacker(xdrlib.Unpacker):
             data.spr_ssv_info = self.unpack_ssv_prot_info4()
         else:
             raise XDRError, 'bad switch=%s' % data.spr_how
-        if hasattr(self, 'filter_state_protect4_r'):
-            data = getattr(self, 'filter_state_protect4_r')(data)
+        if 'state_protect4_r' in self._filters:
+            data = self._filters['state_protect4_r'](self, data)
         return data
 
     def unpack_EXCHANGE_ID4resok(self):
@@ -6206,8 +6407,8 @@ class NFS4Unpacker(xdrlib.Unpacker):
         data.eir_server_impl_id = self.unpack_array(self.unpack_nfs_impl_id4)
         if len(data.eir_server_impl_id) > 1 and self.check_array:
             raise XDRError, 'array length too long for data.eir_server_impl_id'
-        if hasattr(self, 'filter_EXCHANGE_ID4resok'):
-            data = getattr(self, 'filter_EXCHANGE_ID4resok')(data)
+        if 'EXCHANGE_ID4resok' in self._filters:
+            data = self._filters['EXCHANGE_ID4resok'](self, data)
         return data
 
     def unpack_EXCHANGE_ID4res(self):
@@ -6217,8 +6418,8 @@ class NFS4Unpacker(xdrlib.Unpacker):
             data.eir_resok4 = self.unpack_EXCHANGE_ID4resok()
         else:
             pass
-        if hasattr(self, 'filter_EXCHANGE_ID4res'):
-            data = getattr(self, 'filter_EXCHANGE_ID4res')(data)
+        if 'EXCHANGE_ID4res' in self._filters:
+            data = self._filters['EXCHANGE_ID4res'](self, data)
         return data
 
     def unpack_channel_attrs4(self):
@@ -6232,8 +6433,8 @@ class NFS4Unpacker(xdrlib.Unpacker):
         data.ca_rdma_ird = self.unpack_array(self.unpack_uint32_t)
         if len(data.ca_rdma_ird) > 1 and self.check_array:
             raise XDRError, 'array length too long for data.ca_rdma_ird'
-        if hasattr(self, 'filter_channel_attrs4'):
-            data = getattr(self, 'filter_channel_attrs4')(data)
+        if 'channel_attrs4' in self._filters:
+            data = self._filters['channel_attrs4'](self, data)
         return data
 
     def unpack_CREATE_SESSION4args(self):
@@ -6245,8 +6446,8 @@ class NFS4Unpacker(xdrlib.Unpacker):
         data.csa_back_chan_attrs = self.unpack_channel_attrs4()
         data.csa_cb_program = self.unpack_uint32_t()
         data.csa_sec_parms = self.unpack_array(self.unpack_callback_sec_parms4)
-        if hasattr(self, 'filter_CREATE_SESSION4args'):
-            data = getattr(self, 'filter_CREATE_SESSION4args')(data)
+        if 'CREATE_SESSION4args' in self._filters:
+            data = self._filters['CREATE_SESSION4args'](self, data)
         return data
 
     def unpack_CREATE_SESSION4resok(self):
@@ -6256,8 +6457,8 @@ class NFS4Unpacker(xdrlib.Unpacker):
         data.csr_flags = self.unpack_uint32_t()
         data.csr_fore_chan_attrs = self.unpack_channel_attrs4()
         data.csr_back_chan_attrs = self.unpack_channel_attrs4()
-        if hasattr(self, 'filter_CREATE_SESSION4resok'):
-            data = getattr(self, 'filter_CREATE_SESSION4resok')(data)
+        if 'CREATE_SESSION4resok' in self._filters:
+            data = self._filters['CREATE_SESSION4resok'](self, data)
         return data
 
     def unpack_CREATE_SESSION4res(self):
@@ -6267,36 +6468,36 @@ class NFS4Unpacker(xdrlib.Unpacker):
             data.csr_resok4 = self.unpack_CREATE_SESSION4resok()
         else:
             pass
-        if hasattr(self, 'filter_CREATE_SESSION4res'):
-            data = getattr(self, 'filter_CREATE_SESSION4res')(data)
+        if 'CREATE_SESSION4res' in self._filters:
+            data = self._filters['CREATE_SESSION4res'](self, data)
         return data
 
     def unpack_DESTROY_SESSION4args(self):
         data = types.DESTROY_SESSION4args()
         data.dsa_sessionid = self.unpack_sessionid4()
-        if hasattr(self, 'filter_DESTROY_SESSION4args'):
-            data = getattr(self, 'filter_DESTROY_SESSION4args')(data)
+        if 'DESTROY_SESSION4args' in self._filters:
+            data = self._filters['DESTROY_SESSION4args'](self, data)
         return data
 
     def unpack_DESTROY_SESSION4res(self):
         data = types.DESTROY_SESSION4res()
         data.dsr_status = self.unpack_nfsstat4()
-        if hasattr(self, 'filter_DESTROY_SESSION4res'):
-            data = getattr(self, 'filter_DESTROY_SESSION4res')(data)
+        if 'DESTROY_SESSION4res' in self._filters:
+            data = self._filters['DESTROY_SESSION4res'](self, data)
         return data
 
     def unpack_FREE_STATEID4args(self):
         data = types.FREE_STATEID4args()
         data.fsa_stateid = self.unpack_stateid4()
-        if hasattr(self, 'filter_FREE_STATEID4args'):
-            data = getattr(self, 'filter_FREE_STATEID4args')(data)
+        if 'FREE_STATEID4args' in self._filters:
+            data = self._filters['FREE_STATEID4args'](self, data)
         return data
 
     def unpack_FREE_STATEID4res(self):
         data = types.FREE_STATEID4res()
         data.fsr_status = self.unpack_nfsstat4()
-        if hasattr(self, 'filter_FREE_STATEID4res'):
-            data = getattr(self, 'filter_FREE_STATEID4res')(data)
+        if 'FREE_STATEID4res' in self._filters:
+            data = self._filters['FREE_STATEID4res'](self, data)
         return data
 
     unpack_attr_notice4 = unpack_nfstime4
@@ -6309,8 +6510,8 @@ class NFS4Unpacker(xdrlib.Unpacker):
         data.gdda_dir_attr_delay = self.unpack_attr_notice4()
         data.gdda_child_attributes = self.unpack_bitmap4()
         data.gdda_dir_attributes = self.unpack_bitmap4()
-        if hasattr(self, 'filter_GET_DIR_DELEGATION4args'):
-            data = getattr(self, 'filter_GET_DIR_DELEGATION4args')(data)
+        if 'GET_DIR_DELEGATION4args' in self._filters:
+            data = self._filters['GET_DIR_DELEGATION4args'](self, data)
         return data
 
     def unpack_GET_DIR_DELEGATION4resok(self):
@@ -6320,16 +6521,16 @@ class NFS4Unpacker(xdrlib.Unpacker):
         data.gddr_notification = self.unpack_bitmap4()
         data.gddr_child_attributes = self.unpack_bitmap4()
         data.gddr_dir_attributes = self.unpack_bitmap4()
-        if hasattr(self, 'filter_GET_DIR_DELEGATION4resok'):
-            data = getattr(self, 'filter_GET_DIR_DELEGATION4resok')(data)
+        if 'GET_DIR_DELEGATION4resok' in self._filters:
+            data = self._filters['GET_DIR_DELEGATION4resok'](self, data)
         return data
 
     def unpack_gddrnf4_status(self):
         data = self.unpack_int()
         if self.check_enum and data not in [const.GDD4_OK, const.GDD4_UNAVAIL]:
             raise XDRError, 'value=%s not in enum gddrnf4_status' % data
-        if hasattr(self, 'filter_gddrnf4_status'):
-            data = getattr(self, 'filter_gddrnf4_status')(data)
+        if 'gddrnf4_status' in self._filters:
+            data = self._filters['gddrnf4_status'](self, data)
         return data
 
     def unpack_GET_DIR_DELEGATION4res_non_fatal(self):
@@ -6341,8 +6542,8 @@ class NFS4Unpacker(xdrlib.Unpacker):
             data.gddrnf_will_signal_deleg_avail = self.unpack_bool()
         else:
             raise XDRError, 'bad switch=%s' % data.gddrnf_status
-        if hasattr(self, 'filter_GET_DIR_DELEGATION4res_non_fatal'):
-            data = getattr(self, 'filter_GET_DIR_DELEGATION4res_non_fatal')(data)
+        if 'GET_DIR_DELEGATION4res_non_fatal' in self._filters:
+            data = self._filters['GET_DIR_DELEGATION4res_non_fatal'](self, data)
         return data
 
     def unpack_GET_DIR_DELEGATION4res(self):
@@ -6352,8 +6553,8 @@ class NFS4Unpacker(xdrlib.Unpacker):
             data.gddr_res_non_fatal4 = self.unpack_GET_DIR_DELEGATION4res_non_fatal()
         else:
             pass
-        if hasattr(self, 'filter_GET_DIR_DELEGATION4res'):
-            data = getattr(self, 'filter_GET_DIR_DELEGATION4res')(data)
+        if 'GET_DIR_DELEGATION4res' in self._filters:
+            data = self._filters['GET_DIR_DELEGATION4res'](self, data)
         return data
 
     def unpack_GETDEVICEINFO4args(self):
@@ -6362,16 +6563,16 @@ class NFS4Unpacker(xdrlib.Unpacker):
         data.gdia_layout_type = self.unpack_layouttype4()
         data.gdia_maxcount = self.unpack_count4()
         data.gdia_notify_types = self.unpack_bitmap4()
-        if hasattr(self, 'filter_GETDEVICEINFO4args'):
-            data = getattr(self, 'filter_GETDEVICEINFO4args')(data)
+        if 'GETDEVICEINFO4args' in self._filters:
+            data = self._filters['GETDEVICEINFO4args'](self, data)
         return data
 
     def unpack_GETDEVICEINFO4resok(self):
         data = types.GETDEVICEINFO4resok()
         data.gdir_device_addr = self.unpack_device_addr4()
         data.gdir_notification = self.unpack_bitmap4()
-        if hasattr(self, 'filter_GETDEVICEINFO4resok'):
-            data = getattr(self, 'filter_GETDEVICEINFO4resok')(data)
+        if 'GETDEVICEINFO4resok' in self._filters:
+            data = self._filters['GETDEVICEINFO4resok'](self, data)
         return data
 
     def unpack_GETDEVICEINFO4res(self):
@@ -6383,8 +6584,8 @@ class NFS4Unpacker(xdrlib.Unpacker):
             data.gdir_mincount = self.unpack_count4()
         else:
             pass
-        if hasattr(self, 'filter_GETDEVICEINFO4res'):
-            data = getattr(self, 'filter_GETDEVICEINFO4res')(data)
+        if 'GETDEVICEINFO4res' in self._filters:
+            data = self._filters['GETDEVICEINFO4res'](self, data)
         return data
 
     def unpack_GETDEVICELIST4args(self):
@@ -6393,8 +6594,8 @@ class NFS4Unpacker(xdrlib.Unpacker):
         data.gdla_maxdevices = self.unpack_count4()
         data.gdla_cookie = self.unpack_nfs_cookie4()
         data.gdla_cookieverf = self.unpack_verifier4()
-        if hasattr(self, 'filter_GETDEVICELIST4args'):
-            data = getattr(self, 'filter_GETDEVICELIST4args')(data)
+        if 'GETDEVICELIST4args' in self._filters:
+            data = self._filters['GETDEVICELIST4args'](self, data)
         return data
 
     def unpack_GETDEVICELIST4resok(self):
@@ -6403,8 +6604,8 @@ class NFS4Unpacker(xdrlib.Unpacker):
         data.gdlr_cookieverf = self.unpack_verifier4()
         data.gdlr_deviceid_list = self.unpack_array(self.unpack_deviceid4)
         data.gdlr_eof = self.unpack_bool()
-        if hasattr(self, 'filter_GETDEVICELIST4resok'):
-            data = getattr(self, 'filter_GETDEVICELIST4resok')(data)
+        if 'GETDEVICELIST4resok' in self._filters:
+            data = self._filters['GETDEVICELIST4resok'](self, data)
         return data
 
     def unpack_GETDEVICELIST4res(self):
@@ -6414,8 +6615,8 @@ class NFS4Unpacker(xdrlib.Unpacker):
             data.gdlr_resok4 = self.unpack_GETDEVICELIST4resok()
         else:
             pass
-        if hasattr(self, 'filter_GETDEVICELIST4res'):
-            data = getattr(self, 'filter_GETDEVICELIST4res')(data)
+        if 'GETDEVICELIST4res' in self._filters:
+            data = self._filters['GETDEVICELIST4res'](self, data)
         return data
 
     def unpack_newtime4(self):
@@ -6427,8 +6628,8 @@ class NFS4Unpacker(xdrlib.Unpacker):
             pass
         else:
             raise XDRError, 'bad switch=%s' % data.nt_timechanged
-        if hasattr(self, 'filter_newtime4'):
-            data = getattr(self, 'filter_newtime4')(data)
+        if 'newtime4' in self._filters:
+            data = self._filters['newtime4'](self, data)
         return data
 
     def unpack_newoffset4(self):
@@ -6440,8 +6641,8 @@ class NFS4Unpacker(xdrlib.Unpacker):
             pass
         else:
             raise XDRError, 'bad switch=%s' % data.no_newoffset
-        if hasattr(self, 'filter_newoffset4'):
-            data = getattr(self, 'filter_newoffset4')(data)
+        if 'newoffset4' in self._filters:
+            data = self._filters['newoffset4'](self, data)
         return data
 
     def unpack_LAYOUTCOMMIT4args(self):
@@ -6453,8 +6654,8 @@ class NFS4Unpacker(xdrlib.Unpacker):
         data.loca_last_write_offset = self.unpack_newoffset4()
         data.loca_time_modify = self.unpack_newtime4()
         data.loca_layoutupdate = self.unpack_layoutupdate4()
-        if hasattr(self, 'filter_LAYOUTCOMMIT4args'):
-            data = getattr(self, 'filter_LAYOUTCOMMIT4args')(data)
+        if 'LAYOUTCOMMIT4args' in self._filters:
+            data = self._filters['LAYOUTCOMMIT4args'](self, data)
         return data
 
     def unpack_newsize4(self):
@@ -6466,15 +6667,15 @@ class NFS4Unpacker(xdrlib.Unpacker):
             pass
         else:
             raise XDRError, 'bad switch=%s' % data.ns_sizechanged
-        if hasattr(self, 'filter_newsize4'):
-            data = getattr(self, 'filter_newsize4')(data)
+        if 'newsize4' in self._filters:
+            data = self._filters['newsize4'](self, data)
         return data
 
     def unpack_LAYOUTCOMMIT4resok(self):
         data = types.LAYOUTCOMMIT4resok()
         data.locr_newsize = self.unpack_newsize4()
-        if hasattr(self, 'filter_LAYOUTCOMMIT4resok'):
-            data = getattr(self, 'filter_LAYOUTCOMMIT4resok')(data)
+        if 'LAYOUTCOMMIT4resok' in self._filters:
+            data = self._filters['LAYOUTCOMMIT4resok'](self, data)
         return data
 
     def unpack_LAYOUTCOMMIT4res(self):
@@ -6484,8 +6685,8 @@ class NFS4Unpacker(xdrlib.Unpacker):
             data.locr_resok4 = self.unpack_LAYOUTCOMMIT4resok()
         else:
             pass
-        if hasattr(self, 'filter_LAYOUTCOMMIT4res'):
-            data = getattr(self, 'filter_LAYOUTCOMMIT4res')(data)
+        if 'LAYOUTCOMMIT4res' in self._filters:
+            data = self._filters['LAYOUTCOMMIT4res'](self, data)
         return data
 
     def unpack_LAYOUTGET4args(self):
@@ -6498,8 +6699,8 @@ class NFS4Unpacker(xdrlib.Unpacker):
         data.loga_minlength = self.unpack_length4()
         data.loga_stateid = self.unpack_stateid4()
         data.loga_maxcount = self.unpack_count4()
-        if hasattr(self, 'filter_LAYOUTGET4args'):
-            data = getattr(self, 'filter_LAYOUTGET4args')(data)
+        if 'LAYOUTGET4args' in self._filters:
+            data = self._filters['LAYOUTGET4args'](self, data)
         return data
 
     def unpack_LAYOUTGET4resok(self):
@@ -6507,8 +6708,8 @@ class NFS4Unpacker(xdrlib.Unpacker):
         data.logr_return_on_close = self.unpack_bool()
         data.logr_stateid = self.unpack_stateid4()
         data.logr_layout = self.unpack_array(self.unpack_layout4)
-        if hasattr(self, 'filter_LAYOUTGET4resok'):
-            data = getattr(self, 'filter_LAYOUTGET4resok')(data)
+        if 'LAYOUTGET4resok' in self._filters:
+            data = self._filters['LAYOUTGET4resok'](self, data)
         return data
 
     def unpack_LAYOUTGET4res(self):
@@ -6520,8 +6721,8 @@ class NFS4Unpacker(xdrlib.Unpacker):
             data.logr_will_signal_layout_avail = self.unpack_bool()
         else:
             pass
-        if hasattr(self, 'filter_LAYOUTGET4res'):
-            data = getattr(self, 'filter_LAYOUTGET4res')(data)
+        if 'LAYOUTGET4res' in self._filters:
+            data = self._filters['LAYOUTGET4res'](self, data)
         return data
 
     def unpack_LAYOUTRETURN4args(self):
@@ -6530,8 +6731,8 @@ class NFS4Unpacker(xdrlib.Unpacker):
         data.lora_layout_type = self.unpack_layouttype4()
         data.lora_iomode = self.unpack_layoutiomode4()
         data.lora_layoutreturn = self.unpack_layoutreturn4()
-        if hasattr(self, 'filter_LAYOUTRETURN4args'):
-            data = getattr(self, 'filter_LAYOUTRETURN4args')(data)
+        if 'LAYOUTRETURN4args' in self._filters:
+            data = self._filters['LAYOUTRETURN4args'](self, data)
         return data
 
     def unpack_layoutreturn_stateid(self):
@@ -6543,8 +6744,8 @@ class NFS4Unpacker(xdrlib.Unpacker):
             pass
         else:
             raise XDRError, 'bad switch=%s' % data.lrs_present
-        if hasattr(self, 'filter_layoutreturn_stateid'):
-            data = getattr(self, 'filter_layoutreturn_stateid')(data)
+        if 'layoutreturn_stateid' in self._filters:
+            data = self._filters['layoutreturn_stateid'](self, data)
         return data
 
     def unpack_LAYOUTRETURN4res(self):
@@ -6554,16 +6755,16 @@ class NFS4Unpacker(xdrlib.Unpacker):
             data.lorr_stateid = self.unpack_layoutreturn_stateid()
         else:
             pass
-        if hasattr(self, 'filter_LAYOUTRETURN4res'):
-            data = getattr(self, 'filter_LAYOUTRETURN4res')(data)
+        if 'LAYOUTRETURN4res' in self._filters:
+            data = self._filters['LAYOUTRETURN4res'](self, data)
         return data
 
     def unpack_secinfo_style4(self):
         data = self.unpack_int()
         if self.check_enum and data not in [const.SECINFO_STYLE4_CURRENT_FH, const.SECINFO_STYLE4_PARENT]:
             raise XDRError, 'value=%s not in enum secinfo_style4' % data
-        if hasattr(self, 'filter_secinfo_style4'):
-            data = getattr(self, 'filter_secinfo_style4')(data)
+        if 'secinfo_style4' in self._filters:
+            data = self._filters['secinfo_style4'](self, data)
         return data
 
     unpack_SECINFO_NO_NAME4args = unpack_secinfo_style4
@@ -6577,8 +6778,8 @@ class NFS4Unpacker(xdrlib.Unpacker):
         data.sa_slotid = self.unpack_slotid4()
         data.sa_highest_slotid = self.unpack_slotid4()
         data.sa_cachethis = self.unpack_bool()
-        if hasattr(self, 'filter_SEQUENCE4args'):
-            data = getattr(self, 'filter_SEQUENCE4args')(data)
+        if 'SEQUENCE4args' in self._filters:
+            data = self._filters['SEQUENCE4args'](self, data)
         return data
 
     def unpack_SEQUENCE4resok(self):
@@ -6589,8 +6790,8 @@ class NFS4Unpacker(xdrlib.Unpacker):
         data.sr_highest_slotid = self.unpack_slotid4()
         data.sr_target_highest_slotid = self.unpack_slotid4()
         data.sr_status_flags = self.unpack_uint32_t()
-        if hasattr(self, 'filter_SEQUENCE4resok'):
-            data = getattr(self, 'filter_SEQUENCE4resok')(data)
+        if 'SEQUENCE4resok' in self._filters:
+            data = self._filters['SEQUENCE4resok'](self, data)
         return data
 
     def unpack_SEQUENCE4res(self):
@@ -6600,37 +6801,37 @@ class NFS4Unpacker(xdrlib.Unpacker):
             data.sr_resok4 = self.unpack_SEQUENCE4resok()
         else:
             pass
-        if hasattr(self, 'filter_SEQUENCE4res'):
-            data = getattr(self, 'filter_SEQUENCE4res')(data)
+        if 'SEQUENCE4res' in self._filters:
+            data = self._filters['SEQUENCE4res'](self, data)
         return data
 
     def unpack_ssa_digest_input4(self):
         data = types.ssa_digest_input4()
         data.sdi_seqargs = self.unpack_SEQUENCE4args()
-        if hasattr(self, 'filter_ssa_digest_input4'):
-            data = getattr(self, 'filter_ssa_digest_input4')(data)
+        if 'ssa_digest_input4' in self._filters:
+            data = self._filters['ssa_digest_input4'](self, data)
         return data
 
     def unpack_SET_SSV4args(self):
         data = types.SET_SSV4args()
         data.ssa_ssv = self.unpack_opaque()
         data.ssa_digest = self.unpack_opaque()
-        if hasattr(self, 'filter_SET_SSV4args'):
-            data = getattr(self, 'filter_SET_SSV4args')(data)
+        if 'SET_SSV4args' in self._filters:
+            data = self._filters['SET_SSV4args'](self, data)
         return data
 
     def unpack_ssr_digest_input4(self):
         data = types.ssr_digest_input4()
         data.sdi_seqres = self.unpack_SEQUENCE4res()
-        if hasattr(self, 'filter_ssr_digest_input4'):
-            data = getattr(self, 'filter_ssr_digest_input4')(data)
+        if 'ssr_digest_input4' in self._filters:
+            data = self._filters['ssr_digest_input4'](self, data)
         return data
 
     def unpack_SET_SSV4resok(self):
         data = types.SET_SSV4resok()
         data.ssr_digest = self.unpack_opaque()
-        if hasattr(self, 'filter_SET_SSV4resok'):
-            data = getattr(self, 'filter_SET_SSV4resok')(data)
+        if 'SET_SSV4resok' in self._filters:
+            data = self._filters['SET_SSV4resok'](self, data)
         return data
 
     def unpack_SET_SSV4res(self):
@@ -6640,22 +6841,22 @@ class NFS4Unpacker(xdrlib.Unpacker):
             data.ssr_resok4 = self.unpack_SET_SSV4resok()
         else:
             pass
-        if hasattr(self, 'filter_SET_SSV4res'):
-            data = getattr(self, 'filter_SET_SSV4res')(data)
+        if 'SET_SSV4res' in self._filters:
+            data = self._filters['SET_SSV4res'](self, data)
         return data
 
     def unpack_TEST_STATEID4args(self):
         data = types.TEST_STATEID4args()
         data.ts_stateids = self.unpack_array(self.unpack_stateid4)
-        if hasattr(self, 'filter_TEST_STATEID4args'):
-            data = getattr(self, 'filter_TEST_STATEID4args')(data)
+        if 'TEST_STATEID4args' in self._filters:
+            data = self._filters['TEST_STATEID4args'](self, data)
         return data
 
     def unpack_TEST_STATEID4resok(self):
         data = types.TEST_STATEID4resok()
         data.tsr_status_codes = self.unpack_array(self.unpack_nfsstat4)
-        if hasattr(self, 'filter_TEST_STATEID4resok'):
-            data = getattr(self, 'filter_TEST_STATEID4resok')(data)
+        if 'TEST_STATEID4resok' in self._filters:
+            data = self._filters['TEST_STATEID4resok'](self, data)
         return data
 
     def unpack_TEST_STATEID4res(self):
@@ -6665,8 +6866,8 @@ class NFS4Unpacker(xdrlib.Unpacker):
             data.tsr_resok4 = self.unpack_TEST_STATEID4resok()
         else:
             pass
-        if hasattr(self, 'filter_TEST_STATEID4res'):
-            data = getattr(self, 'filter_TEST_STATEID4res')(data)
+        if 'TEST_STATEID4res' in self._filters:
+            data = self._filters['TEST_STATEID4res'](self, data)
         return data
 
     def unpack_deleg_claim4(self):
@@ -6680,16 +6881,16 @@ class NFS4Unpacker(xdrlib.Unpacker):
             data.dc_delegate_type = self.unpack_open_delegation_type4()
         else:
             raise XDRError, 'bad switch=%s' % data.dc_claim
-        if hasattr(self, 'filter_deleg_claim4'):
-            data = getattr(self, 'filter_deleg_claim4')(data)
+        if 'deleg_claim4' in self._filters:
+            data = self._filters['deleg_claim4'](self, data)
         return data
 
     def unpack_WANT_DELEGATION4args(self):
         data = types.WANT_DELEGATION4args()
         data.wda_want = self.unpack_uint32_t()
         data.wda_claim = self.unpack_deleg_claim4()
-        if hasattr(self, 'filter_WANT_DELEGATION4args'):
-            data = getattr(self, 'filter_WANT_DELEGATION4args')(data)
+        if 'WANT_DELEGATION4args' in self._filters:
+            data = self._filters['WANT_DELEGATION4args'](self, data)
         return data
 
     def unpack_WANT_DELEGATION4res(self):
@@ -6699,290 +6900,70 @@ class NFS4Unpacker(xdrlib.Unpacker):
             data.wdr_resok4 = self.unpack_open_delegation4()
         else:
             pass
-        if hasattr(self, 'filter_WANT_DELEGATION4res'):
-            data = getattr(self, 'filter_WANT_DELEGATION4res')(data)
+        if 'WANT_DELEGATION4res' in self._filters:
+            data = self._filters['WANT_DELEGATION4res'](self, data)
         return data
 
     def unpack_DESTROY_CLIENTID4args(self):
         data = types.DESTROY_CLIENTID4args()
         data.dca_clientid = self.unpack_clientid4()
-        if hasattr(self, 'filter_DESTROY_CLIENTID4args'):
-            data = getattr(self, 'filter_DESTROY_CLIENTID4args')(data)
+        if 'DESTROY_CLIENTID4args' in self._filters:
+            data = self._filters['DESTROY_CLIENTID4args'](self, data)
         return data
 
     def unpack_DESTROY_CLIENTID4res(self):
         data = types.DESTROY_CLIENTID4res()
         data.dcr_status = self.unpack_nfsstat4()
-        if hasattr(self, 'filter_DESTROY_CLIENTID4res'):
-            data = getattr(self, 'filter_DESTROY_CLIENTID4res')(data)
+        if 'DESTROY_CLIENTID4res' in self._filters:
+            data = self._filters['DESTROY_CLIENTID4res'](self, data)
         return data
 
     def unpack_RECLAIM_COMPLETE4args(self):
         data = types.RECLAIM_COMPLETE4args()
         data.rca_one_fs = self.unpack_bool()
-        if hasattr(self, 'filter_RECLAIM_COMPLETE4args'):
-            data = getattr(self, 'filter_RECLAIM_COMPLETE4args')(data)
+        if 'RECLAIM_COMPLETE4args' in self._filters:
+            data = self._filters['RECLAIM_COMPLETE4args'](self, data)
         return data
 
     def unpack_RECLAIM_COMPLETE4res(self):
         data = types.RECLAIM_COMPLETE4res()
         data.rcr_status = self.unpack_nfsstat4()
-        if hasattr(self, 'filter_RECLAIM_COMPLETE4res'):
-            data = getattr(self, 'filter_RECLAIM_COMPLETE4res')(data)
+        if 'RECLAIM_COMPLETE4res' in self._filters:
+            data = self._filters['RECLAIM_COMPLETE4res'](self, data)
         return data
 
     def unpack_nfs_opnum4(self):
         data = self.unpack_int()
         if self.check_enum and data not in [const.OP_ACCESS, const.OP_CLOSE, const.OP_COMMIT, const.OP_CREATE, const.OP_DELEGPURGE, const.OP_DELEGRETURN, const.OP_GETATTR, const.OP_GETFH, const.OP_LINK, const.OP_LOCK, const.OP_LOCKT, const.OP_LOCKU, const.OP_LOOKUP, const.OP_LOOKUPP, const.OP_NVERIFY, const.OP_OPEN, const.OP_OPENATTR, const.OP_OPEN_CONFIRM, const.OP_OPEN_DOWNGRADE, const.OP_PUTFH, const.OP_PUTPUBFH, const.OP_PUTROOTFH, const.OP_READ, const.OP_READDIR, const.OP_READLINK, const.OP_REMOVE, const.OP_RENAME, const.OP_RENEW, const.OP_RESTOREFH, const.OP_SAVEFH, const.OP_SECINFO, const.OP_SETATTR, const.OP_SETCLIENTID, const.OP_SETCLIENTID_CONFIRM, const.OP_VERIFY, const.OP_WRITE, const.OP_RELEASE_LOCKOWNER, const.OP_BACKCHANNEL_CTL, const.OP_BIND_CONN_TO_SESSION, const.OP_EXCHANGE_ID, const.OP_CREATE_SESSION, const.OP_DESTROY_SESSION, const.OP_FREE_STATEID, const.OP_GET_DIR_DELEGATION, const.OP_GETDEVICEINFO, const.OP_GETDEVICELIST, const.OP_LAYOUTCOMMIT, const.OP_LAYOUTGET, const.OP_LAYOUTRETURN, const.OP_SECINFO_NO_NAME, const.OP_SEQUENCE, const.OP_SET_SSV, const.OP_TEST_STATEID, const.OP_WANT_DELEGATION, const.OP_DESTROY_CLIENTID, const.OP_RECLAIM_COMPLETE, const.OP_ILLEGAL]:
             raise XDRError, 'value=%s not in enum nfs_opnum4' % data
-        if hasattr(self, 'filter_nfs_opnum4'):
-            data = getattr(self, 'filter_nfs_opnum4')(data)
+        if 'nfs_opnum4' in self._filters:
+            data = self._filters['nfs_opnum4'](self, data)
         return data
 
     def unpack_nfs_argop4(self):
         data = types.nfs_argop4()
         data.argop = self.unpack_nfs_opnum4()
-        if data.argop == const.OP_ACCESS:
-            data.opaccess = self.unpack_ACCESS4args()
-        elif data.argop == const.OP_CLOSE:
-            data.opclose = self.unpack_CLOSE4args()
-        elif data.argop == const.OP_COMMIT:
-            data.opcommit = self.unpack_COMMIT4args()
-        elif data.argop == const.OP_CREATE:
-            data.opcreate = self.unpack_CREATE4args()
-        elif data.argop == const.OP_DELEGPURGE:
-            data.opdelegpurge = self.unpack_DELEGPURGE4args()
-        elif data.argop == const.OP_DELEGRETURN:
-            data.opdelegreturn = self.unpack_DELEGRETURN4args()
-        elif data.argop == const.OP_GETATTR:
-            data.opgetattr = self.unpack_GETATTR4args()
-        elif data.argop == const.OP_GETFH:
-            pass
-        elif data.argop == const.OP_LINK:
-            data.oplink = self.unpack_LINK4args()
-        elif data.argop == const.OP_LOCK:
-            data.oplock = self.unpack_LOCK4args()
-        elif data.argop == const.OP_LOCKT:
-            data.oplockt = self.unpack_LOCKT4args()
-        elif data.argop == const.OP_LOCKU:
-            data.oplocku = self.unpack_LOCKU4args()
-        elif data.argop == const.OP_LOOKUP:
-            data.oplookup = self.unpack_LOOKUP4args()
-        elif data.argop == const.OP_LOOKUPP:
-            pass
-        elif data.argop == const.OP_NVERIFY:
-            data.opnverify = self.unpack_NVERIFY4args()
-        elif data.argop == const.OP_OPEN:
-            data.opopen = self.unpack_OPEN4args()
-        elif data.argop == const.OP_OPENATTR:
-            data.opopenattr = self.unpack_OPENATTR4args()
-        elif data.argop == const.OP_OPEN_CONFIRM:
-            data.opopen_confirm = self.unpack_OPEN_CONFIRM4args()
-        elif data.argop == const.OP_OPEN_DOWNGRADE:
-            data.opopen_downgrade = self.unpack_OPEN_DOWNGRADE4args()
-        elif data.argop == const.OP_PUTFH:
-            data.opputfh = self.unpack_PUTFH4args()
-        elif data.argop == const.OP_PUTPUBFH:
-            pass
-        elif data.argop == const.OP_PUTROOTFH:
-            pass
-        elif data.argop == const.OP_READ:
-            data.opread = self.unpack_READ4args()
-        elif data.argop == const.OP_READDIR:
-            data.opreaddir = self.unpack_READDIR4args()
-        elif data.argop == const.OP_READLINK:
-            pass
-        elif data.argop == const.OP_REMOVE:
-            data.opremove = self.unpack_REMOVE4args()
-        elif data.argop == const.OP_RENAME:
-            data.oprename = self.unpack_RENAME4args()
-        elif data.argop == const.OP_RENEW:
-            data.oprenew = self.unpack_RENEW4args()
-        elif data.argop == const.OP_RESTOREFH:
-            pass
-        elif data.argop == const.OP_SAVEFH:
-            pass
-        elif data.argop == const.OP_SECINFO:
-            data.opsecinfo = self.unpack_SECINFO4args()
-        elif data.argop == const.OP_SETATTR:
-            data.opsetattr = self.unpack_SETATTR4args()
-        elif data.argop == const.OP_SETCLIENTID:
-            data.opsetclientid = self.unpack_SETCLIENTID4args()
-        elif data.argop == const.OP_SETCLIENTID_CONFIRM:
-            data.opsetclientid_confirm = self.unpack_SETCLIENTID_CONFIRM4args()
-        elif data.argop == const.OP_VERIFY:
-            data.opverify = self.unpack_VERIFY4args()
-        elif data.argop == const.OP_WRITE:
-            data.opwrite = self.unpack_WRITE4args()
-        elif data.argop == const.OP_RELEASE_LOCKOWNER:
-            data.oprelease_lockowner = self.unpack_RELEASE_LOCKOWNER4args()
-        elif data.argop == const.OP_BACKCHANNEL_CTL:
-            data.opbackchannel_ctl = self.unpack_BACKCHANNEL_CTL4args()
-        elif data.argop == const.OP_BIND_CONN_TO_SESSION:
-            data.opbind_conn_to_session = self.unpack_BIND_CONN_TO_SESSION4args()
-        elif data.argop == const.OP_EXCHANGE_ID:
-            data.opexchange_id = self.unpack_EXCHANGE_ID4args()
-        elif data.argop == const.OP_CREATE_SESSION:
-            data.opcreate_session = self.unpack_CREATE_SESSION4args()
-        elif data.argop == const.OP_DESTROY_SESSION:
-            data.opdestroy_session = self.unpack_DESTROY_SESSION4args()
-        elif data.argop == const.OP_FREE_STATEID:
-            data.opfree_stateid = self.unpack_FREE_STATEID4args()
-        elif data.argop == const.OP_GET_DIR_DELEGATION:
-            data.opget_dir_delegation = self.unpack_GET_DIR_DELEGATION4args()
-        elif data.argop == const.OP_GETDEVICEINFO:
-            data.opgetdeviceinfo = self.unpack_GETDEVICEINFO4args()
-        elif data.argop == const.OP_GETDEVICELIST:
-            data.opgetdevicelist = self.unpack_GETDEVICELIST4args()
-        elif data.argop == const.OP_LAYOUTCOMMIT:
-            data.oplayoutcommit = self.unpack_LAYOUTCOMMIT4args()
-        elif data.argop == const.OP_LAYOUTGET:
-            data.oplayoutget = self.unpack_LAYOUTGET4args()
-        elif data.argop == const.OP_LAYOUTRETURN:
-            data.oplayoutreturn = self.unpack_LAYOUTRETURN4args()
-        elif data.argop == const.OP_SECINFO_NO_NAME:
-            data.opsecinfo_no_name = self.unpack_SECINFO_NO_NAME4args()
-        elif data.argop == const.OP_SEQUENCE:
-            data.opsequence = self.unpack_SEQUENCE4args()
-        elif data.argop == const.OP_SET_SSV:
-            data.opset_ssv = self.unpack_SET_SSV4args()
-        elif data.argop == const.OP_TEST_STATEID:
-            data.optest_stateid = self.unpack_TEST_STATEID4args()
-        elif data.argop == const.OP_WANT_DELEGATION:
-            data.opwant_delegation = self.unpack_WANT_DELEGATION4args()
-        elif data.argop == const.OP_DESTROY_CLIENTID:
-            data.opdestroy_clientid = self.unpack_DESTROY_CLIENTID4args()
-        elif data.argop == const.OP_RECLAIM_COMPLETE:
-            data.opreclaim_complete = self.unpack_RECLAIM_COMPLETE4args()
-        elif data.argop == const.OP_ILLEGAL:
-            pass
-        else:
+        try:
+            arm = _nfs_argop4_arms[data.argop]
+        except KeyError:
             raise XDRError, 'bad switch=%s' % data.argop
-        if hasattr(self, 'filter_nfs_argop4'):
-            data = getattr(self, 'filter_nfs_argop4')(data)
+        if arm is not None:
+            setattr(data, arm[0], getattr(self, arm[1])())
+        if 'nfs_argop4' in self._filters:
+            data = self._filters['nfs_argop4'](self, data)
         return data
 
     def unpack_nfs_resop4(self):
         data = types.nfs_resop4()
         data.resop = self.unpack_nfs_opnum4()
-        if data.resop == const.OP_ACCESS:
-            data.opaccess = self.unpack_ACCESS4res()
-        elif data.resop == const.OP_CLOSE:
-            data.opclose = self.unpack_CLOSE4res()
-        elif data.resop == const.OP_COMMIT:
-            data.opcommit = self.unpack_COMMIT4res()
-        elif data.resop == const.OP_CREATE:
-            data.opcreate = self.unpack_CREATE4res()
-        elif data.resop == const.OP_DELEGPURGE:
-            data.opdelegpurge = self.unpack_DELEGPURGE4res()
-        elif data.resop == const.OP_DELEGRETURN:
-            data.opdelegreturn = self.unpack_DELEGRETURN4res()
-        elif data.resop == const.OP_GETATTR:
-            data.opgetattr = self.unpack_GETATTR4res()
-        elif data.resop == const.OP_GETFH:
-            data.opgetfh = self.unpack_GETFH4res()
-        elif data.resop == const.OP_LINK:
-            data.oplink = self.unpack_LINK4res()
-        elif data.resop == const.OP_LOCK:
-            data.oplock = self.unpack_LOCK4res()
-        elif data.resop == const.OP_LOCKT:
-            data.oplockt = self.unpack_LOCKT4res()
-        elif data.resop == const.OP_LOCKU:
-            data.oplocku = self.unpack_LOCKU4res()
-        elif data.resop == const.OP_LOOKUP:
-            data.oplookup = self.unpack_LOOKUP4res()
-        elif data.resop == const.OP_LOOKUPP:
-            data.oplookupp = self.unpack_LOOKUPP4res()
-        elif data.resop == const.OP_NVERIFY:
-            data.opnverify = self.unpack_NVERIFY4res()
-        elif data.resop == const.OP_OPEN:
-            data.opopen = self.unpack_OPEN4res()
-        elif data.resop == const.OP_OPENATTR:
-            data.opopenattr = self.unpack_OPENATTR4res()
-        elif data.resop == const.OP_OPEN_CONFIRM:
-            data.opopen_confirm = self.unpack_OPEN_CONFIRM4res()
-        elif data.resop == const.OP_OPEN_DOWNGRADE:
-            data.opopen_downgrade = self.unpack_OPEN_DOWNGRADE4res()
-        elif data.resop == const.OP_PUTFH:
-            data.opputfh = self.unpack_PUTFH4res()
-        elif data.resop == const.OP_PUTPUBFH:
-            data.opputpubfh = self.unpack_PUTPUBFH4res()
-        elif data.resop == const.OP_PUTROOTFH:
-            data.opputrootfh = self.unpack_PUTROOTFH4res()
-        elif data.resop == const.OP_READ:
-            data.opread = self.unpack_READ4res()
-        elif data.resop == const.OP_READDIR:
-            data.opreaddir = self.unpack_READDIR4res()
-        elif data.resop == const.OP_READLINK:
-            data.opreadlink = self.unpack_READLINK4res()
-        elif data.resop == const.OP_REMOVE:
-            data.opremove = self.unpack_REMOVE4res()
-        elif data.resop == const.OP_RENAME:
-            data.oprename = self.unpack_RENAME4res()
-        elif data.resop == const.OP_RENEW:
-            data.oprenew = self.unpack_RENEW4res()
-        elif data.resop == const.OP_RESTOREFH:
-            data.oprestorefh = self.unpack_RESTOREFH4res()
-        elif data.resop == const.OP_SAVEFH:
-            data.opsavefh = self.unpack_SAVEFH4res()
-        elif data.resop == const.OP_SECINFO:
-            data.opsecinfo = self.unpack_SECINFO4res()
-        elif data.resop == const.OP_SETATTR:
-            data.opsetattr = self.unpack_SETATTR4res()
-        elif data.resop == const.OP_SETCLIENTID:
-            data.opsetclientid = self.unpack_SETCLIENTID4res()
-        elif data.resop == const.OP_SETCLIENTID_CONFIRM:
-            data.opsetclientid_confirm = self.unpack_SETCLIENTID_CONFIRM4res()
-        elif data.resop == const.OP_VERIFY:
-            data.opverify = self.unpack_VERIFY4res()
-        elif data.resop == const.OP_WRITE:
-            data.opwrite = self.unpack_WRITE4res()
-        elif data.resop == const.OP_RELEASE_LOCKOWNER:
-            data.oprelease_lockowner = self.unpack_RELEASE_LOCKOWNER4res()
-        elif data.resop == const.OP_BACKCHANNEL_CTL:
-            data.opbackchannel_ctl = self.unpack_BACKCHANNEL_CTL4res()
-        elif data.resop == const.OP_BIND_CONN_TO_SESSION:
-            data.opbind_conn_to_session = self.unpack_BIND_CONN_TO_SESSION4res()
-        elif data.resop == const.OP_EXCHANGE_ID:
-            data.opexchange_id = self.unpack_EXCHANGE_ID4res()
-        elif data.resop == const.OP_CREATE_SESSION:
-            data.opcreate_session = self.unpack_CREATE_SESSION4res()
-        elif data.resop == const.OP_DESTROY_SESSION:
-            data.opdestroy_session = self.unpack_DESTROY_SESSION4res()
-        elif data.resop == const.OP_FREE_STATEID:
-            data.opfree_stateid = self.unpack_FREE_STATEID4res()
-        elif data.resop == const.OP_GET_DIR_DELEGATION:
-            data.opget_dir_delegation = self.unpack_GET_DIR_DELEGATION4res()
-        elif data.resop == const.OP_GETDEVICEINFO:
-            data.opgetdeviceinfo = self.unpack_GETDEVICEINFO4res()
-        elif data.resop == const.OP_GETDEVICELIST:
-            data.opgetdevicelist = self.unpack_GETDEVICELIST4res()
-        elif data.resop == const.OP_LAYOUTCOMMIT:
-            data.oplayoutcommit = self.unpack_LAYOUTCOMMIT4res()
-        elif data.resop == const.OP_LAYOUTGET:
-            data.oplayoutget = self.unpack_LAYOUTGET4res()
-        elif data.resop == const.OP_LAYOUTRETURN:
-            data.oplayoutreturn = self.unpack_LAYOUTRETURN4res()
-        elif data.resop == const.OP_SECINFO_NO_NAME:
-            data.opsecinfo_no_name = self.unpack_SECINFO_NO_NAME4res()
-        elif data.resop == const.OP_SEQUENCE:
-            data.opsequence = self.unpack_SEQUENCE4res()
-        elif data.resop == const.OP_SET_SSV:
-            data.opset_ssv = self.unpack_SET_SSV4res()
-        elif data.resop == const.OP_TEST_STATEID:
-            data.optest_stateid = self.unpack_TEST_STATEID4res()
-        elif data.resop == const.OP_WANT_DELEGATION:
-            data.opwant_delegation = self.unpack_WANT_DELEGATION4res()
-        elif data.resop == const.OP_DESTROY_CLIENTID:
-            data.opdestroy_clientid = self.unpack_DESTROY_CLIENTID4res()
-        elif data.resop == const.OP_RECLAIM_COMPLETE:
-            data.opreclaim_complete = self.unpack_RECLAIM_COMPLETE4res()
-        elif data.resop == const.OP_ILLEGAL:
-            data.opillegal = self.unpack_ILLEGAL4res()
-        else:
+        try:
+            arm = _nfs_resop4_arms[data.resop]
+        except KeyError:
             raise XDRError, 'bad switch=%s' % data.resop
-        if hasattr(self, 'filter_nfs_resop4'):
-            data = getattr(self, 'filter_nfs_resop4')(data)
+        if arm is not None:
+            setattr(data, arm[0], getattr(self, arm[1])())
+        if 'nfs_resop4' in self._filters:
+            data = self._filters['nfs_resop4'](self, data)
         return data
 
     def unpack_COMPOUND4args(self):
@@ -6990,8 +6971,8 @@ class NFS4Unpacker(xdrlib.Unpacker):
         data.tag = self.unpack_utf8str_cs()
         data.minorversion = self.unpack_uint32_t()
         data.argarray = self.unpack_array(self.unpack_nfs_argop4)
-        if hasattr(self, 'filter_COMPOUND4args'):
-            data = getattr(self, 'filter_COMPOUND4args')(data)
+        if 'COMPOUND4args' in self._filters:
+            data = self._filters['COMPOUND4args'](self, data)
         return data
 
     def unpack_COMPOUND4res(self):
@@ -6999,23 +6980,23 @@ class NFS4Unpacker(xdrlib.Unpacker):
         data.status = self.unpack_nfsstat4()
         data.tag = self.unpack_utf8str_cs()
         data.resarray = self.unpack_array(self.unpack_nfs_resop4)
-        if hasattr(self, 'filter_COMPOUND4res'):
-            data = getattr(self, 'filter_COMPOUND4res')(data)
+        if 'COMPOUND4res' in self._filters:
+            data = self._filters['COMPOUND4res'](self, data)
         return data
 
     def unpack_CB_GETATTR4args(self):
         data = types.CB_GETATTR4args()
         data.fh = self.unpack_nfs_fh4()
         data.attr_request = self.unpack_bitmap4()
-        if hasattr(self, 'filter_CB_GETATTR4args'):
-            data = getattr(self, 'filter_CB_GETATTR4args')(data)
+        if 'CB_GETATTR4args' in self._filters:
+            data = self._filters['CB_GETATTR4args'](self, data)
         return data
 
     def unpack_CB_GETATTR4resok(self):
         data = types.CB_GETATTR4resok()
         data.obj_attributes = self.unpack_fattr4()
-        if hasattr(self, 'filter_CB_GETATTR4resok'):
-            data = getattr(self, 'filter_CB_GETATTR4resok')(data)
+        if 'CB_GETATTR4resok' in self._filters:
+            data = self._filters['CB_GETATTR4resok'](self, data)
         return data
 
     def unpack_CB_GETATTR4res(self):
@@ -7025,8 +7006,8 @@ class NFS4Unpacker(xdrlib.Unpacker):
             data.resok4 = self.unpack_CB_GETATTR4resok()
         else:
             pass
-        if hasattr(self, 'filter_CB_GETATTR4res'):
-            data = getattr(self, 'filter_CB_GETATTR4res')(data)
+        if 'CB_GETATTR4res' in self._filters:
+            data = self._filters['CB_GETATTR4res'](self, data)
         return data
 
     def unpack_CB_RECALL4args(self):
@@ -7034,30 +7015,30 @@ class NFS4Unpacker(xdrlib.Unpacker):
         data.stateid = self.unpack_stateid4()
         data.truncate = self.unpack_bool()
         data.fh = self.unpack_nfs_fh4()
-        if hasattr(self, 'filter_CB_RECALL4args'):
-            data = getattr(self, 'filter_CB_RECALL4args')(data)
+        if 'CB_RECALL4args' in self._filters:
+            data = self._filters['CB_RECALL4args'](self, data)
         return data
 
     def unpack_CB_RECALL4res(self):
         data = types.CB_RECALL4res()
         data.status = self.unpack_nfsstat4()
-        if hasattr(self, 'filter_CB_RECALL4res'):
-            data = getattr(self, 'filter_CB_RECALL4res')(data)
+        if 'CB_RECALL4res' in self._filters:
+            data = self._filters['CB_RECALL4res'](self, data)
         return data
 
     def unpack_CB_ILLEGAL4res(self):
         data = types.CB_ILLEGAL4res()
         data.status = self.unpack_nfsstat4()
-        if hasattr(self, 'filter_CB_ILLEGAL4res'):
-            data = getattr(self, 'filter_CB_ILLEGAL4res')(data)
+        if 'CB_ILLEGAL4res' in self._filters:
+            data = self._filters['CB_ILLEGAL4res'](self, data)
         return data
 
     def unpack_layoutrecall_type4(self):
         data = self.unpack_int()
         if self.check_enum and data not in [const.LAYOUTRECALL4_FILE, const.LAYOUTRECALL4_FSID, const.LAYOUTRECALL4_ALL]:
             raise XDRError, 'value=%s not in enum layoutrecall_type4' % data
-        if hasattr(self, 'filter_layoutrecall_type4'):
-            data = getattr(self, 'filter_layoutrecall_type4')(data)
+        if 'layoutrecall_type4' in self._filters:
+            data = self._filters['layoutrecall_type4'](self, data)
         return data
 
     def unpack_layoutrecall_file4(self):
@@ -7066,8 +7047,8 @@ class NFS4Unpacker(xdrlib.Unpacker):
         data.lor_offset = self.unpack_offset4()
         data.lor_length = self.unpack_length4()
         data.lor_stateid = self.unpack_stateid4()
-        if hasattr(self, 'filter_layoutrecall_file4'):
-            data = getattr(self, 'filter_layoutrecall_file4')(data)
+        if 'layoutrecall_file4' in self._filters:
+            data = self._filters['layoutrecall_file4'](self, data)
         return data
 
     def unpack_layoutrecall4(self):
@@ -7081,8 +7062,8 @@ class NFS4Unpacker(xdrlib.Unpacker):
             pass
         else:
             raise XDRError, 'bad switch=%s' % data.lor_recalltype
-        if hasattr(self, 'filter_layoutrecall4'):
-            data = getattr(self, 'filter_layoutrecall4')(data)
+        if 'layoutrecall4' in self._filters:
+            data = self._filters['layoutrecall4'](self, data)
         return data
 
     def unpack_CB_LAYOUTRECALL4args(self):
@@ -7091,47 +7072,47 @@ class NFS4Unpacker(xdrlib.Unpacker):
         data.clora_iomode = self.unpack_layoutiomode4()
         data.clora_changed = self.unpack_bool()
         data.clora_recall = self.unpack_layoutrecall4()
-        if hasattr(self, 'filter_CB_LAYOUTRECALL4args'):
-            data = getattr(self, 'filter_CB_LAYOUTRECALL4args')(data)
+        if 'CB_LAYOUTRECALL4args' in self._filters:
+            data = self._filters['CB_LAYOUTRECALL4args'](self, data)
         return data
 
     def unpack_CB_LAYOUTRECALL4res(self):
         data = types.CB_LAYOUTRECALL4res()
         data.clorr_status = self.unpack_nfsstat4()
-        if hasattr(self, 'filter_CB_LAYOUTRECALL4res'):
-            data = getattr(self, 'filter_CB_LAYOUTRECALL4res')(data)
+        if 'CB_LAYOUTRECALL4res' in self._filters:
+            data = self._filters['CB_LAYOUTRECALL4res'](self, data)
         return data
 
     def unpack_notify_type4(self):
         data = self.unpack_int()
         if self.check_enum and data not in [const.NOTIFY4_CHANGE_CHILD_ATTRS, const.NOTIFY4_CHANGE_DIR_ATTRS, const.NOTIFY4_REMOVE_ENTRY, const.NOTIFY4_ADD_ENTRY, const.NOTIFY4_RENAME_ENTRY, const.NOTIFY4_CHANGE_COOKIE_VERIFIER]:
             raise XDRError, 'value=%s not in enum notify_type4' % data
-        if hasattr(self, 'filter_notify_type4'):
-            data = getattr(self, 'filter_notify_type4')(data)
+        if 'notify_type4' in self._filters:
+            data = self._filters['notify_type4'](self, data)
         return data
 
     def unpack_notify_entry4(self):
         data = types.notify_entry4()
         data.ne_file = self.unpack_component4()
         data.ne_attrs = self.unpack_fattr4()
-        if hasattr(self, 'filter_notify_entry4'):
-            data = getattr(self, 'filter_notify_entry4')(data)
+        if 'notify_entry4' in self._filters:
+            data = self._filters['notify_entry4'](self, data)
         return data
 
     def unpack_prev_entry4(self):
         data = types.prev_entry4()
         data.pe_prev_entry = self.unpack_notify_entry4()
         data.pe_prev_entry_cookie = self.unpack_nfs_cookie4()
-        if hasattr(self, 'filter_prev_entry4'):
-            data = getattr(self, 'filter_prev_entry4')(data)
+        if 'prev_entry4' in self._filters:
+            data = self._filters['prev_entry4'](self, data)
         return data
 
     def unpack_notify_remove4(self):
         data = types.notify_remove4()
         data.nrm_old_entry = self.unpack_notify_entry4()
         data.nrm_old_entry_cookie = self.unpack_nfs_cookie4()
-        if hasattr(self, 'filter_notify_remove4'):
-            data = getattr(self, 'filter_notify_remove4')(data)
+        if 'notify_remove4' in self._filters:
+            data = self._filters['notify_remove4'](self, data)
         return data
 
     def unpack_notify_add4(self):
@@ -7147,45 +7128,45 @@ class NFS4Unpacker(xdrlib.Unpacker):
         if len(data.nad_prev_entry) > 1 and self.check_array:
             raise XDRError, 'array length too long for data.nad_prev_entry'
         data.nad_last_entry = self.unpack_bool()
-        if hasattr(self, 'filter_notify_add4'):
-            data = getattr(self, 'filter_notify_add4')(data)
+        if 'notify_add4' in self._filters:
+            data = self._filters['notify_add4'](self, data)
         return data
 
     def unpack_notify_attr4(self):
         data = types.notify_attr4()
         data.na_changed_entry = self.unpack_notify_entry4()
-        if hasattr(self, 'filter_notify_attr4'):
-            data = getattr(self, 'filter_notify_attr4')(data)
+        if 'notify_attr4' in self._filters:
+            data = self._filters['notify_attr4'](self, data)
         return data
 
     def unpack_notify_rename4(self):
         data = types.notify_rename4()
         data.nrn_old_entry = self.unpack_notify_remove4()
         data.nrn_new_entry = self.unpack_notify_add4()
-        if hasattr(self, 'filter_notify_rename4'):
-            data = getattr(self, 'filter_notify_rename4')(data)
+        if 'notify_rename4' in self._filters:
+            data = self._filters['notify_rename4'](self, data)
         return data
 
     def unpack_notify_verifier4(self):
         data = types.notify_verifier4()
         data.nv_old_cookieverf = self.unpack_verifier4()
         data.nv_new_cookieverf = self.unpack_verifier4()
-        if hasattr(self, 'filter_notify_verifier4'):
-            data = getattr(self, 'filter_notify_verifier4')(data)
+        if 'notify_verifier4' in self._filters:
+            data = self._filters['notify_verifier4'](self, data)
         return data
 
     def unpack_notifylist4(self):
         data = self.unpack_opaque()
-        if hasattr(self, 'filter_notifylist4'):
-            data = getattr(self, 'filter_notifylist4')(data)
+        if 'notifylist4' in self._filters:
+            data = self._filters['notifylist4'](self, data)
         return data
 
     def unpack_notify4(self):
         data = types.notify4()
         data.notify_mask = self.unpack_bitmap4()
         data.notify_vals = self.unpack_notifylist4()
-        if hasattr(self, 'filter_notify4'):
-            data = getattr(self, 'filter_notify4')(data)
+        if 'notify4' in self._filters:
+            data = self._filters['notify4'](self, data)
         return data
 
     def unpack_CB_NOTIFY4args(self):
@@ -7193,45 +7174,45 @@ class NFS4Unpacker(xdrlib.Unpacker):
         data.cna_stateid = self.unpack_stateid4()
         data.cna_fh = self.unpack_nfs_fh4()
         data.cna_changes = self.unpack_array(self.unpack_notify4)
-        if hasattr(self, 'filter_CB_NOTIFY4args'):
-            data = getattr(self, 'filter_CB_NOTIFY4args')(data)
+        if 'CB_NOTIFY4args' in self._filters:
+            data = self._filters['CB_NOTIFY4args'](self, data)
         return data
 
     def unpack_CB_NOTIFY4res(self):
         data = types.CB_NOTIFY4res()
         data.cnr_status = self.unpack_nfsstat4()
-        if hasattr(self, 'filter_CB_NOTIFY4res'):
-            data = getattr(self, 'filter_CB_NOTIFY4res')(data)
+        if 'CB_NOTIFY4res' in self._filters:
+            data = self._filters['CB_NOTIFY4res'](self, data)
         return data
 
     def unpack_CB_PUSH_DELEG4args(self):
         data = types.CB_PUSH_DELEG4args()
         data.cpda_fh = self.unpack_nfs_fh4()
         data.cpda_delegation = self.unpack_open_delegation4()
-        if hasattr(self, 'filter_CB_PUSH_DELEG4args'):
-            data = getattr(self, 'filter_CB_PUSH_DELEG4args')(data)
+        if 'CB_PUSH_DELEG4args' in self._filters:
+            data = self._filters['CB_PUSH_DELEG4args'](self, data)
         return data
 
     def unpack_CB_PUSH_DELEG4res(self):
         data = types.CB_PUSH_DELEG4res()
         data.cpdr_status = self.unpack_nfsstat4()
-        if hasattr(self, 'filter_CB_PUSH_DELEG4res'):
-            data = getattr(self, 'filter_CB_PUSH_DELEG4res')(data)
+        if 'CB_PUSH_DELEG4res' in self._filters:
+            data = self._filters['CB_PUSH_DELEG4res'](self, data)
         return data
 
     def unpack_CB_RECALL_ANY4args(self):
         data = types.CB_RECALL_ANY4args()
         data.craa_objects_to_keep = self.unpack_uint32_t()
         data.craa_type_mask = self.unpack_bitmap4()
-        if hasattr(self, 'filter_CB_RECALL_ANY4args'):
-            data = getattr(self, 'filter_CB_RECALL_ANY4args')(data)
+        if 'CB_RECALL_ANY4args' in self._filters:
+            data = self._filters['CB_RECALL_ANY4args'](self, data)
         return data
 
     def unpack_CB_RECALL_ANY4res(self):
         data = types.CB_RECALL_ANY4res()
         data.crar_status = self.unpack_nfsstat4()
-        if hasattr(self, 'filter_CB_RECALL_ANY4res'):
-            data = getattr(self, 'filter_CB_RECALL_ANY4res')(data)
+        if 'CB_RECALL_ANY4res' in self._filters:
+            data = self._filters['CB_RECALL_ANY4res'](self, data)
         return data
 
     unpack_CB_RECALLABLE_OBJ_AVAIL4args = unpack_CB_RECALL_ANY4args
@@ -7239,38 +7220,38 @@ class NFS4Unpacker(xdrlib.Unpacker):
     def unpack_CB_RECALLABLE_OBJ_AVAIL4res(self):
         data = types.CB_RECALLABLE_OBJ_AVAIL4res()
         data.croa_status = self.unpack_nfsstat4()
-        if hasattr(self, 'filter_CB_RECALLABLE_OBJ_AVAIL4res'):
-            data = getattr(self, 'filter_CB_RECALLABLE_OBJ_AVAIL4res')(data)
+        if 'CB_RECALLABLE_OBJ_AVAIL4res' in self._filters:
+            data = self._filters['CB_RECALLABLE_OBJ_AVAIL4res'](self, data)
         return data
 
     def unpack_CB_RECALL_SLOT4args(self):
         data = types.CB_RECALL_SLOT4args()
         data.rsa_target_highest_slotid = self.unpack_slotid4()
-        if hasattr(self, 'filter_CB_RECALL_SLOT4args'):
-            data = getattr(self, 'filter_CB_RECALL_SLOT4args')(data)
+        if 'CB_RECALL_SLOT4args' in self._filters:
+            data = self._filters['CB_RECALL_SLOT4args'](self, data)
         return data
 
     def unpack_CB_RECALL_SLOT4res(self):
         data = types.CB_RECALL_SLOT4res()
         data.rsr_status = self.unpack_nfsstat4()
-        if hasattr(self, 'filter_CB_RECALL_SLOT4res'):
-            data = getattr(self, 'filter_CB_RECALL_SLOT4res')(data)
+        if 'CB_RECALL_SLOT4res' in self._filters:
+            data = self._filters['CB_RECALL_SLOT4res'](self, data)
         return data
 
     def unpack_referring_call4(self):
         data = types.referring_call4()
         data.rc_sequenceid = self.unpack_sequenceid4()
         data.rc_slotid = self.unpack_slotid4()
-        if hasattr(self, 'filter_referring_call4'):
-            data = getattr(self, 'filter_referring_call4')(data)
+        if 'referring_call4' in self._filters:
+            data = self._filters['referring_call4'](self, data)
         return data
 
     def unpack_referring_call_list4(self):
         data = types.referring_call_list4()
         data.rcl_sessionid = self.unpack_sessionid4()
         data.rcl_referring_calls = self.unpack_array(self.unpack_referring_call4)
-        if hasattr(self, 'filter_referring_call_list4'):
-            data = getattr(self, 'filter_referring_call_list4')(data)
+        if 'referring_call_list4' in self._filters:
+            data = self._filters['referring_call_list4'](self, data)
         return data
 
     def unpack_CB_SEQUENCE4args(self):
@@ -7281,8 +7262,8 @@ class NFS4Unpacker(xdrlib.Unpacker):
         data.csa_highest_slotid = self.unpack_slotid4()
         data.csa_cachethis = self.unpack_bool()
         data.csa_referring_call_lists = self.unpack_array(self.unpack_referring_call_list4)
-        if hasattr(self, 'filter_CB_SEQUENCE4args'):
-            data = getattr(self, 'filter_CB_SEQUENCE4args')(data)
+        if 'CB_SEQUENCE4args' in self._filters:
+            data = self._filters['CB_SEQUENCE4args'](self, data)
         return data
 
     def unpack_CB_SEQUENCE4resok(self):
@@ -7292,8 +7273,8 @@ class NFS4Unpacker(xdrlib.Unpacker):
         data.csr_slotid = self.unpack_slotid4()
         data.csr_highest_slotid = self.unpack_slotid4()
         data.csr_target_highest_slotid = self.unpack_slotid4()
-        if hasattr(self, 'filter_CB_SEQUENCE4resok'):
-            data = getattr(self, 'filter_CB_SEQUENCE4resok')(data)
+        if 'CB_SEQUENCE4resok' in self._filters:
+            data = self._filters['CB_SEQUENCE4resok'](self, data)
         return data
 
     def unpack_CB_SEQUENCE4res(self):
@@ -7303,54 +7284,54 @@ class NFS4Unpacker(xdrlib.Unpacker):
             data.csr_resok4 = self.unpack_CB_SEQUENCE4resok()
         else:
             pass
-        if hasattr(self, 'filter_CB_SEQUENCE4res'):
-            data = getattr(self, 'filter_CB_SEQUENCE4res')(data)
+        if 'CB_SEQUENCE4res' in self._filters:
+            data = self._filters['CB_SEQUENCE4res'](self, data)
         return data
 
     def unpack_CB_WANTS_CANCELLED4args(self):
         data = types.CB_WANTS_CANCELLED4args()
         data.cwca_contended_wants_cancelled = self.unpack_bool()
         data.cwca_resourced_wants_cancelled = self.unpack_bool()
-        if hasattr(self, 'filter_CB_WANTS_CANCELLED4args'):
-            data = getattr(self, 'filter_CB_WANTS_CANCELLED4args')(data)
+        if 'CB_WANTS_CANCELLED4args' in self._filters:
+            data = self._filters['CB_WANTS_CANCELLED4args'](self, data)
         return data
 
     def unpack_CB_WANTS_CANCELLED4res(self):
         data = types.CB_WANTS_CANCELLED4res()
         data.cwcr_status = self.unpack_nfsstat4()
-        if hasattr(self, 'filter_CB_WANTS_CANCELLED4res'):
-            data = getattr(self, 'filter_CB_WANTS_CANCELLED4res')(data)
+        if 'CB_WANTS_CANCELLED4res' in self._filters:
+            data = self._filters['CB_WANTS_CANCELLED4res'](self, data)
         return data
 
     def unpack_CB_NOTIFY_LOCK4args(self):
         data = types.CB_NOTIFY_LOCK4args()
         data.cnla_fh = self.unpack_nfs_fh4()
         data.cnla_lock_owner = self.unpack_lock_owner4()
-        if hasattr(self, 'filter_CB_NOTIFY_LOCK4args'):
-            data = getattr(self, 'filter_CB_NOTIFY_LOCK4args')(data)
+        if 'CB_NOTIFY_LOCK4args' in self._filters:
+            data = self._filters['CB_NOTIFY_LOCK4args'](self, data)
         return data
 
     def unpack_CB_NOTIFY_LOCK4res(self):
         data = types.CB_NOTIFY_LOCK4res()
         data.cnlr_status = self.unpack_nfsstat4()
-        if hasattr(self, 'filter_CB_NOTIFY_LOCK4res'):
-            data = getattr(self, 'filter_CB_NOTIFY_LOCK4res')(data)
+        if 'CB_NOTIFY_LOCK4res' in self._filters:
+            data = self._filters['CB_NOTIFY_LOCK4res'](self, data)
         return data
 
     def unpack_notify_deviceid_type4(self):
         data = self.unpack_int()
         if self.check_enum and data not in [const.NOTIFY_DEVICEID4_CHANGE, const.NOTIFY_DEVICEID4_DELETE]:
             raise XDRError, 'value=%s not in enum notify_deviceid_type4' % data
-        if hasattr(self, 'filter_notify_deviceid_type4'):
-            data = getattr(self, 'filter_notify_deviceid_type4')(data)
+        if 'notify_deviceid_type4' in self._filters:
+            data = self._filters['notify_deviceid_type4'](self, data)
         return data
 
     def unpack_notify_deviceid_delete4(self):
         data = types.notify_deviceid_delete4()
         data.ndd_layouttype = self.unpack_layouttype4()
         data.ndd_deviceid = self.unpack_deviceid4()
-        if hasattr(self, 'filter_notify_deviceid_delete4'):
-            data = getattr(self, 'filter_notify_deviceid_delete4')(data)
+        if 'notify_deviceid_delete4' in self._filters:
+            data = self._filters['notify_deviceid_delete4'](self, data)
         return data
 
     def unpack_notify_deviceid_change4(self):
@@ -7358,100 +7339,56 @@ class NFS4Unpacker(xdrlib.Unpacker):
         data.ndc_layouttype = self.unpack_layouttype4()
         data.ndc_deviceid = self.unpack_deviceid4()
         data.ndc_immediate = self.unpack_bool()
-        if hasattr(self, 'filter_notify_deviceid_change4'):
-            data = getattr(self, 'filter_notify_deviceid_change4')(data)
+        if 'notify_deviceid_change4' in self._filters:
+            data = self._filters['notify_deviceid_change4'](self, data)
         return data
 
     def unpack_CB_NOTIFY_DEVICEID4args(self):
         data = types.CB_NOTIFY_DEVICEID4args()
         data.cnda_changes = self.unpack_array(self.unpack_notify4)
-        if hasattr(self, 'filter_CB_NOTIFY_DEVICEID4args'):
-            data = getattr(self, 'filter_CB_NOTIFY_DEVICEID4args')(data)
+        if 'CB_NOTIFY_DEVICEID4args' in self._filters:
+            data = self._filters['CB_NOTIFY_DEVICEID4args'](self, data)
         return data
 
     def unpack_CB_NOTIFY_DEVICEID4res(self):
         data = types.CB_NOTIFY_DEVICEID4res()
         data.cndr_status = self.unpack_nfsstat4()
-        if hasattr(self, 'filter_CB_NOTIFY_DEVICEID4res'):
-            data = getattr(self, 'filter_CB_NOTIFY_DEVICEID4res')(data)
+        if 'CB_NOTIFY_DEVICEID4res' in self._filters:
+            data = self._filters['CB_NOTIFY_DEVICEID4res'](self, data)
         return data
 
     def unpack_nfs_cb_opnum4(self):
         data = self.unpack_int()
         if self.check_enum and data not in [const.OP_CB_GETATTR, const.OP_CB_RECALL, const.OP_CB_LAYOUTRECALL, const.OP_CB_NOTIFY, const.OP_CB_PUSH_DELEG, const.OP_CB_RECALL_ANY, const.OP_CB_RECALLABLE_OBJ_AVAIL, const.OP_CB_RECALL_SLOT, const.OP_CB_SEQUENCE, const.OP_CB_WANTS_CANCELLED, const.OP_CB_NOTIFY_LOCK, const.OP_CB_NOTIFY_DEVICEID, const.OP_CB_ILLEGAL]:
             raise XDRError, 'value=%s not in enum nfs_cb_opnum4' % data
-        if hasattr(self, 'filter_nfs_cb_opnum4'):
-            data = getattr(self, 'filter_nfs_cb_opnum4')(data)
+        if 'nfs_cb_opnum4' in self._filters:
+            data = self._filters['nfs_cb_opnum4'](self, data)
         return data
 
     def unpack_nfs_cb_argop4(self):
         data = types.nfs_cb_argop4()
         data.argop = self.unpack_nfs_cb_opnum4()
-        if data.argop == const.OP_CB_GETATTR:
-            data.opcbgetattr = self.unpack_CB_GETATTR4args()
-        elif data.argop == const.OP_CB_RECALL:
-            data.opcbrecall = self.unpack_CB_RECALL4args()
-        elif data.argop == const.OP_CB_LAYOUTRECALL:
-            data.opcblayoutrecall = self.unpack_CB_LAYOUTRECALL4args()
-        elif data.argop == const.OP_CB_NOTIFY:
-            data.opcbnotify = self.unpack_CB_NOTIFY4args()
-        elif data.argop == const.OP_CB_PUSH_DELEG:
-            data.opcbpush_deleg = self.unpack_CB_PUSH_DELEG4args()
-        elif data.argop == const.OP_CB_RECALL_ANY:
-            data.opcbrecall_any = self.unpack_CB_RECALL_ANY4args()
-        elif data.argop == const.OP_CB_RECALLABLE_OBJ_AVAIL:
-            data.opcbrecallable_obj_avail = self.unpack_CB_RECALLABLE_OBJ_AVAIL4args()
-        elif data.argop == const.OP_CB_RECALL_SLOT:
-            data.opcbrecall_slot = self.unpack_CB_RECALL_SLOT4args()
-        elif data.argop == const.OP_CB_SEQUENCE:
-            data.opcbsequence = self.unpack_CB_SEQUENCE4args()
-        elif data.argop == const.OP_CB_WANTS_CANCELLED:
-            data.opcbwants_cancelled = self.unpack_CB_WANTS_CANCELLED4args()
-        elif data.argop == const.OP_CB_NOTIFY_LOCK:
-            data.opcbnotify_lock = self.unpack_CB_NOTIFY_LOCK4args()
-        elif data.argop == const.OP_CB_NOTIFY_DEVICEID:
-            data.opcbnotify_deviceid = self.unpack_CB_NOTIFY_DEVICEID4args()
-        elif data.argop == const.OP_CB_ILLEGAL:
-            pass
-        else:
+        try:
+            arm = _nfs_cb_argop4_arms[data.argop]
+        except KeyError:
             raise XDRError, 'bad switch=%s' % data.argop
-        if hasattr(self, 'filter_nfs_cb_argop4'):
-            data = getattr(self, 'filter_nfs_cb_argop4')(data)
+        if arm is not None:
+            setattr(data, arm[0], getattr(self, arm[1])())
+        if 'nfs_cb_argop4' in self._filters:
+            data = self._filters['nfs_cb_argop4'](self, data)
         return data
 
     def unpack_nfs_cb_resop4(self):
         data = types.nfs_cb_resop4()
         data.resop = self.unpack_nfs_cb_opnum4()
-        if data.resop == const.OP_CB_GETATTR:
-            data.opcbgetattr = self.unpack_CB_GETATTR4res()
-        elif data.resop == const.OP_CB_RECALL:
-            data.opcbrecall = self.unpack_CB_RECALL4res()
-        elif data.resop == const.OP_CB_LAYOUTRECALL:
-            data.opcblayoutrecall = self.unpack_CB_LAYOUTRECALL4res()
-        elif data.resop == const.OP_CB_NOTIFY:
-            data.opcbnotify = self.unpack_CB_NOTIFY4res()
-        elif data.resop == const.OP_CB_PUSH_DELEG:
-            data.opcbpush_deleg = self.unpack_CB_PUSH_DELEG4res()
-        elif data.resop == const.OP_CB_RECALL_ANY:
-            data.opcbrecall_any = self.unpack_CB_RECALL_ANY4res()
-        elif data.resop == const.OP_CB_RECALLABLE_OBJ_AVAIL:
-            data.opcbrecallable_obj_avail = self.unpack_CB_RECALLABLE_OBJ_AVAIL4res()
-        elif data.resop == const.OP_CB_RECALL_SLOT:
-            data.opcbrecall_slot = self.unpack_CB_RECALL_SLOT4res()
-        elif data.resop == const.OP_CB_SEQUENCE:
-            data.opcbsequence = self.unpack_CB_SEQUENCE4res()
-        elif data.resop == const.OP_CB_WANTS_CANCELLED:
-            data.opcbwants_cancelled = self.unpack_CB_WANTS_CANCELLED4res()
-        elif data.resop == const.OP_CB_NOTIFY_LOCK:
-            data.opcbnotify_lock = self.unpack_CB_NOTIFY_LOCK4res()
-        elif data.resop == const.OP_CB_NOTIFY_DEVICEID:
-            data.opcbnotify_deviceid = self.unpack_CB_NOTIFY_DEVICEID4res()
-        elif data.resop == const.OP_CB_ILLEGAL:
-            data.opcbillegal = self.unpack_CB_ILLEGAL4res()
-        else:
+        try:
+            arm = _nfs_cb_resop4_arms[data.resop]
+        except KeyError:
             raise XDRError, 'bad switch=%s' % data.resop
-        if hasattr(self, 'filter_nfs_cb_resop4'):
-            data = getattr(self, 'filter_nfs_cb_resop4')(data)
+        if arm is not None:
+            setattr(data, arm[0], getattr(self, arm[1])())
+        if 'nfs_cb_resop4' in self._filters:
+            data = self._filters['nfs_cb_resop4'](self, data)
         return data
 
     def unpack_CB_COMPOUND4args(self):
@@ -7460,8 +7397,8 @@ class NFS4Unpacker(xdrlib.Unpacker):
         data.minorversion = self.unpack_uint32_t()
         data.callback_ident = self.unpack_uint32_t()
         data.argarray = self.unpack_array(self.unpack_nfs_cb_argop4)
-        if hasattr(self, 'filter_CB_COMPOUND4args'):
-            data = getattr(self, 'filter_CB_COMPOUND4args')(data)
+        if 'CB_COMPOUND4args' in self._filters:
+            data = self._filters['CB_COMPOUND4args'](self, data)
         return data
 
     def unpack_CB_COMPOUND4res(self):
@@ -7469,7 +7406,7 @@ class NFS4Unpacker(xdrlib.Unpacker):
         data.status = self.unpack_nfsstat4()
         data.tag = self.unpack_utf8str_cs()
         data.resarray = self.unpack_array(self.unpack_nfs_cb_resop4)
-        if hasattr(self, 'filter_CB_COMPOUND4res'):
-            data = getattr(self, 'filter_CB_COMPOUND4res')(data)
+        if 'CB_COMPOUND4res' in self._filters:
+            data = self._filters['CB_COMPOUND4res'](self, data)
         return data
 
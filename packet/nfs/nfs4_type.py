@@ -1,6 +1,7 @@
 # Generated by rpcgen.py from nfs4.x on Wed Jul 11 08:30:29 2012
+# Maintained by hand since then, the classes are new-style classes with __slots__
 import nfs4_const as const
-class authsys_parms:
+class authsys_parms(object):
     # XDR definition:
     # struct authsys_parms {
     #     uint stamp;
@@ -9,6 +10,8 @@ class authsys_parms:
     #     uint gid;
     #     uint gids<16>;
     # };
+    __slots__ = ('stamp', 'machinename', 'uid', 'gid', 'gids')
+
     def __init__(self, stamp=None, machinename=None, uid=None, gid=None, gids=None):
         self.stamp = stamp
         self.machinename = machinename
@@ -31,12 +34,14 @@ class authsys_parms:
         return 'authsys_parms(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class nfstime4:
+class nfstime4(object):
     # XDR definition:
     # struct nfstime4 {
     #     int64_t seconds;
     #     uint32_t nseconds;
     # };
+    __slots__ = ('seconds', 'nseconds')
+
     def __init__(self, seconds=None, nseconds=None):
         self.seconds = seconds
         self.nseconds = nseconds
@@ -50,7 +55,7 @@ class nfstime4:
         return 'nfstime4(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class settime4:
+class settime4(object):
     # XDR definition:
     # union settime4 switch(time_how4 set_it) {
     #     case SET_TO_CLIENT_TIME4:
@@ -58,6 +63,8 @@ class settime4:
     #     default:
     #         void;
     # };
+    __slots__ = ('set_it', 'time')
+
     def __init__(self, set_it=None, time=None):
         self.set_it = set_it
         self.time = time
@@ -76,12 +83,14 @@ class settime4:
         return 'settime4(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class fsid4:
+class fsid4(object):
     # XDR definition:
     # struct fsid4 {
     #     uint64_t major;
     #     uint64_t minor;
     # };
+    __slots__ = ('major', 'minor')
+
     def __init__(self, major=None, minor=None):
         self.major = major
         self.minor = minor
@@ -95,12 +104,14 @@ class fsid4:
         return 'fsid4(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class change_policy4:
+class change_policy4(object):
     # XDR definition:
     # struct change_policy4 {
     #     uint64_t cp_major;
     #     uint64_t cp_minor;
     # };
+    __slots__ = ('cp_major', 'cp_minor')
+
     def __init__(self, cp_major=None, cp_minor=None):
         self.cp_major = cp_major
         self.cp_minor = cp_minor
@@ -114,12 +125,14 @@ class change_policy4:
         return 'change_policy4(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class fs_location4:
+class fs_location4(object):
     # XDR definition:
     # struct fs_location4 {
     #     utf8str_cis server<>;
     #     pathname4 rootpath;
     # };
+    __slots__ = ('server', 'rootpath')
+
     def __init__(self, server=None, rootpath=None):
         self.server = server
         self.rootpath = rootpath
@@ -133,12 +146,14 @@ class fs_location4:
         return 'fs_location4(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class fs_locations4:
+class fs_locations4(object):
     # XDR definition:
     # struct fs_locations4 {
     #     pathname4 fs_root;
     #     fs_location4 locations<>;
     # };
+    __slots__ = ('fs_root', 'locations')
+
     def __init__(self, fs_root=None, locations=None):
         self.fs_root = fs_root
         self.locations = locations
@@ -152,7 +167,7 @@ class fs_locations4:
         return 'fs_locations4(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class nfsace4:
+class nfsace4(object):
     # XDR definition:
     # struct nfsace4 {
     #     acetype4 type;
@@ -160,6 +175,8 @@ class nfsace4:
     #     acemask4 access_mask;
     #     utf8str_mixed who;
     # };
+    __slots__ = ('type', 'flag', 'access_mask', 'who')
+
     def __init__(self, type=None, flag=None, access_mask=None, who=None):
         self.type = type
         self.flag = flag
@@ -179,12 +196,14 @@ class nfsace4:
         return 'nfsace4(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class nfsacl41:
+class nfsacl41(object):
     # XDR definition:
     # struct nfsacl41 {
     #     aclflag4 na41_flag;
     #     nfsace4 na41_aces<>;
     # };
+    __slots__ = ('na41_flag', 'na41_aces')
+
     def __init__(self, na41_flag=None, na41_aces=None):
         self.na41_flag = na41_flag
         self.na41_aces = na41_aces
@@ -198,12 +217,14 @@ class nfsacl41:
         return 'nfsacl41(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class mode_masked4:
+class mode_masked4(object):
     # XDR definition:
     # struct mode_masked4 {
     #     mode4 mm_value_to_set;
     #     mode4 mm_mask_bits;
     # };
+    __slots__ = ('mm_value_to_set', 'mm_mask_bits')
+
     def __init__(self, mm_value_to_set=None, mm_mask_bits=None):
         self.mm_value_to_set = mm_value_to_set
         self.mm_mask_bits = mm_mask_bits
@@ -217,12 +238,14 @@ class mode_masked4:
         return 'mode_masked4(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class specdata4:
+class specdata4(object):
     # XDR definition:
     # struct specdata4 {
     #     uint32_t specdata1;
     #     uint32_t specdata2;
     # };
+    __slots__ = ('specdata1', 'specdata2')
+
     def __init__(self, specdata1=None, specdata2=None):
         self.specdata1 = specdata1
         self.specdata2 = specdata2
@@ -236,12 +259,14 @@ class specdata4:
         return 'specdata4(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class netaddr4:
+class netaddr4(object):
     # XDR definition:
     # struct netaddr4 {
     #     string na_r_netid<>;
     #     string na_r_addr<>;
     # };
+    __slots__ = ('na_r_netid', 'na_r_addr')
+
     def __init__(self, na_r_netid=None, na_r_addr=None):
         self.na_r_netid = na_r_netid
         self.na_r_addr = na_r_addr
@@ -255,13 +280,15 @@ class netaddr4:
         return 'netaddr4(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class nfs_impl_id4:
+class nfs_impl_id4(object):
     # XDR definition:
     # struct nfs_impl_id4 {
     #     utf8str_cis nii_domain;
     #     utf8str_cs nii_name;
     #     nfstime4 nii_date;
     # };
+    __slots__ = ('nii_domain', 'nii_name', 'nii_date')
+
     def __init__(self, nii_domain=None, nii_name=None, nii_date=None):
         self.nii_domain = nii_domain
         self.nii_name = nii_name
@@ -281,12 +308,14 @@ class nfs_impl_id4:
         return 'nfs_impl_id4(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class stateid4:
+class stateid4(object):
     # XDR definition:
     # struct stateid4 {
     #     uint32_t seqid;
     #     opaque other[12];
     # };
+    __slots__ = ('seqid', 'other')
+
     def __init__(self, seqid=None, other=None):
         self.seqid = seqid
         self.other = other
@@ -300,12 +329,14 @@ class stateid4:
         return 'stateid4(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class layout_content4:
+class layout_content4(object):
     # XDR definition:
     # struct layout_content4 {
     #     layouttype4 loc_type;
     #     opaque loc_body<>;
     # };
+    __slots__ = ('loc_type', 'loc_body')
+
     def __init__(self, loc_type=None, loc_body=None):
         self.loc_type = loc_type
         self.loc_body = loc_body
@@ -319,12 +350,14 @@ class layout_content4:
         return 'layout_content4(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class layouthint4:
+class layouthint4(object):
     # XDR definition:
     # struct layouthint4 {
     #     layouttype4 loh_type;
     #     opaque loh_body<>;
     # };
+    __slots__ = ('loh_type', 'loh_body')
+
     def __init__(self, loh_type=None, loh_body=None):
         self.loh_type = loh_type
         self.loh_body = loh_body
@@ -338,7 +371,7 @@ class layouthint4:
         return 'layouthint4(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class layout4:
+class layout4(object):
     # XDR definition:
     # struct layout4 {
     #     offset4 lo_offset;
@@ -346,6 +379,8 @@ class layout4:
     #     layoutiomode4 lo_iomode;
     #     layout_content4 lo_content;
     # };
+    __slots__ = ('lo_offset', 'lo_length', 'lo_iomode', 'lo_content')
+
     def __init__(self, lo_offset=None, lo_length=None, lo_iomode=None, lo_content=None):
         self.lo_offset = lo_offset
         self.lo_length = lo_length
@@ -368,12 +403,14 @@ class layout4:
         return 'layout4(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class device_addr4:
+class device_addr4(object):
     # XDR definition:
     # struct device_addr4 {
     #     layouttype4 da_layout_type;
     #     opaque da_addr_body<>;
     # };
+    __slots__ = ('da_layout_type', 'da_addr_body')
+
     def __init__(self, da_layout_type=None, da_addr_body=None):
         self.da_layout_type = da_layout_type
         self.da_addr_body = da_addr_body
@@ -387,12 +424,14 @@ class device_addr4:
         return 'device_addr4(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class layoutupdate4:
+class layoutupdate4(object):
     # XDR definition:
     # struct layoutupdate4 {
     #     layouttype4 lou_type;
     #     opaque lou_body<>;
     # };
+    __slots__ = ('lou_type', 'lou_body')
+
     def __init__(self, lou_type=None, lou_body=None):
         self.lou_type = lou_type
         self.lou_body = lou_body
@@ -406,7 +445,7 @@ class layoutupdate4:
         return 'layoutupdate4(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class layoutreturn_file4:
+class layoutreturn_file4(object):
     # XDR definition:
     # struct layoutreturn_file4 {
     #     offset4 lrf_offset;
@@ -414,6 +453,8 @@ class layoutreturn_file4:
     #     stateid4 lrf_stateid;
     #     opaque lrf_body<>;
     # };
+    __slots__ = ('lrf_offset', 'lrf_length', 'lrf_stateid', 'lrf_body')
+
     def __init__(self, lrf_offset=None, lrf_length=None, lrf_stateid=None, lrf_body=None):
         self.lrf_offset = lrf_offset
         self.lrf_length = lrf_length
@@ -436,7 +477,7 @@ class layoutreturn_file4:
         return 'layoutreturn_file4(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class layoutreturn4:
+class layoutreturn4(object):
     # XDR definition:
     # union layoutreturn4 switch(layoutreturn_type4 lr_returntype) {
     #     case LAYOUTRETURN4_FILE:
@@ -444,6 +485,8 @@ class layoutreturn4:
     #     default:
     #         void;
     # };
+    __slots__ = ('lr_returntype', 'lr_layout')
+
     def __init__(self, lr_returntype=None, lr_layout=None):
         self.lr_returntype = lr_returntype
         self.lr_layout = lr_layout
@@ -462,7 +505,7 @@ class layoutreturn4:
         return 'layoutreturn4(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class fs4_status:
+class fs4_status(object):
     # XDR definition:
     # struct fs4_status {
     #     bool fss_absent;
@@ -472,6 +515,8 @@ class fs4_status:
     #     int32_t fss_age;
     #     nfstime4 fss_version;
     # };
+    __slots__ = ('fss_absent', 'fss_type', 'fss_source', 'fss_current', 'fss_age', 'fss_version')
+
     def __init__(self, fss_absent=None, fss_type=None, fss_source=None, fss_current=None, fss_age=None, fss_version=None):
         self.fss_absent = fss_absent
         self.fss_type = fss_type
@@ -500,13 +545,15 @@ class fs4_status:
         return 'fs4_status(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class threshold_item4:
+class threshold_item4(object):
     # XDR definition:
     # struct threshold_item4 {
     #     layouttype4 thi_layout_type;
     #     bitmap4 thi_hintset;
     #     opaque thi_hintlist<>;
     # };
+    __slots__ = ('thi_layout_type', 'thi_hintset', 'thi_hintlist')
+
     def __init__(self, thi_layout_type=None, thi_hintset=None, thi_hintlist=None):
         self.thi_layout_type = thi_layout_type
         self.thi_hintset = thi_hintset
@@ -523,11 +570,13 @@ class threshold_item4:
         return 'threshold_item4(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class mdsthreshold4:
+class mdsthreshold4(object):
     # XDR definition:
     # struct mdsthreshold4 {
     #     threshold_item4 mth_hints<>;
     # };
+    __slots__ = ('mth_hints',)
+
     def __init__(self, mth_hints=None):
         self.mth_hints = mth_hints
 
@@ -538,12 +587,14 @@ class mdsthreshold4:
         return 'mdsthreshold4(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class retention_get4:
+class retention_get4(object):
     # XDR definition:
     # struct retention_get4 {
     #     uint64_t rg_duration;
     #     nfstime4 rg_begin_time<1>;
     # };
+    __slots__ = ('rg_duration', 'rg_begin_time')
+
     def __init__(self, rg_duration=None, rg_begin_time=None):
         self.rg_duration = rg_duration
         self.rg_begin_time = rg_begin_time
@@ -557,12 +608,14 @@ class retention_get4:
         return 'retention_get4(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class retention_set4:
+class retention_set4(object):
     # XDR definition:
     # struct retention_set4 {
     #     bool rs_enable;
     #     uint64_t rs_duration<1>;
     # };
+    __slots__ = ('rs_enable', 'rs_duration')
+
     def __init__(self, rs_enable=None, rs_duration=None):
         self.rs_enable = rs_enable
         self.rs_duration = rs_duration
@@ -601,12 +654,14 @@ fattr4_retentevt_get = retention_get4
 fattr4_retentevt_set = retention_set4
 fattr4_dacl = nfsacl41
 fattr4_sacl = nfsacl41
-class fattr4:
+class fattr4(object):
     # XDR definition:
     # struct fattr4 {
     #     bitmap4 attrmask;
     #     attrlist4 attr_vals;
     # };
+    __slots__ = ('attrmask', 'attr_vals')
+
     def __init__(self, attrmask=None, attr_vals=None):
         self.attrmask = attrmask
         self.attr_vals = attr_vals
@@ -620,13 +675,15 @@ class fattr4:
         return 'fattr4(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class change_info4:
+class change_info4(object):
     # XDR definition:
     # struct change_info4 {
     #     bool atomic;
     #     changeid4 before;
     #     changeid4 after;
     # };
+    __slots__ = ('atomic', 'before', 'after')
+
     def __init__(self, atomic=None, before=None, after=None):
         self.atomic = atomic
         self.before = before
@@ -644,12 +701,14 @@ class change_info4:
     __str__ = __repr__
 
 clientaddr4 = netaddr4
-class cb_client4:
+class cb_client4(object):
     # XDR definition:
     # struct cb_client4 {
     #     uint32_t cb_program;
     #     netaddr4 cb_location;
     # };
+    __slots__ = ('cb_program', 'cb_location')
+
     def __init__(self, cb_program=None, cb_location=None):
         self.cb_program = cb_program
         self.cb_location = cb_location
@@ -666,12 +725,14 @@ class cb_client4:
         return 'cb_client4(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class nfs_client_id4:
+class nfs_client_id4(object):
     # XDR definition:
     # struct nfs_client_id4 {
     #     verifier4 verifier;
     #     opaque id<NFS4_OPAQUE_LIMIT>;
     # };
+    __slots__ = ('verifier', 'id')
+
     def __init__(self, verifier=None, id=None):
         self.verifier = verifier
         self.id = id
@@ -685,12 +746,14 @@ class nfs_client_id4:
         return 'nfs_client_id4(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class client_owner4:
+class client_owner4(object):
     # XDR definition:
     # struct client_owner4 {
     #     verifier4 co_verifier;
     #     opaque co_ownerid<NFS4_OPAQUE_LIMIT>;
     # };
+    __slots__ = ('co_verifier', 'co_ownerid')
+
     def __init__(self, co_verifier=None, co_ownerid=None):
         self.co_verifier = co_verifier
         self.co_ownerid = co_ownerid
@@ -704,12 +767,14 @@ class client_owner4:
         return 'client_owner4(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class server_owner4:
+class server_owner4(object):
     # XDR definition:
     # struct server_owner4 {
     #     uint64_t so_minor_id;
     #     opaque so_major_id<NFS4_OPAQUE_LIMIT>;
     # };
+    __slots__ = ('so_minor_id', 'so_major_id')
+
     def __init__(self, so_minor_id=None, so_major_id=None):
         self.so_minor_id = so_minor_id
         self.so_major_id = so_major_id
@@ -723,12 +788,14 @@ class server_owner4:
         return 'server_owner4(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class state_owner4:
+class state_owner4(object):
     # XDR definition:
     # struct state_owner4 {
     #     clientid4 clientid;
     #     opaque owner<NFS4_OPAQUE_LIMIT>;
     # };
+    __slots__ = ('clientid', 'owner')
+
     def __init__(self, clientid=None, owner=None):
         self.clientid = clientid
         self.owner = owner
@@ -744,12 +811,14 @@ class state_owner4:
 
 open_owner4 = state_owner4
 lock_owner4 = state_owner4
-class ssv_mic_plain_tkn4:
+class ssv_mic_plain_tkn4(object):
     # XDR definition:
     # struct ssv_mic_plain_tkn4 {
     #     uint32_t smpt_ssv_seq;
     #     opaque smpt_orig_plain<>;
     # };
+    __slots__ = ('smpt_ssv_seq', 'smpt_orig_plain')
+
     def __init__(self, smpt_ssv_seq=None, smpt_orig_plain=None):
         self.smpt_ssv_seq = smpt_ssv_seq
         self.smpt_orig_plain = smpt_orig_plain
@@ -763,12 +832,14 @@ class ssv_mic_plain_tkn4:
         return 'ssv_mic_plain_tkn4(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class ssv_mic_tkn4:
+class ssv_mic_tkn4(object):
     # XDR definition:
     # struct ssv_mic_tkn4 {
     #     uint32_t smt_ssv_seq;
     #     opaque smt_hmac<>;
     # };
+    __slots__ = ('smt_ssv_seq', 'smt_hmac')
+
     def __init__(self, smt_ssv_seq=None, smt_hmac=None):
         self.smt_ssv_seq = smt_ssv_seq
         self.smt_hmac = smt_hmac
@@ -782,7 +853,7 @@ class ssv_mic_tkn4:
         return 'ssv_mic_tkn4(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class ssv_seal_plain_tkn4:
+class ssv_seal_plain_tkn4(object):
     # XDR definition:
     # struct ssv_seal_plain_tkn4 {
     #     opaque sspt_confounder<>;
@@ -790,6 +861,8 @@ class ssv_seal_plain_tkn4:
     #     opaque sspt_orig_plain<>;
     #     opaque sspt_pad<>;
     # };
+    __slots__ = ('sspt_confounder', 'sspt_ssv_seq', 'sspt_orig_plain', 'sspt_pad')
+
     def __init__(self, sspt_confounder=None, sspt_ssv_seq=None, sspt_orig_plain=None, sspt_pad=None):
         self.sspt_confounder = sspt_confounder
         self.sspt_ssv_seq = sspt_ssv_seq
@@ -809,7 +882,7 @@ class ssv_seal_plain_tkn4:
         return 'ssv_seal_plain_tkn4(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class ssv_seal_cipher_tkn4:
+class ssv_seal_cipher_tkn4(object):
     # XDR definition:
     # struct ssv_seal_cipher_tkn4 {
     #     uint32_t ssct_ssv_seq;
@@ -817,6 +890,8 @@ class ssv_seal_cipher_tkn4:
     #     opaque ssct_encr_data<>;
     #     opaque ssct_hmac<>;
     # };
+    __slots__ = ('ssct_ssv_seq', 'ssct_iv', 'ssct_encr_data', 'ssct_hmac')
+
     def __init__(self, ssct_ssv_seq=None, ssct_iv=None, ssct_encr_data=None, ssct_hmac=None):
         self.ssct_ssv_seq = ssct_ssv_seq
         self.ssct_iv = ssct_iv
@@ -836,13 +911,15 @@ class ssv_seal_cipher_tkn4:
         return 'ssv_seal_cipher_tkn4(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class fs_locations_server4:
+class fs_locations_server4(object):
     # XDR definition:
     # struct fs_locations_server4 {
     #     int32_t fls_currency;
     #     opaque fls_info<>;
     #     utf8str_cis fls_server;
     # };
+    __slots__ = ('fls_currency', 'fls_info', 'fls_server')
+
     def __init__(self, fls_currency=None, fls_info=None, fls_server=None):
         self.fls_currency = fls_currency
         self.fls_info = fls_info
@@ -859,12 +936,14 @@ class fs_locations_server4:
         return 'fs_locations_server4(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class fs_locations_item4:
+class fs_locations_item4(object):
     # XDR definition:
     # struct fs_locations_item4 {
     #     fs_locations_server4 fli_entries<>;
     #     pathname4 fli_rootpath;
     # };
+    __slots__ = ('fli_entries', 'fli_rootpath')
+
     def __init__(self, fli_entries=None, fli_rootpath=None):
         self.fli_entries = fli_entries
         self.fli_rootpath = fli_rootpath
@@ -878,7 +957,7 @@ class fs_locations_item4:
         return 'fs_locations_item4(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class fs_locations_info4:
+class fs_locations_info4(object):
     # XDR definition:
     # struct fs_locations_info4 {
     #     uint32_t fli_flags;
@@ -886,6 +965,8 @@ class fs_locations_info4:
     #     pathname4 fli_fs_root;
     #     fs_locations_item4 fli_items<>;
     # };
+    __slots__ = ('fli_flags', 'fli_valid_for', 'fli_fs_root', 'fli_items')
+
     def __init__(self, fli_flags=None, fli_valid_for=None, fli_fs_root=None, fli_items=None):
         self.fli_flags = fli_flags
         self.fli_valid_for = fli_valid_for
@@ -906,13 +987,15 @@ class fs_locations_info4:
     __str__ = __repr__
 
 fattr4_fs_locations_info = fs_locations_info4
-class nfsv4_1_file_layouthint4:
+class nfsv4_1_file_layouthint4(object):
     # XDR definition:
     # struct nfsv4_1_file_layouthint4 {
     #     uint32_t nflh_care;
     #     nfl_util4 nflh_util;
     #     count4 nflh_stripe_count;
     # };
+    __slots__ = ('nflh_care', 'nflh_util', 'nflh_stripe_count')
+
     def __init__(self, nflh_care=None, nflh_util=None, nflh_stripe_count=None):
         self.nflh_care = nflh_care
         self.nflh_util = nflh_util
@@ -929,12 +1012,14 @@ class nfsv4_1_file_layouthint4:
         return 'nfsv4_1_file_layouthint4(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class nfsv4_1_file_layout_ds_addr4:
+class nfsv4_1_file_layout_ds_addr4(object):
     # XDR definition:
     # struct nfsv4_1_file_layout_ds_addr4 {
     #     uint32_t nflda_stripe_indices<>;
     #     multipath_list4 nflda_multipath_ds_list<>;
     # };
+    __slots__ = ('nflda_stripe_indices', 'nflda_multipath_ds_list')
+
     def __init__(self, nflda_stripe_indices=None, nflda_multipath_ds_list=None):
         self.nflda_stripe_indices = nflda_stripe_indices
         self.nflda_multipath_ds_list = nflda_multipath_ds_list
@@ -948,7 +1033,7 @@ class nfsv4_1_file_layout_ds_addr4:
         return 'nfsv4_1_file_layout_ds_addr4(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class nfsv4_1_file_layout4:
+class nfsv4_1_file_layout4(object):
     # XDR definition:
     # struct nfsv4_1_file_layout4 {
     #     deviceid4 nfl_deviceid;
@@ -957,6 +1042,8 @@ class nfsv4_1_file_layout4:
     #     offset4 nfl_pattern_offset;
     #     nfs_fh4 nfl_fh_list<>;
     # };
+    __slots__ = ('nfl_deviceid', 'nfl_util', 'nfl_first_stripe_index', 'nfl_pattern_offset', 'nfl_fh_list')
+
     def __init__(self, nfl_deviceid=None, nfl_util=None, nfl_first_stripe_index=None, nfl_pattern_offset=None, nfl_fh_list=None):
         self.nfl_deviceid = nfl_deviceid
         self.nfl_util = nfl_util
@@ -979,11 +1066,13 @@ class nfsv4_1_file_layout4:
         return 'nfsv4_1_file_layout4(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class ACCESS4args:
+class ACCESS4args(object):
     # XDR definition:
     # struct ACCESS4args {
     #     uint32_t access;
     # };
+    __slots__ = ('access',)
+
     def __init__(self, access=None):
         self.access = access
 
@@ -994,12 +1083,14 @@ class ACCESS4args:
         return 'ACCESS4args(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class ACCESS4resok:
+class ACCESS4resok(object):
     # XDR definition:
     # struct ACCESS4resok {
     #     uint32_t supported;
     #     uint32_t access;
     # };
+    __slots__ = ('supported', 'access')
+
     def __init__(self, supported=None, access=None):
         self.supported = supported
         self.access = access
@@ -1013,7 +1104,7 @@ class ACCESS4resok:
         return 'ACCESS4resok(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class ACCESS4res:
+class ACCESS4res(object):
     # XDR definition:
     # union ACCESS4res switch(nfsstat4 status) {
     #     case NFS4_OK:
@@ -1021,6 +1112,8 @@ class ACCESS4res:
     #     default:
     #         void;
     # };
+    __slots__ = ('status', 'resok4')
+
     def __init__(self, status=None, resok4=None):
         self.status = status
         self.resok4 = resok4
@@ -1039,12 +1132,14 @@ class ACCESS4res:
         return 'ACCESS4res(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class CLOSE4args:
+class CLOSE4args(object):
     # XDR definition:
     # struct CLOSE4args {
     #     seqid4 seqid;
     #     stateid4 open_stateid;
     # };
+    __slots__ = ('seqid', 'open_stateid')
+
     def __init__(self, seqid=None, open_stateid=None):
         self.seqid = seqid
         self.open_stateid = open_stateid
@@ -1061,7 +1156,7 @@ class CLOSE4args:
         return 'CLOSE4args(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class CLOSE4res:
+class CLOSE4res(object):
     # XDR definition:
     # union CLOSE4res switch(nfsstat4 status) {
     #     case NFS4_OK:
@@ -1069,6 +1164,8 @@ class CLOSE4res:
     #     default:
     #         void;
     # };
+    __slots__ = ('status', 'open_stateid')
+
     def __init__(self, status=None, open_stateid=None):
         self.status = status
         self.open_stateid = open_stateid
@@ -1087,12 +1184,14 @@ class CLOSE4res:
         return 'CLOSE4res(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class COMMIT4args:
+class COMMIT4args(object):
     # XDR definition:
     # struct COMMIT4args {
     #     offset4 offset;
     #     count4 count;
     # };
+    __slots__ = ('offset', 'count')
+
     def __init__(self, offset=None, count=None):
         self.offset = offset
         self.count = count
@@ -1106,11 +1205,13 @@ class COMMIT4args:
         return 'COMMIT4args(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class COMMIT4resok:
+class COMMIT4resok(object):
     # XDR definition:
     # struct COMMIT4resok {
     #     verifier4 writeverf;
     # };
+    __slots__ = ('writeverf',)
+
     def __init__(self, writeverf=None):
         self.writeverf = writeverf
 
@@ -1121,7 +1222,7 @@ class COMMIT4resok:
         return 'COMMIT4resok(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class COMMIT4res:
+class COMMIT4res(object):
     # XDR definition:
     # union COMMIT4res switch(nfsstat4 status) {
     #     case NFS4_OK:
@@ -1129,6 +1230,8 @@ class COMMIT4res:
     #     default:
     #         void;
     # };
+    __slots__ = ('status', 'resok4')
+
     def __init__(self, status=None, resok4=None):
         self.status = status
         self.resok4 = resok4
@@ -1147,7 +1250,7 @@ class COMMIT4res:
         return 'COMMIT4res(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class createtype4:
+class createtype4(object):
     # XDR definition:
     # union createtype4 switch(nfs_ftype4 type) {
     #     case NF4LNK:
@@ -1162,6 +1265,8 @@ class createtype4:
     #     default:
     #         void;
     # };
+    __slots__ = ('type', 'linkdata', 'devdata')
+
     def __init__(self, type=None, linkdata=None, devdata=None):
         self.type = type
         self.linkdata = linkdata
@@ -1183,13 +1288,15 @@ class createtype4:
         return 'createtype4(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class CREATE4args:
+class CREATE4args(object):
     # XDR definition:
     # struct CREATE4args {
     #     createtype4 objtype;
     #     component4 objname;
     #     fattr4 createattrs;
     # };
+    __slots__ = ('objtype', 'objname', 'createattrs')
+
     def __init__(self, objtype=None, objname=None, createattrs=None):
         self.objtype = objtype
         self.objname = objname
@@ -1206,12 +1313,14 @@ class CREATE4args:
         return 'CREATE4args(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class CREATE4resok:
+class CREATE4resok(object):
     # XDR definition:
     # struct CREATE4resok {
     #     change_info4 cinfo;
     #     bitmap4 attrset;
     # };
+    __slots__ = ('cinfo', 'attrset')
+
     def __init__(self, cinfo=None, attrset=None):
         self.cinfo = cinfo
         self.attrset = attrset
@@ -1228,7 +1337,7 @@ class CREATE4resok:
         return 'CREATE4resok(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class CREATE4res:
+class CREATE4res(object):
     # XDR definition:
     # union CREATE4res switch(nfsstat4 status) {
     #     case NFS4_OK:
@@ -1236,6 +1345,8 @@ class CREATE4res:
     #     default:
     #         void;
     # };
+    __slots__ = ('status', 'resok4')
+
     def __init__(self, status=None, resok4=None):
         self.status = status
         self.resok4 = resok4
@@ -1254,11 +1365,13 @@ class CREATE4res:
         return 'CREATE4res(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class DELEGPURGE4args:
+class DELEGPURGE4args(object):
     # XDR definition:
     # struct DELEGPURGE4args {
     #     clientid4 clientid;
     # };
+    __slots__ = ('clientid',)
+
     def __init__(self, clientid=None):
         self.clientid = clientid
 
@@ -1269,11 +1382,13 @@ class DELEGPURGE4args:
         return 'DELEGPURGE4args(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class DELEGPURGE4res:
+class DELEGPURGE4res(object):
     # XDR definition:
     # struct DELEGPURGE4res {
     #     nfsstat4 status;
     # };
+    __slots__ = ('status',)
+
     def __init__(self, status=None):
         self.status = status
 
@@ -1284,11 +1399,13 @@ class DELEGPURGE4res:
         return 'DELEGPURGE4res(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class DELEGRETURN4args:
+class DELEGRETURN4args(object):
     # XDR definition:
     # struct DELEGRETURN4args {
     #     stateid4 deleg_stateid;
     # };
+    __slots__ = ('deleg_stateid',)
+
     def __init__(self, deleg_stateid=None):
         self.deleg_stateid = deleg_stateid
 
@@ -1302,11 +1419,13 @@ class DELEGRETURN4args:
         return 'DELEGRETURN4args(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class DELEGRETURN4res:
+class DELEGRETURN4res(object):
     # XDR definition:
     # struct DELEGRETURN4res {
     #     nfsstat4 status;
     # };
+    __slots__ = ('status',)
+
     def __init__(self, status=None):
         self.status = status
 
@@ -1317,11 +1436,13 @@ class DELEGRETURN4res:
         return 'DELEGRETURN4res(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class GETATTR4args:
+class GETATTR4args(object):
     # XDR definition:
     # struct GETATTR4args {
     #     bitmap4 attr_request;
     # };
+    __slots__ = ('attr_request',)
+
     def __init__(self, attr_request=None):
         self.attr_request = attr_request
 
@@ -1332,11 +1453,13 @@ class GETATTR4args:
         return 'GETATTR4args(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class GETATTR4resok:
+class GETATTR4resok(object):
     # XDR definition:
     # struct GETATTR4resok {
     #     fattr4 obj_attributes;
     # };
+    __slots__ = ('obj_attributes',)
+
     def __init__(self, obj_attributes=None):
         self.obj_attributes = obj_attributes
 
@@ -1350,7 +1473,7 @@ class GETATTR4resok:
         return 'GETATTR4resok(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class GETATTR4res:
+class GETATTR4res(object):
     # XDR definition:
     # union GETATTR4res switch(nfsstat4 status) {
     #     case NFS4_OK:
@@ -1358,6 +1481,8 @@ class GETATTR4res:
     #     default:
     #         void;
     # };
+    __slots__ = ('status', 'resok4')
+
     def __init__(self, status=None, resok4=None):
         self.status = status
         self.resok4 = resok4
@@ -1376,11 +1501,13 @@ class GETATTR4res:
         return 'GETATTR4res(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class GETFH4resok:
+class GETFH4resok(object):
     # XDR definition:
     # struct GETFH4resok {
     #     nfs_fh4 object;
     # };
+    __slots__ = ('object',)
+
     def __init__(self, object=None):
         self.object = object
 
@@ -1391,7 +1518,7 @@ class GETFH4resok:
         return 'GETFH4resok(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class GETFH4res:
+class GETFH4res(object):
     # XDR definition:
     # union GETFH4res switch(nfsstat4 status) {
     #     case NFS4_OK:
@@ -1399,6 +1526,8 @@ class GETFH4res:
     #     default:
     #         void;
     # };
+    __slots__ = ('status', 'resok4')
+
     def __init__(self, status=None, resok4=None):
         self.status = status
         self.resok4 = resok4
@@ -1417,11 +1546,13 @@ class GETFH4res:
         return 'GETFH4res(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class LINK4args:
+class LINK4args(object):
     # XDR definition:
     # struct LINK4args {
     #     component4 newname;
     # };
+    __slots__ = ('newname',)
+
     def __init__(self, newname=None):
         self.newname = newname
 
@@ -1432,11 +1563,13 @@ class LINK4args:
         return 'LINK4args(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class LINK4resok:
+class LINK4resok(object):
     # XDR definition:
     # struct LINK4resok {
     #     change_info4 cinfo;
     # };
+    __slots__ = ('cinfo',)
+
     def __init__(self, cinfo=None):
         self.cinfo = cinfo
 
@@ -1450,7 +1583,7 @@ class LINK4resok:
         return 'LINK4resok(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class LINK4res:
+class LINK4res(object):
     # XDR definition:
     # union LINK4res switch(nfsstat4 status) {
     #     case NFS4_OK:
@@ -1458,6 +1591,8 @@ class LINK4res:
     #     default:
     #         void;
     # };
+    __slots__ = ('status', 'resok4')
+
     def __init__(self, status=None, resok4=None):
         self.status = status
         self.resok4 = resok4
@@ -1476,7 +1611,7 @@ class LINK4res:
         return 'LINK4res(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class open_to_lock_owner4:
+class open_to_lock_owner4(object):
     # XDR definition:
     # struct open_to_lock_owner4 {
     #     seqid4 open_seqid;
@@ -1484,6 +1619,8 @@ class open_to_lock_owner4:
     #     seqid4 lock_seqid;
     #     lock_owner4 lock_owner;
     # };
+    __slots__ = ('open_seqid', 'open_stateid', 'lock_seqid', 'lock_owner')
+
     def __init__(self, open_seqid=None, open_stateid=None, lock_seqid=None, lock_owner=None):
         self.open_seqid = open_seqid
         self.open_stateid = open_stateid
@@ -1503,12 +1640,14 @@ class open_to_lock_owner4:
         return 'open_to_lock_owner4(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class exist_lock_owner4:
+class exist_lock_owner4(object):
     # XDR definition:
     # struct exist_lock_owner4 {
     #     stateid4 lock_stateid;
     #     seqid4 lock_seqid;
     # };
+    __slots__ = ('lock_stateid', 'lock_seqid')
+
     def __init__(self, lock_stateid=None, lock_seqid=None):
         self.lock_stateid = lock_stateid
         self.lock_seqid = lock_seqid
@@ -1525,7 +1664,7 @@ class exist_lock_owner4:
         return 'exist_lock_owner4(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class locker4:
+class locker4(object):
     # XDR definition:
     # union locker4 switch(bool new_lock_owner) {
     #     case TRUE:
@@ -1533,6 +1672,8 @@ class locker4:
     #     case FALSE:
     #         exist_lock_owner4 lock_owner;
     # };
+    __slots__ = ('new_lock_owner', 'open_owner', 'lock_owner')
+
     def __init__(self, new_lock_owner=None, open_owner=None, lock_owner=None):
         self.new_lock_owner = new_lock_owner
         self.open_owner = open_owner
@@ -1554,7 +1695,7 @@ class locker4:
         return 'locker4(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class LOCK4args:
+class LOCK4args(object):
     # XDR definition:
     # struct LOCK4args {
     #     nfs_lock_type4 locktype;
@@ -1563,6 +1704,8 @@ class LOCK4args:
     #     length4 length;
     #     locker4 locker;
     # };
+    __slots__ = ('locktype', 'reclaim', 'offset', 'length', 'locker')
+
     def __init__(self, locktype=None, reclaim=None, offset=None, length=None, locker=None):
         self.locktype = locktype
         self.reclaim = reclaim
@@ -1588,7 +1731,7 @@ class LOCK4args:
         return 'LOCK4args(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class LOCK4denied:
+class LOCK4denied(object):
     # XDR definition:
     # struct LOCK4denied {
     #     offset4 offset;
@@ -1596,6 +1739,8 @@ class LOCK4denied:
     #     nfs_lock_type4 locktype;
     #     lock_owner4 owner;
     # };
+    __slots__ = ('offset', 'length', 'locktype', 'owner')
+
     def __init__(self, offset=None, length=None, locktype=None, owner=None):
         self.offset = offset
         self.length = length
@@ -1618,11 +1763,13 @@ class LOCK4denied:
         return 'LOCK4denied(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class LOCK4resok:
+class LOCK4resok(object):
     # XDR definition:
     # struct LOCK4resok {
     #     stateid4 lock_stateid;
     # };
+    __slots__ = ('lock_stateid',)
+
     def __init__(self, lock_stateid=None):
         self.lock_stateid = lock_stateid
 
@@ -1636,7 +1783,7 @@ class LOCK4resok:
         return 'LOCK4resok(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class LOCK4res:
+class LOCK4res(object):
     # XDR definition:
     # union LOCK4res switch(nfsstat4 status) {
     #     case NFS4_OK:
@@ -1646,6 +1793,8 @@ class LOCK4res:
     #     default:
     #         void;
     # };
+    __slots__ = ('status', 'resok4', 'denied')
+
     def __init__(self, status=None, resok4=None, denied=None):
         self.status = status
         self.resok4 = resok4
@@ -1667,7 +1816,7 @@ class LOCK4res:
         return 'LOCK4res(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class LOCKT4args:
+class LOCKT4args(object):
     # XDR definition:
     # struct LOCKT4args {
     #     nfs_lock_type4 locktype;
@@ -1675,6 +1824,8 @@ class LOCKT4args:
     #     length4 length;
     #     lock_owner4 owner;
     # };
+    __slots__ = ('locktype', 'offset', 'length', 'owner')
+
     def __init__(self, locktype=None, offset=None, length=None, owner=None):
         self.locktype = locktype
         self.offset = offset
@@ -1697,7 +1848,7 @@ class LOCKT4args:
         return 'LOCKT4args(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class LOCKT4res:
+class LOCKT4res(object):
     # XDR definition:
     # union LOCKT4res switch(nfsstat4 status) {
     #     case NFS4ERR_DENIED:
@@ -1707,6 +1858,8 @@ class LOCKT4res:
     #     default:
     #         void;
     # };
+    __slots__ = ('status', 'denied')
+
     def __init__(self, status=None, denied=None):
         self.status = status
         self.denied = denied
@@ -1725,7 +1878,7 @@ class LOCKT4res:
         return 'LOCKT4res(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class LOCKU4args:
+class LOCKU4args(object):
     # XDR definition:
     # struct LOCKU4args {
     #     nfs_lock_type4 locktype;
@@ -1734,6 +1887,8 @@ class LOCKU4args:
     #     offset4 offset;
     #     length4 length;
     # };
+    __slots__ = ('locktype', 'seqid', 'lock_stateid', 'offset', 'length')
+
     def __init__(self, locktype=None, seqid=None, lock_stateid=None, offset=None, length=None):
         self.locktype = locktype
         self.seqid = seqid
@@ -1759,7 +1914,7 @@ class LOCKU4args:
         return 'LOCKU4args(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class LOCKU4res:
+class LOCKU4res(object):
     # XDR definition:
     # union LOCKU4res switch(nfsstat4 status) {
     #     case NFS4_OK:
@@ -1767,6 +1922,8 @@ class LOCKU4res:
     #     default:
     #         void;
     # };
+    __slots__ = ('status', 'lock_stateid')
+
     def __init__(self, status=None, lock_stateid=None):
         self.status = status
         self.lock_stateid = lock_stateid
@@ -1785,11 +1942,13 @@ class LOCKU4res:
         return 'LOCKU4res(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class LOOKUP4args:
+class LOOKUP4args(object):
     # XDR definition:
     # struct LOOKUP4args {
     #     component4 objname;
     # };
+    __slots__ = ('objname',)
+
     def __init__(self, objname=None):
         self.objname = objname
 
@@ -1800,11 +1959,13 @@ class LOOKUP4args:
         return 'LOOKUP4args(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class LOOKUP4res:
+class LOOKUP4res(object):
     # XDR definition:
     # struct LOOKUP4res {
     #     nfsstat4 status;
     # };
+    __slots__ = ('status',)
+
     def __init__(self, status=None):
         self.status = status
 
@@ -1815,11 +1976,13 @@ class LOOKUP4res:
         return 'LOOKUP4res(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class LOOKUPP4res:
+class LOOKUPP4res(object):
     # XDR definition:
     # struct LOOKUPP4res {
     #     nfsstat4 status;
     # };
+    __slots__ = ('status',)
+
     def __init__(self, status=None):
         self.status = status
 
@@ -1830,11 +1993,13 @@ class LOOKUPP4res:
         return 'LOOKUPP4res(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class NVERIFY4args:
+class NVERIFY4args(object):
     # XDR definition:
     # struct NVERIFY4args {
     #     fattr4 obj_attributes;
     # };
+    __slots__ = ('obj_attributes',)
+
     def __init__(self, obj_attributes=None):
         self.obj_attributes = obj_attributes
 
@@ -1848,11 +2013,13 @@ class NVERIFY4args:
         return 'NVERIFY4args(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class NVERIFY4res:
+class NVERIFY4res(object):
     # XDR definition:
     # struct NVERIFY4res {
     #     nfsstat4 status;
     # };
+    __slots__ = ('status',)
+
     def __init__(self, status=None):
         self.status = status
 
@@ -1863,12 +2030,14 @@ class NVERIFY4res:
         return 'NVERIFY4res(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class creatverfattr:
+class creatverfattr(object):
     # XDR definition:
     # struct creatverfattr {
     #     verifier4 cva_verf;
     #     fattr4 cva_attrs;
     # };
+    __slots__ = ('cva_verf', 'cva_attrs')
+
     def __init__(self, cva_verf=None, cva_attrs=None):
         self.cva_verf = cva_verf
         self.cva_attrs = cva_attrs
@@ -1885,7 +2054,7 @@ class creatverfattr:
         return 'creatverfattr(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class createhow4:
+class createhow4(object):
     # XDR definition:
     # union createhow4 switch(createmode4 mode) {
     #     case UNCHECKED4:
@@ -1896,6 +2065,8 @@ class createhow4:
     #     case EXCLUSIVE4_1:
     #         creatverfattr ch_createboth;
     # };
+    __slots__ = ('mode', 'createattrs', 'createverf', 'ch_createboth')
+
     def __init__(self, mode=None, createattrs=None, createverf=None, ch_createboth=None):
         self.mode = mode
         self.createattrs = createattrs
@@ -1920,7 +2091,7 @@ class createhow4:
         return 'createhow4(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class openflag4:
+class openflag4(object):
     # XDR definition:
     # union openflag4 switch(opentype4 opentype) {
     #     case OPEN4_CREATE:
@@ -1928,6 +2099,8 @@ class openflag4:
     #     default:
     #         void;
     # };
+    __slots__ = ('opentype', 'how')
+
     def __init__(self, opentype=None, how=None):
         self.opentype = opentype
         self.how = how
@@ -1946,12 +2119,14 @@ class openflag4:
         return 'openflag4(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class nfs_modified_limit4:
+class nfs_modified_limit4(object):
     # XDR definition:
     # struct nfs_modified_limit4 {
     #     uint32_t num_blocks;
     #     uint32_t bytes_per_block;
     # };
+    __slots__ = ('num_blocks', 'bytes_per_block')
+
     def __init__(self, num_blocks=None, bytes_per_block=None):
         self.num_blocks = num_blocks
         self.bytes_per_block = bytes_per_block
@@ -1965,7 +2140,7 @@ class nfs_modified_limit4:
         return 'nfs_modified_limit4(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class nfs_space_limit4:
+class nfs_space_limit4(object):
     # XDR definition:
     # union nfs_space_limit4 switch(limit_by4 limitby) {
     #     case NFS_LIMIT_SIZE:
@@ -1973,6 +2148,8 @@ class nfs_space_limit4:
     #     case NFS_LIMIT_BLOCKS:
     #         nfs_modified_limit4 mod_blocks;
     # };
+    __slots__ = ('limitby', 'filesize', 'mod_blocks')
+
     def __init__(self, limitby=None, filesize=None, mod_blocks=None):
         self.limitby = limitby
         self.filesize = filesize
@@ -1994,12 +2171,14 @@ class nfs_space_limit4:
         return 'nfs_space_limit4(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class open_claim_delegate_cur4:
+class open_claim_delegate_cur4(object):
     # XDR definition:
     # struct open_claim_delegate_cur4 {
     #     stateid4 delegate_stateid;
     #     component4 file;
     # };
+    __slots__ = ('delegate_stateid', 'file')
+
     def __init__(self, delegate_stateid=None, file=None):
         self.delegate_stateid = delegate_stateid
         self.file = file
@@ -2016,7 +2195,7 @@ class open_claim_delegate_cur4:
         return 'open_claim_delegate_cur4(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class open_claim4:
+class open_claim4(object):
     # XDR definition:
     # union open_claim4 switch(open_claim_type4 claim) {
     #     case CLAIM_NULL:
@@ -2034,6 +2213,8 @@ class open_claim4:
     #     case CLAIM_DELEG_CUR_FH:
     #         stateid4 oc_delegate_stateid;
     # };
+    __slots__ = ('claim', 'file', 'delegate_type', 'delegate_cur_info', 'file_delegate_prev', 'oc_delegate_stateid')
+
     def __init__(self, claim=None, file=None, delegate_type=None, delegate_cur_info=None, file_delegate_prev=None, oc_delegate_stateid=None):
         self.claim = claim
         self.file = file
@@ -2064,7 +2245,7 @@ class open_claim4:
         return 'open_claim4(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class OPEN4args:
+class OPEN4args(object):
     # XDR definition:
     # struct OPEN4args {
     #     seqid4 seqid;
@@ -2074,6 +2255,8 @@ class OPEN4args:
     #     openflag4 openhow;
     #     open_claim4 claim;
     # };
+    __slots__ = ('seqid', 'share_access', 'share_deny', 'owner', 'openhow', 'claim')
+
     def __init__(self, seqid=None, share_access=None, share_deny=None, owner=None, openhow=None, claim=None):
         self.seqid = seqid
         self.share_access = share_access
@@ -2099,13 +2282,15 @@ class OPEN4args:
         return 'OPEN4args(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class open_read_delegation4:
+class open_read_delegation4(object):
     # XDR definition:
     # struct open_read_delegation4 {
     #     stateid4 stateid;
     #     bool recall;
     #     nfsace4 permissions;
     # };
+    __slots__ = ('stateid', 'recall', 'permissions')
+
     def __init__(self, stateid=None, recall=None, permissions=None):
         self.stateid = stateid
         self.recall = recall
@@ -2122,7 +2307,7 @@ class open_read_delegation4:
         return 'open_read_delegation4(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class open_write_delegation4:
+class open_write_delegation4(object):
     # XDR definition:
     # struct open_write_delegation4 {
     #     stateid4 stateid;
@@ -2130,6 +2315,8 @@ class open_write_delegation4:
     #     nfs_space_limit4 space_limit;
     #     nfsace4 permissions;
     # };
+    __slots__ = ('stateid', 'recall', 'space_limit', 'permissions')
+
     def __init__(self, stateid=None, recall=None, space_limit=None, permissions=None):
         self.stateid = stateid
         self.recall = recall
@@ -2149,7 +2336,7 @@ class open_write_delegation4:
         return 'open_write_delegation4(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class open_none_delegation4:
+class open_none_delegation4(object):
     # XDR definition:
     # union open_none_delegation4 switch(why_no_delegation4 ond_why) {
     #     case WND4_CONTENTION:
@@ -2159,6 +2346,8 @@ class open_none_delegation4:
     #     default:
     #         void;
     # };
+    __slots__ = ('ond_why', 'ond_server_will_push_deleg', 'ond_server_will_signal_avail')
+
     def __init__(self, ond_why=None, ond_server_will_push_deleg=None, ond_server_will_signal_avail=None):
         self.ond_why = ond_why
         self.ond_server_will_push_deleg = ond_server_will_push_deleg
@@ -2180,7 +2369,7 @@ class open_none_delegation4:
         return 'open_none_delegation4(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class open_delegation4:
+class open_delegation4(object):
     # XDR definition:
     # union open_delegation4 switch(open_delegation_type4 delegation_type) {
     #     case OPEN_DELEGATE_NONE:
@@ -2192,6 +2381,8 @@ class open_delegation4:
     #     case OPEN_DELEGATE_NONE_EXT:
     #         open_none_delegation4 od_whynone;
     # };
+    __slots__ = ('delegation_type', 'read', 'write', 'od_whynone')
+
     def __init__(self, delegation_type=None, read=None, write=None, od_whynone=None):
         self.delegation_type = delegation_type
         self.read = read
@@ -2216,7 +2407,7 @@ class open_delegation4:
         return 'open_delegation4(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class OPEN4resok:
+class OPEN4resok(object):
     # XDR definition:
     # struct OPEN4resok {
     #     stateid4 stateid;
@@ -2225,6 +2416,8 @@ class OPEN4resok:
     #     bitmap4 attrset;
     #     open_delegation4 delegation;
     # };
+    __slots__ = ('stateid', 'cinfo', 'rflags', 'attrset', 'delegation')
+
     def __init__(self, stateid=None, cinfo=None, rflags=None, attrset=None, delegation=None):
         self.stateid = stateid
         self.cinfo = cinfo
@@ -2247,7 +2440,7 @@ class OPEN4resok:
         return 'OPEN4resok(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class OPEN4res:
+class OPEN4res(object):
     # XDR definition:
     # union OPEN4res switch(nfsstat4 status) {
     #     case NFS4_OK:
@@ -2255,6 +2448,8 @@ class OPEN4res:
     #     default:
     #         void;
     # };
+    __slots__ = ('status', 'resok4')
+
     def __init__(self, status=None, resok4=None):
         self.status = status
         self.resok4 = resok4
@@ -2273,11 +2468,13 @@ class OPEN4res:
         return 'OPEN4res(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class OPENATTR4args:
+class OPENATTR4args(object):
     # XDR definition:
     # struct OPENATTR4args {
     #     bool createdir;
     # };
+    __slots__ = ('createdir',)
+
     def __init__(self, createdir=None):
         self.createdir = createdir
 
@@ -2288,11 +2485,13 @@ class OPENATTR4args:
         return 'OPENATTR4args(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class OPENATTR4res:
+class OPENATTR4res(object):
     # XDR definition:
     # struct OPENATTR4res {
     #     nfsstat4 status;
     # };
+    __slots__ = ('status',)
+
     def __init__(self, status=None):
         self.status = status
 
@@ -2303,12 +2502,14 @@ class OPENATTR4res:
         return 'OPENATTR4res(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class OPEN_CONFIRM4args:
+class OPEN_CONFIRM4args(object):
     # XDR definition:
     # struct OPEN_CONFIRM4args {
     #     stateid4 open_stateid;
     #     seqid4 seqid;
     # };
+    __slots__ = ('open_stateid', 'seqid')
+
     def __init__(self, open_stateid=None, seqid=None):
         self.open_stateid = open_stateid
         self.seqid = seqid
@@ -2325,11 +2526,13 @@ class OPEN_CONFIRM4args:
         return 'OPEN_CONFIRM4args(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class OPEN_CONFIRM4resok:
+class OPEN_CONFIRM4resok(object):
     # XDR definition:
     # struct OPEN_CONFIRM4resok {
     #     stateid4 open_stateid;
     # };
+    __slots__ = ('open_stateid',)
+
     def __init__(self, open_stateid=None):
         self.open_stateid = open_stateid
 
@@ -2343,7 +2546,7 @@ class OPEN_CONFIRM4resok:
         return 'OPEN_CONFIRM4resok(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class OPEN_CONFIRM4res:
+class OPEN_CONFIRM4res(object):
     # XDR definition:
     # union OPEN_CONFIRM4res switch(nfsstat4 status) {
     #     case NFS4_OK:
@@ -2351,6 +2554,8 @@ class OPEN_CONFIRM4res:
     #     default:
     #         void;
     # };
+    __slots__ = ('status', 'resok4')
+
     def __init__(self, status=None, resok4=None):
         self.status = status
         self.resok4 = resok4
@@ -2369,7 +2574,7 @@ class OPEN_CONFIRM4res:
         return 'OPEN_CONFIRM4res(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class OPEN_DOWNGRADE4args:
+class OPEN_DOWNGRADE4args(object):
     # XDR definition:
     # struct OPEN_DOWNGRADE4args {
     #     stateid4 open_stateid;
@@ -2377,6 +2582,8 @@ class OPEN_DOWNGRADE4args:
     #     uint32_t share_access;
     #     uint32_t share_deny;
     # };
+    __slots__ = ('open_stateid', 'seqid', 'share_access', 'share_deny')
+
     def __init__(self, open_stateid=None, seqid=None, share_access=None, share_deny=None):
         self.open_stateid = open_stateid
         self.seqid = seqid
@@ -2399,11 +2606,13 @@ class OPEN_DOWNGRADE4args:
         return 'OPEN_DOWNGRADE4args(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class OPEN_DOWNGRADE4resok:
+class OPEN_DOWNGRADE4resok(object):
     # XDR definition:
     # struct OPEN_DOWNGRADE4resok {
     #     stateid4 open_stateid;
     # };
+    __slots__ = ('open_stateid',)
+
     def __init__(self, open_stateid=None):
         self.open_stateid = open_stateid
 
@@ -2417,7 +2626,7 @@ class OPEN_DOWNGRADE4resok:
         return 'OPEN_DOWNGRADE4resok(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class OPEN_DOWNGRADE4res:
+class OPEN_DOWNGRADE4res(object):
     # XDR definition:
     # union OPEN_DOWNGRADE4res switch(nfsstat4 status) {
     #     case NFS4_OK:
@@ -2425,6 +2634,8 @@ class OPEN_DOWNGRADE4res:
     #     default:
     #         void;
     # };
+    __slots__ = ('status', 'resok4')
+
     def __init__(self, status=None, resok4=None):
         self.status = status
         self.resok4 = resok4
@@ -2443,11 +2654,13 @@ class OPEN_DOWNGRADE4res:
         return 'OPEN_DOWNGRADE4res(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class PUTFH4args:
+class PUTFH4args(object):
     # XDR definition:
     # struct PUTFH4args {
     #     nfs_fh4 object;
     # };
+    __slots__ = ('object',)
+
     def __init__(self, object=None):
         self.object = object
 
@@ -2458,11 +2671,13 @@ class PUTFH4args:
         return 'PUTFH4args(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class PUTFH4res:
+class PUTFH4res(object):
     # XDR definition:
     # struct PUTFH4res {
     #     nfsstat4 status;
     # };
+    __slots__ = ('status',)
+
     def __init__(self, status=None):
         self.status = status
 
@@ -2473,11 +2688,13 @@ class PUTFH4res:
         return 'PUTFH4res(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class PUTPUBFH4res:
+class PUTPUBFH4res(object):
     # XDR definition:
     # struct PUTPUBFH4res {
     #     nfsstat4 status;
     # };
+    __slots__ = ('status',)
+
     def __init__(self, status=None):
         self.status = status
 
@@ -2488,11 +2705,13 @@ class PUTPUBFH4res:
         return 'PUTPUBFH4res(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class PUTROOTFH4res:
+class PUTROOTFH4res(object):
     # XDR definition:
     # struct PUTROOTFH4res {
     #     nfsstat4 status;
     # };
+    __slots__ = ('status',)
+
     def __init__(self, status=None):
         self.status = status
 
@@ -2503,13 +2722,15 @@ class PUTROOTFH4res:
         return 'PUTROOTFH4res(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class READ4args:
+class READ4args(object):
     # XDR definition:
     # struct READ4args {
     #     stateid4 stateid;
     #     offset4 offset;
     #     count4 count;
     # };
+    __slots__ = ('stateid', 'offset', 'count')
+
     def __init__(self, stateid=None, offset=None, count=None):
         self.stateid = stateid
         self.offset = offset
@@ -2529,12 +2750,14 @@ class READ4args:
         return 'READ4args(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class READ4resok:
+class READ4resok(object):
     # XDR definition:
     # struct READ4resok {
     #     bool eof;
     #     opaque data<>;
     # };
+    __slots__ = ('eof', 'data')
+
     def __init__(self, eof=None, data=None):
         self.eof = eof
         self.data = data
@@ -2548,7 +2771,7 @@ class READ4resok:
         return 'READ4resok(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class READ4res:
+class READ4res(object):
     # XDR definition:
     # union READ4res switch(nfsstat4 status) {
     #     case NFS4_OK:
@@ -2556,6 +2779,8 @@ class READ4res:
     #     default:
     #         void;
     # };
+    __slots__ = ('status', 'resok4')
+
     def __init__(self, status=None, resok4=None):
         self.status = status
         self.resok4 = resok4
@@ -2574,7 +2799,7 @@ class READ4res:
         return 'READ4res(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class READDIR4args:
+class READDIR4args(object):
     # XDR definition:
     # struct READDIR4args {
     #     nfs_cookie4 cookie;
@@ -2583,6 +2808,8 @@ class READDIR4args:
     #     count4 maxcount;
     #     bitmap4 attr_request;
     # };
+    __slots__ = ('cookie', 'cookieverf', 'dircount', 'maxcount', 'attr_request')
+
     def __init__(self, cookie=None, cookieverf=None, dircount=None, maxcount=None, attr_request=None):
         self.cookie = cookie
         self.cookieverf = cookieverf
@@ -2605,7 +2832,7 @@ class READDIR4args:
         return 'READDIR4args(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class entry4:
+class entry4(object):
     # XDR definition:
     # struct entry4 {
     #     nfs_cookie4 cookie;
@@ -2613,6 +2840,8 @@ class entry4:
     #     fattr4 attrs;
     #     entry4 nextentry<1>;
     # };
+    __slots__ = ('cookie', 'name', 'attrs', 'nextentry')
+
     def __init__(self, cookie=None, name=None, attrs=None, nextentry=None):
         self.cookie = cookie
         self.name = name
@@ -2635,12 +2864,14 @@ class entry4:
         return 'entry4(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class dirlist4:
+class dirlist4(object):
     # XDR definition:
     # struct dirlist4 {
     #     entry4 entries<1>;
     #     bool eof;
     # };
+    __slots__ = ('entries', 'eof')
+
     def __init__(self, entries=None, eof=None):
         self.entries = entries
         self.eof = eof
@@ -2654,12 +2885,14 @@ class dirlist4:
         return 'dirlist4(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class READDIR4resok:
+class READDIR4resok(object):
     # XDR definition:
     # struct READDIR4resok {
     #     verifier4 cookieverf;
     #     dirlist4 reply;
     # };
+    __slots__ = ('cookieverf', 'reply')
+
     def __init__(self, cookieverf=None, reply=None):
         self.cookieverf = cookieverf
         self.reply = reply
@@ -2676,7 +2909,7 @@ class READDIR4resok:
         return 'READDIR4resok(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class READDIR4res:
+class READDIR4res(object):
     # XDR definition:
     # union READDIR4res switch(nfsstat4 status) {
     #     case NFS4_OK:
@@ -2684,6 +2917,8 @@ class READDIR4res:
     #     default:
     #         void;
     # };
+    __slots__ = ('status', 'resok4')
+
     def __init__(self, status=None, resok4=None):
         self.status = status
         self.resok4 = resok4
@@ -2702,11 +2937,13 @@ class READDIR4res:
         return 'READDIR4res(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class READLINK4resok:
+class READLINK4resok(object):
     # XDR definition:
     # struct READLINK4resok {
     #     linktext4 link;
     # };
+    __slots__ = ('link',)
+
     def __init__(self, link=None):
         self.link = link
 
@@ -2717,7 +2954,7 @@ class READLINK4resok:
         return 'READLINK4resok(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class READLINK4res:
+class READLINK4res(object):
     # XDR definition:
     # union READLINK4res switch(nfsstat4 status) {
     #     case NFS4_OK:
@@ -2725,6 +2962,8 @@ class READLINK4res:
     #     default:
     #         void;
     # };
+    __slots__ = ('status', 'resok4')
+
     def __init__(self, status=None, resok4=None):
         self.status = status
         self.resok4 = resok4
@@ -2743,11 +2982,13 @@ class READLINK4res:
         return 'READLINK4res(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class REMOVE4args:
+class REMOVE4args(object):
     # XDR definition:
     # struct REMOVE4args {
     #     component4 target;
     # };
+    __slots__ = ('target',)
+
     def __init__(self, target=None):
         self.target = target
 
@@ -2758,11 +2999,13 @@ class REMOVE4args:
         return 'REMOVE4args(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class REMOVE4resok:
+class REMOVE4resok(object):
     # XDR definition:
     # struct REMOVE4resok {
     #     change_info4 cinfo;
     # };
+    __slots__ = ('cinfo',)
+
     def __init__(self, cinfo=None):
         self.cinfo = cinfo
 
@@ -2776,7 +3019,7 @@ class REMOVE4resok:
         return 'REMOVE4resok(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class REMOVE4res:
+class REMOVE4res(object):
     # XDR definition:
     # union REMOVE4res switch(nfsstat4 status) {
     #     case NFS4_OK:
@@ -2784,6 +3027,8 @@ class REMOVE4res:
     #     default:
     #         void;
     # };
+    __slots__ = ('status', 'resok4')
+
     def __init__(self, status=None, resok4=None):
         self.status = status
         self.resok4 = resok4
@@ -2802,12 +3047,14 @@ class REMOVE4res:
         return 'REMOVE4res(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class RENAME4args:
+class RENAME4args(object):
     # XDR definition:
     # struct RENAME4args {
     #     component4 oldname;
     #     component4 newname;
     # };
+    __slots__ = ('oldname', 'newname')
+
     def __init__(self, oldname=None, newname=None):
         self.oldname = oldname
         self.newname = newname
@@ -2821,12 +3068,14 @@ class RENAME4args:
         return 'RENAME4args(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class RENAME4resok:
+class RENAME4resok(object):
     # XDR definition:
     # struct RENAME4resok {
     #     change_info4 source_cinfo;
     #     change_info4 target_cinfo;
     # };
+    __slots__ = ('source_cinfo', 'target_cinfo')
+
     def __init__(self, source_cinfo=None, target_cinfo=None):
         self.source_cinfo = source_cinfo
         self.target_cinfo = target_cinfo
@@ -2840,7 +3089,7 @@ class RENAME4resok:
         return 'RENAME4resok(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class RENAME4res:
+class RENAME4res(object):
     # XDR definition:
     # union RENAME4res switch(nfsstat4 status) {
     #     case NFS4_OK:
@@ -2848,6 +3097,8 @@ class RENAME4res:
     #     default:
     #         void;
     # };
+    __slots__ = ('status', 'resok4')
+
     def __init__(self, status=None, resok4=None):
         self.status = status
         self.resok4 = resok4
@@ -2866,11 +3117,13 @@ class RENAME4res:
         return 'RENAME4res(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class RENEW4args:
+class RENEW4args(object):
     # XDR definition:
     # struct RENEW4args {
     #     clientid4 clientid;
     # };
+    __slots__ = ('clientid',)
+
     def __init__(self, clientid=None):
         self.clientid = clientid
 
@@ -2881,11 +3134,13 @@ class RENEW4args:
         return 'RENEW4args(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class RENEW4res:
+class RENEW4res(object):
     # XDR definition:
     # struct RENEW4res {
     #     nfsstat4 status;
     # };
+    __slots__ = ('status',)
+
     def __init__(self, status=None):
         self.status = status
 
@@ -2896,11 +3151,13 @@ class RENEW4res:
         return 'RENEW4res(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class RESTOREFH4res:
+class RESTOREFH4res(object):
     # XDR definition:
     # struct RESTOREFH4res {
     #     nfsstat4 status;
     # };
+    __slots__ = ('status',)
+
     def __init__(self, status=None):
         self.status = status
 
@@ -2911,11 +3168,13 @@ class RESTOREFH4res:
         return 'RESTOREFH4res(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class SAVEFH4res:
+class SAVEFH4res(object):
     # XDR definition:
     # struct SAVEFH4res {
     #     nfsstat4 status;
     # };
+    __slots__ = ('status',)
+
     def __init__(self, status=None):
         self.status = status
 
@@ -2926,11 +3185,13 @@ class SAVEFH4res:
         return 'SAVEFH4res(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class SECINFO4args:
+class SECINFO4args(object):
     # XDR definition:
     # struct SECINFO4args {
     #     component4 name;
     # };
+    __slots__ = ('name',)
+
     def __init__(self, name=None):
         self.name = name
 
@@ -2941,13 +3202,15 @@ class SECINFO4args:
         return 'SECINFO4args(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class rpcsec_gss_info:
+class rpcsec_gss_info(object):
     # XDR definition:
     # struct rpcsec_gss_info {
     #     sec_oid4 oid;
     #     qop4 qop;
     #     rpc_gss_svc_t service;
     # };
+    __slots__ = ('oid', 'qop', 'service')
+
     def __init__(self, oid=None, qop=None, service=None):
         self.oid = oid
         self.qop = qop
@@ -2964,7 +3227,7 @@ class rpcsec_gss_info:
         return 'rpcsec_gss_info(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class secinfo4:
+class secinfo4(object):
     # XDR definition:
     # union secinfo4 switch(uint32_t flavor) {
     #     case RPCSEC_GSS:
@@ -2972,6 +3235,8 @@ class secinfo4:
     #     default:
     #         void;
     # };
+    __slots__ = ('flavor', 'flavor_info')
+
     def __init__(self, flavor=None, flavor_info=None):
         self.flavor = flavor
         self.flavor_info = flavor_info
@@ -2990,7 +3255,7 @@ class secinfo4:
         return 'secinfo4(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class SECINFO4res:
+class SECINFO4res(object):
     # XDR definition:
     # union SECINFO4res switch(nfsstat4 status) {
     #     case NFS4_OK:
@@ -2998,6 +3263,8 @@ class SECINFO4res:
     #     default:
     #         void;
     # };
+    __slots__ = ('status', 'resok4')
+
     def __init__(self, status=None, resok4=None):
         self.status = status
         self.resok4 = resok4
@@ -3016,12 +3283,14 @@ class SECINFO4res:
         return 'SECINFO4res(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class SETATTR4args:
+class SETATTR4args(object):
     # XDR definition:
     # struct SETATTR4args {
     #     stateid4 stateid;
     #     fattr4 obj_attributes;
     # };
+    __slots__ = ('stateid', 'obj_attributes')
+
     def __init__(self, stateid=None, obj_attributes=None):
         self.stateid = stateid
         self.obj_attributes = obj_attributes
@@ -3035,12 +3304,14 @@ class SETATTR4args:
         return 'SETATTR4args(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class SETATTR4res:
+class SETATTR4res(object):
     # XDR definition:
     # struct SETATTR4res {
     #     nfsstat4 status;
     #     bitmap4 attrsset;
     # };
+    __slots__ = ('status', 'attrsset')
+
     def __init__(self, status=None, attrsset=None):
         self.status = status
         self.attrsset = attrsset
@@ -3054,13 +3325,15 @@ class SETATTR4res:
         return 'SETATTR4res(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class SETCLIENTID4args:
+class SETCLIENTID4args(object):
     # XDR definition:
     # struct SETCLIENTID4args {
     #     nfs_client_id4 client;
     #     cb_client4 callback;
     #     uint32_t callback_ident;
     # };
+    __slots__ = ('client', 'callback', 'callback_ident')
+
     def __init__(self, client=None, callback=None, callback_ident=None):
         self.client = client
         self.callback = callback
@@ -3077,12 +3350,14 @@ class SETCLIENTID4args:
         return 'SETCLIENTID4args(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class SETCLIENTID4resok:
+class SETCLIENTID4resok(object):
     # XDR definition:
     # struct SETCLIENTID4resok {
     #     clientid4 clientid;
     #     verifier4 setclientid_confirm;
     # };
+    __slots__ = ('clientid', 'setclientid_confirm')
+
     def __init__(self, clientid=None, setclientid_confirm=None):
         self.clientid = clientid
         self.setclientid_confirm = setclientid_confirm
@@ -3096,7 +3371,7 @@ class SETCLIENTID4resok:
         return 'SETCLIENTID4resok(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class SETCLIENTID4res:
+class SETCLIENTID4res(object):
     # XDR definition:
     # union SETCLIENTID4res switch(nfsstat4 status) {
     #     case NFS4_OK:
@@ -3106,6 +3381,8 @@ class SETCLIENTID4res:
     #     default:
     #         void;
     # };
+    __slots__ = ('status', 'resok4', 'client_using')
+
     def __init__(self, status=None, resok4=None, client_using=None):
         self.status = status
         self.resok4 = resok4
@@ -3127,12 +3404,14 @@ class SETCLIENTID4res:
         return 'SETCLIENTID4res(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class SETCLIENTID_CONFIRM4args:
+class SETCLIENTID_CONFIRM4args(object):
     # XDR definition:
     # struct SETCLIENTID_CONFIRM4args {
     #     clientid4 clientid;
     #     verifier4 setclientid_confirm;
     # };
+    __slots__ = ('clientid', 'setclientid_confirm')
+
     def __init__(self, clientid=None, setclientid_confirm=None):
         self.clientid = clientid
         self.setclientid_confirm = setclientid_confirm
@@ -3146,11 +3425,13 @@ class SETCLIENTID_CONFIRM4args:
         return 'SETCLIENTID_CONFIRM4args(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class SETCLIENTID_CONFIRM4res:
+class SETCLIENTID_CONFIRM4res(object):
     # XDR definition:
     # struct SETCLIENTID_CONFIRM4res {
     #     nfsstat4 status;
     # };
+    __slots__ = ('status',)
+
     def __init__(self, status=None):
         self.status = status
 
@@ -3161,11 +3442,13 @@ class SETCLIENTID_CONFIRM4res:
         return 'SETCLIENTID_CONFIRM4res(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class VERIFY4args:
+class VERIFY4args(object):
     # XDR definition:
     # struct VERIFY4args {
     #     fattr4 obj_attributes;
     # };
+    __slots__ = ('obj_attributes',)
+
     def __init__(self, obj_attributes=None):
         self.obj_attributes = obj_attributes
 
@@ -3179,11 +3462,13 @@ class VERIFY4args:
         return 'VERIFY4args(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class VERIFY4res:
+class VERIFY4res(object):
     # XDR definition:
     # struct VERIFY4res {
     #     nfsstat4 status;
     # };
+    __slots__ = ('status',)
+
     def __init__(self, status=None):
         self.status = status
 
@@ -3194,7 +3479,7 @@ class VERIFY4res:
         return 'VERIFY4res(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class WRITE4args:
+class WRITE4args(object):
     # XDR definition:
     # struct WRITE4args {
     #     stateid4 stateid;
@@ -3202,6 +3487,8 @@ class WRITE4args:
     #     stable_how4 stable;
     #     opaque data<>;
     # };
+    __slots__ = ('stateid', 'offset', 'stable', 'data')
+
     def __init__(self, stateid=None, offset=None, stable=None, data=None):
         self.stateid = stateid
         self.offset = offset
@@ -3224,13 +3511,15 @@ class WRITE4args:
         return 'WRITE4args(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class WRITE4resok:
+class WRITE4resok(object):
     # XDR definition:
     # struct WRITE4resok {
     #     count4 count;
     #     stable_how4 committed;
     #     verifier4 writeverf;
     # };
+    __slots__ = ('count', 'committed', 'writeverf')
+
     def __init__(self, count=None, committed=None, writeverf=None):
         self.count = count
         self.committed = committed
@@ -3247,7 +3536,7 @@ class WRITE4resok:
         return 'WRITE4resok(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class WRITE4res:
+class WRITE4res(object):
     # XDR definition:
     # union WRITE4res switch(nfsstat4 status) {
     #     case NFS4_OK:
@@ -3255,6 +3544,8 @@ class WRITE4res:
     #     default:
     #         void;
     # };
+    __slots__ = ('status', 'resok4')
+
     def __init__(self, status=None, resok4=None):
         self.status = status
         self.resok4 = resok4
@@ -3273,11 +3564,13 @@ class WRITE4res:
         return 'WRITE4res(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class RELEASE_LOCKOWNER4args:
+class RELEASE_LOCKOWNER4args(object):
     # XDR definition:
     # struct RELEASE_LOCKOWNER4args {
     #     lock_owner4 lock_owner;
     # };
+    __slots__ = ('lock_owner',)
+
     def __init__(self, lock_owner=None):
         self.lock_owner = lock_owner
 
@@ -3291,11 +3584,13 @@ class RELEASE_LOCKOWNER4args:
         return 'RELEASE_LOCKOWNER4args(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class RELEASE_LOCKOWNER4res:
+class RELEASE_LOCKOWNER4res(object):
     # XDR definition:
     # struct RELEASE_LOCKOWNER4res {
     #     nfsstat4 status;
     # };
+    __slots__ = ('status',)
+
     def __init__(self, status=None):
         self.status = status
 
@@ -3306,11 +3601,13 @@ class RELEASE_LOCKOWNER4res:
         return 'RELEASE_LOCKOWNER4res(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class ILLEGAL4res:
+class ILLEGAL4res(object):
     # XDR definition:
     # struct ILLEGAL4res {
     #     nfsstat4 status;
     # };
+    __slots__ = ('status',)
+
     def __init__(self, status=None):
         self.status = status
 
@@ -3321,13 +3618,15 @@ class ILLEGAL4res:
         return 'ILLEGAL4res(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class gss_cb_handles4:
+class gss_cb_handles4(object):
     # XDR definition:
     # struct gss_cb_handles4 {
     #     rpc_gss_svc_t gcbp_service;
     #     gsshandle4_t gcbp_handle_from_server;
     #     gsshandle4_t gcbp_handle_from_client;
     # };
+    __slots__ = ('gcbp_service', 'gcbp_handle_from_server', 'gcbp_handle_from_client')
+
     def __init__(self, gcbp_service=None, gcbp_handle_from_server=None, gcbp_handle_from_client=None):
         self.gcbp_service = gcbp_service
         self.gcbp_handle_from_server = gcbp_handle_from_server
@@ -3344,7 +3643,7 @@ class gss_cb_handles4:
         return 'gss_cb_handles4(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class callback_sec_parms4:
+class callback_sec_parms4(object):
     # XDR definition:
     # union callback_sec_parms4 switch(uint32_t cb_secflavor) {
     #     case AUTH_NONE:
@@ -3354,6 +3653,8 @@ class callback_sec_parms4:
     #     case RPCSEC_GSS:
     #         gss_cb_handles4 cbsp_gss_handles;
     # };
+    __slots__ = ('cb_secflavor', 'cbsp_sys_cred', 'cbsp_gss_handles')
+
     def __init__(self, cb_secflavor=None, cbsp_sys_cred=None, cbsp_gss_handles=None):
         self.cb_secflavor = cb_secflavor
         self.cbsp_sys_cred = cbsp_sys_cred
@@ -3375,12 +3676,14 @@ class callback_sec_parms4:
         return 'callback_sec_parms4(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class BACKCHANNEL_CTL4args:
+class BACKCHANNEL_CTL4args(object):
     # XDR definition:
     # struct BACKCHANNEL_CTL4args {
     #     uint32_t bca_cb_program;
     #     callback_sec_parms4 bca_sec_parms<>;
     # };
+    __slots__ = ('bca_cb_program', 'bca_sec_parms')
+
     def __init__(self, bca_cb_program=None, bca_sec_parms=None):
         self.bca_cb_program = bca_cb_program
         self.bca_sec_parms = bca_sec_parms
@@ -3394,11 +3697,13 @@ class BACKCHANNEL_CTL4args:
         return 'BACKCHANNEL_CTL4args(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class BACKCHANNEL_CTL4res:
+class BACKCHANNEL_CTL4res(object):
     # XDR definition:
     # struct BACKCHANNEL_CTL4res {
     #     nfsstat4 bcr_status;
     # };
+    __slots__ = ('bcr_status',)
+
     def __init__(self, bcr_status=None):
         self.bcr_status = bcr_status
 
@@ -3409,13 +3714,15 @@ class BACKCHANNEL_CTL4res:
         return 'BACKCHANNEL_CTL4res(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class BIND_CONN_TO_SESSION4args:
+class BIND_CONN_TO_SESSION4args(object):
     # XDR definition:
     # struct BIND_CONN_TO_SESSION4args {
     #     sessionid4 bctsa_sessid;
     #     channel_dir_from_client4 bctsa_dir;
     #     bool bctsa_use_conn_in_rdma_mode;
     # };
+    __slots__ = ('bctsa_sessid', 'bctsa_dir', 'bctsa_use_conn_in_rdma_mode')
+
     def __init__(self, bctsa_sessid=None, bctsa_dir=None, bctsa_use_conn_in_rdma_mode=None):
         self.bctsa_sessid = bctsa_sessid
         self.bctsa_dir = bctsa_dir
@@ -3432,13 +3739,15 @@ class BIND_CONN_TO_SESSION4args:
         return 'BIND_CONN_TO_SESSION4args(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class BIND_CONN_TO_SESSION4resok:
+class BIND_CONN_TO_SESSION4resok(object):
     # XDR definition:
     # struct BIND_CONN_TO_SESSION4resok {
     #     sessionid4 bctsr_sessid;
     #     channel_dir_from_server4 bctsr_dir;
     #     bool bctsr_use_conn_in_rdma_mode;
     # };
+    __slots__ = ('bctsr_sessid', 'bctsr_dir', 'bctsr_use_conn_in_rdma_mode')
+
     def __init__(self, bctsr_sessid=None, bctsr_dir=None, bctsr_use_conn_in_rdma_mode=None):
         self.bctsr_sessid = bctsr_sessid
         self.bctsr_dir = bctsr_dir
@@ -3455,7 +3764,7 @@ class BIND_CONN_TO_SESSION4resok:
         return 'BIND_CONN_TO_SESSION4resok(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class BIND_CONN_TO_SESSION4res:
+class BIND_CONN_TO_SESSION4res(object):
     # XDR definition:
     # union BIND_CONN_TO_SESSION4res switch(nfsstat4 bctsr_status) {
     #     case NFS4_OK:
@@ -3463,6 +3772,8 @@ class BIND_CONN_TO_SESSION4res:
     #     default:
     #         void;
     # };
+    __slots__ = ('bctsr_status', 'bctsr_resok4')
+
     def __init__(self, bctsr_status=None, bctsr_resok4=None):
         self.bctsr_status = bctsr_status
         self.bctsr_resok4 = bctsr_resok4
@@ -3481,12 +3792,14 @@ class BIND_CONN_TO_SESSION4res:
         return 'BIND_CONN_TO_SESSION4res(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class state_protect_ops4:
+class state_protect_ops4(object):
     # XDR definition:
     # struct state_protect_ops4 {
     #     bitmap4 spo_must_enforce;
     #     bitmap4 spo_must_allow;
     # };
+    __slots__ = ('spo_must_enforce', 'spo_must_allow')
+
     def __init__(self, spo_must_enforce=None, spo_must_allow=None):
         self.spo_must_enforce = spo_must_enforce
         self.spo_must_allow = spo_must_allow
@@ -3500,7 +3813,7 @@ class state_protect_ops4:
         return 'state_protect_ops4(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class ssv_sp_parms4:
+class ssv_sp_parms4(object):
     # XDR definition:
     # struct ssv_sp_parms4 {
     #     state_protect_ops4 ssp_ops;
@@ -3509,6 +3822,8 @@ class ssv_sp_parms4:
     #     uint32_t ssp_window;
     #     uint32_t ssp_num_gss_handles;
     # };
+    __slots__ = ('ssp_ops', 'ssp_hash_algs', 'ssp_encr_algs', 'ssp_window', 'ssp_num_gss_handles')
+
     def __init__(self, ssp_ops=None, ssp_hash_algs=None, ssp_encr_algs=None, ssp_window=None, ssp_num_gss_handles=None):
         self.ssp_ops = ssp_ops
         self.ssp_hash_algs = ssp_hash_algs
@@ -3534,7 +3849,7 @@ class ssv_sp_parms4:
         return 'ssv_sp_parms4(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class state_protect4_a:
+class state_protect4_a(object):
     # XDR definition:
     # union state_protect4_a switch(state_protect_how4 spa_how) {
     #     case SP4_NONE:
@@ -3544,6 +3859,8 @@ class state_protect4_a:
     #     case SP4_SSV:
     #         ssv_sp_parms4 spa_ssv_parms;
     # };
+    __slots__ = ('spa_how', 'spa_mach_ops', 'spa_ssv_parms')
+
     def __init__(self, spa_how=None, spa_mach_ops=None, spa_ssv_parms=None):
         self.spa_how = spa_how
         self.spa_mach_ops = spa_mach_ops
@@ -3565,7 +3882,7 @@ class state_protect4_a:
         return 'state_protect4_a(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class EXCHANGE_ID4args:
+class EXCHANGE_ID4args(object):
     # XDR definition:
     # struct EXCHANGE_ID4args {
     #     client_owner4 eia_clientowner;
@@ -3573,6 +3890,8 @@ class EXCHANGE_ID4args:
     #     state_protect4_a eia_state_protect;
     #     nfs_impl_id4 eia_client_impl_id<1>;
     # };
+    __slots__ = ('eia_clientowner', 'eia_flags', 'eia_state_protect', 'eia_client_impl_id')
+
     def __init__(self, eia_clientowner=None, eia_flags=None, eia_state_protect=None, eia_client_impl_id=None):
         self.eia_clientowner = eia_clientowner
         self.eia_flags = eia_flags
@@ -3592,7 +3911,7 @@ class EXCHANGE_ID4args:
         return 'EXCHANGE_ID4args(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class ssv_prot_info4:
+class ssv_prot_info4(object):
     # XDR definition:
     # struct ssv_prot_info4 {
     #     state_protect_ops4 spi_ops;
@@ -3602,6 +3921,8 @@ class ssv_prot_info4:
     #     uint32_t spi_window;
     #     gsshandle4_t spi_handles<>;
     # };
+    __slots__ = ('spi_ops', 'spi_hash_alg', 'spi_encr_alg', 'spi_ssv_len', 'spi_window', 'spi_handles')
+
     def __init__(self, spi_ops=None, spi_hash_alg=None, spi_encr_alg=None, spi_ssv_len=None, spi_window=None, spi_handles=None):
         self.spi_ops = spi_ops
         self.spi_hash_alg = spi_hash_alg
@@ -3630,7 +3951,7 @@ class ssv_prot_info4:
         return 'ssv_prot_info4(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class state_protect4_r:
+class state_protect4_r(object):
     # XDR definition:
     # union state_protect4_r switch(state_protect_how4 spr_how) {
     #     case SP4_NONE:
@@ -3640,6 +3961,8 @@ class state_protect4_r:
     #     case SP4_SSV:
     #         ssv_prot_info4 spr_ssv_info;
     # };
+    __slots__ = ('spr_how', 'spr_mach_ops', 'spr_ssv_info')
+
     def __init__(self, spr_how=None, spr_mach_ops=None, spr_ssv_info=None):
         self.spr_how = spr_how
         self.spr_mach_ops = spr_mach_ops
@@ -3661,7 +3984,7 @@ class state_protect4_r:
         return 'state_protect4_r(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class EXCHANGE_ID4resok:
+class EXCHANGE_ID4resok(object):
     # XDR definition:
     # struct EXCHANGE_ID4resok {
     #     clientid4 eir_clientid;
@@ -3672,6 +3995,8 @@ class EXCHANGE_ID4resok:
     #     opaque eir_server_scope<NFS4_OPAQUE_LIMIT>;
     #     nfs_impl_id4 eir_server_impl_id<1>;
     # };
+    __slots__ = ('eir_clientid', 'eir_sequenceid', 'eir_flags', 'eir_state_protect', 'eir_server_owner', 'eir_server_scope', 'eir_server_impl_id')
+
     def __init__(self, eir_clientid=None, eir_sequenceid=None, eir_flags=None, eir_state_protect=None, eir_server_owner=None, eir_server_scope=None, eir_server_impl_id=None):
         self.eir_clientid = eir_clientid
         self.eir_sequenceid = eir_sequenceid
@@ -3700,7 +4025,7 @@ class EXCHANGE_ID4resok:
         return 'EXCHANGE_ID4resok(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class EXCHANGE_ID4res:
+class EXCHANGE_ID4res(object):
     # XDR definition:
     # union EXCHANGE_ID4res switch(nfsstat4 eir_status) {
     #     case NFS4_OK:
@@ -3708,6 +4033,8 @@ class EXCHANGE_ID4res:
     #     default:
     #         void;
     # };
+    __slots__ = ('eir_status', 'eir_resok4')
+
     def __init__(self, eir_status=None, eir_resok4=None):
         self.eir_status = eir_status
         self.eir_resok4 = eir_resok4
@@ -3726,7 +4053,7 @@ class EXCHANGE_ID4res:
         return 'EXCHANGE_ID4res(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class channel_attrs4:
+class channel_attrs4(object):
     # XDR definition:
     # struct channel_attrs4 {
     #     count4 ca_headerpadsize;
@@ -3737,6 +4064,8 @@ class channel_attrs4:
     #     count4 ca_maxrequests;
     #     uint32_t ca_rdma_ird<1>;
     # };
+    __slots__ = ('ca_headerpadsize', 'ca_maxrequestsize', 'ca_maxresponsesize', 'ca_maxresponsesize_cached', 'ca_maxoperations', 'ca_maxrequests', 'ca_rdma_ird')
+
     def __init__(self, ca_headerpadsize=None, ca_maxrequestsize=None, ca_maxresponsesize=None, ca_maxresponsesize_cached=None, ca_maxoperations=None, ca_maxrequests=None, ca_rdma_ird=None):
         self.ca_headerpadsize = ca_headerpadsize
         self.ca_maxrequestsize = ca_maxrequestsize
@@ -3765,7 +4094,7 @@ class channel_attrs4:
         return 'channel_attrs4(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class CREATE_SESSION4args:
+class CREATE_SESSION4args(object):
     # XDR definition:
     # struct CREATE_SESSION4args {
     #     clientid4 csa_clientid;
@@ -3776,6 +4105,8 @@ class CREATE_SESSION4args:
     #     uint32_t csa_cb_program;
     #     callback_sec_parms4 csa_sec_parms<>;
     # };
+    __slots__ = ('csa_clientid', 'csa_sequence', 'csa_flags', 'csa_fore_chan_attrs', 'csa_back_chan_attrs', 'csa_cb_program', 'csa_sec_parms')
+
     def __init__(self, csa_clientid=None, csa_sequence=None, csa_flags=None, csa_fore_chan_attrs=None, csa_back_chan_attrs=None, csa_cb_program=None, csa_sec_parms=None):
         self.csa_clientid = csa_clientid
         self.csa_sequence = csa_sequence
@@ -3804,7 +4135,7 @@ class CREATE_SESSION4args:
         return 'CREATE_SESSION4args(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class CREATE_SESSION4resok:
+class CREATE_SESSION4resok(object):
     # XDR definition:
     # struct CREATE_SESSION4resok {
     #     sessionid4 csr_sessionid;
@@ -3813,6 +4144,8 @@ class CREATE_SESSION4resok:
     #     channel_attrs4 csr_fore_chan_attrs;
     #     channel_attrs4 csr_back_chan_attrs;
     # };
+    __slots__ = ('csr_sessionid', 'csr_sequence', 'csr_flags', 'csr_fore_chan_attrs', 'csr_back_chan_attrs')
+
     def __init__(self, csr_sessionid=None, csr_sequence=None, csr_flags=None, csr_fore_chan_attrs=None, csr_back_chan_attrs=None):
         self.csr_sessionid = csr_sessionid
         self.csr_sequence = csr_sequence
@@ -3835,7 +4168,7 @@ class CREATE_SESSION4resok:
         return 'CREATE_SESSION4resok(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class CREATE_SESSION4res:
+class CREATE_SESSION4res(object):
     # XDR definition:
     # union CREATE_SESSION4res switch(nfsstat4 csr_status) {
     #     case NFS4_OK:
@@ -3843,6 +4176,8 @@ class CREATE_SESSION4res:
     #     default:
     #         void;
     # };
+    __slots__ = ('csr_status', 'csr_resok4')
+
     def __init__(self, csr_status=None, csr_resok4=None):
         self.csr_status = csr_status
         self.csr_resok4 = csr_resok4
@@ -3861,11 +4196,13 @@ class CREATE_SESSION4res:
         return 'CREATE_SESSION4res(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class DESTROY_SESSION4args:
+class DESTROY_SESSION4args(object):
     # XDR definition:
     # struct DESTROY_SESSION4args {
     #     sessionid4 dsa_sessionid;
     # };
+    __slots__ = ('dsa_sessionid',)
+
     def __init__(self, dsa_sessionid=None):
         self.dsa_sessionid = dsa_sessionid
 
@@ -3876,11 +4213,13 @@ class DESTROY_SESSION4args:
         return 'DESTROY_SESSION4args(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class DESTROY_SESSION4res:
+class DESTROY_SESSION4res(object):
     # XDR definition:
     # struct DESTROY_SESSION4res {
     #     nfsstat4 dsr_status;
     # };
+    __slots__ = ('dsr_status',)
+
     def __init__(self, dsr_status=None):
         self.dsr_status = dsr_status
 
@@ -3891,11 +4230,13 @@ class DESTROY_SESSION4res:
         return 'DESTROY_SESSION4res(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class FREE_STATEID4args:
+class FREE_STATEID4args(object):
     # XDR definition:
     # struct FREE_STATEID4args {
     #     stateid4 fsa_stateid;
     # };
+    __slots__ = ('fsa_stateid',)
+
     def __init__(self, fsa_stateid=None):
         self.fsa_stateid = fsa_stateid
 
@@ -3909,11 +4250,13 @@ class FREE_STATEID4args:
         return 'FREE_STATEID4args(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class FREE_STATEID4res:
+class FREE_STATEID4res(object):
     # XDR definition:
     # struct FREE_STATEID4res {
     #     nfsstat4 fsr_status;
     # };
+    __slots__ = ('fsr_status',)
+
     def __init__(self, fsr_status=None):
         self.fsr_status = fsr_status
 
@@ -3925,7 +4268,7 @@ class FREE_STATEID4res:
     __str__ = __repr__
 
 attr_notice4 = nfstime4
-class GET_DIR_DELEGATION4args:
+class GET_DIR_DELEGATION4args(object):
     # XDR definition:
     # struct GET_DIR_DELEGATION4args {
     #     bool gdda_signal_deleg_avail;
@@ -3935,6 +4278,8 @@ class GET_DIR_DELEGATION4args:
     #     bitmap4 gdda_child_attributes;
     #     bitmap4 gdda_dir_attributes;
     # };
+    __slots__ = ('gdda_signal_deleg_avail', 'gdda_notification_types', 'gdda_child_attr_delay', 'gdda_dir_attr_delay', 'gdda_child_attributes', 'gdda_dir_attributes')
+
     def __init__(self, gdda_signal_deleg_avail=None, gdda_notification_types=None, gdda_child_attr_delay=None, gdda_dir_attr_delay=None, gdda_child_attributes=None, gdda_dir_attributes=None):
         self.gdda_signal_deleg_avail = gdda_signal_deleg_avail
         self.gdda_notification_types = gdda_notification_types
@@ -3960,7 +4305,7 @@ class GET_DIR_DELEGATION4args:
         return 'GET_DIR_DELEGATION4args(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class GET_DIR_DELEGATION4resok:
+class GET_DIR_DELEGATION4resok(object):
     # XDR definition:
     # struct GET_DIR_DELEGATION4resok {
     #     verifier4 gddr_cookieverf;
@@ -3969,6 +4314,8 @@ class GET_DIR_DELEGATION4resok:
     #     bitmap4 gddr_child_attributes;
     #     bitmap4 gddr_dir_attributes;
     # };
+    __slots__ = ('gddr_cookieverf', 'gddr_stateid', 'gddr_notification', 'gddr_child_attributes', 'gddr_dir_attributes')
+
     def __init__(self, gddr_cookieverf=None, gddr_stateid=None, gddr_notification=None, gddr_child_attributes=None, gddr_dir_attributes=None):
         self.gddr_cookieverf = gddr_cookieverf
         self.gddr_stateid = gddr_stateid
@@ -3994,7 +4341,7 @@ class GET_DIR_DELEGATION4resok:
         return 'GET_DIR_DELEGATION4resok(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class GET_DIR_DELEGATION4res_non_fatal:
+class GET_DIR_DELEGATION4res_non_fatal(object):
     # XDR definition:
     # union GET_DIR_DELEGATION4res_non_fatal switch(gddrnf4_status gddrnf_status) {
     #     case GDD4_OK:
@@ -4002,6 +4349,8 @@ class GET_DIR_DELEGATION4res_non_fatal:
     #     case GDD4_UNAVAIL:
     #         bool gddrnf_will_signal_deleg_avail;
     # };
+    __slots__ = ('gddrnf_status', 'gddrnf_resok4', 'gddrnf_will_signal_deleg_avail')
+
     def __init__(self, gddrnf_status=None, gddrnf_resok4=None, gddrnf_will_signal_deleg_avail=None):
         self.gddrnf_status = gddrnf_status
         self.gddrnf_resok4 = gddrnf_resok4
@@ -4023,7 +4372,7 @@ class GET_DIR_DELEGATION4res_non_fatal:
         return 'GET_DIR_DELEGATION4res_non_fatal(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class GET_DIR_DELEGATION4res:
+class GET_DIR_DELEGATION4res(object):
     # XDR definition:
     # union GET_DIR_DELEGATION4res switch(nfsstat4 gddr_status) {
     #     case NFS4_OK:
@@ -4031,6 +4380,8 @@ class GET_DIR_DELEGATION4res:
     #     default:
     #         void;
     # };
+    __slots__ = ('gddr_status', 'gddr_res_non_fatal4')
+
     def __init__(self, gddr_status=None, gddr_res_non_fatal4=None):
         self.gddr_status = gddr_status
         self.gddr_res_non_fatal4 = gddr_res_non_fatal4
@@ -4049,7 +4400,7 @@ class GET_DIR_DELEGATION4res:
         return 'GET_DIR_DELEGATION4res(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class GETDEVICEINFO4args:
+class GETDEVICEINFO4args(object):
     # XDR definition:
     # struct GETDEVICEINFO4args {
     #     deviceid4 gdia_device_id;
@@ -4057,6 +4408,8 @@ class GETDEVICEINFO4args:
     #     count4 gdia_maxcount;
     #     bitmap4 gdia_notify_types;
     # };
+    __slots__ = ('gdia_device_id', 'gdia_layout_type', 'gdia_maxcount', 'gdia_notify_types')
+
     def __init__(self, gdia_device_id=None, gdia_layout_type=None, gdia_maxcount=None, gdia_notify_types=None):
         self.gdia_device_id = gdia_device_id
         self.gdia_layout_type = gdia_layout_type
@@ -4076,12 +4429,14 @@ class GETDEVICEINFO4args:
         return 'GETDEVICEINFO4args(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class GETDEVICEINFO4resok:
+class GETDEVICEINFO4resok(object):
     # XDR definition:
     # struct GETDEVICEINFO4resok {
     #     device_addr4 gdir_device_addr;
     #     bitmap4 gdir_notification;
     # };
+    __slots__ = ('gdir_device_addr', 'gdir_notification')
+
     def __init__(self, gdir_device_addr=None, gdir_notification=None):
         self.gdir_device_addr = gdir_device_addr
         self.gdir_notification = gdir_notification
@@ -4098,7 +4453,7 @@ class GETDEVICEINFO4resok:
         return 'GETDEVICEINFO4resok(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class GETDEVICEINFO4res:
+class GETDEVICEINFO4res(object):
     # XDR definition:
     # union GETDEVICEINFO4res switch(nfsstat4 gdir_status) {
     #     case NFS4_OK:
@@ -4108,6 +4463,8 @@ class GETDEVICEINFO4res:
     #     default:
     #         void;
     # };
+    __slots__ = ('gdir_status', 'gdir_resok4', 'gdir_mincount')
+
     def __init__(self, gdir_status=None, gdir_resok4=None, gdir_mincount=None):
         self.gdir_status = gdir_status
         self.gdir_resok4 = gdir_resok4
@@ -4129,7 +4486,7 @@ class GETDEVICEINFO4res:
         return 'GETDEVICEINFO4res(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class GETDEVICELIST4args:
+class GETDEVICELIST4args(object):
     # XDR definition:
     # struct GETDEVICELIST4args {
     #     layouttype4 gdla_layout_type;
@@ -4137,6 +4494,8 @@ class GETDEVICELIST4args:
     #     nfs_cookie4 gdla_cookie;
     #     verifier4 gdla_cookieverf;
     # };
+    __slots__ = ('gdla_layout_type', 'gdla_maxdevices', 'gdla_cookie', 'gdla_cookieverf')
+
     def __init__(self, gdla_layout_type=None, gdla_maxdevices=None, gdla_cookie=None, gdla_cookieverf=None):
         self.gdla_layout_type = gdla_layout_type
         self.gdla_maxdevices = gdla_maxdevices
@@ -4156,7 +4515,7 @@ class GETDEVICELIST4args:
         return 'GETDEVICELIST4args(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class GETDEVICELIST4resok:
+class GETDEVICELIST4resok(object):
     # XDR definition:
     # struct GETDEVICELIST4resok {
     #     nfs_cookie4 gdlr_cookie;
@@ -4164,6 +4523,8 @@ class GETDEVICELIST4resok:
     #     deviceid4 gdlr_deviceid_list<>;
     #     bool gdlr_eof;
     # };
+    __slots__ = ('gdlr_cookie', 'gdlr_cookieverf', 'gdlr_deviceid_list', 'gdlr_eof')
+
     def __init__(self, gdlr_cookie=None, gdlr_cookieverf=None, gdlr_deviceid_list=None, gdlr_eof=None):
         self.gdlr_cookie = gdlr_cookie
         self.gdlr_cookieverf = gdlr_cookieverf
@@ -4183,7 +4544,7 @@ class GETDEVICELIST4resok:
         return 'GETDEVICELIST4resok(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class GETDEVICELIST4res:
+class GETDEVICELIST4res(object):
     # XDR definition:
     # union GETDEVICELIST4res switch(nfsstat4 gdlr_status) {
     #     case NFS4_OK:
@@ -4191,6 +4552,8 @@ class GETDEVICELIST4res:
     #     default:
     #         void;
     # };
+    __slots__ = ('gdlr_status', 'gdlr_resok4')
+
     def __init__(self, gdlr_status=None, gdlr_resok4=None):
         self.gdlr_status = gdlr_status
         self.gdlr_resok4 = gdlr_resok4
@@ -4209,7 +4572,7 @@ class GETDEVICELIST4res:
         return 'GETDEVICELIST4res(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class newtime4:
+class newtime4(object):
     # XDR definition:
     # union newtime4 switch(bool nt_timechanged) {
     #     case TRUE:
@@ -4217,6 +4580,8 @@ class newtime4:
     #     case FALSE:
     #         void;
     # };
+    __slots__ = ('nt_timechanged', 'nt_time')
+
     def __init__(self, nt_timechanged=None, nt_time=None):
         self.nt_timechanged = nt_timechanged
         self.nt_time = nt_time
@@ -4235,7 +4600,7 @@ class newtime4:
         return 'newtime4(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class newoffset4:
+class newoffset4(object):
     # XDR definition:
     # union newoffset4 switch(bool no_newoffset) {
     #     case TRUE:
@@ -4243,6 +4608,8 @@ class newoffset4:
     #     case FALSE:
     #         void;
     # };
+    __slots__ = ('no_newoffset', 'no_offset')
+
     def __init__(self, no_newoffset=None, no_offset=None):
         self.no_newoffset = no_newoffset
         self.no_offset = no_offset
@@ -4261,7 +4628,7 @@ class newoffset4:
         return 'newoffset4(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class LAYOUTCOMMIT4args:
+class LAYOUTCOMMIT4args(object):
     # XDR definition:
     # struct LAYOUTCOMMIT4args {
     #     offset4 loca_offset;
@@ -4272,6 +4639,8 @@ class LAYOUTCOMMIT4args:
     #     newtime4 loca_time_modify;
     #     layoutupdate4 loca_layoutupdate;
     # };
+    __slots__ = ('loca_offset', 'loca_length', 'loca_reclaim', 'loca_stateid', 'loca_last_write_offset', 'loca_time_modify', 'loca_layoutupdate')
+
     def __init__(self, loca_offset=None, loca_length=None, loca_reclaim=None, loca_stateid=None, loca_last_write_offset=None, loca_time_modify=None, loca_layoutupdate=None):
         self.loca_offset = loca_offset
         self.loca_length = loca_length
@@ -4300,7 +4669,7 @@ class LAYOUTCOMMIT4args:
         return 'LAYOUTCOMMIT4args(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class newsize4:
+class newsize4(object):
     # XDR definition:
     # union newsize4 switch(bool ns_sizechanged) {
     #     case TRUE:
@@ -4308,6 +4677,8 @@ class newsize4:
     #     case FALSE:
     #         void;
     # };
+    __slots__ = ('ns_sizechanged', 'ns_size')
+
     def __init__(self, ns_sizechanged=None, ns_size=None):
         self.ns_sizechanged = ns_sizechanged
         self.ns_size = ns_size
@@ -4326,11 +4697,13 @@ class newsize4:
         return 'newsize4(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class LAYOUTCOMMIT4resok:
+class LAYOUTCOMMIT4resok(object):
     # XDR definition:
     # struct LAYOUTCOMMIT4resok {
     #     newsize4 locr_newsize;
     # };
+    __slots__ = ('locr_newsize',)
+
     def __init__(self, locr_newsize=None):
         self.locr_newsize = locr_newsize
 
@@ -4344,7 +4717,7 @@ class LAYOUTCOMMIT4resok:
         return 'LAYOUTCOMMIT4resok(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class LAYOUTCOMMIT4res:
+class LAYOUTCOMMIT4res(object):
     # XDR definition:
     # union LAYOUTCOMMIT4res switch(nfsstat4 locr_status) {
     #     case NFS4_OK:
@@ -4352,6 +4725,8 @@ class LAYOUTCOMMIT4res:
     #     default:
     #         void;
     # };
+    __slots__ = ('locr_status', 'locr_resok4')
+
     def __init__(self, locr_status=None, locr_resok4=None):
         self.locr_status = locr_status
         self.locr_resok4 = locr_resok4
@@ -4370,7 +4745,7 @@ class LAYOUTCOMMIT4res:
         return 'LAYOUTCOMMIT4res(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class LAYOUTGET4args:
+class LAYOUTGET4args(object):
     # XDR definition:
     # struct LAYOUTGET4args {
     #     bool loga_signal_layout_avail;
@@ -4382,6 +4757,8 @@ class LAYOUTGET4args:
     #     stateid4 loga_stateid;
     #     count4 loga_maxcount;
     # };
+    __slots__ = ('loga_signal_layout_avail', 'loga_layout_type', 'loga_iomode', 'loga_offset', 'loga_length', 'loga_minlength', 'loga_stateid', 'loga_maxcount')
+
     def __init__(self, loga_signal_layout_avail=None, loga_layout_type=None, loga_iomode=None, loga_offset=None, loga_length=None, loga_minlength=None, loga_stateid=None, loga_maxcount=None):
         self.loga_signal_layout_avail = loga_signal_layout_avail
         self.loga_layout_type = loga_layout_type
@@ -4416,13 +4793,15 @@ class LAYOUTGET4args:
         return 'LAYOUTGET4args(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class LAYOUTGET4resok:
+class LAYOUTGET4resok(object):
     # XDR definition:
     # struct LAYOUTGET4resok {
     #     bool logr_return_on_close;
     #     stateid4 logr_stateid;
     #     layout4 logr_layout<>;
     # };
+    __slots__ = ('logr_return_on_close', 'logr_stateid', 'logr_layout')
+
     def __init__(self, logr_return_on_close=None, logr_stateid=None, logr_layout=None):
         self.logr_return_on_close = logr_return_on_close
         self.logr_stateid = logr_stateid
@@ -4442,7 +4821,7 @@ class LAYOUTGET4resok:
         return 'LAYOUTGET4resok(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class LAYOUTGET4res:
+class LAYOUTGET4res(object):
     # XDR definition:
     # union LAYOUTGET4res switch(nfsstat4 logr_status) {
     #     case NFS4_OK:
@@ -4452,6 +4831,8 @@ class LAYOUTGET4res:
     #     default:
     #         void;
     # };
+    __slots__ = ('logr_status', 'logr_resok4', 'logr_will_signal_layout_avail')
+
     def __init__(self, logr_status=None, logr_resok4=None, logr_will_signal_layout_avail=None):
         self.logr_status = logr_status
         self.logr_resok4 = logr_resok4
@@ -4473,7 +4854,7 @@ class LAYOUTGET4res:
         return 'LAYOUTGET4res(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class LAYOUTRETURN4args:
+class LAYOUTRETURN4args(object):
     # XDR definition:
     # struct LAYOUTRETURN4args {
     #     bool lora_reclaim;
@@ -4481,6 +4862,8 @@ class LAYOUTRETURN4args:
     #     layoutiomode4 lora_iomode;
     #     layoutreturn4 lora_layoutreturn;
     # };
+    __slots__ = ('lora_reclaim', 'lora_layout_type', 'lora_iomode', 'lora_layoutreturn')
+
     def __init__(self, lora_reclaim=None, lora_layout_type=None, lora_iomode=None, lora_layoutreturn=None):
         self.lora_reclaim = lora_reclaim
         self.lora_layout_type = lora_layout_type
@@ -4503,7 +4886,7 @@ class LAYOUTRETURN4args:
         return 'LAYOUTRETURN4args(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class layoutreturn_stateid:
+class layoutreturn_stateid(object):
     # XDR definition:
     # union layoutreturn_stateid switch(bool lrs_present) {
     #     case TRUE:
@@ -4511,6 +4894,8 @@ class layoutreturn_stateid:
     #     case FALSE:
     #         void;
     # };
+    __slots__ = ('lrs_present', 'lrs_stateid')
+
     def __init__(self, lrs_present=None, lrs_stateid=None):
         self.lrs_present = lrs_present
         self.lrs_stateid = lrs_stateid
@@ -4529,7 +4914,7 @@ class layoutreturn_stateid:
         return 'layoutreturn_stateid(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class LAYOUTRETURN4res:
+class LAYOUTRETURN4res(object):
     # XDR definition:
     # union LAYOUTRETURN4res switch(nfsstat4 lorr_status) {
     #     case NFS4_OK:
@@ -4537,6 +4922,8 @@ class LAYOUTRETURN4res:
     #     default:
     #         void;
     # };
+    __slots__ = ('lorr_status', 'lorr_stateid')
+
     def __init__(self, lorr_status=None, lorr_stateid=None):
         self.lorr_status = lorr_status
         self.lorr_stateid = lorr_stateid
@@ -4557,7 +4944,7 @@ class LAYOUTRETURN4res:
 
 SECINFO_NO_NAME4args = const.secinfo_style4
 SECINFO_NO_NAME4res = SECINFO4res
-class SEQUENCE4args:
+class SEQUENCE4args(object):
     # XDR definition:
     # struct SEQUENCE4args {
     #     sessionid4 sa_sessionid;
@@ -4566,6 +4953,8 @@ class SEQUENCE4args:
     #     slotid4 sa_highest_slotid;
     #     bool sa_cachethis;
     # };
+    __slots__ = ('sa_sessionid', 'sa_sequenceid', 'sa_slotid', 'sa_highest_slotid', 'sa_cachethis')
+
     def __init__(self, sa_sessionid=None, sa_sequenceid=None, sa_slotid=None, sa_highest_slotid=None, sa_cachethis=None):
         self.sa_sessionid = sa_sessionid
         self.sa_sequenceid = sa_sequenceid
@@ -4588,7 +4977,7 @@ class SEQUENCE4args:
         return 'SEQUENCE4args(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class SEQUENCE4resok:
+class SEQUENCE4resok(object):
     # XDR definition:
     # struct SEQUENCE4resok {
     #     sessionid4 sr_sessionid;
@@ -4598,6 +4987,8 @@ class SEQUENCE4resok:
     #     slotid4 sr_target_highest_slotid;
     #     uint32_t sr_status_flags;
     # };
+    __slots__ = ('sr_sessionid', 'sr_sequenceid', 'sr_slotid', 'sr_highest_slotid', 'sr_target_highest_slotid', 'sr_status_flags')
+
     def __init__(self, sr_sessionid=None, sr_sequenceid=None, sr_slotid=None, sr_highest_slotid=None, sr_target_highest_slotid=None, sr_status_flags=None):
         self.sr_sessionid = sr_sessionid
         self.sr_sequenceid = sr_sequenceid
@@ -4623,7 +5014,7 @@ class SEQUENCE4resok:
         return 'SEQUENCE4resok(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class SEQUENCE4res:
+class SEQUENCE4res(object):
     # XDR definition:
     # union SEQUENCE4res switch(nfsstat4 sr_status) {
     #     case NFS4_OK:
@@ -4631,6 +5022,8 @@ class SEQUENCE4res:
     #     default:
     #         void;
     # };
+    __slots__ = ('sr_status', 'sr_resok4')
+
     def __init__(self, sr_status=None, sr_resok4=None):
         self.sr_status = sr_status
         self.sr_resok4 = sr_resok4
@@ -4649,11 +5042,13 @@ class SEQUENCE4res:
         return 'SEQUENCE4res(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class ssa_digest_input4:
+class ssa_digest_input4(object):
     # XDR definition:
     # struct ssa_digest_input4 {
     #     SEQUENCE4args sdi_seqargs;
     # };
+    __slots__ = ('sdi_seqargs',)
+
     def __init__(self, sdi_seqargs=None):
         self.sdi_seqargs = sdi_seqargs
 
@@ -4667,12 +5062,14 @@ class ssa_digest_input4:
         return 'ssa_digest_input4(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class SET_SSV4args:
+class SET_SSV4args(object):
     # XDR definition:
     # struct SET_SSV4args {
     #     opaque ssa_ssv<>;
     #     opaque ssa_digest<>;
     # };
+    __slots__ = ('ssa_ssv', 'ssa_digest')
+
     def __init__(self, ssa_ssv=None, ssa_digest=None):
         self.ssa_ssv = ssa_ssv
         self.ssa_digest = ssa_digest
@@ -4686,11 +5083,13 @@ class SET_SSV4args:
         return 'SET_SSV4args(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class ssr_digest_input4:
+class ssr_digest_input4(object):
     # XDR definition:
     # struct ssr_digest_input4 {
     #     SEQUENCE4res sdi_seqres;
     # };
+    __slots__ = ('sdi_seqres',)
+
     def __init__(self, sdi_seqres=None):
         self.sdi_seqres = sdi_seqres
 
@@ -4704,11 +5103,13 @@ class ssr_digest_input4:
         return 'ssr_digest_input4(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class SET_SSV4resok:
+class SET_SSV4resok(object):
     # XDR definition:
     # struct SET_SSV4resok {
     #     opaque ssr_digest<>;
     # };
+    __slots__ = ('ssr_digest',)
+
     def __init__(self, ssr_digest=None):
         self.ssr_digest = ssr_digest
 
@@ -4719,7 +5120,7 @@ class SET_SSV4resok:
         return 'SET_SSV4resok(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class SET_SSV4res:
+class SET_SSV4res(object):
     # XDR definition:
     # union SET_SSV4res switch(nfsstat4 ssr_status) {
     #     case NFS4_OK:
@@ -4727,6 +5128,8 @@ class SET_SSV4res:
     #     default:
     #         void;
     # };
+    __slots__ = ('ssr_status', 'ssr_resok4')
+
     def __init__(self, ssr_status=None, ssr_resok4=None):
         self.ssr_status = ssr_status
         self.ssr_resok4 = ssr_resok4
@@ -4745,11 +5148,13 @@ class SET_SSV4res:
         return 'SET_SSV4res(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class TEST_STATEID4args:
+class TEST_STATEID4args(object):
     # XDR definition:
     # struct TEST_STATEID4args {
     #     stateid4 ts_stateids<>;
     # };
+    __slots__ = ('ts_stateids',)
+
     def __init__(self, ts_stateids=None):
         self.ts_stateids = ts_stateids
 
@@ -4760,11 +5165,13 @@ class TEST_STATEID4args:
         return 'TEST_STATEID4args(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class TEST_STATEID4resok:
+class TEST_STATEID4resok(object):
     # XDR definition:
     # struct TEST_STATEID4resok {
     #     nfsstat4 tsr_status_codes<>;
     # };
+    __slots__ = ('tsr_status_codes',)
+
     def __init__(self, tsr_status_codes=None):
         self.tsr_status_codes = tsr_status_codes
 
@@ -4775,7 +5182,7 @@ class TEST_STATEID4resok:
         return 'TEST_STATEID4resok(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class TEST_STATEID4res:
+class TEST_STATEID4res(object):
     # XDR definition:
     # union TEST_STATEID4res switch(nfsstat4 tsr_status) {
     #     case NFS4_OK:
@@ -4783,6 +5190,8 @@ class TEST_STATEID4res:
     #     default:
     #         void;
     # };
+    __slots__ = ('tsr_status', 'tsr_resok4')
+
     def __init__(self, tsr_status=None, tsr_resok4=None):
         self.tsr_status = tsr_status
         self.tsr_resok4 = tsr_resok4
@@ -4801,7 +5210,7 @@ class TEST_STATEID4res:
         return 'TEST_STATEID4res(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class deleg_claim4:
+class deleg_claim4(object):
     # XDR definition:
     # union deleg_claim4 switch(open_claim_type4 dc_claim) {
     #     case CLAIM_FH:
@@ -4811,6 +5220,8 @@ class deleg_claim4:
     #     case CLAIM_PREVIOUS:
     #         open_delegation_type4 dc_delegate_type;
     # };
+    __slots__ = ('dc_claim', 'dc_delegate_type')
+
     def __init__(self, dc_claim=None, dc_delegate_type=None):
         self.dc_claim = dc_claim
         self.dc_delegate_type = dc_delegate_type
@@ -4829,12 +5240,14 @@ class deleg_claim4:
         return 'deleg_claim4(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class WANT_DELEGATION4args:
+class WANT_DELEGATION4args(object):
     # XDR definition:
     # struct WANT_DELEGATION4args {
     #     uint32_t wda_want;
     #     deleg_claim4 wda_claim;
     # };
+    __slots__ = ('wda_want', 'wda_claim')
+
     def __init__(self, wda_want=None, wda_claim=None):
         self.wda_want = wda_want
         self.wda_claim = wda_claim
@@ -4851,7 +5264,7 @@ class WANT_DELEGATION4args:
         return 'WANT_DELEGATION4args(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class WANT_DELEGATION4res:
+class WANT_DELEGATION4res(object):
     # XDR definition:
     # union WANT_DELEGATION4res switch(nfsstat4 wdr_status) {
     #     case NFS4_OK:
@@ -4859,6 +5272,8 @@ class WANT_DELEGATION4res:
     #     default:
     #         void;
     # };
+    __slots__ = ('wdr_status', 'wdr_resok4')
+
     def __init__(self, wdr_status=None, wdr_resok4=None):
         self.wdr_status = wdr_status
         self.wdr_resok4 = wdr_resok4
@@ -4877,11 +5292,13 @@ class WANT_DELEGATION4res:
         return 'WANT_DELEGATION4res(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class DESTROY_CLIENTID4args:
+class DESTROY_CLIENTID4args(object):
     # XDR definition:
     # struct DESTROY_CLIENTID4args {
     #     clientid4 dca_clientid;
     # };
+    __slots__ = ('dca_clientid',)
+
     def __init__(self, dca_clientid=None):
         self.dca_clientid = dca_clientid
 
@@ -4892,11 +5309,13 @@ class DESTROY_CLIENTID4args:
         return 'DESTROY_CLIENTID4args(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class DESTROY_CLIENTID4res:
+class DESTROY_CLIENTID4res(object):
     # XDR definition:
     # struct DESTROY_CLIENTID4res {
     #     nfsstat4 dcr_status;
     # };
+    __slots__ = ('dcr_status',)
+
     def __init__(self, dcr_status=None):
         self.dcr_status = dcr_status
 
@@ -4907,11 +5326,13 @@ class DESTROY_CLIENTID4res:
         return 'DESTROY_CLIENTID4res(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class RECLAIM_COMPLETE4args:
+class RECLAIM_COMPLETE4args(object):
     # XDR definition:
     # struct RECLAIM_COMPLETE4args {
     #     bool rca_one_fs;
     # };
+    __slots__ = ('rca_one_fs',)
+
     def __init__(self, rca_one_fs=None):
         self.rca_one_fs = rca_one_fs
 
@@ -4922,11 +5343,13 @@ class RECLAIM_COMPLETE4args:
         return 'RECLAIM_COMPLETE4args(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class RECLAIM_COMPLETE4res:
+class RECLAIM_COMPLETE4res(object):
     # XDR definition:
     # struct RECLAIM_COMPLETE4res {
     #     nfsstat4 rcr_status;
     # };
+    __slots__ = ('rcr_status',)
+
     def __init__(self, rcr_status=None):
         self.rcr_status = rcr_status
 
@@ -4937,7 +5360,7 @@ class RECLAIM_COMPLETE4res:
         return 'RECLAIM_COMPLETE4res(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class nfs_argop4:
+class nfs_argop4(object):
     # XDR definition:
     # union nfs_argop4 switch(nfs_opnum4 argop) {
     #     case OP_ACCESS:
@@ -5055,6 +5478,8 @@ class nfs_argop4:
     #     case OP_ILLEGAL:
     #         void;
     # };
+    __slots__ = ('argop', 'opaccess', 'opclose', 'opcommit', 'opcreate', 'opdelegpurge', 'opdelegreturn', 'opgetattr', 'oplink', 'oplock', 'oplockt', 'oplocku', 'oplookup', 'opnverify', 'opopen', 'opopenattr', 'opopen_confirm', 'opopen_downgrade', 'opputfh', 'opread', 'opreaddir', 'opremove', 'oprename', 'oprenew', 'opsecinfo', 'opsetattr', 'opsetclientid', 'opsetclientid_confirm', 'opverify', 'opwrite', 'oprelease_lockowner', 'opbackchannel_ctl', 'opbind_conn_to_session', 'opexchange_id', 'opcreate_session', 'opdestroy_session', 'opfree_stateid', 'opget_dir_delegation', 'opgetdeviceinfo', 'opgetdevicelist', 'oplayoutcommit', 'oplayoutget', 'oplayoutreturn', 'opsecinfo_no_name', 'opsequence', 'opset_ssv', 'optest_stateid', 'opwant_delegation', 'opdestroy_clientid', 'opreclaim_complete')
+
     def __init__(self, argop=None, opaccess=None, opclose=None, opcommit=None, opcreate=None, opdelegpurge=None, opdelegreturn=None, opgetattr=None, oplink=None, oplock=None, oplockt=None, oplocku=None, oplookup=None, opnverify=None, opopen=None, opopenattr=None, opopen_confirm=None, opopen_downgrade=None, opputfh=None, opread=None, opreaddir=None, opremove=None, oprename=None, oprenew=None, opsecinfo=None, opsetattr=None, opsetclientid=None, opsetclientid_confirm=None, opverify=None, opwrite=None, oprelease_lockowner=None, opbackchannel_ctl=None, opbind_conn_to_session=None, opexchange_id=None, opcreate_session=None, opdestroy_session=None, opfree_stateid=None, opget_dir_delegation=None, opgetdeviceinfo=None, opgetdevicelist=None, oplayoutcommit=None, oplayoutget=None, oplayoutreturn=None, opsecinfo_no_name=None, opsequence=None, opset_ssv=None, optest_stateid=None, opwant_delegation=None, opdestroy_clientid=None, opreclaim_complete=None):
         self.argop = argop
         self.opaccess = opaccess
@@ -5217,7 +5642,7 @@ class nfs_argop4:
         return 'nfs_argop4(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class nfs_resop4:
+class nfs_resop4(object):
     # XDR definition:
     # union nfs_resop4 switch(nfs_opnum4 resop) {
     #     case OP_ACCESS:
@@ -5335,6 +5760,8 @@ class nfs_resop4:
     #     case OP_ILLEGAL:
     #         ILLEGAL4res opillegal;
     # };
+    __slots__ = ('resop', 'opaccess', 'opclose', 'opcommit', 'opcreate', 'opdelegpurge', 'opdelegreturn', 'opgetattr', 'opgetfh', 'oplink', 'oplock', 'oplockt', 'oplocku', 'oplookup', 'oplookupp', 'opnverify', 'opopen', 'opopenattr', 'opopen_confirm', 'opopen_downgrade', 'opputfh', 'opputpubfh', 'opputrootfh', 'opread', 'opreaddir', 'opreadlink', 'opremove', 'oprename', 'oprenew', 'oprestorefh', 'opsavefh', 'opsecinfo', 'opsetattr', 'opsetclientid', 'opsetclientid_confirm', 'opverify', 'opwrite', 'oprelease_lockowner', 'opbackchannel_ctl', 'opbind_conn_to_session', 'opexchange_id', 'opcreate_session', 'opdestroy_session', 'opfree_stateid', 'opget_dir_delegation', 'opgetdeviceinfo', 'opgetdevicelist', 'oplayoutcommit', 'oplayoutget', 'oplayoutreturn', 'opsecinfo_no_name', 'opsequence', 'opset_ssv', 'optest_stateid', 'opwant_delegation', 'opdestroy_clientid', 'opreclaim_complete', 'opillegal')
+
     def __init__(self, resop=None, opaccess=None, opclose=None, opcommit=None, opcreate=None, opdelegpurge=None, opdelegreturn=None, opgetattr=None, opgetfh=None, oplink=None, oplock=None, oplockt=None, oplocku=None, oplookup=None, oplookupp=None, opnverify=None, opopen=None, opopenattr=None, opopen_confirm=None, opopen_downgrade=None, opputfh=None, opputpubfh=None, opputrootfh=None, opread=None, opreaddir=None, opreadlink=None, opremove=None, oprename=None, oprenew=None, oprestorefh=None, opsavefh=None, opsecinfo=None, opsetattr=None, opsetclientid=None, opsetclientid_confirm=None, opverify=None, opwrite=None, oprelease_lockowner=None, opbackchannel_ctl=None, opbind_conn_to_session=None, opexchange_id=None, opcreate_session=None, opdestroy_session=None, opfree_stateid=None, opget_dir_delegation=None, opgetdeviceinfo=None, opgetdevicelist=None, oplayoutcommit=None, oplayoutget=None, oplayoutreturn=None, opsecinfo_no_name=None, opsequence=None, opset_ssv=None, optest_stateid=None, opwant_delegation=None, opdestroy_clientid=None, opreclaim_complete=None, opillegal=None):
         self.resop = resop
         self.opaccess = opaccess
@@ -5521,13 +5948,15 @@ class nfs_resop4:
         return 'nfs_resop4(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class COMPOUND4args:
+class COMPOUND4args(object):
     # XDR definition:
     # struct COMPOUND4args {
     #     utf8str_cs tag;
     #     uint32_t minorversion;
     #     nfs_argop4 argarray<>;
     # };
+    __slots__ = ('tag', 'minorversion', 'argarray')
+
     def __init__(self, tag=None, minorversion=None, argarray=None):
         self.tag = tag
         self.minorversion = minorversion
@@ -5544,13 +5973,15 @@ class COMPOUND4args:
         return 'COMPOUND4args(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class COMPOUND4res:
+class COMPOUND4res(object):
     # XDR definition:
     # struct COMPOUND4res {
     #     nfsstat4 status;
     #     utf8str_cs tag;
     #     nfs_resop4 resarray<>;
     # };
+    __slots__ = ('status', 'tag', 'resarray')
+
     def __init__(self, status=None, tag=None, resarray=None):
         self.status = status
         self.tag = tag
@@ -5567,12 +5998,14 @@ class COMPOUND4res:
         return 'COMPOUND4res(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class CB_GETATTR4args:
+class CB_GETATTR4args(object):
     # XDR definition:
     # struct CB_GETATTR4args {
     #     nfs_fh4 fh;
     #     bitmap4 attr_request;
     # };
+    __slots__ = ('fh', 'attr_request')
+
     def __init__(self, fh=None, attr_request=None):
         self.fh = fh
         self.attr_request = attr_request
@@ -5586,11 +6019,13 @@ class CB_GETATTR4args:
         return 'CB_GETATTR4args(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class CB_GETATTR4resok:
+class CB_GETATTR4resok(object):
     # XDR definition:
     # struct CB_GETATTR4resok {
     #     fattr4 obj_attributes;
     # };
+    __slots__ = ('obj_attributes',)
+
     def __init__(self, obj_attributes=None):
         self.obj_attributes = obj_attributes
 
@@ -5604,7 +6039,7 @@ class CB_GETATTR4resok:
         return 'CB_GETATTR4resok(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class CB_GETATTR4res:
+class CB_GETATTR4res(object):
     # XDR definition:
     # union CB_GETATTR4res switch(nfsstat4 status) {
     #     case NFS4_OK:
@@ -5612,6 +6047,8 @@ class CB_GETATTR4res:
     #     default:
     #         void;
     # };
+    __slots__ = ('status', 'resok4')
+
     def __init__(self, status=None, resok4=None):
         self.status = status
         self.resok4 = resok4
@@ -5630,13 +6067,15 @@ class CB_GETATTR4res:
         return 'CB_GETATTR4res(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class CB_RECALL4args:
+class CB_RECALL4args(object):
     # XDR definition:
     # struct CB_RECALL4args {
     #     stateid4 stateid;
     #     bool truncate;
     #     nfs_fh4 fh;
     # };
+    __slots__ = ('stateid', 'truncate', 'fh')
+
     def __init__(self, stateid=None, truncate=None, fh=None):
         self.stateid = stateid
         self.truncate = truncate
@@ -5656,11 +6095,13 @@ class CB_RECALL4args:
         return 'CB_RECALL4args(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class CB_RECALL4res:
+class CB_RECALL4res(object):
     # XDR definition:
     # struct CB_RECALL4res {
     #     nfsstat4 status;
     # };
+    __slots__ = ('status',)
+
     def __init__(self, status=None):
         self.status = status
 
@@ -5671,11 +6112,13 @@ class CB_RECALL4res:
         return 'CB_RECALL4res(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class CB_ILLEGAL4res:
+class CB_ILLEGAL4res(object):
     # XDR definition:
     # struct CB_ILLEGAL4res {
     #     nfsstat4 status;
     # };
+    __slots__ = ('status',)
+
     def __init__(self, status=None):
         self.status = status
 
@@ -5686,7 +6129,7 @@ class CB_ILLEGAL4res:
         return 'CB_ILLEGAL4res(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class layoutrecall_file4:
+class layoutrecall_file4(object):
     # XDR definition:
     # struct layoutrecall_file4 {
     #     nfs_fh4 lor_fh;
@@ -5694,6 +6137,8 @@ class layoutrecall_file4:
     #     length4 lor_length;
     #     stateid4 lor_stateid;
     # };
+    __slots__ = ('lor_fh', 'lor_offset', 'lor_length', 'lor_stateid')
+
     def __init__(self, lor_fh=None, lor_offset=None, lor_length=None, lor_stateid=None):
         self.lor_fh = lor_fh
         self.lor_offset = lor_offset
@@ -5716,7 +6161,7 @@ class layoutrecall_file4:
         return 'layoutrecall_file4(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class layoutrecall4:
+class layoutrecall4(object):
     # XDR definition:
     # union layoutrecall4 switch(layoutrecall_type4 lor_recalltype) {
     #     case LAYOUTRECALL4_FILE:
@@ -5726,6 +6171,8 @@ class layoutrecall4:
     #     case LAYOUTRECALL4_ALL:
     #         void;
     # };
+    __slots__ = ('lor_recalltype', 'lor_layout', 'lor_fsid')
+
     def __init__(self, lor_recalltype=None, lor_layout=None, lor_fsid=None):
         self.lor_recalltype = lor_recalltype
         self.lor_layout = lor_layout
@@ -5747,7 +6194,7 @@ class layoutrecall4:
         return 'layoutrecall4(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class CB_LAYOUTRECALL4args:
+class CB_LAYOUTRECALL4args(object):
     # XDR definition:
     # struct CB_LAYOUTRECALL4args {
     #     layouttype4 clora_type;
@@ -5755,6 +6202,8 @@ class CB_LAYOUTRECALL4args:
     #     bool clora_changed;
     #     layoutrecall4 clora_recall;
     # };
+    __slots__ = ('clora_type', 'clora_iomode', 'clora_changed', 'clora_recall')
+
     def __init__(self, clora_type=None, clora_iomode=None, clora_changed=None, clora_recall=None):
         self.clora_type = clora_type
         self.clora_iomode = clora_iomode
@@ -5777,11 +6226,13 @@ class CB_LAYOUTRECALL4args:
         return 'CB_LAYOUTRECALL4args(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class CB_LAYOUTRECALL4res:
+class CB_LAYOUTRECALL4res(object):
     # XDR definition:
     # struct CB_LAYOUTRECALL4res {
     #     nfsstat4 clorr_status;
     # };
+    __slots__ = ('clorr_status',)
+
     def __init__(self, clorr_status=None):
         self.clorr_status = clorr_status
 
@@ -5792,12 +6243,14 @@ class CB_LAYOUTRECALL4res:
         return 'CB_LAYOUTRECALL4res(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class notify_entry4:
+class notify_entry4(object):
     # XDR definition:
     # struct notify_entry4 {
     #     component4 ne_file;
     #     fattr4 ne_attrs;
     # };
+    __slots__ = ('ne_file', 'ne_attrs')
+
     def __init__(self, ne_file=None, ne_attrs=None):
         self.ne_file = ne_file
         self.ne_attrs = ne_attrs
@@ -5814,12 +6267,14 @@ class notify_entry4:
         return 'notify_entry4(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class prev_entry4:
+class prev_entry4(object):
     # XDR definition:
     # struct prev_entry4 {
     #     notify_entry4 pe_prev_entry;
     #     nfs_cookie4 pe_prev_entry_cookie;
     # };
+    __slots__ = ('pe_prev_entry', 'pe_prev_entry_cookie')
+
     def __init__(self, pe_prev_entry=None, pe_prev_entry_cookie=None):
         self.pe_prev_entry = pe_prev_entry
         self.pe_prev_entry_cookie = pe_prev_entry_cookie
@@ -5836,12 +6291,14 @@ class prev_entry4:
         return 'prev_entry4(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class notify_remove4:
+class notify_remove4(object):
     # XDR definition:
     # struct notify_remove4 {
     #     notify_entry4 nrm_old_entry;
     #     nfs_cookie4 nrm_old_entry_cookie;
     # };
+    __slots__ = ('nrm_old_entry', 'nrm_old_entry_cookie')
+
     def __init__(self, nrm_old_entry=None, nrm_old_entry_cookie=None):
         self.nrm_old_entry = nrm_old_entry
         self.nrm_old_entry_cookie = nrm_old_entry_cookie
@@ -5858,7 +6315,7 @@ class notify_remove4:
         return 'notify_remove4(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class notify_add4:
+class notify_add4(object):
     # XDR definition:
     # struct notify_add4 {
     #     notify_remove4 nad_old_entry<1>;
@@ -5867,6 +6324,8 @@ class notify_add4:
     #     prev_entry4 nad_prev_entry<1>;
     #     bool nad_last_entry;
     # };
+    __slots__ = ('nad_old_entry', 'nad_new_entry', 'nad_new_entry_cookie', 'nad_prev_entry', 'nad_last_entry')
+
     def __init__(self, nad_old_entry=None, nad_new_entry=None, nad_new_entry_cookie=None, nad_prev_entry=None, nad_last_entry=None):
         self.nad_old_entry = nad_old_entry
         self.nad_new_entry = nad_new_entry
@@ -5892,11 +6351,13 @@ class notify_add4:
         return 'notify_add4(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class notify_attr4:
+class notify_attr4(object):
     # XDR definition:
     # struct notify_attr4 {
     #     notify_entry4 na_changed_entry;
     # };
+    __slots__ = ('na_changed_entry',)
+
     def __init__(self, na_changed_entry=None):
         self.na_changed_entry = na_changed_entry
 
@@ -5910,12 +6371,14 @@ class notify_attr4:
         return 'notify_attr4(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class notify_rename4:
+class notify_rename4(object):
     # XDR definition:
     # struct notify_rename4 {
     #     notify_remove4 nrn_old_entry;
     #     notify_add4 nrn_new_entry;
     # };
+    __slots__ = ('nrn_old_entry', 'nrn_new_entry')
+
     def __init__(self, nrn_old_entry=None, nrn_new_entry=None):
         self.nrn_old_entry = nrn_old_entry
         self.nrn_new_entry = nrn_new_entry
@@ -5929,12 +6392,14 @@ class notify_rename4:
         return 'notify_rename4(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class notify_verifier4:
+class notify_verifier4(object):
     # XDR definition:
     # struct notify_verifier4 {
     #     verifier4 nv_old_cookieverf;
     #     verifier4 nv_new_cookieverf;
     # };
+    __slots__ = ('nv_old_cookieverf', 'nv_new_cookieverf')
+
     def __init__(self, nv_old_cookieverf=None, nv_new_cookieverf=None):
         self.nv_old_cookieverf = nv_old_cookieverf
         self.nv_new_cookieverf = nv_new_cookieverf
@@ -5948,12 +6413,14 @@ class notify_verifier4:
         return 'notify_verifier4(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class notify4:
+class notify4(object):
     # XDR definition:
     # struct notify4 {
     #     bitmap4 notify_mask;
     #     notifylist4 notify_vals;
     # };
+    __slots__ = ('notify_mask', 'notify_vals')
+
     def __init__(self, notify_mask=None, notify_vals=None):
         self.notify_mask = notify_mask
         self.notify_vals = notify_vals
@@ -5967,13 +6434,15 @@ class notify4:
         return 'notify4(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class CB_NOTIFY4args:
+class CB_NOTIFY4args(object):
     # XDR definition:
     # struct CB_NOTIFY4args {
     #     stateid4 cna_stateid;
     #     nfs_fh4 cna_fh;
     #     notify4 cna_changes<>;
     # };
+    __slots__ = ('cna_stateid', 'cna_fh', 'cna_changes')
+
     def __init__(self, cna_stateid=None, cna_fh=None, cna_changes=None):
         self.cna_stateid = cna_stateid
         self.cna_fh = cna_fh
@@ -5993,11 +6462,13 @@ class CB_NOTIFY4args:
         return 'CB_NOTIFY4args(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class CB_NOTIFY4res:
+class CB_NOTIFY4res(object):
     # XDR definition:
     # struct CB_NOTIFY4res {
     #     nfsstat4 cnr_status;
     # };
+    __slots__ = ('cnr_status',)
+
     def __init__(self, cnr_status=None):
         self.cnr_status = cnr_status
 
@@ -6008,12 +6479,14 @@ class CB_NOTIFY4res:
         return 'CB_NOTIFY4res(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class CB_PUSH_DELEG4args:
+class CB_PUSH_DELEG4args(object):
     # XDR definition:
     # struct CB_PUSH_DELEG4args {
     #     nfs_fh4 cpda_fh;
     #     open_delegation4 cpda_delegation;
     # };
+    __slots__ = ('cpda_fh', 'cpda_delegation')
+
     def __init__(self, cpda_fh=None, cpda_delegation=None):
         self.cpda_fh = cpda_fh
         self.cpda_delegation = cpda_delegation
@@ -6030,11 +6503,13 @@ class CB_PUSH_DELEG4args:
         return 'CB_PUSH_DELEG4args(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class CB_PUSH_DELEG4res:
+class CB_PUSH_DELEG4res(object):
     # XDR definition:
     # struct CB_PUSH_DELEG4res {
     #     nfsstat4 cpdr_status;
     # };
+    __slots__ = ('cpdr_status',)
+
     def __init__(self, cpdr_status=None):
         self.cpdr_status = cpdr_status
 
@@ -6045,12 +6520,14 @@ class CB_PUSH_DELEG4res:
         return 'CB_PUSH_DELEG4res(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class CB_RECALL_ANY4args:
+class CB_RECALL_ANY4args(object):
     # XDR definition:
     # struct CB_RECALL_ANY4args {
     #     uint32_t craa_objects_to_keep;
     #     bitmap4 craa_type_mask;
     # };
+    __slots__ = ('craa_objects_to_keep', 'craa_type_mask')
+
     def __init__(self, craa_objects_to_keep=None, craa_type_mask=None):
         self.craa_objects_to_keep = craa_objects_to_keep
         self.craa_type_mask = craa_type_mask
@@ -6064,11 +6541,13 @@ class CB_RECALL_ANY4args:
         return 'CB_RECALL_ANY4args(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class CB_RECALL_ANY4res:
+class CB_RECALL_ANY4res(object):
     # XDR definition:
     # struct CB_RECALL_ANY4res {
     #     nfsstat4 crar_status;
     # };
+    __slots__ = ('crar_status',)
+
     def __init__(self, crar_status=None):
         self.crar_status = crar_status
 
@@ -6080,11 +6559,13 @@ class CB_RECALL_ANY4res:
     __str__ = __repr__
 
 CB_RECALLABLE_OBJ_AVAIL4args = CB_RECALL_ANY4args
-class CB_RECALLABLE_OBJ_AVAIL4res:
+class CB_RECALLABLE_OBJ_AVAIL4res(object):
     # XDR definition:
     # struct CB_RECALLABLE_OBJ_AVAIL4res {
     #     nfsstat4 croa_status;
     # };
+    __slots__ = ('croa_status',)
+
     def __init__(self, croa_status=None):
         self.croa_status = croa_status
 
@@ -6095,11 +6576,13 @@ class CB_RECALLABLE_OBJ_AVAIL4res:
         return 'CB_RECALLABLE_OBJ_AVAIL4res(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class CB_RECALL_SLOT4args:
+class CB_RECALL_SLOT4args(object):
     # XDR definition:
     # struct CB_RECALL_SLOT4args {
     #     slotid4 rsa_target_highest_slotid;
     # };
+    __slots__ = ('rsa_target_highest_slotid',)
+
     def __init__(self, rsa_target_highest_slotid=None):
         self.rsa_target_highest_slotid = rsa_target_highest_slotid
 
@@ -6110,11 +6593,13 @@ class CB_RECALL_SLOT4args:
         return 'CB_RECALL_SLOT4args(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class CB_RECALL_SLOT4res:
+class CB_RECALL_SLOT4res(object):
     # XDR definition:
     # struct CB_RECALL_SLOT4res {
     #     nfsstat4 rsr_status;
     # };
+    __slots__ = ('rsr_status',)
+
     def __init__(self, rsr_status=None):
         self.rsr_status = rsr_status
 
@@ -6125,12 +6610,14 @@ class CB_RECALL_SLOT4res:
         return 'CB_RECALL_SLOT4res(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class referring_call4:
+class referring_call4(object):
     # XDR definition:
     # struct referring_call4 {
     #     sequenceid4 rc_sequenceid;
     #     slotid4 rc_slotid;
     # };
+    __slots__ = ('rc_sequenceid', 'rc_slotid')
+
     def __init__(self, rc_sequenceid=None, rc_slotid=None):
         self.rc_sequenceid = rc_sequenceid
         self.rc_slotid = rc_slotid
@@ -6144,12 +6631,14 @@ class referring_call4:
         return 'referring_call4(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class referring_call_list4:
+class referring_call_list4(object):
     # XDR definition:
     # struct referring_call_list4 {
     #     sessionid4 rcl_sessionid;
     #     referring_call4 rcl_referring_calls<>;
     # };
+    __slots__ = ('rcl_sessionid', 'rcl_referring_calls')
+
     def __init__(self, rcl_sessionid=None, rcl_referring_calls=None):
         self.rcl_sessionid = rcl_sessionid
         self.rcl_referring_calls = rcl_referring_calls
@@ -6163,7 +6652,7 @@ class referring_call_list4:
         return 'referring_call_list4(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class CB_SEQUENCE4args:
+class CB_SEQUENCE4args(object):
     # XDR definition:
     # struct CB_SEQUENCE4args {
     #     sessionid4 csa_sessionid;
@@ -6173,6 +6662,8 @@ class CB_SEQUENCE4args:
     #     bool csa_cachethis;
     #     referring_call_list4 csa_referring_call_lists<>;
     # };
+    __slots__ = ('csa_sessionid', 'csa_sequenceid', 'csa_slotid', 'csa_highest_slotid', 'csa_cachethis', 'csa_referring_call_lists')
+
     def __init__(self, csa_sessionid=None, csa_sequenceid=None, csa_slotid=None, csa_highest_slotid=None, csa_cachethis=None, csa_referring_call_lists=None):
         self.csa_sessionid = csa_sessionid
         self.csa_sequenceid = csa_sequenceid
@@ -6198,7 +6689,7 @@ class CB_SEQUENCE4args:
         return 'CB_SEQUENCE4args(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class CB_SEQUENCE4resok:
+class CB_SEQUENCE4resok(object):
     # XDR definition:
     # struct CB_SEQUENCE4resok {
     #     sessionid4 csr_sessionid;
@@ -6207,6 +6698,8 @@ class CB_SEQUENCE4resok:
     #     slotid4 csr_highest_slotid;
     #     slotid4 csr_target_highest_slotid;
     # };
+    __slots__ = ('csr_sessionid', 'csr_sequenceid', 'csr_slotid', 'csr_highest_slotid', 'csr_target_highest_slotid')
+
     def __init__(self, csr_sessionid=None, csr_sequenceid=None, csr_slotid=None, csr_highest_slotid=None, csr_target_highest_slotid=None):
         self.csr_sessionid = csr_sessionid
         self.csr_sequenceid = csr_sequenceid
@@ -6229,7 +6722,7 @@ class CB_SEQUENCE4resok:
         return 'CB_SEQUENCE4resok(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class CB_SEQUENCE4res:
+class CB_SEQUENCE4res(object):
     # XDR definition:
     # union CB_SEQUENCE4res switch(nfsstat4 csr_status) {
     #     case NFS4_OK:
@@ -6237,6 +6730,8 @@ class CB_SEQUENCE4res:
     #     default:
     #         void;
     # };
+    __slots__ = ('csr_status', 'csr_resok4')
+
     def __init__(self, csr_status=None, csr_resok4=None):
         self.csr_status = csr_status
         self.csr_resok4 = csr_resok4
@@ -6255,12 +6750,14 @@ class CB_SEQUENCE4res:
         return 'CB_SEQUENCE4res(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class CB_WANTS_CANCELLED4args:
+class CB_WANTS_CANCELLED4args(object):
     # XDR definition:
     # struct CB_WANTS_CANCELLED4args {
     #     bool cwca_contended_wants_cancelled;
     #     bool cwca_resourced_wants_cancelled;
     # };
+    __slots__ = ('cwca_contended_wants_cancelled', 'cwca_resourced_wants_cancelled')
+
     def __init__(self, cwca_contended_wants_cancelled=None, cwca_resourced_wants_cancelled=None):
         self.cwca_contended_wants_cancelled = cwca_contended_wants_cancelled
         self.cwca_resourced_wants_cancelled = cwca_resourced_wants_cancelled
@@ -6274,11 +6771,13 @@ class CB_WANTS_CANCELLED4args:
         return 'CB_WANTS_CANCELLED4args(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class CB_WANTS_CANCELLED4res:
+class CB_WANTS_CANCELLED4res(object):
     # XDR definition:
     # struct CB_WANTS_CANCELLED4res {
     #     nfsstat4 cwcr_status;
     # };
+    __slots__ = ('cwcr_status',)
+
     def __init__(self, cwcr_status=None):
         self.cwcr_status = cwcr_status
 
@@ -6289,12 +6788,14 @@ class CB_WANTS_CANCELLED4res:
         return 'CB_WANTS_CANCELLED4res(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class CB_NOTIFY_LOCK4args:
+class CB_NOTIFY_LOCK4args(object):
     # XDR definition:
     # struct CB_NOTIFY_LOCK4args {
     #     nfs_fh4 cnla_fh;
     #     lock_owner4 cnla_lock_owner;
     # };
+    __slots__ = ('cnla_fh', 'cnla_lock_owner')
+
     def __init__(self, cnla_fh=None, cnla_lock_owner=None):
         self.cnla_fh = cnla_fh
         self.cnla_lock_owner = cnla_lock_owner
@@ -6311,11 +6812,13 @@ class CB_NOTIFY_LOCK4args:
         return 'CB_NOTIFY_LOCK4args(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class CB_NOTIFY_LOCK4res:
+class CB_NOTIFY_LOCK4res(object):
     # XDR definition:
     # struct CB_NOTIFY_LOCK4res {
     #     nfsstat4 cnlr_status;
     # };
+    __slots__ = ('cnlr_status',)
+
     def __init__(self, cnlr_status=None):
         self.cnlr_status = cnlr_status
 
@@ -6326,12 +6829,14 @@ class CB_NOTIFY_LOCK4res:
         return 'CB_NOTIFY_LOCK4res(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class notify_deviceid_delete4:
+class notify_deviceid_delete4(object):
     # XDR definition:
     # struct notify_deviceid_delete4 {
     #     layouttype4 ndd_layouttype;
     #     deviceid4 ndd_deviceid;
     # };
+    __slots__ = ('ndd_layouttype', 'ndd_deviceid')
+
     def __init__(self, ndd_layouttype=None, ndd_deviceid=None):
         self.ndd_layouttype = ndd_layouttype
         self.ndd_deviceid = ndd_deviceid
@@ -6345,13 +6850,15 @@ class notify_deviceid_delete4:
         return 'notify_deviceid_delete4(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class notify_deviceid_change4:
+class notify_deviceid_change4(object):
     # XDR definition:
     # struct notify_deviceid_change4 {
     #     layouttype4 ndc_layouttype;
     #     deviceid4 ndc_deviceid;
     #     bool ndc_immediate;
     # };
+    __slots__ = ('ndc_layouttype', 'ndc_deviceid', 'ndc_immediate')
+
     def __init__(self, ndc_layouttype=None, ndc_deviceid=None, ndc_immediate=None):
         self.ndc_layouttype = ndc_layouttype
         self.ndc_deviceid = ndc_deviceid
@@ -6368,11 +6875,13 @@ class notify_deviceid_change4:
         return 'notify_deviceid_change4(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class CB_NOTIFY_DEVICEID4args:
+class CB_NOTIFY_DEVICEID4args(object):
     # XDR definition:
     # struct CB_NOTIFY_DEVICEID4args {
     #     notify4 cnda_changes<>;
     # };
+    __slots__ = ('cnda_changes',)
+
     def __init__(self, cnda_changes=None):
         self.cnda_changes = cnda_changes
 
@@ -6383,11 +6892,13 @@ class CB_NOTIFY_DEVICEID4args:
         return 'CB_NOTIFY_DEVICEID4args(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class CB_NOTIFY_DEVICEID4res:
+class CB_NOTIFY_DEVICEID4res(object):
     # XDR definition:
     # struct CB_NOTIFY_DEVICEID4res {
     #     nfsstat4 cndr_status;
     # };
+    __slots__ = ('cndr_status',)
+
     def __init__(self, cndr_status=None):
         self.cndr_status = cndr_status
 
@@ -6398,7 +6909,7 @@ class CB_NOTIFY_DEVICEID4res:
         return 'CB_NOTIFY_DEVICEID4res(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class nfs_cb_argop4:
+class nfs_cb_argop4(object):
     # XDR definition:
     # union nfs_cb_argop4 switch(nfs_cb_opnum4 argop) {
     #     case OP_CB_GETATTR:
@@ -6428,6 +6939,8 @@ class nfs_cb_argop4:
     #     case OP_CB_ILLEGAL:
     #         void;
     # };
+    __slots__ = ('argop', 'opcbgetattr', 'opcbrecall', 'opcblayoutrecall', 'opcbnotify', 'opcbpush_deleg', 'opcbrecall_any', 'opcbrecallable_obj_avail', 'opcbrecall_slot', 'opcbsequence', 'opcbwants_cancelled', 'opcbnotify_lock', 'opcbnotify_deviceid')
+
     def __init__(self, argop=None, opcbgetattr=None, opcbrecall=None, opcblayoutrecall=None, opcbnotify=None, opcbpush_deleg=None, opcbrecall_any=None, opcbrecallable_obj_avail=None, opcbrecall_slot=None, opcbsequence=None, opcbwants_cancelled=None, opcbnotify_lock=None, opcbnotify_deviceid=None):
         self.argop = argop
         self.opcbgetattr = opcbgetattr
@@ -6479,7 +6992,7 @@ class nfs_cb_argop4:
         return 'nfs_cb_argop4(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class nfs_cb_resop4:
+class nfs_cb_resop4(object):
     # XDR definition:
     # union nfs_cb_resop4 switch(nfs_cb_opnum4 resop) {
     #     case OP_CB_GETATTR:
@@ -6509,6 +7022,8 @@ class nfs_cb_resop4:
     #     case OP_CB_ILLEGAL:
     #         CB_ILLEGAL4res opcbillegal;
     # };
+    __slots__ = ('resop', 'opcbgetattr', 'opcbrecall', 'opcblayoutrecall', 'opcbnotify', 'opcbpush_deleg', 'opcbrecall_any', 'opcbrecallable_obj_avail', 'opcbrecall_slot', 'opcbsequence', 'opcbwants_cancelled', 'opcbnotify_lock', 'opcbnotify_deviceid', 'opcbillegal')
+
     def __init__(self, resop=None, opcbgetattr=None, opcbrecall=None, opcblayoutrecall=None, opcbnotify=None, opcbpush_deleg=None, opcbrecall_any=None, opcbrecallable_obj_avail=None, opcbrecall_slot=None, opcbsequence=None, opcbwants_cancelled=None, opcbnotify_lock=None, opcbnotify_deviceid=None, opcbillegal=None):
         self.resop = resop
         self.opcbgetattr = opcbgetattr
@@ -6563,7 +7078,7 @@ class nfs_cb_resop4:
         return 'nfs_cb_resop4(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class CB_COMPOUND4args:
+class CB_COMPOUND4args(object):
     # XDR definition:
     # struct CB_COMPOUND4args {
     #     utf8str_cs tag;
@@ -6571,6 +7086,8 @@ class CB_COMPOUND4args:
     #     uint32_t callback_ident;
     #     nfs_cb_argop4 argarray<>;
     # };
+    __slots__ = ('tag', 'minorversion', 'callback_ident', 'argarray')
+
     def __init__(self, tag=None, minorversion=None, callback_ident=None, argarray=None):
         self.tag = tag
         self.minorversion = minorversion
@@ -6590,13 +7107,15 @@ class CB_COMPOUND4args:
         return 'CB_COMPOUND4args(%s)' % ', '.join(out)
     __str__ = __repr__
 
-class CB_COMPOUND4res:
+class CB_COMPOUND4res(object):
     # XDR definition:
     # struct CB_COMPOUND4res {
     #     nfsstat4 status;
     #     utf8str_cs tag;
     #     nfs_cb_resop4 resarray<>;
     # };
+    __slots__ = ('status', 'tag', 'resarray')
+
     def __init__(self, status=None, tag=None, resarray=None):
         self.status = status
         self.tag = tag
@@ -1,5 +1,11 @@
+import zlib
+import types
+import hashlib
+import collections
 import nfs4_pack
 import nfs4_const
+import nfs4_type
+import nfs4_opattr
 
 # Static FATTR4 dictionaries that are created from nfs4_const data
 attr2bitnum = {}
@@ -32,6 +38,47 @@ def set_attrbit_dicts():
 # Actually set the dictionaries
 set_attrbit_dicts()
 
+def _getstate(self):
+    return dict((name, getattr(self, name)) for name in self.__slots__)
+
+def _setstate(self, state):
+    for name, value in state.iteritems():
+        setattr(self, name, value)
+
+def set_pickle_methods():
+    """Set pickle methods on all the classes in nfs4_type.
+
+    Note: Most of these classes define __getattr__ to delegate attribute
+    lookups to one of their members. When unpickling, the object is created
+    empty and the lookup for __setstate__ goes through __getattr__ which
+    never ends since the delegated member does not exist yet. Defining the
+    pickle methods on the class avoids the use of __getattr__.
+    """
+    for name in dir(nfs4_type):
+        obj = getattr(nfs4_type, name)
+        if type(obj) is type and obj.__module__ == nfs4_type.__name__:
+            obj.__getstate__ = _getstate
+            obj.__setstate__ = _setstate
+# Objects can be pickled, e.g., to be sent to another process
+set_pickle_methods()
+
+def get_opattr_map(isarg):
+    """Return a dictionary of attribute names mapping to the set of operation
+       numbers where the attribute is reachable from the operation object
+       of a compound, e.g., nfs_argop4(argop=OP_WRITE).stateid is reachable
+       so the set for 'stateid' on the arguments includes OP_WRITE.
+
+       The map includes both NFS and callback operations, the maps are
+       created from nfs4_type by tools/create_opattr.py.
+
+       isarg:
+           Return map for arguments (nfs_argop4) if True,
+           else return map for results (nfs_resop4)
+    """
+    if isarg:
+        return nfs4_opattr.opattr_args
+    return nfs4_opattr.opattr_res
+
 class FancyNFS4Unpacker(nfs4_pack.NFS4Unpacker):
     def filter_bitmap4(self, data):
         """Put bitmap into single long, instead of array of 32bit chunks"""
@@ -43,8 +90,8 @@ class FancyNFS4Unpacker(nfs4_pack.NFS4Unpacker):
         return out
 
     def filter_fattr4(self, data):
-        """Return as dict, instead of opaque attrlist"""
-        return fattr2dict(data)
+        """Return as lazy dict, instead of opaque attrlist"""
+        return FattrDict(data)
 
     def filter_layout_content4(self, data):
         """Unpack layout content"""
@@ -60,6 +107,168 @@ class FancyNFS4Unpacker(nfs4_pack.NFS4Unpacker):
             data.da_addr_body = u.unpack_nfsv4_1_file_layout_ds_addr4()
         return data
             
+class FattrDict(collections.Mapping):
+    """Read-only dictionary of attribute values of a fattr4 object.
+
+    The attribute bit numbers are known from the attribute mask but the
+    values are decoded from the opaque attrlist only when they are first
+    accessed. Since the attribute values are encoded one after the other,
+    accessing an attribute decodes all the attributes before it which have
+    not been decoded yet. Any decoding error is raised on access.
+    """
+    def __init__(self, obj):
+        self._bitlist = bitmap2list(obj.attrmask)
+        self._attr_vals = obj.attr_vals
+        self._values = {}
+        self._index = 0   # Index in self._bitlist of next attribute to decode
+        self._offset = 0  # Offset in self._attr_vals of next attribute
+
+    def _decode(self, bitnum=None):
+        """Decode attributes up to the given bit number or all of them"""
+        unpacker = FancyNFS4Unpacker(self._attr_vals)
+        unpacker.set_position(self._offset)
+        count = len(self._bitlist)
+        while self._index < count:
+            bnum = self._bitlist[self._index]
+            self._values[bnum] = getattr(unpacker, bitnum2unpacker[bnum])()
+            self._index += 1
+            self._offset = unpacker.get_position()
+            if bnum == bitnum:
+                break
+        if self._index == count:
+            # All attributes have been decoded
+            unpacker.done()
+            self._attr_vals = None
+
+    def __getitem__(self, bitnum):
+        try:
+            return self._values[bitnum]
+        except KeyError:
+            if bitnum not in self._bitlist:
+                raise
+        self._decode(bitnum)
+        return self._values[bitnum]
+
+    def __contains__(self, bitnum):
+        return bitnum in self._bitlist
+
+    def __iter__(self):
+        return iter(self._bitlist)
+
+    def __len__(self):
+        return len(self._bitlist)
+
+    def __repr__(self):
+        if self._attr_vals is not None:
+            self._decode()
+        return repr(self._values)
+    __str__ = __repr__
+
+class Payload(object):
+    """Read-only view of the data of a READ reply or a WRITE call.
+
+    The data is not copied out of the packet buffer, the object keeps a
+    reference to the buffer together with the offset and length of the
+    data. The data is returned as a string only when needed, e.g., by
+    str() or when comparing it to a string, while len(), crc32() and
+    digest() use the packet buffer directly. The checksums are cached.
+    The data is copied if the packet buffer is a view of a memory mapped
+    trace file since the file could be unmapped before the data is used.
+    """
+    def __init__(self, buf, offset, size):
+        self._buf = buf
+        self._offset = offset
+        self._size = size
+        self._crc32 = None
+        self._digests = {}
+
+    def _view(self):
+        """Return a buffer object for the data without copying it"""
+        return buffer(self._buf, self._offset, self._size)
+
+    def __len__(self):
+        return self._size
+
+    def __str__(self):
+        return self._buf[self._offset:self._offset+self._size]
+
+    def __repr__(self):
+        return repr(str(self))
+
+    def __getitem__(self, index):
+        return str(self)[index]
+
+    def __eq__(self, other):
+        if isinstance(other, Payload):
+            other = other._view()
+        elif isinstance(other, str):
+            other = buffer(other)
+        else:
+            return NotImplemented
+        return len(other) == self._size and self._view() == other
+
+    def __ne__(self, other):
+        ret = self.__eq__(other)
+        if ret is NotImplemented:
+            return ret
+        return not ret
+
+    def __hash__(self):
+        return hash(str(self))
+
+    def __reduce__(self):
+        # Only the data is pickled, not the whole packet buffer
+        return (Payload, (str(self), 0, self._size))
+
+    def crc32(self):
+        """Return the CRC-32 of the data as an unsigned integer"""
+        if self._crc32 is None:
+            self._crc32 = zlib.crc32(self._view()) & 0xffffffff
+        return self._crc32
+
+    def digest(self, name="md5"):
+        """Return the hexadecimal digest of the data using the hashlib
+        algorithm given by name
+        """
+        ret = self._digests.get(name)
+        if ret is None:
+            ret = hashlib.new(name, self._view()).hexdigest()
+            self._digests[name] = ret
+        return ret
+
+class PayloadNFS4Unpacker(FancyNFS4Unpacker):
+    """Unpack the data of READ replies and WRITE calls as Payload objects"""
+    def unpack_payload(self):
+        """Unpack variable length opaque as a Payload object"""
+        size = self.unpack_uint()
+        offset = self.get_position()
+        buf = self.get_buffer()
+        if offset + size > len(buf):
+            raise EOFError
+        self.set_position(offset + (size+3)//4*4)
+        if isinstance(buf, buffer):
+            # The packet buffer is a view of a memory mapped trace file
+            return Payload(buf[offset:offset+size], 0, size)
+        return Payload(buf, offset, size)
+
+    def unpack_READ4resok(self):
+        data = nfs4_type.READ4resok()
+        data.eof = self.unpack_bool()
+        data.data = self.unpack_payload()
+        if 'READ4resok' in self._filters:
+            data = self._filters['READ4resok'](self, data)
+        return data
+
+    def unpack_WRITE4args(self):
+        data = nfs4_type.WRITE4args()
+        data.stateid = self.unpack_stateid4()
+        data.offset = self.unpack_offset4()
+        data.stable = self.unpack_stable_how4()
+        data.data = self.unpack_payload()
+        if 'WRITE4args' in self._filters:
+            data = self._filters['WRITE4args'](self, data)
+        return data
+
 def fattr2dict(obj):
     """Convert a fattr4 object to a dictionary with attribute name and values.
 
@@ -73,14 +282,19 @@ def fattr2dict(obj):
     unpacker.done()
     return result
 
+# Bit numbers set in each byte value
+_byte2bits = [tuple(i for i in range(8) if byte & (1 << i)) for byte in range(256)]
+
 def bitmap2list(bitmap):
     """Return (sorted) list of bit numbers set in bitmap"""
     out = []
     bitnum = 0
     while bitmap:
-        if bitmap & 1:
-            out.append(bitnum)
-        bitnum += 1
-        bitmap >>= 1
+        byte = bitmap & 0xff
+        if byte:
+            for i in _byte2bits[byte]:
+                out.append(bitnum + i)
+        bitnum += 8
+        bitmap >>= 8
     return out
 
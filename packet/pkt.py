@@ -66,6 +66,7 @@ class Pkt(BaseObj):
                print x.nfs
     """
     _attrlist = tuple(_PKT_layers)
+    __slots__ = _attrlist + ("NFSop", "NFSidx")
 
     # Do not use BaseObj constructor to have a little bit of
     # performance improvement
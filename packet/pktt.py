@@ -35,18 +35,32 @@ Packet layers supported:
 """
 import os
 import re
-import gzip
-import time
+import ast
+import mmap
 import token
 import struct
 import parser
 import symbol
+import heapq
+import bisect
+import shutil
+import cPickle
+import tempfile
+import multiprocessing
+from array import array
+from itertools import izip
+from collections import OrderedDict
 import nfstest_config as c
 from baseobj import BaseObj
 from packet.pkt import Pkt
 from packet.unpack import Unpack
 from packet.record import Record
+from packet.gzindex import GzipIndex
+from packet.inotify import Inotify
 from packet.link.ethernet import ETHERNET
+from packet.internet.ipv6addr import IPv6Addr
+from packet.nfs.nfs4lib import get_opattr_map
+from packet.nfs.nfs4_opattr import opattr_args, opattr_res
 
 # Module constants
 __author__    = 'Jorge Mora (%s)' % c.NFSTEST_AUTHOR_EMAIL
@@ -72,6 +86,53 @@ _match_func_map = {
     'RPC':      'self.match_rpc',
     'NFS':      'self.match_nfs',
 }
+# Packet layer needed by each of the match functions
+_match_layer_map = {
+    'ethernet': 0,
+    'ip':       1,
+    'tcp':      2,
+    'rpc':      3,
+    'nfs':      3,
+}
+# Search index names for each of the match attributes: (layer, lhs) -> names
+_search_index_map = {
+    ('rpc', 'xid'):           ('xid',),
+    ('nfs', 'argop'):         ('argop',),
+    ('nfs', 'resop'):         ('resop',),
+    ('nfs', 'op'):            ('argop', 'resop'),
+    ('nfs', 'object'):        ('object',),
+    ('nfs', 'stateid.other'): ('stateid',),
+}
+# Operations where the filehandle and stateid could be found for the
+# arguments (True) and the results (False) as a tuple (object, stateid)
+_search_opset_map = {
+    True:  (opattr_args.get('object'), opattr_args.get('stateid')),
+    False: (opattr_res.get('object'),  opattr_res.get('stateid')),
+}
+# Layers above the link layer decoded for each decode level
+_decode_layer_map = {
+    'link':   frozenset(),
+    'ip':     frozenset(['ip']),
+    'tcp':    frozenset(['ip', 'tcp']),
+    'rpc':    frozenset(['ip', 'tcp', 'rpc']),
+    'full':   frozenset(['ip', 'tcp', 'rpc', 'nfs']),
+}
+# Cache of compiled match expressions:
+#   (expr, debug) -> (function, prefilter, search keys)
+_match_cache = {}
+# Set once the fallback to polling a live trace file has been logged
+_follow_logged = False
+_MATCH_CACHE_MAX = 1024
+# Packet index sidecar file identifier and header format: identifier,
+# size of each offset, size and modification time of the trace file,
+# record header of the first packet, timestamp of the first packet,
+# number of packets and number of gzip access points
+_IDX_MAGIC  = 'PKTTIDX4'
+_IDX_HEADER = '!8sIQd16sdQQ'
+# Gzip access point in the packet index sidecar file: uncompressed and
+# compressed offsets, number of bits (-1 for the start of a gzip member)
+# and size of the history window which follows
+_IDX_POINT  = '!QQbI'
 
 class Header(BaseObj):
     # Class attributes
@@ -98,8 +159,16 @@ class Pktt(BaseObj, Unpack):
            # Iterate over all packets found in the trace file
            for pkt in x:
                print pkt
+
+       The attribute pkt_call is a summary of the RPC call (CallInfo)
+       when the current packet is an RPC reply and its call was found,
+       the call packet itself is not kept in memory. Use get_call() to
+       decode the call packet again.
     """
-    def __init__(self, tfile, live=False, state=True):
+    def __init__(self, tfile, live=False, state=True, checkpoint=1000,
+                 index_file=None, use_mmap=True, workers=0, max_files=64,
+                 buffer_size=65536, max_calls=100000, call_timeout=None,
+                 payload_views=False, decode='full'):
         """Constructor
 
            Initialize object's private data, note that this will not check the
@@ -118,6 +187,78 @@ class Pktt(BaseObj, Unpack):
                case when <EOF> is encountered the next trace file created by
                tcpdump will be opened and the object will be re-initialized,
                all private data referencing the previous file is lost.
+               Once all data in the file has been processed the object
+               waits for tcpdump to write more data or to create the next
+               trace file using inotify instead of polling the file.
+           checkpoint:
+               Number of packets between decoder state checkpoints. The TCP
+               reassembly state is saved every checkpoint packets so rewind()
+               and random access only need to decode the packets between
+               the nearest checkpoint and the requested packet. The RPC xid
+               map is rebuilt by decoding at least checkpoint packets before
+               the requested packet, so a reply is not matched to its call
+               if the call is further back than that [default: 1000]
+           index_file:
+               Name of the packet index sidecar file, if set to True the
+               name of the trace file is used with an ".idx" extension.
+               The index has the file offset of every packet and the
+               access points into a gzip compressed trace file. It is loaded the first time the
+               trace file is opened if it exists and it matches the trace
+               file, otherwise it is saved once the first pass through the
+               trace file is done [default: None]
+           use_mmap:
+               Memory map uncompressed trace files so each record is read
+               as a view of the mapped file instead of copying it with
+               read(). It is not used if live is set [default: True]
+           workers:
+               Number of worker processes used to decode the trace file in
+               parallel. The record headers are scanned first to split the
+               packets by TCP connection, each connection is decoded by
+               a single worker with its own TCP and RPC state and the decoded
+               packets are merged back in timestamp order, packets having
+               the same timestamp are kept in the same order as in the
+               trace file. RPC replies are only matched to calls on the same TCP
+               connection. It is not used if live is set or if more than
+               one trace file is given. If set to 0 or 1 the trace file is
+               decoded serially [default: 0]
+           max_files:
+               Maximum number of trace files opened at the same time when
+               a list of trace files is given, a trace file is opened when
+               its first packet is needed and it is closed when all its
+               packets have been processed or when another trace file needs
+               to be opened and the limit has been reached, in which case
+               the trace file is re-opened at the same position the next
+               time it is accessed [default: 64]
+           buffer_size:
+               Size in bytes of the read buffer used for a live trace file,
+               the file is read from the buffer one record at a time. It is
+               only used if live is set [default: 65536]
+           max_calls:
+               Maximum number of RPC calls waiting for their replies, the
+               least recent call is evicted from the xid map when the limit
+               is reached. If set to 0 there is no limit [default: 100000]
+           call_timeout:
+               Maximum number of seconds an RPC call waits for its reply
+               using the packet timestamps, calls older than this are
+               evicted from the xid map as orphaned calls. If set to None
+               calls never time out [default: None]
+           payload_views:
+               Decode the data of READ replies and WRITE calls as Payload
+               objects instead of strings. A Payload object references the
+               data in the packet buffer without copying it unless the
+               trace file is memory mapped, it supports len() and string
+               comparison and has the cached checksum methods crc32() and
+               digest() [default: False]
+           decode:
+               Decode each packet up to the given layer, the decoding stops
+               at the layer given even if the packet has more layers. RPC
+               record boundaries are still tracked on the TCP streams when
+               the NFS layer is not decoded [default: 'full']
+                   'link':   only the link layer (ETHERNET)
+                   'ip':     up to the IP layer
+                   'tcp':    up to the TCP layer
+                   'rpc':    up to the RPC layer, the RPC payload is skipped
+                   'full':   decode all layers
         """
         self.tfile   = tfile  # Current trace file name
         self.bfile   = tfile  # Base trace file name
@@ -129,20 +270,89 @@ class Pktt(BaseObj, Unpack):
         self.mindex  = 0      # Maximum packet index for current trace file
         self.findex  = 0      # Current tcpdump file index (used with self.live)
         self.fh      = None   # Current file handle
+        self.use_mmap = use_mmap
+        self._mm     = None   # Memory mapped trace file
         self.eof     = False  # End of file marker for current packet trace
         self.serial  = False  # Processing trace files serially
         self.pkt     = None   # Current packet
-        self.pkt_call  = None # The current packet call if self.pkt is a reply
+        self.pkt_call  = None # Summary of the call (CallInfo) if self.pkt is a reply
         self.pktt_list = []   # List of Pktt objects created
         self.tfiles    = []   # List of packet trace files
+        self.max_files = max_files
+        self.buffer_size = buffer_size
+        self._follow    = None # Inotify object used with self.live
+        self._suspended = None # File position saved when file is closed
+        self._gzindex   = None # Access points into the gzip compressed file
+        self._fsecs     = None # Timestamp of first packet in the trace file
+        self._fpos      = 0    # Position of trace file in the list of files
+
+        # Merging multiple trace files: heap of trace files with a packet
+        # ready, heap of trace files not started yet and list of trace
+        # files currently opened, least recently used first
+        self._pktt_heap    = []
+        self._pktt_pending = None
+        self._pktt_open    = []
+        self.workers   = 0 if live else workers
+
+        # Parallel decoding: shard file objects holding the decoded packets,
+        # shard number, shard file offset and index of the call for every
+        # packet, the call summaries keyed by the index of the call and the
+        # indexes of the calls removed from the xid map keyed by the index
+        # of the packet which removed them
+        self._shards     = None
+        self._pkt_shard  = array('H')
+        self._pkt_foff   = array('L')
+        self._pkt_pcall  = array('l')
+        self._pcall_map  = {}
+        self._pcall_removed = {}
+
+        # Packet index: file offset for every packet processed so far,
+        # rewind() is allowed up to the last packet in the index
+        self._pkt_offset = array('L')
+        self.index_file  = index_file
+        self._idx_done   = False
+        if index_file is True and not isinstance(tfile, list):
+            self.index_file = tfile + '.idx'
+
+        # Decoder state checkpoints: sorted list of packet indexes and a
+        # map of the saved state keyed by the packet index
+        self.ckpt_interval = checkpoint
+        self._ckpt_list = []
+        self._ckpt_map  = {}
+
+        # Search index: packet indexes keyed by xid, filehandle, stateid
+        # and operation, see build_search_index()
+        self._search_index = None
+
+        # Prefilter for the current search and prefilter result for the
+        # current packet, see _prefilter_packet()
+        self._prefilter = None
+        self._pfskip    = 0
 
         # TCP stream map: to keep track of the different TCP streams within
         # the trace file -- used to deal with RPC packets spanning multiple
         # TCP packets or to handle a TCP packet having multiple RPC packets
         self._tcp_stream_map = {}
 
-        # RPC xid map: to keep track of packet calls
-        self._rpc_xid_map = {}
+        # RPC xid map: to keep track of packet calls, a summary of each
+        # call is kept in order so the least recent calls are evicted
+        # first, see _evict_calls()
+        self._rpc_xid_map   = OrderedDict()
+        self.max_calls      = max_calls
+        self.call_timeout   = call_timeout
+        self._rpc_evictions = 0 # Calls evicted because of max_calls
+        self._rpc_orphans   = 0 # Calls evicted because of call_timeout
+        self._rpc_removed   = None # Packet index of every call removed from
+                                   # the xid map, see add_call_callback()
+        self._call_callbacks = []  # Functions called with every call removed
+                                   # from the xid map
+        self.payload_views  = payload_views
+
+        # Layers above the link layer to decode for the given decode level
+        if decode not in _decode_layer_map:
+            raise Exception("Unknown decode level '%s'" % decode)
+        self.decode = decode
+        self._decode_layers = _decode_layer_map[decode]
 
         # Process tfile argument
         if isinstance(tfile, list):
@@ -153,16 +363,40 @@ class Pktt(BaseObj, Unpack):
                 self.tfile = self.tfiles[0]
             else:
                 # Create all packet trace objects
+                self.workers = 0
                 for tfile in self.tfiles:
-                    self.pktt_list.append(Pktt(tfile))
+                    self.pktt_list.append(Pktt(tfile, checkpoint=checkpoint, use_mmap=use_mmap,
+                                               **self._decoder_options()))
+
+    def _decoder_options(self):
+        """Return the options given to the constructor which change how
+           the packets are decoded as a dictionary of named arguments,
+           used to create other Pktt objects decoding the same way.
+        """
+        return {
+            'max_calls':     self.max_calls,
+            'call_timeout':  self.call_timeout,
+            'payload_views': self.payload_views,
+            'decode':        self.decode,
+        }
 
     def __del__(self):
         """Destructor
 
            Gracefully close the tcpdump trace file if it is opened.
         """
+        if self._mm:
+            self._mm.close()
+            self._mm = None
         if self.fh:
             self.fh.close()
+        if self._follow:
+            self._follow.close()
+            self._follow = None
+        if self._shards:
+            for fd in self._shards:
+                fd.close()
+            self._shards = None
 
     def __iter__(self):
         """Make this object iterable."""
@@ -206,11 +440,11 @@ class Pktt(BaseObj, Unpack):
         except:
             pass
 
-        if index < self.index:
-            # Reset the current packet index and offset
-            # The index is less than the current packet offset so position
-            # the file pointer to the offset of the packet given by index
-            self.rewind(index)
+        if index != self.index:
+            # Position the file pointer to the offset of the packet given
+            # by index, the decoder state is restored from the nearest
+            # checkpoint so only the packets in between are decoded
+            self.seek(index)
 
         # Move to the packet specified by the index
         pkt = None
@@ -257,61 +491,71 @@ class Pktt(BaseObj, Unpack):
                Supports only single active iteration
         """
         self.dprint('PKT4', ">>> %d: next()" % self.index)
-        # Initialize next packet
-        self.pkt = Pkt()
-
         if len(self.pktt_list) > 1:
+            # Initialize next packet
+            self.pkt = Pkt()
+
             # Dealing with multiple trace files
-            minsecs  = None
-            pktt_obj = None
-            for obj in self.pktt_list:
-                if obj.pkt is None:
-                    # Get first packet for this packet trace object
-                    try:
-                        obj.next()
-                    except StopIteration:
-                        obj.mindex = self.index
-                if obj.eof:
-                    continue
-                if minsecs is None or obj.pkt.record.secs < minsecs:
-                    minsecs = obj.pkt.record.secs
-                    pktt_obj = obj
-            if pktt_obj is None:
+            if self._pktt_pending is None:
+                self._merge_init()
+            # Start all packet trace objects which have their first packet
+            # before the next packet to process
+            while self._pktt_pending and (not self._pktt_heap or self._pktt_pending[0][:2] < self._pktt_heap[0][:2]):
+                self._merge_start(heapq.heappop(self._pktt_pending)[2])
+            if not self._pktt_heap:
                 # All packet trace files have been processed
                 raise StopIteration
-            elif len(self._tcp_stream_map):
+            pktt_obj = heapq.heappop(self._pktt_heap)[2]
+            if len(self._tcp_stream_map):
                 # This packet trace file should be processed serially
                 # Have all state transferred to next packet object
+                self._merge_use(pktt_obj)
                 pktt_obj.rewind()
                 pktt_obj._tcp_stream_map = self._tcp_stream_map
                 pktt_obj._rpc_xid_map    = self._rpc_xid_map
                 self._tcp_stream_map = {}
-                self._rpc_xid_map    = {}
+                self._rpc_xid_map    = OrderedDict()
                 pktt_obj.next()
 
             # Overwrite attributes seen by the caller with the attributes
             # from the current packet trace object
             self.pkt = pktt_obj.pkt
             self.pkt_call = pktt_obj.pkt_call
+            if pktt_obj._rpc_removed:
+                # Calls removed while decoding this packet
+                self._rpc_removed.extend(pktt_obj._rpc_removed)
+                del pktt_obj._rpc_removed[:]
+                self._report_removed()
             self.tfile = pktt_obj.tfile
+            lindex = self.pkt.record.index
             self.pkt.record.index = self.index  # Use a cumulative index
+            rpc = getattr(self.pkt, 'rpc', None)
+            if rpc is not None and rpc.type == 0:
+                # Use the cumulative index in the call summary as well
+                call = pktt_obj._rpc_xid_map.get(rpc.xid)
+                if call is not None and call.index == lindex:
+                    call.index = self.index
 
             try:
                 # Get next packet for this packet trace object
+                self._merge_use(pktt_obj)
                 pktt_obj.next()
+                heapq.heappush(self._pktt_heap, (pktt_obj.pkt.record.secs, pktt_obj._fpos, pktt_obj))
             except StopIteration:
                 # Set maximum packet index for this packet trace object to
                 # be used by rewind to select the proper packet trace object
                 pktt_obj.mindex = self.index
-                # Check if objects should be serially processed
-                pktt_obj.serial = False
-                for obj in self.pktt_list:
-                    if not obj.eof:
-                        if obj.index > 1:
-                            pktt_obj.serial = False
-                            break
-                        elif obj.index == 1:
-                            pktt_obj.serial = True
+                self._merge_close(pktt_obj)
+                # Check if objects should be serially processed: all other
+                # packet trace objects have not processed any packets yet,
+                # only their first packet has been fetched
+                pktt_obj.serial = len(self._pktt_pending) > 0
+                for item in self._pktt_heap:
+                    if item[2].index > 1:
+                        pktt_obj.serial = False
+                        break
+                    elif item[2].index == 1:
+                        pktt_obj.serial = True
                 if pktt_obj.serial:
                     # Save current state
                     self._tcp_stream_map = pktt_obj._tcp_stream_map
@@ -321,6 +565,20 @@ class Pktt(BaseObj, Unpack):
             self.index += 1
             return self.pkt
 
+        if self.workers > 1:
+            # Get packet decoded by the worker processes
+            return self._next_parallel()
+
+        # Make sure the trace file is opened so the offset is valid
+        self._getfh()
+        if self.ckpt_interval and self.index % self.ckpt_interval == 0 and \
+           self.index not in self._ckpt_map:
+            # Save decoder state before processing this packet
+            self._checkpoint()
+
+        # Initialize next packet
+        self.pkt = Pkt()
+
         # Save file offset for this packet
         self.boffset = self.offset
 
@@ -328,17 +586,32 @@ class Pktt(BaseObj, Unpack):
         data = self._read(16)
         if len(data) < 16:
             self.eof = True
+            if self.index_file and not self.live and not self._idx_done:
+                # First pass through the trace file is done
+                self.save_index()
             raise StopIteration
         # Decode record header
         record = Record(self, data)
+        if self.index == len(self._pkt_offset):
+            # First time this packet is seen, add it to the index
+            self._pkt_offset.append(self.boffset)
 
         # Get record data and create Unpack object
-        self.unpack = Unpack(self._read(record.length_inc))
+        data = self._read(record.length_inc)
+        self.unpack = Unpack(data)
         if self.unpack.size() < record.length_inc:
             # Record has been truncated, stop iteration
             raise StopIteration
 
-        if self.header.link_type == 1:
+        self._pfskip = 0
+        if self._prefilter is not None and self.header.link_type == 1:
+            # Test the raw packet data against the current search
+            self._pfskip = self._prefilter_packet(data)
+
+        if self._pfskip == 2:
+            # Packet has been skipped without decoding any layer
+            pass
+        elif self.header.link_type == 1:
             # Decode ethernet layer
             ETHERNET(self)
         else:
@@ -348,6 +621,10 @@ class Pktt(BaseObj, Unpack):
         # Increment packet index
         self.index += 1
 
+        if self._rpc_removed:
+            # Report the calls removed while decoding this packet
+            self._report_removed()
+
         return self.pkt
 
     def rewind(self, index=0):
@@ -355,33 +632,53 @@ class Pktt(BaseObj, Unpack):
            the given packet index. Returns False if unable to rewind the file,
            e.g., when the given index is greater than the maximum number
            of packets processed so far.
+
+           The decoder state is restored from the nearest checkpoint at or
+           before the given index, so only the packets between the checkpoint
+           and the given index are decoded again.
         """
         self.dprint('PKT1', ">>> rewind(%d)" % index)
         if index >= 0 and index < self.index:
+            return self.seek(index)
+        return False
+
+    def seek(self, index):
+        """Set the file pointer to the start of the given packet index,
+           moving either backward or forward. Returns False if unable to
+           seek, e.g., when the given index is greater than the maximum
+           number of packets processed so far or the number of packets
+           in the packet index.
+
+           The decoder state is restored from the nearest checkpoint at or
+           before the given index, see rewind().
+        """
+        self.dprint('PKT1', ">>> seek(%d)" % index)
+        if self.workers > 1:
+            return self._seek_parallel(index)
+        if len(self.pktt_list) > 1:
+            maxindex = self.index
+        else:
+            # Make sure the packet index is loaded
+            self._getfh()
+            maxindex = max(self.index, len(self._pkt_offset))
+        if index >= 0 and index < maxindex:
             if len(self.pktt_list) > 1:
                 # Dealing with multiple trace files
                 self.index = 0
+                olist = []
                 for obj in self.pktt_list:
-                    if not obj.eof or index <= obj.mindex:
-                        obj.rewind()
-                        try:
-                            obj.next()
-                        except StopIteration:
-                            pass
+                    if not obj.eof or index <= obj.mindex or not obj.serial:
+                        # Start this packet trace object again, a trace
+                        # file with packets interleaved with the packets
+                        # of other trace files is always started again
+                        # so its packets are counted in the index
+                        olist.append(obj)
                     elif obj.serial and index > obj.mindex:
                         self.index = obj.mindex + 1
+                self._merge_init(olist)
             else:
-                # Reset the current packet index and offset to the first packet
-                self.offset = self.ioffset
-                self.index  = 0
-                self.eof    = False
-
-                # Position the file pointer to the offset of the first packet
-                self._getfh().seek(self.offset)
-
-                # Clear state
-                self._tcp_stream_map = {}
-                self._rpc_xid_map    = {}
+                self._getfh()
+                self._restore_checkpoint(index)
 
             # Move to the packet before the specified by the index so the
             # next packet fetched will be the one given by index
@@ -395,6 +692,666 @@ class Pktt(BaseObj, Unpack):
             return True
         return False
 
+    def get_call(self, pkt_call=None):
+        """Return the call packet given by the call summary or None if
+           there is no call. The call packet is decoded again from the
+           trace file, the current packet and the position in the trace
+           file are not changed.
+
+           pkt_call:
+               Call summary (packet.application.rpc.CallInfo)
+               [default: pkt_call attribute]
+
+           Examples:
+               # Get the call of the next WRITE reply
+               pkt = x.match("NFS.resop == 38")
+               call = x.get_call()
+               print call.nfs
+        """
+        if pkt_call is None:
+            pkt_call = self.pkt_call
+        if pkt_call is None:
+            return
+        index, pkt, pcall = self.index, self.pkt, self.pkt_call
+        try:
+            return self[pkt_call.index]
+        finally:
+            # Go back to where the caller was
+            if not self.seek(index):
+                while self.index < index:
+                    try:
+                        self.next()
+                    except StopIteration:
+                        break
+            self.pkt = pkt
+            self.pkt_call = pcall
+
+    def _suspend(self):
+        """Close the trace file keeping the current position so the file
+           is re-opened at the same position the next time it is accessed.
+        """
+        if self.fh is not None:
+            self._suspended = (self.offset, self.index, self.tstart)
+            if self._mm:
+                self._mm.close()
+                self._mm = None
+            self.fh.close()
+            self.fh = None
+
+    def _first_record(self):
+        """Return the record header of the first packet in the trace file
+           or an empty string if the trace file does not have any packets.
+        """
+        offset = self.offset
+        self.offset = self.ioffset
+        self._getfh().seek(self.offset)
+        data = str(self._read(16))
+        self.offset = offset
+        self._getfh().seek(self.offset)
+        return data if len(data) == 16 else ''
+
+    def _first_secs(self):
+        """Return the timestamp of the first packet in the trace file
+           or None if the trace file does not have any packets.
+        """
+        if self._fsecs is None:
+            self._getfh()
+            data = self._first_record()
+            if data:
+                ulist = self.rec_struct.unpack(data)
+                self._fsecs = float(ulist[0]) + float(ulist[1])/1000000.0
+        return self._fsecs
+
+    def _merge_use(self, obj):
+        """Mark the packet trace object as being used, the least recently
+           used trace file is closed if the maximum number of opened trace
+           files has been reached.
+        """
+        if obj in self._pktt_open:
+            self._pktt_open.remove(obj)
+        else:
+            while len(self._pktt_open) >= max(1, self.max_files):
+                self._pktt_open.pop(0)._suspend()
+        self._pktt_open.append(obj)
+
+    def _merge_close(self, obj):
+        """Close trace file of the packet trace object."""
+        if obj in self._pktt_open:
+            self._pktt_open.remove(obj)
+        obj._suspend()
+
+    def _merge_init(self, olist=None):
+        """Initialize merging of multiple trace files, the packet trace
+           objects are not started until their first packet is needed.
+
+           olist:
+               List of packet trace objects to merge
+               [default: all packet trace objects]
+        """
+        if olist is None:
+            olist = self.pktt_list
+        self._pktt_heap = []
+        self._pktt_pending = []
+        for obj in olist:
+            obj._fpos = self.pktt_list.index(obj)
+            opened = obj.fh is not None
+            self._merge_use(obj)
+            secs = obj._first_secs()
+            if not opened:
+                self._merge_close(obj)
+            if secs is None:
+                # No packets in this trace file
+                obj.eof = True
+                obj.mindex = self.index
+            else:
+                obj.eof = False
+                self._pktt_pending.append((secs, obj._fpos, obj))
+        heapq.heapify(self._pktt_pending)
+
+    def _merge_start(self, obj):
+        """Start processing the given packet trace object from the
+           beginning and add it to the heap of trace files with a
+           packet ready.
+        """
+        self._merge_use(obj)
+        obj.rewind()
+        if len(self._tcp_stream_map):
+            # This packet trace file should be processed serially
+            # Have all state transferred to this packet object
+            obj._tcp_stream_map = self._tcp_stream_map
+            obj._rpc_xid_map    = self._rpc_xid_map
+            self._tcp_stream_map = {}
+            self._rpc_xid_map    = OrderedDict()
+        else:
+            obj._tcp_stream_map = {}
+            obj._rpc_xid_map    = OrderedDict()
+        try:
+            # Get first packet for this packet trace object
+            obj.next()
+            heapq.heappush(self._pktt_heap, (obj.pkt.record.secs, obj._fpos, obj))
+        except StopIteration:
+            obj.mindex = self.index
+            self._merge_close(obj)
+
+    def _stream_key(self, data):
+        """Return the TCP connection of the raw packet data given as a tuple
+           of both (address, port) end points in sorted order so both
+           directions of the connection have the same key. Return None if
+           the packet is not a TCP packet.
+        """
+        ldata = len(data)
+        if ldata < 14:
+            return
+        etype = struct.unpack_from("!H", data, 12)[0]
+        if etype == 0x0800 and ldata >= 34:
+            # IPv4
+            offset = 14 + 4*(ord(data[14]) & 0x0F)
+            proto = ord(data[23])
+            src = data[26:30]
+            dst = data[30:34]
+        elif etype == 0x86dd and ldata >= 54:
+            # IPv6
+            offset = 54
+            proto = ord(data[20])
+            src = data[22:38]
+            dst = data[38:54]
+        else:
+            return
+        if proto != 6 or ldata < offset + 4:
+            return
+        sport, dport = struct.unpack_from("!HH", data, offset)
+        return tuple(sorted([(src, sport), (dst, dport)]))
+
+    def _decode_parallel(self):
+        """Decode the trace file using the worker processes.
+
+           The record headers are scanned first to assign each TCP connection
+           to a worker, packets which are not TCP are stateless so they are
+           treated as a single connection. Every worker decodes all of its
+           records in order and saves the decoded packets in a shard file,
+           then the packets are merged back in timestamp order. The packets
+           decoded by each worker are kept in their own order, so a reply
+           always comes after its call.
+        """
+        self._getfh()
+        self.offset = self.ioffset
+        self._getfh().seek(self.offset)
+
+        # Scan the record headers
+        rec_offset = array('L')
+        rec_secs   = array('d')
+        rec_key    = []
+        key_size   = {}
+        while True:
+            offset = self.offset
+            data = self._read(16)
+            if len(data) < 16:
+                break
+            ulist = self.rec_struct.unpack(data)
+            data = self._read(ulist[2])
+            if len(data) < ulist[2]:
+                # Record has been truncated
+                break
+            key = self._stream_key(data) if self.header.link_type == 1 else None
+            rec_offset.append(offset)
+            rec_secs.append(float(ulist[0]) + float(ulist[1])/1000000.0)
+            rec_key.append(key)
+            key_size[key] = key_size.get(key, 0) + ulist[2]
+
+        # Assign connections to workers, largest connection first
+        nshards = max(1, min(self.workers, len(key_size)))
+        load = [0] * nshards
+        key_shard = {}
+        for key in sorted(key_size, key=key_size.get, reverse=True):
+            shard = load.index(min(load))
+            key_shard[key] = shard
+            load[shard] += key_size[key]
+
+        rec_shard = array('H', [key_shard[key] for key in rec_key])
+        rlists = [array('L') for i in xrange(nshards)]
+        for ordinal in xrange(len(rec_shard)):
+            rlists[rec_shard[ordinal]].append(ordinal)
+        del rec_key
+
+        tstart = rec_secs[0] if len(rec_secs) else None
+        shard_dir = tempfile.mkdtemp(prefix='pktt')
+        args = []
+        for shard in xrange(nshards):
+            olist = array('L', [rec_offset[i] for i in rlists[shard]])
+            sfile = os.path.join(shard_dir, "shard%d" % shard)
+            args.append((self.tfile, tstart, rlists[shard], olist, sfile,
+                         self._decoder_options()))
+        self.dprint('PKT1', ">>> decoding %d records using %d workers" % (len(rec_shard), nshards))
+        pool = multiprocessing.Pool(nshards)
+        try:
+            results = pool.map(_decode_records, args)
+            self._shards = [open(arg[4], 'rb') for arg in args]
+        finally:
+            pool.close()
+            pool.join()
+            # The shard files are still available through the open file
+            # objects after the directory is removed
+            shutil.rmtree(shard_dir, True)
+
+        # Merge the packets decoded by all workers
+        self._pkt_offset = array('L')
+        self._pkt_shard  = array('H')
+        self._pkt_foff   = array('L')
+        self._pkt_pcall  = array('l')
+        self._pcall_map  = {}
+        self._pcall_removed = {}
+        gindex = [array('L') for i in xrange(nshards)]
+        spos   = [0] * nshards
+        pcall = -1
+        # Heap of the next packet from each worker keyed by its timestamp
+        # and its position in the trace file
+        heap = []
+        for shard in xrange(nshards):
+            ords = results[shard][0]
+            if len(ords):
+                heap.append((rec_secs[ords[0]], ords[0], shard))
+        heapq.heapify(heap)
+        while heap:
+            secs, ordinal, shard = heapq.heappop(heap)
+            ords, foffs, calls, cmap, counts, rmap = results[shard]
+            pos = spos[shard]
+            while pos < len(ords) and ords[pos] == ordinal:
+                index = len(self._pkt_foff)
+                gindex[shard].append(index)
+                if calls[pos] == -2:
+                    pcall = -1
+                elif calls[pos] >= 0:
+                    pcall = gindex[shard][calls[pos]]
+                    if pcall not in self._pcall_map:
+                        # Use the index of the call in the trace file
+                        call = cmap[calls[pos]]
+                        call.index = pcall
+                        self._pcall_map[pcall] = call
+                self._pkt_offset.append(rec_offset[ordinal])
+                self._pkt_shard.append(shard)
+                self._pkt_foff.append(foffs[pos])
+                self._pkt_pcall.append(pcall)
+                if pos in rmap:
+                    self._pcall_removed[index] = array('L', [gindex[shard][x] for x in rmap[pos]])
+                pos += 1
+            spos[shard] = pos
+            if pos < len(ords):
+                heapq.heappush(heap, (rec_secs[ords[pos]], ords[pos], shard))
+        self._rpc_evictions = sum(x[4][0] for x in results)
+        self._rpc_orphans   = sum(x[4][1] for x in results)
+        self.tstart = tstart
+        self.index = 0
+
+    def _load_pkt(self, index):
+        """Load packet given by the index from its shard file."""
+        fd = self._shards[self._pkt_shard[index]]
+        fd.seek(self._pkt_foff[index])
+        pkt = cPickle.load(fd)
+        pkt.record.index = index
+        return pkt
+
+    def _set_pkt_call(self, index):
+        """Set pkt_call for the packet given by the index."""
+        pcall = self._pkt_pcall[index] if index >= 0 else -1
+        if pcall < 0:
+            self.pkt_call = None
+        else:
+            self.pkt_call = self._pcall_map[pcall]
+
+    def _next_parallel(self):
+        """Get next packet decoded by the worker processes."""
+        if self._shards is None:
+            self._decode_parallel()
+        if self.index >= len(self._pkt_foff):
+            self.eof = True
+            raise StopIteration
+        self.pkt = self._load_pkt(self.index)
+        self._set_pkt_call(self.index)
+        if self._rpc_removed is not None:
+            self._rpc_removed.extend(self._pcall_removed.get(self.index, ()))
+            self._report_removed()
+        self.index += 1
+        return self.pkt
+
+    def _seek_parallel(self, index):
+        """Seek when decoding with worker processes, see seek()."""
+        if self._shards is None:
+            self._decode_parallel()
+        if index >= 0 and index < len(self._pkt_foff):
+            if index > 0 and (self.pkt is None or self.pkt.record.index != index - 1):
+                self.pkt = self._load_pkt(index - 1)
+            self._set_pkt_call(index - 1)
+            self.index = index
+            self.eof = False
+            return True
+        return False
+
+    def _copy_stream_map(self, streams):
+        """Return a copy of the TCP stream map given, the list of data
+           chunks in the reassembly buffer of each stream is also copied
+           since it is modified in place.
+        """
+        ret = {}
+        for streamid, stream in streams.iteritems():
+            stream = dict(stream)
+            stream['msfrag'] = list(stream['msfrag'])
+            ret[streamid] = stream
+        return ret
+
+    def _get_decoder_state(self):
+        """Return a copy of the decoder state for the current packet index:
+           file offset, TCP stream map, RPC xid map and eviction counters.
+        """
+        return (
+            self.index,
+            self.offset,
+            self.pkt,
+            self.pkt_call,
+            self._copy_stream_map(self._tcp_stream_map),
+            OrderedDict(self._rpc_xid_map),
+            (self._rpc_evictions, self._rpc_orphans),
+        )
+
+    def _set_decoder_state(self, state):
+        """Restore the decoder state returned by _get_decoder_state() and
+           position the file pointer to the offset saved in the state.
+        """
+        self.index, self.offset, self.pkt, self.pkt_call, streams, xids, counts = state
+        # Copy the maps again so the saved state can be restored many times
+        self._tcp_stream_map = self._copy_stream_map(streams)
+        self._rpc_xid_map    = OrderedDict(xids)
+        self._rpc_evictions, self._rpc_orphans = counts
+        self.eof = False
+        self._getfh().seek(self.offset)
+
+    def _checkpoint(self):
+        """Save the TCP reassembly state for the current packet index, the
+           RPC xid map is not saved, see _restore_checkpoint().
+        """
+        self.dprint('PKT4', ">>> %d: checkpoint()" % self.index)
+        self._ckpt_map[self.index] = (
+            self.offset,
+            self._copy_stream_map(self._tcp_stream_map),
+            (self._rpc_evictions, self._rpc_orphans),
+        )
+        bisect.insort(self._ckpt_list, self.index)
+
+    def _restore_checkpoint(self, index):
+        """Position the file pointer so the packets before the given index
+           can be decoded again to rebuild the decoder state. Decoding starts
+           at the nearest checkpoint at least a checkpoint interval before
+           the given packet index with an empty RPC xid map, so the xid map
+           has all calls within that window. The state is not changed if
+           moving forward and the current packet index is closer to the
+           given index.
+        """
+        start = max(0, index - self.ckpt_interval) if self.ckpt_interval else 0
+        idx = bisect.bisect_right(self._ckpt_list, start) - 1
+        cindex = self._ckpt_list[idx] if idx >= 0 else 0
+        # No checkpoint near the given index, e.g., the packet index has
+        # been loaded from the index file: start decoding at the packet
+        # offset with no TCP state, the TCP layer finds the next RPC
+        # record on each stream
+        cold = self.ckpt_interval and start - cindex >= self.ckpt_interval and \
+               start < len(self._pkt_offset)
+        if cold:
+            cindex = start
+        if index >= self.index and cindex <= self.index and not self.eof:
+            # Moving forward, no need to restore any state
+            return
+
+        self.dprint('PKT4', ">>> %d: restore_checkpoint(%d)" % (index, cindex))
+        if cold:
+            offset, streams = self._pkt_offset[cindex], {}
+            counts = (self._rpc_evictions, self._rpc_orphans)
+        elif cindex in self._ckpt_map:
+            offset, streams, counts = self._ckpt_map[cindex]
+            streams = self._copy_stream_map(streams)
+        else:
+            # No checkpoint, start from the first packet and clear state
+            cindex, offset, streams, counts = 0, self.ioffset, {}, (0, 0)
+        self.index  = cindex
+        self.offset = offset
+        self.pkt    = None
+        self.pkt_call = None
+        self._tcp_stream_map = streams
+        self._rpc_xid_map    = OrderedDict()
+        self._rpc_evictions, self._rpc_orphans = counts
+        self.eof = False
+        self._getfh().seek(self.offset)
+
+    def _evict_calls(self, secs):
+        """Evict the least recent calls from the RPC xid map if there are
+           more than max_calls calls or if they are older than call_timeout
+           seconds relative to the given timestamp.
+        """
+        xid_map = self._rpc_xid_map
+        removed = self._rpc_removed
+        if self.max_calls:
+            while len(xid_map) > self.max_calls:
+                xid, call = xid_map.popitem(last=False)
+                self._rpc_evictions += 1
+                if removed is not None:
+                    removed.append(call.index)
+        if self.call_timeout is not None:
+            mintime = secs - self.call_timeout
+            while xid_map:
+                xid, call = next(xid_map.iteritems())
+                if call.secs >= mintime:
+                    break
+                del xid_map[xid]
+                self._rpc_orphans += 1
+                if removed is not None:
+                    removed.append(call.index)
+
+    def add_call_callback(self, func):
+        """Add a function to be called with the packet index of every call
+           removed from the RPC xid map, the call is removed when it is
+           evicted or when it is replaced by another call with the same xid.
+           The function is called for the calls removed while decoding a
+           packet right before the packet is returned by next().
+
+           func:
+               Function called as func(index)
+        """
+        self._call_callbacks.append(func)
+        self._track_calls()
+
+    def remove_call_callback(self, func):
+        """Remove a function added by add_call_callback()."""
+        if func in self._call_callbacks:
+            self._call_callbacks.remove(func)
+        self._track_calls()
+
+    def _track_calls(self):
+        """Start tracking the calls removed from the RPC xid map if there
+           are any callbacks, stop tracking otherwise.
+        """
+        removed = [] if self._call_callbacks else None
+        self._rpc_removed = removed
+        for obj in self.pktt_list:
+            # The next packet of each trace file is decoded before it is
+            # needed so the calls are added to the list when the packet
+            # is returned by next()
+            obj._rpc_removed = None if removed is None else []
+
+    def _report_removed(self):
+        """Call the callbacks with every call removed from the RPC xid map
+           since the last time they were called.
+        """
+        if self._call_callbacks:
+            removed = self._rpc_removed
+            self._rpc_removed = []
+            for index in removed:
+                for func in self._call_callbacks:
+                    func(index)
+
+    def get_rpc_stats(self):
+        """Return a dictionary with the RPC xid map counters:
+               evictions: number of calls evicted because there were more
+                          than max_calls calls waiting for their replies
+               orphans:   number of calls evicted because their replies
+                          were not seen within call_timeout seconds
+
+           When decoding in parallel, the counters include all packets
+           decoded by the worker processes.
+        """
+        olist = self.pktt_list if len(self.pktt_list) > 1 else [self]
+        return {
+            'evictions': sum(x._rpc_evictions for x in olist),
+            'orphans':   sum(x._rpc_orphans for x in olist),
+        }
+
+    def save_index(self, ifile=None):
+        """Save the packet index into a sidecar file. The packet index is the
+           file offset of every packet processed so far, so the packet trace
+           object created the next time the trace file is opened can start
+           decoding near any packet, e.g., x[index] only decodes the packets
+           between index minus the checkpoint interval and the given index.
+           The access points into a gzip compressed trace file are also
+           saved.
+
+           ifile:
+               Name of packet index file [default: index_file given
+               in the constructor or tfile with an ".idx" extension]
+        """
+        if ifile is None:
+            ifile = self.index_file if isinstance(self.index_file, str) else self.tfile + '.idx'
+        self.dprint('PKT1', ">>> save_index(%s)" % ifile)
+        fstat = os.stat(self.tfile)
+        points = self._gzindex.points() if self._gzindex else []
+        with open(ifile, 'wb') as fd:
+            fd.write(struct.pack(_IDX_HEADER, _IDX_MAGIC, self._pkt_offset.itemsize,
+                                 fstat.st_size, fstat.st_mtime, self._first_record(),
+                                 self.tstart or 0.0, len(self._pkt_offset), len(points)))
+            self._pkt_offset.tofile(fd)
+            for uoffset, coffset, state in points:
+                bits, window = (-1, '') if state is None else state
+                fd.write(struct.pack(_IDX_POINT, uoffset, coffset, bits, len(window)))
+                fd.write(window)
+        self._idx_done = True
+
+    def load_index(self, ifile=None):
+        """Load the packet index from a sidecar file. Return False if the
+           index file does not exist or it does not match the trace file:
+           the size, the modification time and the first record header of
+           the trace file are compared with the values in the index file.
+
+           ifile:
+               Name of packet index file [default: index_file given
+               in the constructor or tfile with an ".idx" extension]
+        """
+        if ifile is None:
+            ifile = self.index_file if isinstance(self.index_file, str) else self.tfile + '.idx'
+        if not os.path.isfile(ifile):
+            return False
+        self.dprint('PKT1', ">>> load_index(%s)" % ifile)
+        fstat = os.stat(self.tfile)
+        hsize = struct.calcsize(_IDX_HEADER)
+        psize = struct.calcsize(_IDX_POINT)
+        with open(ifile, 'rb') as fd:
+            data = fd.read(hsize)
+            if len(data) < hsize:
+                return False
+            magic, isize, tsize, mtime, record, tstart, count, npoints = \
+                struct.unpack(_IDX_HEADER, data)
+            if magic != _IDX_MAGIC or isize != self._pkt_offset.itemsize or \
+               tsize != fstat.st_size or mtime != fstat.st_mtime or \
+               record != self._first_record().ljust(16, '\x00'):
+                # Index file does not match this trace file
+                return False
+            offsets = array('L')
+            points = []
+            try:
+                offsets.fromfile(fd, count)
+                for i in xrange(npoints):
+                    data = fd.read(psize)
+                    if len(data) < psize:
+                        return False
+                    uoffset, coffset, bits, wsize = struct.unpack(_IDX_POINT, data)
+                    window = fd.read(wsize)
+                    if len(window) < wsize:
+                        return False
+                    points.append((uoffset, coffset, None if bits < 0 else (bits, window)))
+            except EOFError:
+                return False
+        if self._gzindex:
+            self._gzindex.add_points(points)
+        if len(offsets) > len(self._pkt_offset):
+            self._pkt_offset = offsets
+        if self.tstart is None and count > 0:
+            self.tstart = tstart
+        self._idx_done = True
+        return True
+
+    def get_position(self):
+        """Return the current position in the trace file so the caller can
+           go back to it with set_position() after going through other
+           packets, e.g., after decoding the whole trace file.
+        """
+        if len(self.pktt_list) <= 1 and self.workers <= 1:
+            # Save decoder state to go back to where it started without
+            # decoding any packets again
+            self._getfh()
+            return (self.index, self._get_decoder_state())
+        return (self.index, None)
+
+    def set_position(self, position):
+        """Go back to the position in the trace file returned by
+           get_position().
+        """
+        index, state = position
+        if state is not None:
+            self._set_decoder_state(state)
+        else:
+            self.seek(index)
+
+    def export_columns(self, cfile=None):
+        """Decode the whole trace file in a single pass and return the
+           per-packet summary as a TraceColumns object having a typed array
+           for each column: timestamp, TCP connection, xid, NFS operations,
+           status, offset, count and packet length. The arrays are NumPy
+           arrays if NumPy is available. The file pointer is re-positioned
+           back to where it was before the call.
+
+           cfile:
+               Name of the NumPy .npz cache file, if set to True the name
+               of the trace file is used with an ".npz" extension. The
+               columns are loaded from the cache file if it exists and
+               it matches the trace file, otherwise the columns are saved
+               into the cache file after the trace file is decoded.
+               NumPy is needed to use the cache file and it is not used
+               when a list of trace files is given [default: None]
+
+           Examples:
+               # Get the columns and save them next to the trace file
+               cols = x.export_columns(True)
+        """
+        # Imported here so NumPy is only loaded when it is needed
+        from packet.analysis.columns import TraceColumns
+        if len(self.tfiles) > 1:
+            cfile = None
+        elif cfile is True:
+            cfile = self.tfile + '.npz'
+        if cfile is not None:
+            tsize = os.stat(self.tfile).st_size
+            cols = TraceColumns.load(cfile, tsize)
+            if cols is not None:
+                return cols
+        self.dprint('PKT1', ">>> export_columns()")
+        position = self.get_position()
+        cols = TraceColumns()
+        self.rewind(0)
+        for pkt in self:
+            cols.add_packet(pkt, self.pkt_call)
+        cols.to_numpy()
+
+        # Re-position the file pointer back to where it started
+        self.set_position(position)
+        if cfile is not None:
+            cols.save(cfile, tsize)
+        return cols
+
     def _getfh(self):
         """Get the filehandle of the trace file, open file if necessary."""
         if self.fh == None:
@@ -404,7 +1361,10 @@ class Pktt(BaseObj, Unpack):
                 raise Exception("Packet trace file is empty")
 
             # Open trace file
-            self.fh = open(self.tfile, 'rb')
+            if self.live:
+                self.fh = open(self.tfile, 'rb', self.buffer_size)
+            else:
+                self.fh = open(self.tfile, 'rb')
 
             iszip = False
             self.header_fmt = None
@@ -431,8 +1391,20 @@ class Pktt(BaseObj, Unpack):
                         raise Exception('Not a tcpdump file')
                     iszip = True
                     self.fh.seek(0)
-                    # Try if this is a gzip compress file
-                    self.fh = gzip.GzipFile(fileobj=self.fh)
+                    # Try if this is a gzip compress file, keep the
+                    # access points when the file is re-opened
+                    self.fh = GzipIndex(self.fh, index=self._gzindex)
+                    self._gzindex = self.fh
+
+            # Compiled record header format
+            self.rec_struct = struct.Struct(self.header_rec)
+
+            if self.use_mmap and not iszip and not self.live:
+                try:
+                    # Memory map the trace file
+                    self._mm = mmap.mmap(self.fh.fileno(), 0, access=mmap.ACCESS_READ)
+                except (EnvironmentError, ValueError, OverflowError):
+                    self._mm = None
 
             # Get header information
             self.header = Header(self)
@@ -442,34 +1414,93 @@ class Pktt(BaseObj, Unpack):
             self.tstart  = None
             self.ioffset = self.offset
 
+            if self._suspended is not None:
+                # Trace file is re-opened, restore its position
+                self.offset, self.index, self.tstart = self._suspended
+                self._suspended = None
+                self.fh.seek(self.offset)
+            elif self.index_file and not self.live:
+                # Load packet index if it exists
+                self.load_index()
+
         return self.fh
 
     def _read(self, count):
         """Wrapper for read in order to increment the object's offset. It also
            takes care of <EOF> when 'live' option is set which keeps on trying
            to read and switching files when needed.
+
+           If the trace file is memory mapped, the data returned is a
+           read-only buffer of the mapped file instead of a copy.
         """
+        global _follow_logged
+        if self._mm is not None:
+            if self.offset >= len(self._mm):
+                return ''
+            data = buffer(self._mm, self.offset, count)
+            self.offset += len(data)
+            return data
+
         while True:
             # Read number of bytes specified
             data = self._getfh().read(count)
             ldata = len(data)
             if self.live and ldata != count:
                 # Not all data was read (<EOF>)
+                if self._follow is None:
+                    # Watch for writes to the trace file and for the
+                    # creation of the next trace file
+                    self._follow = Inotify(self.bfile)
+                    if self._follow.fd is None and not _follow_logged:
+                        # Only log it once for all live trace files
+                        _follow_logged = True
+                        self.dprint('INFO', "inotify is not available, polling live trace file every second")
                 tracefile = "%s%d" % (self.bfile, self.findex+1)
                 # Check if next trace file exists
                 if os.path.isfile(tracefile):
+                    # Make sure all data written to the current trace file
+                    # before the next trace file was created is processed
+                    self._getfh().seek(self.offset)
+                    data = self._getfh().read(count)
+                    ldata = len(data)
+                    if ldata == count:
+                        break
                     # Save information that keeps track of the next trace file
                     basefile = self.bfile
                     findex = self.findex + 1
+                    follow = self._follow
+                    pkt = self.pkt
+                    callbacks = self._call_callbacks
+                    removed = self._rpc_removed
+                    # Options given to the constructor, the index file
+                    # and workers are not used with live trace files
+                    options = self._decoder_options()
+                    options.update(
+                        checkpoint = self.ckpt_interval,
+                        use_mmap   = self.use_mmap,
+                        max_files  = self.max_files,
+                        buffer_size = self.buffer_size,
+                    )
                     # Re-initialize the object
+                    self._follow = None
                     self.__del__()
-                    self.__init__(tracefile, live=self.live)
+                    self.__init__(tracefile, live=self.live, **options)
                     # Overwrite next trace file info
                     self.bfile = basefile
                     self.findex = findex
+                    self._follow = follow
+                    self._call_callbacks = callbacks
+                    self._rpc_removed = removed
+                    # Keep the packet being processed which now starts
+                    # at the first record of the next trace file
+                    self.pkt = pkt
+                    self._getfh()
+                    self.boffset = self.offset
+                else:
+                    # Wait for more data or for the next trace file
+                    self._follow.wait(1)
                 # Re-position file pointer to last known offset
                 self._getfh().seek(self.offset)
-                time.sleep(1)
             else:
                 break
 
@@ -701,18 +1732,307 @@ class Pktt(BaseObj, Unpack):
         self.dprint('PKT2', "    %d: match_nfs(%s) -> %r" % (self.pkt.record.index, args, texpr))
         return texpr
 
-    def _convert_match(self, ast):
+    def _match_opset(self, isarg, lhs, opr, rhs):
+        """Return the set of operation numbers where the attribute used
+           in the NFS match expression could be found or None if all
+           operations must be searched.
+        """
+        if lhs == 'op':
+            return None
+        if opr == 'in' and not self.inlhs and rhs[:3] != 're(':
+            # Attribute is on the right hand side: "62 in obj_attributes"
+            data = rhs
+        else:
+            data = lhs
+        m = re.match(r"\s*([a-zA-Z_]\w*)", data)
+        if m is None:
+            return None
+        return get_opattr_map(isarg).get(m.group(1))
+
+    def _compile_func(self, layer, args):
+        """Return a function for the given layer and match arguments.
+           The function takes the Pktt object as its only argument and
+           returns the result of the match on the current packet, it is
+           equivalent to calling the corresponding match_<layer>(args).
+        """
+        lhs, opr, rhs = self._split_match(args)
+        if layer != 'nfs':
+            expr = self._process_match("self.pkt.%s." % layer, lhs, opr, rhs)
+            func = eval("lambda self: " + expr, globals())
+        elif _nfsopmap.get(lhs):
+            # Top level NFS packet info
+            expr = self._process_match("self.pkt.nfs.", lhs, opr, rhs)
+            nfsfunc = eval("lambda self: " + expr, globals())
+            def func(pktt):
+                try:
+                    return nfsfunc(pktt)
+                except Exception:
+                    return False
+        else:
+            if lhs == 'op':
+                argexpr = self._process_match("item.arg", lhs, opr, rhs)
+                resexpr = self._process_match("item.res", lhs, opr, rhs)
+            else:
+                argexpr = resexpr = self._process_match("item.", lhs, opr, rhs)
+            argfunc = eval("lambda item: " + argexpr, globals())
+            resfunc = eval("lambda item: " + resexpr, globals())
+            # Only test the operations where the attribute could be found
+            argops = self._match_opset(True, lhs, opr, rhs)
+            resops = self._match_opset(False, lhs, opr, rhs)
+            def func(pktt):
+                pkt = pktt.pkt
+                try:
+                    array = pkt.nfs.argarray
+                    ifunc, opset, isarg = argfunc, argops, True
+                except Exception:
+                    try:
+                        array = pkt.nfs.resarray
+                        ifunc, opset, isarg = resfunc, resops, False
+                    except Exception:
+                        # No NFS or no compound call/reply
+                        return False
+                idx = 0
+                for item in array:
+                    try:
+                        if opset is None or (item.argop if isarg else item.resop) in opset:
+                            if ifunc(item):
+                                pkt.NFSop = item
+                                pkt.NFSidx = idx
+                                return True
+                    except Exception:
+                        # Continue searching
+                        pass
+                    idx += 1
+                return False
+
+        if self.debug_enabled('pkt2'):
+            mfunc = func
+            def func(pktt):
+                texpr = mfunc(pktt)
+                pktt.dprint('PKT2', "    %d: match_%s(%s) -> %r" % (pktt.pkt.record.index, layer, args, texpr))
+                return texpr
+        return func
+
+    def _split_and(self, pdata, flist):
+        """Return the list of (layer, args) for all comparisons in the top
+           level of the compiled match expression given by pdata joined by
+           the 'and' operator, see _convert_match(). Return an empty list
+           if the expression is not a conjunction of comparisons.
+        """
+        # Split expression on the top level 'and' operators
+        parts = []
+        depth = 0
+        start = 0
+        for m in re.finditer(r"[()]|[a-z]+", pdata):
+            item = m.group(0)
+            if item == '(':
+                depth += 1
+            elif item == ')':
+                depth -= 1
+            elif depth == 0:
+                if item == 'and':
+                    parts.append(pdata[start:m.start()])
+                    start = m.end()
+                elif item != 'not':
+                    # Not a conjunction of comparisons
+                    return []
+        parts.append(pdata[start:])
+
+        ret = []
+        for part in parts:
+            m = re.search(r"^\(_m\[(\d+)\]\(self\)\)$", part)
+            if m is not None:
+                ret.append(flist[int(m.group(1))][1:])
+        return ret
+
+    def _get_search_keys(self, pdata, flist):
+        """Return the list of search keys for the compiled match expression
+           given by pdata and the list of match functions, or None if the
+           search index cannot be used for this expression.
+
+           Each search key is a tuple (names, values) where names is the
+           list of search index names and values is the list of values
+           the packet must have in any of these indexes. Only the equality
+           and membership comparisons against a constant on the top level
+           of the expression joined by the 'and' operator are used, e.g.,
+           for the expression "NFS.argop in [42,43] and RPC.xid == 0x101"
+           the search keys are [(('argop',), [42, 43]), (('xid',), [257])].
+        """
+        keys = []
+        for layer, args in self._split_and(pdata, flist):
+            lhs, opr, rhs = self._split_match(args)
+            names = _search_index_map.get((layer, lhs.strip()))
+            if names is None or opr not in ('==', 'in'):
+                continue
+            try:
+                value = ast.literal_eval(rhs.strip())
+            except Exception:
+                continue
+            if opr == '==':
+                keys.append((names, [value]))
+            elif isinstance(value, (list, tuple, set)):
+                keys.append((names, list(value)))
+        return keys if keys else None
+
+    def _get_prefilter(self, pdata, flist):
+        """Return the prefilter for the compiled match expression given by
+           pdata and the list of match functions, or None if the expression
+           cannot be used to discard packets before decoding them.
+
+           The prefilter is a tuple (level, ipsrc, ipdst, sport, dport) where
+           level is the packet layer needed by the match expression
+           (1: IP, 2: TCP, 3: RPC), ipsrc and ipdst are the packed IPv4
+           addresses and sport and dport are the TCP ports the packet must
+           have. Only the comparisons in the top level of the expression
+           joined by the 'and' operator are used, e.g., for the expression
+           "IP.src == '192.168.0.10' and NFS.argop == 38" the prefilter is
+           (3, '\xc0\xa8\x00\x0a', None, None, None).
+        """
+        level = 0
+        ipaddr = {}
+        ports  = {}
+        for layer, args in self._split_and(pdata, flist):
+            level = max(level, _match_layer_map[layer])
+            lhs, opr, rhs = self._split_match(args)
+            if opr != '==':
+                continue
+            rhs = rhs.strip()
+            if layer == 'ip' and lhs in ('src', 'dst'):
+                m = re.search(r"^(['\"])(\d+)\.(\d+)\.(\d+)\.(\d+)\1$", rhs)
+                if m and max(int(x) for x in m.groups()[1:]) < 256:
+                    ipaddr[lhs] = struct.pack("!4B", *[int(x) for x in m.groups()[1:]])
+            elif layer == 'tcp' and lhs in ('src_port', 'dst_port'):
+                m = re.search(r"^(0[xX][0-9a-fA-F]+|\d+)[lL]?$", rhs)
+                if m:
+                    ports[lhs] = int(m.group(1), 0)
+
+        if level == 0:
+            return None
+        return (level, ipaddr.get('src'), ipaddr.get('dst'),
+                ports.get('src_port'), ports.get('dst_port'))
+
+    def _prefilter_packet(self, data):
+        """Test the raw packet data against the prefilter of the current
+           search, see _get_prefilter().
+
+           Return 0 if the packet could match the search, 1 if the packet
+           cannot match but it must be decoded to keep the TCP and RPC state
+           or 2 if the packet cannot match and it has been skipped without
+           decoding any of its layers. A TCP packet is only skipped if
+           it has no data, e.g., a TCP ACK, and decoding it would not add
+           anything to the TCP stream state other than its sequence number.
+        """
+        level, ipsrc, ipdst, sport, dport = self._prefilter
+        ldata = len(data)
+        if ldata < 14:
+            return 0
+        etype = struct.unpack_from("!H", data, 12)[0]
+        if etype == 0x0800 and ldata >= 34:
+            # IPv4
+            offset = 14 + 4*(ord(data[14]) & 0x0F)
+            proto = ord(data[23])
+            src = data[26:30]
+            dst = data[30:34]
+            ok = (ipsrc is None or ipsrc == src) and (ipdst is None or ipdst == dst)
+        elif etype == 0x86dd and ldata >= 54:
+            # IPv6
+            offset = 54
+            proto = ord(data[20])
+            src = data[22:38]
+            dst = data[38:54]
+            ok = True
+        elif etype in (0x0800, 0x86dd):
+            # Truncated IP header
+            return 0
+        else:
+            # Not an IP packet
+            return 2
+
+        if proto != 6:
+            # Not a TCP packet
+            return 0 if ok and level < 2 else 2
+        elif ldata < offset + 20:
+            return 0
+
+        ulist = struct.unpack_from("!HHIIH", data, offset)
+        ok = ok and (sport is None or sport == ulist[0]) and (dport is None or dport == ulist[1])
+        if ok and level < 3:
+            return 0
+
+        # Find out if the TCP segment could be skipped, this is the same
+        # processing done by the TCP layer for a segment which does not
+        # have any RPC data
+        offset += 4*(ulist[4] >> 12)
+        size = ldata - offset
+        if size > 20 or size < 0 or ulist[4] & 0x02 or data[offset:] != '\x00' * size:
+            # TCP segment has data or it is a SYN
+            return 0 if ok else 1
+        if etype == 0x0800:
+            ipsrc = "%d.%d.%d.%d" % struct.unpack("!4B", src)
+            ipdst = "%d.%d.%d.%d" % struct.unpack("!4B", dst)
+        else:
+            ipsrc = IPv6Addr(src.encode('hex'))
+            ipdst = IPv6Addr(dst.encode('hex'))
+        streamid = "%s:%d-%s:%d" % (ipsrc, ulist[0], ipdst, ulist[1])
+        stream = self._tcp_stream_map.get(streamid)
+        if stream is None:
+            return 0 if ok else 1
+        seq = ulist[2] - stream['seq_base'] + stream['seq_wrap']
+        if seq < 0:
+            # Sequence number has wrapped around
+            return 0 if ok else 1
+        elif seq < stream['last_seq']:
+            # This is a re-transmission
+            return 2
+        elif stream['mslen'] == 0 and stream['frag_off'] == 0:
+            # No data or padding only
+            if size > 0:
+                stream['last_seq'] = seq
+            return 2
+        return 0 if ok else 1
+
+    def _compile_match(self, expr):
+        """Compile match expression and return a tuple
+           (function, prefilter, keys) where function takes the Pktt object
+           as its only argument and returns the result of the match on the
+           current packet, prefilter is used to discard packets before
+           decoding them, see _get_prefilter(), and keys are used to find
+           the packets which could match in the search index, see
+           _get_search_keys(). Compiled expressions are cached so the
+           same expression is parsed and compiled only once.
+        """
+        key = (expr, self.debug_enabled('pkt2'))
+        ret = _match_cache.get(key)
+        if ret is None:
+            # Parse match expression
+            st = parser.expr(expr)
+            smap = parser.st2list(st)
+            flist = []
+            pdata = self._convert_match(smap, flist)
+            pfunc = eval("lambda self: " + pdata, {'_m': [x[0] for x in flist]})
+            ret = (pfunc, self._get_prefilter(pdata, flist), self._get_search_keys(pdata, flist))
+            if len(_match_cache) >= _MATCH_CACHE_MAX:
+                _match_cache.clear()
+            _match_cache[key] = ret
+        return ret
+
+    def _convert_match(self, ast, flist):
         """Convert a parser list match expression into their corresponding
-           function calls.
+           function calls. Each comparison is compiled into a function
+           (see _compile_func()) which is appended to the given list as
+           a tuple (function, layer, args) and it is called from the
+           returned expression as _m[index].
 
            Example:
                expr = "TCP.flags.ACK == 1 and NFS.argop == 50"
                st = parser.expr(expr)
                ast = parser.st2list(st)
-               data =  self._convert_match(ast)
+               flist = []
+               data =  self._convert_match(ast, flist)
 
                Returns:
-               data = "(self.match_tcp('flags.ACK==1'))and(self.match_nfs('argop==50'))"
+               data = "(_m[0](self))and(_m[1](self))"
+               flist = [(<function>, 'tcp', 'flags.ACK==1'), (<function>, 'nfs', 'argop==50')]
         """
         ret = ''
         isin = False
@@ -722,10 +2042,10 @@ class Pktt(BaseObj, Unpack):
                 return _match_func_map[ast]
             return ast
         if len(ast) == 2:
-            return self._convert_match(ast[1])
+            return self._convert_match(ast[1], flist)
 
         for a in ast[1:]:
-            data = self._convert_match(a)
+            data = self._convert_match(a, flist)
             if data == 'in':
                 data = ' in '
                 isin = True
@@ -747,12 +2067,125 @@ class Pktt(BaseObj, Unpack):
                 m = re.search(r"^(self\.match_\w+)\.(.*)", ret)
                 func = m.group(1)
                 args = m.group(2)
-            # Escape all single quotes since the whole string will be quoted
-            args = re.sub(r"'", "\\'", args)
-            ret = "(%s('%s'))" % (func, args)
+            # Escape all single quotes and evaluate the arguments as a
+            # quoted string as if the arguments were given to the function
+            args = eval("'%s'" % re.sub(r"'", "\\'", args))
+            flist.append((self._compile_func(func[11:], args), func[11:], args))
+            ret = "(_m[%d](self))" % (len(flist) - 1)
 
         return ret
 
+    def build_search_index(self):
+        """Build the search index by going through all the packets in the
+           trace file. The search index has the packet indexes for every
+           RPC xid, NFS operation (argop and resop), filehandle (object)
+           and stateid (stateid.other) found in the trace file.
+
+           Once the search index is built, match() only decodes the
+           packets which could match when the expression compares any
+           of these attributes to a constant, e.g., "RPC.xid == 0x101",
+           "NFS.argop in [42,43]" or "NFS.stateid.other == 'xxx'" as long
+           as the comparison is on the top level of the expression and
+           it is joined to the rest of the expression by 'and'. The search
+           index is not used when more than one trace file is given.
+           The packet index is not changed.
+
+           Example:
+               x = Pktt("/traces/tracefile.cap", index_file=True)
+               x.build_search_index()
+
+               # Only the packets having a WRITE are decoded
+               pkt = x.match("NFS.argop == 38 and NFS.stateid.other == '%s'" % other)
+        """
+        save_index = self.index
+        if len(self.pktt_list) <= 1 and self.workers <= 1:
+            # Save decoder state to go back to where it started without
+            # decoding any packets again
+            self._getfh()
+            save_state = self._get_decoder_state()
+        self.dprint('PKT1', ">>> %d: build_search_index()" % self.index)
+
+        sindex = {}
+        for names in _search_index_map.values():
+            for name in names:
+                sindex[name] = {}
+
+        def add_index(name, value, index):
+            """Add packet index to the search index"""
+            try:
+                alist = sindex[name].setdefault(value, array('L'))
+            except TypeError:
+                # Value cannot be used as a key
+                return
+            if len(alist) == 0 or alist[-1] != index:
+                alist.append(index)
+
+        self.rewind(0)
+        for pkt in self:
+            rpc = getattr(pkt, 'rpc', None)
+            if rpc is None:
+                continue
+            index = pkt.record.index
+            add_index('xid', rpc.xid, index)
+            nfs = getattr(pkt, 'nfs', None)
+            try:
+                oplist = nfs.argarray
+                isarg, opname = True, 'argop'
+            except Exception:
+                try:
+                    oplist = nfs.resarray
+                    isarg, opname = False, 'resop'
+                except Exception:
+                    # No NFS or no compound call/reply
+                    continue
+            # Only look for the attributes on the operations where
+            # they could be found
+            objops, sidops = _search_opset_map[isarg]
+            for item in oplist:
+                try:
+                    op = getattr(item, opname)
+                except Exception:
+                    continue
+                add_index(opname, op, index)
+                if objops is None or op in objops:
+                    try:
+                        add_index('object', item.object, index)
+                    except Exception:
+                        pass
+                if sidops is None or op in sidops:
+                    try:
+                        add_index('stateid', item.stateid.other, index)
+                    except Exception:
+                        pass
+        self._search_index = sindex
+
+        # Re-position the file pointer back to where it started
+        if len(self.pktt_list) <= 1 and self.workers <= 1:
+            self._set_decoder_state(save_state)
+        else:
+            self.rewind(save_index)
+
+    def _search_candidates(self, keys):
+        """Return the sorted list of packet indexes which could match
+           the given search keys, see _get_search_keys(). Return None if
+           the search index cannot be used.
+        """
+        if self._search_index is None or keys is None or len(self.pktt_list) > 1:
+            return None
+        ret = None
+        for names, values in keys:
+            iset = set()
+            for name in names:
+                imap = self._search_index[name]
+                for value in values:
+                    try:
+                        iset.update(imap.get(value, ()))
+                    except TypeError:
+                        # Value cannot be used as a key
+                        pass
+            ret = iset if ret is None else ret & iset
+        return sorted(int(x) for x in ret)
+
     def match(self, expr, maxindex=None):
         """Return the packet that matches the given expression, also the packet
            index points to the next packet after the matched packet.
@@ -804,33 +2237,176 @@ class Pktt(BaseObj, Unpack):
         """
         # Save current position
         save_index = self.index
+        if len(self.pktt_list) <= 1 and self.workers <= 1:
+            # Save decoder state so a failed search goes back to where
+            # the search started without decoding any packets again
+            self._getfh()
+            save_state = self._get_decoder_state()
 
-        # Parse match expression
-        st = parser.expr(expr)
-        smap = parser.st2list(st)
-        pdata = self._convert_match(smap)
+        pfunc, prefilter, skeys = self._compile_match(expr)
         self.dprint('PKT1', ">>> %d: match(%s)" % (self.index, expr))
+        cindexes = self._search_candidates(skeys)
 
-        # Search one packet at a time
-        for pkt in self:
-            if maxindex and self.index > maxindex:
-                # Hit maxindex limit
-                break
-            try:
-                if eval(pdata):
-                    # Return matched packet
-                    self.dprint('PKT1', ">>> %d: match() -> True" % pkt.record.index)
-                    return pkt
-            except Exception:
-                pass
+        if len(self.pktt_list) <= 1 and self.workers <= 1:
+            # Discard packets which cannot match before decoding them
+            self._prefilter = prefilter
+        try:
+            if cindexes is not None:
+                # Only decode the packets found in the search index
+                for index in cindexes[bisect.bisect_left(cindexes, self.index):]:
+                    if maxindex and index >= maxindex:
+                        # Hit maxindex limit
+                        break
+                    if index != self.index:
+                        self.seek(index)
+                    try:
+                        pkt = self.next()
+                    except StopIteration:
+                        break
+                    if self._pfskip:
+                        # Packet failed the prefilter
+                        continue
+                    try:
+                        if pfunc(self):
+                            # Return matched packet
+                            self.dprint('PKT1', ">>> %d: match() -> True" % pkt.record.index)
+                            return pkt
+                    except Exception:
+                        pass
+            else:
+                # Search one packet at a time
+                for pkt in self:
+                    if maxindex and self.index > maxindex:
+                        # Hit maxindex limit
+                        break
+                    if self._pfskip:
+                        # Packet failed the prefilter
+                        continue
+                    try:
+                        if pfunc(self):
+                            # Return matched packet
+                            self.dprint('PKT1', ">>> %d: match() -> True" % pkt.record.index)
+                            return pkt
+                    except Exception:
+                        pass
+        finally:
+            self._prefilter = None
+            self._pfskip = 0
 
         # No packet matched, re-position the file pointer back to where
         # the search started
-        self.rewind(save_index)
+        if len(self.pktt_list) <= 1 and self.workers <= 1:
+            self._set_decoder_state(save_state)
+        else:
+            self.rewind(save_index)
         self.pkt = None
         self.dprint('PKT1', ">>> match() -> False")
         return None
 
+    def match_many(self, exprs, maxindex=None, first=True):
+        """Search for several expressions in a single pass through the
+           trace file. Return a dictionary having the same keys as the
+           given dictionary of expressions where each value is the first
+           packet matching the expression or None if no packet matched.
+           If first is False, each value is the list of all packets
+           matching the expression instead. The packet index is not
+           changed, the search always goes back to where it started.
+
+           exprs:
+               Dictionary of expressions to be evaluated keyed by name
+           maxindex:
+               The search stops if packet index hits this limit
+           first:
+               Return only the first packet matching each expression,
+               the search stops as soon as all expressions have been
+               matched [default: True]
+
+           Examples:
+               # Find the first OPEN, LAYOUTGET, GETDEVICEINFO and CLOSE
+               # requests
+               pkts = x.match_many({
+                   'open':      "NFS.argop == 18",
+                   'layoutget': "NFS.argop == 50",
+                   'getdevinfo':"NFS.argop == 47",
+                   'close':     "NFS.argop == 4",
+               })
+               if pkts['open'] and pkts['close']:
+                   print pkts['open'].nfs
+
+               # Find all WRITE and COMMIT requests
+               pkts = x.match_many({'write': "NFS.argop == 38", 'commit': "NFS.argop == 5"}, first=False)
+               print len(pkts['write']), len(pkts['commit'])
+
+           See also:
+               match()
+        """
+        # Save current position
+        save_index = self.index
+        if len(self.pktt_list) <= 1 and self.workers <= 1:
+            # Save decoder state to go back to where the search started
+            # without decoding any packets again
+            self._getfh()
+            save_state = self._get_decoder_state()
+
+        # List of expressions not matched yet: (name, function)
+        mlist = []
+        plist = []
+        for name, expr in exprs.items():
+            pfunc, prefilter, skeys = self._compile_match(expr)
+            mlist.append((name, pfunc))
+            plist.append(prefilter)
+        self.dprint('PKT1', ">>> %d: match_many(%s)" % (self.index, exprs))
+
+        if first:
+            ret = dict((name, None) for name in exprs)
+        else:
+            ret = dict((name, []) for name in exprs)
+
+        if len(self.pktt_list) <= 1 and self.workers <= 1 and len(plist) and None not in plist:
+            # Discard packets which cannot match any of the expressions
+            # before decoding them: use the lowest layer needed and only
+            # the addresses and ports common to all expressions
+            prefilter = [min(x[0] for x in plist)]
+            for i in range(1, 5):
+                items = set(x[i] for x in plist)
+                prefilter.append(items.pop() if len(items) == 1 else None)
+            self._prefilter = tuple(prefilter)
+        try:
+            # Search one packet at a time
+            for pkt in self:
+                if maxindex and self.index > maxindex:
+                    # Hit maxindex limit
+                    break
+                if self._pfskip:
+                    # Packet failed the prefilter
+                    continue
+                for item in list(mlist):
+                    try:
+                        if not item[1](self):
+                            continue
+                    except Exception:
+                        continue
+                    self.dprint('PKT1', ">>> %d: match_many() -> %s" % (pkt.record.index, item[0]))
+                    if first:
+                        ret[item[0]] = pkt
+                        mlist.remove(item)
+                    else:
+                        ret[item[0]].append(pkt)
+                if not mlist:
+                    # All expressions have been matched
+                    break
+        finally:
+            self._prefilter = None
+            self._pfskip = 0
+
+        # Re-position the file pointer back to where the search started
+        if len(self.pktt_list) <= 1 and self.workers <= 1:
+            self._set_decoder_state(save_state)
+        else:
+            self.rewind(save_index)
+        self.pkt = None
+        return ret
+
     @staticmethod
     def escape(data):
         """Escape special characters.
@@ -895,6 +2471,77 @@ class Pktt(BaseObj, Unpack):
         """
         return "IP.dst == '%s' and TCP.dst_port == %d" % (ipaddr, port)
 
+def _decode_records(args):
+    """Decode the given records of a trace file, this is the function run
+       by the worker processes when decoding in parallel.
+
+       args:
+           Tuple (tfile, tstart, ordinals, offsets, sfile, options) where
+           ordinals and offsets are the record numbers and file offsets of
+           the records to decode, tstart is the timestamp of the first
+           packet in the trace file, sfile is the name of the shard file
+           where all decoded packets are saved and options are the named
+           arguments given to the Pktt object
+
+       Return a tuple (ordinals, foffsets, calls, cmap, counts, rmap) where the
+       first three are arrays having an entry for every decoded packet,
+       a single record could have more than one packet if it has multiple
+       RPC packets. The ordinals array has the record number of the packet,
+       foffsets has the offset of the packet in the shard file and calls
+       tells what happened to pkt_call after the packet was decoded: -1 if
+       not modified, -2 if set to None or the position of the call packet
+       in these arrays. The dictionary
+       cmap has the call summary for every position found in calls and
+       counts has the number of calls evicted from the xid map as a tuple
+       (evictions, orphans). The dictionary rmap has the positions of the
+       calls removed from the xid map keyed by the position of the packet
+       which removed them.
+    """
+    tfile, tstart, ordinals, offsets, sfile, options = args
+    pktt = Pktt(tfile, checkpoint=0, **options)
+    pktt._getfh()
+    pktt.tstart = tstart
+    pktt._rpc_removed = []
+    rords = array('L')
+    foffs = array('L')
+    calls = array('l')
+    cmap  = {}
+    rmap  = {}
+    unset = object()
+    fd = open(sfile, 'wb')
+    try:
+        for ordinal, offset in izip(ordinals, offsets):
+            if pktt.offset != offset:
+                pktt.offset = offset
+                pktt._getfh().seek(offset)
+            while True:
+                # Find out if pkt_call is set while decoding the packet
+                pkt_call = pktt.pkt_call
+                pktt.pkt_call = unset
+                pkt = pktt.next()
+                if pktt.pkt_call is unset:
+                    pktt.pkt_call = pkt_call
+                    calls.append(-1)
+                elif pktt.pkt_call is None:
+                    calls.append(-2)
+                else:
+                    # The call index is the position of the call packet
+                    # since every packet decoded increments the index
+                    calls.append(pktt.pkt_call.index)
+                    cmap[pktt.pkt_call.index] = pktt.pkt_call
+                if pktt._rpc_removed:
+                    rmap[len(rords)] = pktt._rpc_removed
+                    pktt._rpc_removed = []
+                rords.append(ordinal)
+                foffs.append(fd.tell())
+                cPickle.dump(pkt, fd, 2)
+                if pktt.offset != offset:
+                    # Next packet is not within the same record
+                    break
+    finally:
+        fd.close()
+    return (rords, foffs, calls, cmap, (pktt._rpc_evictions, pktt._rpc_orphans), rmap)
+
 if __name__ == '__main__':
     # Self test of module
     l_escape = [
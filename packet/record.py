@@ -18,7 +18,6 @@ Provides the object for a record and the string representation of the record
 in a tcpdump trace file.
 """
 import time
-import struct
 import nfstest_config as c
 from baseobj import BaseObj
 
@@ -51,6 +50,7 @@ class Record(BaseObj):
     # Class attributes
     _attrlist = ("index", "seconds", "usecs", "length_inc", "length_orig",
                  "secs", "rsecs")
+    __slots__ = _attrlist + ("data",)
 
     def __init__(self, pktt, data):
         """Constructor
@@ -64,7 +64,7 @@ class Record(BaseObj):
                Raw packet data for this layer.
         """
         # Decode record header
-        ulist = struct.unpack(pktt.header_rec, data)
+        ulist = pktt.rec_struct.unpack(data)
         self.index       = pktt.index
         self.seconds     = ulist[0]
         self.usecs       = ulist[1]
@@ -16,6 +16,7 @@ TCP module
 
 Decode TCP layer.
 """
+import struct
 import nfstest_config as c
 from baseobj import BaseObj
 from packet.application.rpc import RPC
@@ -39,21 +40,27 @@ _TCP_map = {
 }
 
 class Flags(BaseObj):
-    """Flags object"""
+    """Flags object
+
+       Only the raw value is stored, each flag is computed when accessed.
+    """
     # Class attributes
     _attrlist = ("FIN", "SYN", "RST", "PSH", "ACK", "URG", "ECE", "CWR", "NS")
+    __slots__ = ("_data",)
 
     def __init__(self, data):
         """Constructor which takes a short integer as input"""
-        self.FIN = (data & 0x01)
-        self.SYN = ((data >> 1) & 0x01)
-        self.RST = ((data >> 2) & 0x01)
-        self.PSH = ((data >> 3) & 0x01)
-        self.ACK = ((data >> 4) & 0x01)
-        self.URG = ((data >> 5) & 0x01)
-        self.ECE = ((data >> 6) & 0x01)
-        self.CWR = ((data >> 7) & 0x01)
-        self.NS  = ((data >> 8) & 0x01)
+        self._data = data
+
+    FIN = property(lambda self: self._data & 0x01)
+    SYN = property(lambda self: (self._data >> 1) & 0x01)
+    RST = property(lambda self: (self._data >> 2) & 0x01)
+    PSH = property(lambda self: (self._data >> 3) & 0x01)
+    ACK = property(lambda self: (self._data >> 4) & 0x01)
+    URG = property(lambda self: (self._data >> 5) & 0x01)
+    ECE = property(lambda self: (self._data >> 6) & 0x01)
+    CWR = property(lambda self: (self._data >> 7) & 0x01)
+    NS  = property(lambda self: (self._data >> 8) & 0x01)
 
 class TCP(BaseObj):
     """TCP object
@@ -101,6 +108,7 @@ class TCP(BaseObj):
     _attrlist = ("src_port", "dst_port", "seq_number", "ack_number", "hl",
                  "header_size", "flags_raw", "flags", "window_size",
                  "checksum", "urgent_ptr", "options", "data")
+    __slots__ = _attrlist + ("seq", "length")
 
     def __init__(self, pktt):
         """Constructor
@@ -133,11 +141,18 @@ class TCP(BaseObj):
         streamid = "%s:%d-%s:%d" % (ip.src, self.src_port, ip.dst, self.dst_port)
 
         if streamid not in pktt._tcp_stream_map:
-            # msfrag: Keep track of RPC packets spanning multiple TCP packets
+            # msfrag: Keep track of RPC packets spanning multiple TCP packets,
+            #         it is a list of the data chunks of all TCP packets
+            #         so the data is only concatenated once
+            # mslen: Number of bytes in msfrag
+            # msneed: Number of bytes in the RPC record started in msfrag
+            #         including the record mark or 0 if not known
             # frag_off: Keep track of multiple RPC packets within
             #           a single TCP packet
             pktt._tcp_stream_map[streamid] = {
-                'msfrag':   '',
+                'msfrag':   [],
+                'mslen':    0,
+                'msneed':   0,
                 'frag_off': 0,
                 'last_seq': 0,
                 'seq_wrap': 0,
@@ -171,7 +186,8 @@ class TCP(BaseObj):
             # This is a re-transmission, do not process
             return
 
-        self._decode_payload(pktt, stream)
+        if 'rpc' in pktt._decode_layers:
+            self._decode_payload(pktt, stream)
 
         if self.length > 0:
             stream['last_seq'] = seq
@@ -204,12 +220,35 @@ class TCP(BaseObj):
             out = BaseObj.__str__(self)
         return out
 
+    def _reset_msfrag(self, stream):
+        """Discard all data in the reassembly buffer."""
+        stream['msfrag'] = []
+        stream['mslen']  = 0
+        stream['msneed'] = 0
+
+    def _add_msfrag(self, stream, data, isrpc):
+        """Add data to the reassembly buffer, if isrpc is true the buffer
+           starts with a valid RPC header so the expected size of the RPC
+           record is taken from the record mark if the record has only
+           one fragment.
+        """
+        if len(data):
+            stream['msfrag'].append(data)
+            stream['mslen']  += len(data)
+        if isrpc and stream['msneed'] == 0:
+            mark = ''.join(stream['msfrag'][:4])[:4]
+            if len(mark) == 4:
+                mark = struct.unpack('!I', mark)[0]
+                if mark >> 31:
+                    # Last fragment bit is set on the first fragment
+                    stream['msneed'] = (mark & 0x7FFFFFFF) + 4
+
     def _decode_payload(self, pktt, stream):
         """Decode TCP payload."""
         rpc = None
         pkt = pktt.pkt
         unpack = pktt.unpack
-        if stream['frag_off'] > 0 and len(stream['msfrag']) == 0:
+        if stream['frag_off'] > 0 and stream['mslen'] == 0:
             # This RPC packet lies within previous TCP packet,
             # Re-position the offset of the data
             unpack.seek(unpack.tell() + stream['frag_off'])
@@ -221,30 +260,36 @@ class TCP(BaseObj):
 
         # Try decoding the RPC header before using the msfrag data
         # to re-sync the stream
-        if len(stream['msfrag']) > 0:
+        if stream['mslen'] > 0:
             rpc = RPC(pktt, proto=6)
             if not rpc:
                 unpack.restore_state(sid)
                 sid = unpack.save_state()
 
-        if rpc or (size == 0 and len(stream['msfrag']) > 0 and self.flags_raw != 0x10):
+        if rpc or (size == 0 and stream['mslen'] > 0 and self.flags_raw != 0x10):
             # There has been some data lost in the capture,
             # to continue decoding next packets, reset stream
             # except if this packet is just a TCP ACK (flags = 0x10)
-            stream['msfrag'] = ''
+            self._reset_msfrag(stream)
             stream['frag_off'] = 0
 
         # Expected data segment sequence number
         nseg = self.seq - stream['last_seq']
 
         # Make sure this segment has valid data
-        if nseg != len(stream['msfrag']) and nonvalid:
+        if nseg != stream['mslen'] and nonvalid:
             return
 
+        truncbytes = pkt.record.length_orig - pkt.record.length_inc
         if not rpc:
-            if len(stream['msfrag']):
-                # Concatenate previous fragment
-                unpack.insert(stream['msfrag'])
+            if stream['mslen'] > 0:
+                if truncbytes == 0 and stream['mslen'] + size < stream['msneed']:
+                    # The RPC record is not complete yet, just add this
+                    # segment to the reassembly buffer
+                    self._add_msfrag(stream, unpack.getbytes(), False)
+                    return
+                # Concatenate previous fragments
+                unpack.insert(''.join(stream['msfrag']))
             ldata = unpack.size() - 4
 
             # Get RPC header
@@ -257,15 +302,14 @@ class TCP(BaseObj):
 
         rpcsize = rpc.fragment_hdr.size
 
-        truncbytes = pkt.record.length_orig - pkt.record.length_inc
         if truncbytes == 0 and ldata < rpcsize:
             # An RPC fragment is missing to decode RPC payload
             unpack.restore_state(sid)
-            stream['msfrag'] += unpack.getbytes()
+            self._add_msfrag(stream, unpack.getbytes(), True)
         else:
-            if len(stream['msfrag']) > 0 or ldata == rpcsize:
+            if stream['mslen'] > 0 or ldata == rpcsize:
                 stream['frag_off'] = 0
-            stream['msfrag'] = ''
+            self._reset_msfrag(stream)
             # Save RPC layer on packet object
             pkt.rpc = rpc
             if rpc.type:
@@ -273,10 +317,15 @@ class TCP(BaseObj):
                 # already been decoded
                 pktt._rpc_xid_map.pop(rpc.xid, None)
 
-            # Decode NFS layer
-            nfs = rpc.decode_nfs()
-            if nfs:
-                pkt.nfs = nfs
+            if 'nfs' in pktt._decode_layers:
+                # Decode NFS layer
+                nfs = rpc.decode_nfs()
+                if nfs:
+                    pkt.nfs = nfs
+            else:
+                # Skip the RPC payload to get to the next RPC record
+                nfs = None
+                unpack.seek(unpack.tell() + rpcsize - (ldata - unpack.size()))
             rpcbytes = ldata - unpack.size()
             if not nfs and rpcbytes != rpcsize:
                 pass
@@ -294,7 +343,7 @@ class TCP(BaseObj):
                     # Part of next RPC packet is within this TCP packet
                     # Save the multi-span fragment data
                     unpack.restore_state(sid)
-                    stream['msfrag'] += unpack.getbytes()
+                    self._add_msfrag(stream, unpack.getbytes(), bool(rpc_header))
                 else:
                     # Next RPC packet is entirely within this TCP packet
                     # Re-position the file pointer to the current offset
@@ -25,6 +25,19 @@ __version__   = '2.1'
 __copyright__ = "Copyright (C) 2012 NetApp, Inc."
 __license__   = "GPL v2"
 
+# Compiled formats used by unpack(): format -> struct.Struct
+_struct_map = {}
+
+# Compiled formats for the basic types
+_unpack_char   = struct.Struct('!b').unpack_from
+_unpack_uchar  = struct.Struct('!B').unpack_from
+_unpack_short  = struct.Struct('!h').unpack_from
+_unpack_ushort = struct.Struct('!H').unpack_from
+_unpack_int    = struct.Struct('!i').unpack_from
+_unpack_uint   = struct.Struct('!I').unpack_from
+_unpack_int64  = struct.Struct('!q').unpack_from
+_unpack_uint64 = struct.Struct('!Q').unpack_from
+
 class Unpack(object):
     """Unpack object
 
@@ -33,9 +46,17 @@ class Unpack(object):
 
            x = Unpack(buffer)
 
+           # The working buffer could also be a memoryview or a bytearray,
+           # data is not copied until a string is returned
+           x = Unpack(memoryview(bytearray_data))
+
            # Get 32 bytes from the working buffer and move the offset pointer
            data = x.read(32)
 
+           # Get a read-only view of the next 32 bytes in the working buffer
+           # without copying the data and move the offset pointer
+           data = x.read_view(32)
+
            # Get all the unprocessed bytes from the working buffer
            # (all bytes starting from the offset pointer)
            # Do not move the offset pointer
@@ -45,6 +66,11 @@ class Unpack(object):
            # Do not move the offset pointer
            data = x.getbytes(offset)
 
+           # Get the working buffer as a string without copying it, use it
+           # along with the offset pointer to unpack the data with another
+           # object, e.g., an xdrlib.Unpacker
+           data = x.getbuffer()
+
            # Return the number of unprocessed bytes left in the working buffer
            size = x.size()
            size = len(x)
@@ -135,10 +161,14 @@ class Unpack(object):
            Initialize object's private data.
 
            data:
-               Raw packet data
+               Raw packet data given as a string, a buffer, a bytearray
+               or a memoryview
         """
+        if isinstance(data, bytearray):
+            data = memoryview(data)
         self._offset = 0
         self._data = data
+        self._isview = isinstance(data, memoryview)
         self._state = []
 
     def _get_ltype(self, ltype):
@@ -166,8 +196,17 @@ class Unpack(object):
             offset = slen
         self._offset = offset
 
+    def _tostr(self, data):
+        """Return the slice of the working buffer given as a string."""
+        if self._isview:
+            return data.tobytes()
+        return data
+
     def append(self, data):
         """Append data to the working buffer."""
+        if self._isview:
+            self._data = self._data.tobytes()
+            self._isview = False
         self._data += data
 
     def insert(self, data):
@@ -178,7 +217,8 @@ class Unpack(object):
             state = self._state[-1]
             if len(state) == 2:
                 state.append(self._data)
-        self._data = data + self._data[self._offset:]
+        self._data = data + self._tostr(self._data[self._offset:])
+        self._isview = False
         self._offset = 0
 
     def save_state(self):
@@ -195,6 +235,7 @@ class Unpack(object):
             self._offset = state[1]
             if len(state) == 3:
                 self._data = state[2]
+                self._isview = isinstance(self._data, memoryview)
 
     def getbytes(self, offset=None):
         """Get the number of bytes given from the working buffer.
@@ -204,8 +245,19 @@ class Unpack(object):
                Starting offset of data to return [default: current offset]
         """
         if offset is None:
-            return self._data[self._offset:]
-        return self._data[offset:]
+            return self._tostr(self._data[self._offset:])
+        return self._tostr(self._data[offset:])
+
+    def getbuffer(self):
+        """Get the whole working buffer as a string, the data is not
+           copied unless the working buffer is a view in which case the
+           working buffer is replaced by its string representation.
+           Do not move the offset pointer.
+        """
+        if self._isview:
+            self._data = self._data.tobytes()
+            self._isview = False
+        return self._data
 
     def read(self, size, pad=0):
         """Get the number of bytes given from the working buffer.
@@ -217,7 +269,31 @@ class Unpack(object):
                Get and discard padding bytes [default: 0]
                If given, data is padded to this byte boundary
         """
-        buf = self._data[self._offset:self._offset+size]
+        buf = self._tostr(self._data[self._offset:self._offset+size])
+        if pad > 0:
+            # Discard padding bytes
+            size += (size+pad-1)/pad*pad - size
+        self._offset += size
+        return buf
+
+    def read_view(self, size, pad=0):
+        """Get a read-only view of the number of bytes given from the
+           working buffer without copying any data, the view is a buffer
+           or a memoryview object depending on the working buffer.
+           Move the offset pointer.
+
+           size:
+               Length of data to get
+           pad:
+               Get and discard padding bytes [default: 0]
+               If given, data is padded to this byte boundary
+        """
+        offset = self._offset
+        size = max(0, min(size, len(self._data) - offset))
+        if self._isview:
+            buf = self._data[offset:offset+size]
+        else:
+            buf = buffer(self._data, offset, size)
         if pad > 0:
             # Discard padding bytes
             size += (size+pad-1)/pad*pad - size
@@ -234,39 +310,63 @@ class Unpack(object):
            fmt:
                Format string on how to process data
         """
-        return struct.unpack(fmt, self.read(size))
+        st = _struct_map.get(fmt)
+        if st is None:
+            st = struct.Struct(fmt)
+            _struct_map[fmt] = st
+        if st.size != size:
+            return struct.unpack(fmt, self.read(size))
+        ret = st.unpack_from(self._data, self._offset)
+        self._offset += size
+        return ret
 
     def unpack_char(self):
         """Get a signed char"""
-        return self.unpack(1, '!b')[0]
+        ret = _unpack_char(self._data, self._offset)[0]
+        self._offset += 1
+        return ret
 
     def unpack_uchar(self):
         """Get an unsigned char"""
-        return self.unpack(1, '!B')[0]
+        ret = _unpack_uchar(self._data, self._offset)[0]
+        self._offset += 1
+        return ret
 
     def unpack_short(self):
         """Get a signed short integer"""
-        return self.unpack(2, '!h')[0]
+        ret = _unpack_short(self._data, self._offset)[0]
+        self._offset += 2
+        return ret
 
     def unpack_ushort(self):
         """Get an unsigned short integer"""
-        return self.unpack(2, '!H')[0]
+        ret = _unpack_ushort(self._data, self._offset)[0]
+        self._offset += 2
+        return ret
 
     def unpack_int(self):
         """Get a signed integer"""
-        return self.unpack(4, '!i')[0]
+        ret = _unpack_int(self._data, self._offset)[0]
+        self._offset += 4
+        return ret
 
     def unpack_uint(self):
         """Get an unsigned integer"""
-        return self.unpack(4, '!I')[0]
+        ret = _unpack_uint(self._data, self._offset)[0]
+        self._offset += 4
+        return ret
 
     def unpack_int64(self):
         """Get a signed 64 bit integer"""
-        return self.unpack(8, '!q')[0]
+        ret = _unpack_int64(self._data, self._offset)[0]
+        self._offset += 8
+        return ret
 
     def unpack_uint64(self):
         """Get an unsigned 64 bit integer"""
-        return self.unpack(8, '!Q')[0]
+        ret = _unpack_uint64(self._data, self._offset)[0]
+        self._offset += 8
+        return ret
 
     def unpack_opaque(self, maxcount=0):
         """Get a variable length opaque up to a maximum length of maxcount"""
@@ -0,0 +1,160 @@
+#!/usr/bin/env python
+#===============================================================================
+# Copyright 2012 NetApp, Inc. All Rights Reserved,
+# contribution by Jorge Mora <mora@netapp.com>
+#
+# This program is free software; you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation; either version 2 of the License, or (at your option) any later
+# version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#===============================================================================
+import os
+import re
+import sys
+import time
+import nfstest_config as c
+import packet.nfs.nfs4_type as nfs4_type
+import packet.nfs.nfs4_const as nfs4_const
+
+# Module constants
+__author__    = 'Jorge Mora (%s)' % c.NFSTEST_AUTHOR_EMAIL
+__version__   = '1.0'
+__copyright__ = "Copyright (C) 2012 NetApp, Inc."
+__license__   = "GPL v2"
+
+def _xdr_definitions(src):
+    """Return a dictionary of XDR definitions for all classes in nfs4_type.
+    Each definition is a tuple (switch, fields, delegate):
+        switch:   name of the union discriminant or None for a struct
+        fields:   list of (typename, name, cases) where typename is None for
+                  array items and cases is the list of union case labels
+        delegate: name of the attribute given to getattr() by __getattr__
+    """
+    fd = open(src, 'r')
+    source = fd.read()
+    fd.close()
+    ret = {}
+    for block in source.split("\nclass ")[1:]:
+        name = re.split(r'[(:]', block, 1)[0]
+        switch = None
+        fields = []
+        cases = []
+        for line in re.findall(r'^    #\s+(.*)$', block, re.M):
+            m = re.search(r'^union \w+ switch\(\w+ (\w+)\)', line)
+            if m:
+                switch = m.group(1)
+                continue
+            m = re.search(r'^case (\w+):', line)
+            if m:
+                cases.append(m.group(1))
+                continue
+            m = re.search(r'^(\w+) \*?(\w+)(.?)', line)
+            if m and m.group(1) not in ('struct', 'union'):
+                isarray = m.group(3) in ('<', '[')
+                fields.append((None if isarray else m.group(1), m.group(2), cases))
+            if line == 'default:' or line.endswith(';'):
+                cases = []
+        m = re.search(r'def __getattr__\(self, attr\):\s+return getattr\(self\.(\w+), attr\)', block)
+        ret[name] = (switch, fields, m.group(1) if m else None)
+    return ret
+
+def _reachable_attrs(name, xdrdefs, cache):
+    """Return the set of attribute names reachable from an object of the
+       given nfs4_type class name, following __getattr__ delegation.
+    """
+    cls = getattr(nfs4_type, name, None)
+    name = getattr(cls, '__name__', name)
+    if name in cache:
+        return cache[name]
+    attrs = set()
+    cache[name] = attrs
+    if name not in xdrdefs:
+        # Basic type
+        return attrs
+    switch, fields, delegate = xdrdefs[name]
+    if switch:
+        attrs.add(switch)
+    for ftype, fname, cases in fields:
+        attrs.add(fname)
+    for ftype, fname, cases in fields:
+        if ftype and (delegate == fname or (delegate == 'switch' and switch)):
+            attrs.update(_reachable_attrs(ftype, xdrdefs, cache))
+    return attrs
+
+def _opattr_map(names, xdrdefs, cache):
+    """Return a dictionary of attribute names mapping to the set of
+       operation names where the attribute is reachable from the compound
+       item classes given, None if it is reachable from all operations.
+    """
+    opattr = {}
+    for name in names:
+        switch, fields, delegate = xdrdefs[name]
+        for ftype, fname, cases in fields:
+            # Attributes of the compound item are reachable from
+            # all operations
+            opattr[fname] = None
+        opattr[switch] = None
+        for ftype, fname, cases in fields:
+            for attr in _reachable_attrs(ftype, xdrdefs, cache):
+                if opattr.get(attr, 0) is None:
+                    continue
+                opattr.setdefault(attr, set()).update(cases)
+    return opattr
+
+def _write_map(fd, mapname, opattr):
+    """Write the dictionary definition of the given map"""
+    print >>fd, "%s = {" % mapname
+    for attr in sorted(opattr):
+        opset = opattr[attr]
+        if opset is None:
+            value = "None"
+        else:
+            # Sort operation names by their value
+            oplist = sorted(opset, key=lambda x: getattr(nfs4_const, x))
+            value = "frozenset([%s])" % ", ".join("const.%s" % x for x in oplist)
+        print >>fd, "    %-22s %s," % ("'%s':" % attr, value)
+    print >>fd, "}"
+
+def create_opattr(src, dst):
+    """Create the static operation attribute maps module.
+
+       src:
+           Name of nfs4_type source file
+       dst:
+           Name of module to create
+    """
+    xdrdefs = _xdr_definitions(src)
+    cache = {}
+    fd = open(dst, 'w')
+    print >>fd, "# Generated by create_opattr.py from %s on %s" % \
+                (os.path.basename(src), time.strftime("%a %b %d %H:%M:%S %Y"))
+    print >>fd, '"""'
+    print >>fd, "Maps of attribute name to the set of operation numbers where the attribute"
+    print >>fd, "is reachable from the nfs_argop4/nfs_resop4 object (including callbacks),"
+    print >>fd, "the attribute is reachable from all operations if the set is None."
+    print >>fd, '"""'
+    print >>fd, "import nfs4_const as const"
+    print >>fd, ""
+    print >>fd, "# Arguments: nfs_argop4 and nfs_cb_argop4"
+    _write_map(fd, "opattr_args", _opattr_map(('nfs_argop4', 'nfs_cb_argop4'), xdrdefs, cache))
+    print >>fd, ""
+    print >>fd, "# Results: nfs_resop4 and nfs_cb_resop4"
+    _write_map(fd, "opattr_res", _opattr_map(('nfs_resop4', 'nfs_cb_resop4'), xdrdefs, cache))
+    fd.close()
+
+def run():
+    src = re.sub(r'\.py[co]$', '.py', nfs4_type.__file__)
+    dst = os.path.join(os.path.dirname(src), 'nfs4_opattr.py')
+    create_opattr(src, dst)
+
+######################################################################
+# Entry
+if __name__ == '__main__':
+    if len(sys.argv) > 1:
+        create_opattr(sys.argv[1], sys.argv[2])
+    else:
+        run()